@@ -0,0 +1,133 @@
+"""Benchmark each stage of the Project [C]haron pipeline."""
+
+import argparse
+import os
+import sys
+
+from src.benchmark_runner import BENCHMARKS_DIRECTORY, BenchmarkRunner
+from src.scaling_benchmark import ScalingBenchmark
+
+
+def main() -> int:
+    """
+    Benchmark the programs in `benchmarks/`, and save the results as JSON.
+
+    A summary of the medians of each stage is printed. If a baseline is given,
+    the regressions relative to it are also printed, and the exit code is 1
+    if there are any.
+    """
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("benchmarks", nargs="*", help="names of the benchmarks to run (default: all)")
+    parser.add_argument("--directory", default=BENCHMARKS_DIRECTORY, help="directory with the .ch programs")
+    parser.add_argument("--output", default="benchmark_results.json", help="path of the JSON results")
+    parser.add_argument("--baseline", help="path of the JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative slowdown tolerated")
+    parser.add_argument("--optimization-level", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--scaling", metavar="PARAMETER", help="benchmark synthetic programs, scaling a parameter of the generator")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 16, 32, 64, 128], help="values of the scaled parameter")
+    args = parser.parse_args()
+
+    if args.scaling is not None:
+        return run_scaling_benchmark(args)
+
+    runner = BenchmarkRunner.from_directory(
+        directory=args.directory,
+        optimization_level=args.optimization_level,
+        repeats=args.repeats,
+        warmup=args.warmup
+    )
+
+    if args.benchmarks:
+        runner.benchmarks = {
+            name: source_code
+            for name, source_code in runner.benchmarks.items()
+            if name in args.benchmarks or os.path.splitext(name)[0] in args.benchmarks
+        }
+
+    results = runner.run()
+    runner.save(results, args.output)
+
+    print(f"{'benchmark':<28}" + "".join(f"{stage[:12]:>14}" for stage in runner.STAGES))
+
+    for name, result in results["benchmarks"].items():
+        if "error" in result:
+            print(f"{name:<28}  {result['error']}")
+            continue
+
+        print(f"{name:<28}" + "".join(
+            f"{result[stage]['median'] * 1e3:>12.3f}ms" for stage in runner.STAGES
+        ))
+
+    print(f"Results saved to {args.output}")
+
+    if args.baseline is None:
+        return 0
+
+    regressions = runner.compare(
+        baseline=runner.load(args.baseline),
+        results=results,
+        threshold=args.threshold
+    )
+
+    for regression in regressions:
+        print(
+            f"Regression: {regression['benchmark']} ({regression['stage']}): "
+            f"{regression['baseline'] * 1e3:.3f}ms -> {regression['median'] * 1e3:.3f}ms "
+            f"({regression['ratio']:.2f}x)"
+        )
+
+    if not regressions:
+        print("No regressions found.")
+
+    return 1 if regressions else 0
+
+
+def run_scaling_benchmark(args: argparse.Namespace) -> int:
+    """
+    Benchmark synthetic programs of growing sizes, and save the results as
+    JSON.
+
+    The time of each stage for each size, and the exponents of the power laws
+    fitted to the time and the memory of each stage, are printed.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The command line arguments.
+    """
+
+    benchmark = ScalingBenchmark(
+        sizes=args.sizes,
+        parameter=args.scaling,
+        optimization_level=args.optimization_level,
+        repeats=args.repeats,
+        warmup=args.warmup
+    )
+
+    results = benchmark.run()
+    benchmark.save(results, args.output)
+
+    stages = benchmark.runner.STAGES
+
+    print(f"{args.scaling:<12}{'lines':>8}" + "".join(f"{stage[:12]:>14}" for stage in stages))
+
+    for point in results["points"]:
+        print(f"{point['size']:<12}{point['lines']:>8}" + "".join(
+            f"{point['time'][stage] * 1e3:>12.3f}ms" for stage in stages
+        ))
+
+    for metric in ["time", "memory"]:
+        print(f"{metric + ' ~ lines^':<20}" + "".join(
+            f"{results['fits'][metric][stage]['exponent']:>14.2f}" for stage in stages
+        ))
+
+    print(f"Results saved to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,14 @@
 """Implement the main function of the Project [C]haron environment."""
 
+import argparse
 import sys
 
+from src.instrumentation import (
+    SHARED_INSTRUMENTATION,
+    JSONLinesSubscriber,
+    SummarySubscriber
+)
+from src.program_cache import DEFAULT_CACHE_DIRECTORY, ProgramCache
 from src.runner import create_instance
 
 
@@ -9,20 +16,68 @@ def main() -> int:
     """
     Read the source code from the stdin, compile it and run it in the Virtual Machine.
 
-    The variables of the VM are printed after the execution.
+    The variables of the VM are printed after the execution. With `--cache`,
+    compiled programs and their certificates are kept in a `ProgramCache` (in
+    the given directory, or in `~/.cache/charon`), so unchanged programs are
+    not compiled again.
+
+    The time and the memory of each stage can be printed as a table
+    (`--summary`), or appended to a JSON lines file (`--trace`). The
+    execution can also be profiled (`--profile`): the instructions run per
+    opcode, the time spent in each function and an annotated listing of the
+    code are printed.
+
+    The certificates are compared entry by entry, unless `--fingerprint` is
+    set: then, certificates with equal fingerprints are accepted right away.
     """
 
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument(
+        "--cache",
+        metavar="DIR",
+        nargs="?",
+        const=DEFAULT_CACHE_DIRECTORY,
+        help="cache the compiled programs (default directory: %(const)s)"
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="print the time and memory of each stage"
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="append the events of each stage to a JSON lines file"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="profile the execution"
+    )
+    parser.add_argument(
+        "--fingerprint",
+        action="store_true",
+        help="compare the certificates by their fingerprints"
+    )
+    args = parser.parse_args()
+
+    summary = None
+
+    if args.summary:
+        summary = SHARED_INSTRUMENTATION.subscribe(SummarySubscriber())
+
+    if args.trace is not None:
+        SHARED_INSTRUMENTATION.subscribe(JSONLinesSubscriber(args.trace))
+
     source_code: str = sys.stdin.read()
 
-    instance = create_instance(source_code)
+    cache = ProgramCache(directory=args.cache) if args.cache is not None else None
+    instance = create_instance(source_code, cache=cache, profile=args.profile)
 
     vm = instance.get_vm()
 
-    frontend_certificator = instance.get_frontend_certificator()
-    backend_certificator = instance.get_backend_certificator()
-
-    frontend_certificate = ...
-    backend_certificate = ...
+    frontend_certificate = instance.get_frontend_certificate()
+    backend_certificate = instance.get_backend_certificate()
 
     print("Frontend certificate:")
     print(frontend_certificate)
@@ -31,15 +86,24 @@ def main() -> int:
     print(backend_certificate)
 
     try:
-        assert frontend_certificate == backend_certificate
+        assert frontend_certificate.matches(
+            backend_certificate, strict=not args.fingerprint
+        )
         print("Certificates match!")
     except AssertionError:
         print("Certificates don't match. Aborting...")
         return 1
 
-    vm.run()
+    instance.run()
     vm.print()
 
+    if args.profile:
+        print(instance.get_code_generator().format(vm.profiler.get_annotations()))
+        vm.profiler.print()
+
+    if summary is not None:
+        summary.print()
+
     return 0
 
 
@@ -11,7 +11,8 @@ class AbstractSyntaxTree:
     ----------
     source_code : dict[str, dict]
         A list of tuples created by the `Lexer` that contains the
-        representation of the source code in (`symbol`, `value`) format.
+        representation of the source code in (`symbol`, `value`) format. It is
+        not modified, so it can be shared with other consumers.
     """
 
     def __init__(self, source_code: dict[str, dict]) -> None:
@@ -22,6 +23,7 @@ class AbstractSyntaxTree:
         self.current_symbol: str = None
         self.current_value: dict = {}
         self.current_statement_list: list[tuple[str, dict]] = []
+        self.current_statement_idx: int = 0
         self.current_function_type: str = None
 
     def __eq__(self, other: "AbstractSyntaxTree") -> bool:
@@ -68,9 +70,9 @@ class AbstractSyntaxTree:
         )
 
         for struct_name, struct_metadata in struct_definitions.items():
-            struct_metadata["type"] = struct_name
-
-            struct_def_node = STRUCT_DEF(struct_metadata=struct_metadata)
+            struct_def_node = STRUCT_DEF(
+                struct_metadata={**struct_metadata, "type": struct_name}
+            )
 
             self.root.add_child(struct_def_node)
 
@@ -82,9 +84,9 @@ class AbstractSyntaxTree:
         )
 
         for variable_name, variable_metadata in global_variables.items():
-            variable_metadata["name"] = variable_name
-
-            var_def_node = VAR_DEF(variable_metadata=variable_metadata)
+            var_def_node = VAR_DEF(
+                variable_metadata={**variable_metadata, "name": variable_name}
+            )
 
             self.root.add_child(var_def_node)
 
@@ -109,6 +111,7 @@ class AbstractSyntaxTree:
 
             self.current_function_type = function_def_node.get_type()
             self.current_statement_list = function_data.get("statements")
+            self.current_statement_idx = 0
 
             self._next_symbol()
             function_def_node.set_statements(self._statement())
@@ -670,8 +673,11 @@ class AbstractSyntaxTree:
     def _next_symbol(self) -> None:
         """Get the next symbol to evaluate."""
 
-        if len(self.current_statement_list) > 0:
-            self.current_symbol, self.current_value = self.current_statement_list.pop(0)
+        if self.current_statement_idx < len(self.current_statement_list):
+            self.current_symbol, self.current_value = (
+                self.current_statement_list[self.current_statement_idx]
+            )
+            self.current_statement_idx += 1
         else:
             self.current_symbol, self.current_value = ("EOI", {})
 
@@ -5,6 +5,9 @@ from src.ast_nodes.node import Node
 from src.ast_nodes.conditionals.conditional import Conditional
 from src.ast_nodes.operations.operation import Operation
 
+# Certificate labels
+from src.ast_nodes.variable_prime_label import VariablePrimeLabel
+
 # Basic nodes
 from src.ast_nodes.basic.CST import CST
 from src.ast_nodes.basic.PROG import PROG
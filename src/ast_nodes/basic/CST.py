@@ -1,5 +1,7 @@
 """Representation of CST nodes for the Abstract Syntax Tree."""
 
+from typing import Union
+
 from typing_extensions import override
 
 from src.ast_nodes.node import Node
@@ -38,5 +40,32 @@ class CST(Node):
         self.instruction: str = "CONSTANT"
 
         # We apply this linear transformation so we get rid of zeroes
-        value_exponent = value + 1 if value >= 0 else value
-        self.symbol: str = f"({self.symbol})^({value_exponent})"
+        self.value_exponent: Union[int, float] = value + 1 if value >= 0 else value
+
+    @override
+    def certificate(
+        self,
+        certificator_env: dict[int, list[int]]
+    ) -> dict[int, list[int]]:
+        """
+        Compute the certificate of the current `CST`, and set this attribute.
+
+        For `CST` nodes, the label is the symbol of constants raised to the
+        (shifted) value of the constant.
+
+        Parameters
+        ----------
+        certificator_env : dict[int, list[int]]
+            The certificators's environment, that maps variables IDs to
+            encodings of their types.
+
+        Returns
+        -------
+        certificator_env : dict[int, list[int]]
+            The updated certificator's environment, with any additional
+            information about the variable's types it might have captured.
+        """
+
+        self.certificate_label = [(int(self.symbol), self.value_exponent)]
+
+        return certificator_env
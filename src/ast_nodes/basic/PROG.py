@@ -30,29 +30,21 @@ class PROG(Node):
         self.children.append(child)
 
     @override
-    def get_certificate_label(self) -> list[str]:
+    def get_certificate_label_parts(self) -> list[Union[Node, tuple]]:
         """
-        Get the contents of `certificate_label`.
+        Get the certificate label of this `PROG`, with its children in the
+        place of their labels.
 
-        For `PROG` nodes, first obtain the certificate from each `child`
-        subtree, recursively, and then from the `PROG` node itself.
+        For `PROG` nodes, first come the certificates of each `child` subtree,
+        and then the one from the `PROG` node itself.
 
         Returns
         -------
-        : list of str
-            A list containing the certificate label of the `Node`.
+        : list of Union[Node, tuple]
+            The children, and the label elements of this `PROG`.
         """
 
-        certificate_label: list[str] = []
-
-        for child in self.children:
-            certificate_label.extend(
-                [label for label in child.get_certificate_label() if label is not None]
-            )
-
-        certificate_label.extend(super().get_certificate_label())
-
-        return certificate_label
+        return [*self.children, *self.certificate_label]
 
     @override
     def print(self, indent: int = 0) -> None:
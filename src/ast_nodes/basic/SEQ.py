@@ -34,25 +34,21 @@ class SEQ(Node):
         self.children.append(child)
 
     @override
-    def get_certificate_label(self) -> list[str]:
+    def get_certificate_label_parts(self) -> list[Node]:
         """
-        Get the contents of `certificate_label`.
+        Get the certificate label of this `SEQ`, with its children in the
+        place of their labels.
 
-        For `SEQ` nodes, obtain the certificate from the `children` subtrees,
-        recursively. The `SEQ` node itself does not have a certificate.
+        For `SEQ` nodes, only the certificates of the `children` subtrees
+        count. The `SEQ` node itself does not have a certificate.
 
         Returns
         -------
-        : list of str
-            A list containing the certificate label of the `Node`.
+        : list of Node
+            The children of this `SEQ`.
         """
 
-        certificate_label: list[str] = []
-
-        for child in self.children:
-            certificate_label.extend(child.get_certificate_label())
-
-        return certificate_label
+        return self.children
 
     @override
     def print(self, indent: int = 0) -> None:
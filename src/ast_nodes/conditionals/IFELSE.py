@@ -40,23 +40,23 @@ class IFELSE(IF):
         self.else_boundary_certificate = None
 
     @override
-    def get_certificate_label(self) -> list[str]:
+    def get_certificate_label_parts(self) -> list[Union[Node, tuple]]:
         """
-        Get the contents of `certificate_label`.
+        Get the certificate label of this `IFELSE`, with its children in the
+        place of their labels.
 
-        For `IFELSE` nodes, first call the `Conditional.get_certificate_label`
-        method, and compose it with the `certificate_label` obtained recursively
-        from the `statement_if_false` subtree.
+        For `IFELSE` nodes, first call the `Conditional.get_certificate_label_parts`
+        method, and compose it with the `statement_if_false` subtree.
 
         Returns
         -------
-        : list of str
-            A list containing the certificate label of the `Node`.
+        : list of Union[Node, tuple]
+            The children, and the label elements of this `IFELSE`.
         """
 
         return [
-            *super().get_certificate_label(),
-            *self.statement_if_false.get_certificate_label(),
+            *super().get_certificate_label_parts(),
+            self.statement_if_false,
             self.else_boundary_certificate,
         ]
 
@@ -209,6 +209,6 @@ class IFELSE(IF):
         certificator_env = self.statement_if_false.certificate(certificator_env)
         
         _else_boundary_symbol = SYMBOLS_MAP["ELSE_END"]
-        self.else_boundary_certificate = f"{_else_boundary_symbol}"
+        self.else_boundary_certificate = (int(_else_boundary_symbol),)
 
         return certificator_env
@@ -1,5 +1,7 @@
 """Representation of conditionals for the Abstract Syntax Tree."""
 
+from typing import Union
+
 from typing_extensions import override
 
 from src.ast_nodes.node import Node
@@ -31,25 +33,26 @@ class Conditional(Node):
         self.boundary_certificate = None
 
     @override
-    def get_certificate_label(self) -> list[str]:
+    def get_certificate_label_parts(self) -> list[Union[Node, tuple]]:
         """
-        Get the contents of `certificate_label`.
+        Get the certificate label of this `Conditional`, with its children in
+        the place of their labels.
 
-        For `Conditional` nodes, obtain the certificates, recursively, from the
-        `parenthesis_expression` subtree first, then from the `Conditional`
-        node itself, and, finally, from the `statement_if_true` subtree.
+        For `Conditional` nodes, the certificate of the `parenthesis_expression`
+        subtree comes first, then the one from the `Conditional` node itself,
+        and, finally, the one from the `statement_if_true` subtree.
 
         Returns
         -------
-        : list of str
-            A list containing the certificate label of the `Node`.
+        : list of Union[Node, tuple]
+            The children, and the label elements of this `Conditional`.
         """
 
         return [
             self.conditional_expression_boundary,
-            *self.parenthesis_expression.get_certificate_label(),
-            *super().get_certificate_label(),
-            *self.statement_if_true.get_certificate_label(),
+            self.parenthesis_expression,
+            *self.certificate_label,
+            self.statement_if_true,
             self.boundary_certificate
         ]
 
@@ -100,13 +103,13 @@ class Conditional(Node):
         # Add the symbol to delimit the condition expression
         _conditional_expression_boundary_symbol = SYMBOLS_MAP["COND"]
         self.conditional_expression_boundary = (
-            f"{_conditional_expression_boundary_symbol}"
+            int(_conditional_expression_boundary_symbol),
         )
 
         certificator_env = self.parenthesis_expression.certificate(certificator_env)
         certificator_env = super().certificate(certificator_env)
         certificator_env = self.statement_if_true.certificate(certificator_env)
 
-        self.boundary_certificate = f"{self.boundary_symbol}"
+        self.boundary_certificate = (int(self.boundary_symbol),)
 
         return certificator_env
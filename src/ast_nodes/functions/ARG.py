@@ -20,14 +20,22 @@ class ARG(Node):
         The node representation of this argument.
     parameter_type : str
         The type the parameter expects from the argument.
+    argument_index : int
+        The position of this argument in the function call.
     """
 
     @override
-    def __init__(self, argument_value: Union[CST, VAR], parameter_type: str) -> None:
+    def __init__(
+        self,
+        argument_value: Union[CST, VAR],
+        parameter_type: str,
+        argument_index: int
+    ) -> None:
         super().__init__()
 
         self.argument_value: Union[CST, VAR] = argument_value
         self.parameter_type: str = parameter_type
+        self.argument_index: int = argument_index
 
     @override
     def print(self, indent: int = 0) -> None:
@@ -60,7 +68,7 @@ class ARG(Node):
 
         For this node specialization, generate code from the `argument_value`
         node first, and then generate a `MOV` instruction to save the
-        `argument_value` in the `arg` register.
+        `argument_value` in the `arg` register slot of this argument's position.
 
         Parameters
         ----------
@@ -112,6 +120,7 @@ class ARG(Node):
             "metadata": {
                 "register": "arg",
                 "value": argument_value_register,
+                "argument": self.argument_index,
             },
         }
         code.append(argument_store_code)
@@ -143,8 +152,21 @@ class ARG(Node):
         """
 
         certificator_env = self.argument_value.certificate(certificator_env)
-        _argument_value_certificate = self.argument_value.get_certificate_label()
 
-        self.certificate_label = [*_argument_value_certificate, f"{self.symbol}"]
+        self.certificate_label = [(int(self.symbol),)]
 
         return certificator_env
+
+    @override
+    def get_certificate_label_parts(self) -> list[Union[Node, tuple]]:
+        """
+        Get the certificate label of this `ARG`, with its children in the
+        place of their labels.
+
+        Returns
+        -------
+        : list of Union[Node, tuple]
+            The `argument_value`, and the label elements of this `ARG`.
+        """
+
+        return [self.argument_value, *self.certificate_label]
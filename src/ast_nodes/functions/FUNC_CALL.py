@@ -31,32 +31,26 @@ class FUNC_CALL(Node):
         self.arguments: list[ARG] = self._build_children_nodes()
         self.type: str = _function_type
 
-        _prime: int = self.function_call_metadata["called_function_metadata"]["prime"]
-        self.symbol: str = f"({self.symbol})^({_prime})"
+        self.function_prime: int = (
+            self.function_call_metadata["called_function_metadata"]["prime"]
+        )
 
     @override
-    def get_certificate_label(self) -> list[str]:
+    def get_certificate_label_parts(self) -> list[Union[Node, tuple]]:
         """
-        Get the contents of `certificate_label`.
+        Get the certificate label of this `FUNC_CALL`, with its children in the
+        place of their labels.
 
-        For `FUNC_CALL` nodes, obtain the certificates, recursively, from each
-        `argument` subtree first, and then from the `FUNC_CALL` node itself.
+        For `FUNC_CALL` nodes, the certificates of each `argument` subtree come
+        first, and then the one from the `FUNC_CALL` node itself.
 
         Returns
         -------
-        : list of str
-            A list containing the certificate label of the `Node`.
+        : list of Union[Node, tuple]
+            The arguments, and the label elements of this `FUNC_CALL`.
         """
 
-        certificate_label: list[str] = []
-
-        for argument in self.arguments:
-            _argument_certificate = argument.get_certificate_label()
-            certificate_label.extend(_argument_certificate)
-
-        certificate_label.extend(super().get_certificate_label())
-
-        return certificate_label
+        return [*self.arguments, *self.certificate_label]
 
     @override
     def print(self, indent: int = 0) -> None:
@@ -176,7 +170,9 @@ class FUNC_CALL(Node):
         for argument in self.arguments:
             certificator_env = argument.certificate(certificator_env)
 
-        return super().certificate(certificator_env)
+        self.certificate_label = [(int(self.symbol), self.function_prime)]
+
+        return certificator_env
 
     def _build_children_nodes(self) -> list[Node]:
         arguments = self.function_call_metadata["arguments"]
@@ -202,7 +198,9 @@ class FUNC_CALL(Node):
                 argument_value = CST(constant_metadata=argument_metadata)
 
             new_node = ARG(
-                argument_value=argument_value, parameter_type=_parameter_type
+                argument_value=argument_value,
+                parameter_type=_parameter_type,
+                argument_index=idx
             )
 
             children_nodes.append(new_node)
@@ -54,28 +54,22 @@ class FUNC_DEF(Node):
         self.statements = statements
 
     @override
-    def get_certificate_label(self) -> list[str]:
+    def get_certificate_label_parts(self) -> list[Node]:
         """
-        Get the contents of `certificate_label`.
+        Get the certificate label of this `FUNC_DEF`, with its children in the
+        place of their labels.
 
-        For `FUNC_DEF` nodes, obtain the certificates, recursively, starting
-        from the `statements` attribute (i.e., a `SEQ` node). The
-        `FUNC_DEF` node itself does not have a certificate.
+        For `FUNC_DEF` nodes, the certificates of the `parameters` come first,
+        and then the ones of the `statements` attribute (i.e., a `SEQ` node).
+        The `FUNC_DEF` node itself does not have a certificate.
 
         Returns
         -------
-        certificate : list of str
-            A list containing the certificate label of this `FUNC_DEF`.
+        : list of Node
+            The parameters and the statements of this `FUNC_DEF`.
         """
 
-        certificate: list[str] = []
-
-        for parameter in self.parameters:
-            certificate.extend(parameter.get_certificate_label())
-
-        certificate.extend(self.statements.get_certificate_label())
-
-        return certificate
+        return [*self.parameters, self.statements]
 
     @override
     def print(self, indent: int = 0) -> None:
@@ -207,10 +201,17 @@ class FUNC_DEF(Node):
 
         variables: list[PARAM] = []
 
-        for parameter_name, parameter_metadata in parameters.items():
+        for parameter_index, (parameter_name, parameter_metadata) in enumerate(
+            parameters.items()
+        ):
             variable_metadata = {"name": parameter_name, **parameter_metadata}
 
-            variables.append(PARAM(variable_metadata=variable_metadata))
+            variables.append(
+                PARAM(
+                    variable_metadata=variable_metadata,
+                    parameter_index=parameter_index
+                )
+            )
 
         return variables
 
@@ -20,12 +20,16 @@ class PARAM(VAR_DEF):
     ----------
     variable_metadata : dict
         Dictionary of parameter metadata exported by the Lexer.
+    parameter_index : int
+        The position of this parameter in the function definition.
     """
 
     @override
-    def __init__(self, variable_metadata: dict) -> None:
+    def __init__(self, variable_metadata: dict, parameter_index: int) -> None:
         super().__init__(variable_metadata)
 
+        self.parameter_index: int = parameter_index
+
     @override
     def generate_code(
         self, register: int, environment: dict[str, dict[int, str]]
@@ -82,7 +86,11 @@ class PARAM(VAR_DEF):
         _store_instruction = "STOREF" if self.type == "float" else "STORE"
         parameter_store_code = {
             "instruction": _store_instruction,
-            "metadata": {"register": register, "value": "arg"},
+            "metadata": {
+                "register": register,
+                "value": "arg",
+                "argument": self.parameter_index,
+            },
         }
         code.append(parameter_store_code)
 
@@ -125,6 +133,6 @@ class PARAM(VAR_DEF):
         certificator_env[self.id]["active"] = True
 
         _type_symbol = TYPE_SYMBOLS_MAP[self.type]['type_symbol']
-        self.certificate_label = [f"({self.symbol})^({_type_symbol})"]
+        self.certificate_label = [(int(self.symbol), _type_symbol)]
 
         return certificator_env
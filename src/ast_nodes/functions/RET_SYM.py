@@ -151,11 +151,21 @@ class RET_SYM(Node):
         """
 
         certificator_env = self.returned_value.certificate(certificator_env)
-        _returned_value_certificate = self.returned_value.get_certificate_label()
 
-        self.certificate_label = [
-            *_returned_value_certificate,
-            f"{self.symbol}"
-        ]
+        self.certificate_label = [(int(self.symbol),)]
 
         return certificator_env
+
+    @override
+    def get_certificate_label_parts(self) -> list[Union[Node, tuple]]:
+        """
+        Get the certificate label of this `RET_SYM`, with its children in the
+        place of their labels.
+
+        Returns
+        -------
+        : list of Union[Node, tuple]
+            The `returned_value`, and the label elements of this `RET_SYM`.
+        """
+
+        return [self.returned_value, *self.certificate_label]
@@ -1,7 +1,8 @@
 """Base class for AST Nodes classes (e.g., VAR, CST etc.)."""
 
-from typing import Union
+from typing import Iterator, Union
 
+from src.ast_nodes.variable_prime_label import VariablePrimeLabel
 from src.utils import get_certificate_symbol
 
 
@@ -28,7 +29,7 @@ class Node:
     ) -> None:
         self.value: Union[int, str, float, None] = value
         self.type: Union[str, None] = type
-        self.certificate_label: list[str] = []
+        self.certificate_label: list[Union[tuple, VariablePrimeLabel]] = []
         self.uses_register: bool = uses_register
 
         # Each `Node` specialization must set its own `instruction` and
@@ -106,24 +107,73 @@ class Node:
 
         return self.type
 
-    def get_certificate_label(self) -> list[str]:
+    def get_certificate_label(self) -> list[Union[tuple, VariablePrimeLabel]]:
         """
-        Get the contents of `certificate_label`.
+        Get the certificate label of the subtree rooted at this `Node`.
 
         Returns
         -------
-        : list of str
+        : list of Union[tuple, VariablePrimeLabel]
             A list containing the certificate label of the `Node`.
 
         Notes
         -----
-        This method returns a list, rather than the string itself, in order to
-        allow returning multiple labels when nodes have children. Thus,
-        subclasses should return a composition of lists.
+        This method returns a list, rather than a single exponent, in order to
+        allow returning multiple labels when nodes have children. It is a
+        shorthand for collecting `iter_certificate_label`.
+        """
+
+        return list(self.iter_certificate_label())
+
+    def get_certificate_label_parts(
+        self
+    ) -> list[Union["Node", tuple, VariablePrimeLabel, None]]:
+        """
+        Get the certificate label of this `Node`, with its children in the
+        place of their labels.
+
+        Nodes with children must override this method to tell where the
+        labels of the children go, relative to their own `certificate_label`.
+
+        Returns
+        -------
+        : list of Union[Node, tuple, VariablePrimeLabel, None]
+            The label elements of this `Node`, and its children.
         """
 
         return self.certificate_label
 
+    def iter_certificate_label(self) -> Iterator[Union[tuple, VariablePrimeLabel]]:
+        """
+        Iterate over the certificate label of the subtree rooted at this
+        `Node`.
+
+        The subtree is traversed with an explicit stack, expanding the parts of
+        each node (see `get_certificate_label_parts`) as they are reached. So,
+        each label element is yielded straight from the node that holds it,
+        without building intermediate lists, whatever the depth of the tree.
+        Missing labels (i.e., `None`) are skipped.
+
+        Returns
+        -------
+        : Iterator[Union[tuple, VariablePrimeLabel]]
+            An iterator over the label elements, in order.
+        """
+
+        stack: list[Iterator] = [iter(self.get_certificate_label_parts())]
+
+        while stack:
+            for part in stack[-1]:
+                if isinstance(part, Node):
+                    stack.append(iter(part.get_certificate_label_parts()))
+                    break
+
+                if part is not None:
+                    yield part
+
+            else:
+                stack.pop()
+
     def print(self, indent: int = 0) -> None:
         """
         Print the string representation of `self`.
@@ -218,6 +268,6 @@ class Node:
             information about the variable's types it might have captured.
         """
 
-        self.certificate_label = [f"{self.symbol}"]
+        self.certificate_label = [(int(self.symbol),)]
 
         return certificator_env
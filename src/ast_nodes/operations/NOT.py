@@ -126,11 +126,21 @@ class NOT(Node):
 
         # Certificate the negated `expression`
         certificator_env = self.expression.certificate(certificator_env)
-        expression_certificate_label = self.expression.get_certificate_label()
 
-        self.certificate_label = [
-            *expression_certificate_label,
-            f"{self.symbol}",
-        ]
+        self.certificate_label = [(int(self.symbol),)]
 
         return certificator_env
+
+    @override
+    def get_certificate_label_parts(self) -> list[Union[Node, tuple]]:
+        """
+        Get the certificate label of this `NOT`, with its children in the
+        place of their labels.
+
+        Returns
+        -------
+        : list of Union[Node, tuple]
+            The negated `expression`, and the label elements of this `NOT`.
+        """
+
+        return [self.expression, *self.certificate_label]
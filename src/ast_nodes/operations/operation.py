@@ -176,21 +176,27 @@ class Operation(Node):
         """
 
         certificator_env = self.lhs.certificate(certificator_env)
-        lhs_certificate_label = self.lhs.get_certificate_label()
-
         certificator_env = self.rhs.certificate(certificator_env)
-        rhs_certificate_label = self.rhs.get_certificate_label()
-
-        operation_certificate_label = f"{self.symbol}"
 
-        self.certificate_label = [
-            *lhs_certificate_label,
-            *rhs_certificate_label,
-            operation_certificate_label,
-        ]
+        self.certificate_label = [(int(self.symbol),)]
 
         return certificator_env
 
+    @override
+    def get_certificate_label_parts(self) -> list[Union[Node, tuple]]:
+        """
+        Get the certificate label of this `Operation`, with its children in the
+        place of their labels.
+
+        Returns
+        -------
+        : list of Union[Node, tuple]
+            The `lhs` and `rhs` children, and the label elements of this
+            `Operation`.
+        """
+
+        return [self.lhs, self.rhs, *self.certificate_label]
+
     def _compute_operation_type(self) -> str:
         """
         Compute the type this `Operation` will return.
@@ -0,0 +1,89 @@
+"""Implement certificate labels that refer to the primes of variables."""
+
+from typing import Union
+
+
+class VariablePrimeLabel:
+    """
+    Element of a certificate label that refers to the primes of variables.
+
+    The primes of the variables are only assigned after the whole AST is
+    certificated (as only the variables that are actually used get a prime),
+    so labels of variable uses keep symbolic slots -- i.e., the IDs of the
+    variables -- among the elements of their exponents, and are resolved
+    later on.
+
+    Parameters
+    ----------
+    elements : Union[int, float]
+        The elements of the exponent, in order. The elements at the `slots`
+        positions are the IDs of the variables whose primes fill them, and the
+        others are literal.
+    slots : tuple[int, ...], optional (default = ())
+        The positions of the slots in `elements`.
+    """
+
+    def __init__(
+        self,
+        *elements: Union[int, float],
+        slots: tuple[int, ...] = ()
+    ) -> None:
+        self.elements: tuple[Union[int, float], ...] = elements
+        self.slots: tuple[int, ...] = tuple(slots)
+
+    def resolve(self, variables: dict[int, dict]) -> tuple[Union[int, float], ...]:
+        """
+        Fill the slots of this label with the primes of the variables.
+
+        Parameters
+        ----------
+        variables : dict[int, dict]
+            Maps the ID of each variable to its data (e.g., its `prime`).
+
+        Returns
+        -------
+        : tuple[Union[int, float], ...]
+            The exponent, with the primes of the variables.
+        """
+
+        return tuple(
+            variables[element]["prime"] if position in self.slots else element
+            for position, element in enumerate(self.elements)
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Implement the equality comparison between VariablePrimeLabel instances.
+
+        Parameters
+        ----------
+        other : object
+            The right hand side of the comparison.
+
+        Returns
+        -------
+        : bool
+            `True` if both labels have the same elements and slots, `False`
+            otherwise.
+        """
+
+        if not isinstance(other, VariablePrimeLabel):
+            return NotImplemented
+
+        return self.elements == other.elements and self.slots == other.slots
+
+    def __repr__(self) -> str:
+        """
+        Implement the representation of a VariablePrimeLabel, with a
+        placeholder in each slot.
+
+        Returns
+        -------
+        : str
+            The representation of this VariablePrimeLabel.
+        """
+
+        return "^".join(
+            f"(VAR_{element}_PRIME)" if position in self.slots else f"({element})"
+            for position, element in enumerate(self.elements)
+        )
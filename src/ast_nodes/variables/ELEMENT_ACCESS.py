@@ -5,6 +5,7 @@ from typing import Union
 from typing_extensions import override
 
 from src.ast_nodes.node import Node
+from src.ast_nodes.variable_prime_label import VariablePrimeLabel
 from src.ast_nodes.variables.VAR import VAR
 from src.ast_nodes.basic.CST import CST
 from src.utils import (
@@ -250,19 +251,23 @@ class ELEMENT_ACCESS(Node):
             information about the variable's types it might have captured.
         """
 
-        certificate_label = f"({self.symbol})"
+        # The primes of the variables are only known later on, so they are
+        # left as slots
+        label_elements: list[int] = [int(self.symbol)]
+        label_slots: list[int] = []
 
         # Add the prime of the variable being accessed
         self.variable.certificate(certificator_env)
         variable_id = self.variable.get_id()
-        certificate_label += f"^(VAR_{variable_id}_PRIME_PLACEHOLDER)"
+        label_slots.append(len(label_elements))
+        label_elements.append(variable_id)
         certificator_env[variable_id]["active"] = True
 
         # Static access (i.e., indexing an array with a variable, or accessing
         # a struct attribute)
         if isinstance(self.element, CST):
             offset_size = self.element.get_value()
-            certificate_label += f"^(2)^({offset_size + 1})"
+            label_elements.extend([2, offset_size + 1])
 
             # Update the environment with the symbol of the accessed element's
             # type
@@ -274,7 +279,8 @@ class ELEMENT_ACCESS(Node):
         else:
             indexing_variable_id = self.element.get_id()
             certificator_env[indexing_variable_id]["active"] = True
-            certificate_label += f"^(3)^(VAR_{indexing_variable_id}_PRIME_PLACEHOLDER)"
+            label_slots.append(len(label_elements) + 1)
+            label_elements.extend([3, indexing_variable_id])
 
             # Update the environment to tell all the elements of this variable
             # have the same type symbol
@@ -285,7 +291,9 @@ class ELEMENT_ACCESS(Node):
             ]
             
 
-        self.certificate_label = [f"{certificate_label}"]
+        self.certificate_label = [
+            VariablePrimeLabel(*label_elements, slots=tuple(label_slots))
+        ]
 
         return certificator_env
 
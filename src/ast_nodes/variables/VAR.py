@@ -5,6 +5,7 @@ from typing import Union
 from typing_extensions import override
 
 from src.ast_nodes.node import Node
+from src.ast_nodes.variable_prime_label import VariablePrimeLabel
 from src.utils import get_certificate_symbol, type_cast
 
 
@@ -144,7 +145,7 @@ class VAR(Node):
             information about the variable's types it might have captured.
         """
 
-        self.certificate_label = [f"{self.symbol}"]
+        self.certificate_label = [self.symbol]
 
         # Only update the `type` for "simple" variables (`ELEMENT_ACCESS`
         # will do this for arrays/structs)
@@ -196,6 +197,8 @@ class VAR(Node):
 
         # Add ^1 because it means memory offset + 1. As this is a regular
         # variable – and not an array nor struct –, the offset is always 0.
-        self.symbol: str = (
-            f"({symbol})" + f"^(VAR_{self.id}_PRIME_PLACEHOLDER)" + "^(2)" + "^(1)"
+        # The prime of the variable is only known later on, so it is left as
+        # a slot
+        self.symbol: VariablePrimeLabel = VariablePrimeLabel(
+            int(symbol), self.id, 2, 1, slots=(1,)
         )
@@ -94,12 +94,12 @@ class VAR_DEF(Node):
         variable_count = len(environment["variables"])
 
         if not variable_count:
-            new_var_address = hex(0)
+            new_var_address = 0
         else:
             last_var_id = list(environment["variables"]).pop()
             last_var_address = environment["variables"][last_var_id]["address"]
             last_var_size = environment["variables"][last_var_id]["size"]
-            new_var_address = hex(int(last_var_address, 16) + last_var_size)
+            new_var_address = last_var_address + last_var_size
 
         var_id = self.value
         environment["variables"][var_id] = {
@@ -0,0 +1,483 @@
+"""Implement a runner that benchmarks each stage of the pipeline."""
+
+import gc
+import glob
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Union
+
+from src.abstract_syntax_tree import AbstractSyntaxTree
+from src.certificators import BackendCertificator, FrontendCertificator
+from src.code_generator import CodeGenerator
+from src.lexer import Lexer
+from src.virtual_machine import VirtualMachine
+
+
+# The directory with the benchmark programs (i.e., `benchmarks/*.ch`)
+BENCHMARKS_DIRECTORY: str = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "benchmarks"
+)
+
+
+class BenchmarkRunner:
+    """
+    Benchmark each stage of the pipeline over a set of programs.
+
+    Each program is run from scratch (i.e., lexed, parsed, compiled,
+    certificated and executed) `warmup` times, whose timings are discarded,
+    and then `repeats` times, whose timings are summarized by their median and
+    spread. The stages are timed separately:
+
+    - `lexer`: tokenizing and parsing the source code (`Lexer`);
+    - `parser`: building the Abstract Syntax Tree;
+    - `code_generator`: generating (and optimizing) the code;
+    - `frontend_certificator`: certificating the AST;
+    - `backend_certificator`: certificating the generated code;
+    - `virtual_machine`: running the generated code.
+
+    Parameters
+    ----------
+    benchmarks : dict[str, str]
+        Maps the name of each benchmark to its source code.
+    optimization_level : int, optional (default = 0)
+        The optimization level of the generated code.
+    repeats : int, optional (default = 5)
+        The amount of timed runs of each benchmark.
+    warmup : int, optional (default = 1)
+        The amount of untimed runs of each benchmark, before the timed ones.
+    """
+
+    STAGES: list[str] = [
+        "lexer",
+        "parser",
+        "code_generator",
+        "frontend_certificator",
+        "backend_certificator",
+        "virtual_machine",
+    ]
+
+    def __init__(
+        self,
+        benchmarks: dict[str, str],
+        optimization_level: int = 0,
+        repeats: int = 5,
+        warmup: int = 1
+    ) -> None:
+        if repeats < 1:
+            raise ValueError("At least one timed run is required.")
+
+        self.benchmarks: dict[str, str] = benchmarks
+        self.optimization_level: int = optimization_level
+        self.repeats: int = repeats
+        self.warmup: int = warmup
+
+    @classmethod
+    def from_directory(
+        cls, directory: str = BENCHMARKS_DIRECTORY, **kwargs
+    ) -> "BenchmarkRunner":
+        """
+        Create a runner for the `.ch` programs in a directory.
+
+        Parameters
+        ----------
+        directory : str, optional (default = BENCHMARKS_DIRECTORY)
+            The directory with the programs.
+        **kwargs
+            The other parameters of the runner.
+
+        Returns
+        -------
+        : BenchmarkRunner
+            The runner.
+        """
+
+        benchmarks: dict[str, str] = {}
+
+        for path in sorted(glob.glob(os.path.join(directory, "*.ch"))):
+            with open(path, "r") as source_file:
+                benchmarks[os.path.basename(path)] = source_file.read()
+
+        return cls(benchmarks=benchmarks, **kwargs)
+
+    def run(self) -> dict[str, Union[dict, str]]:
+        """
+        Run every benchmark.
+
+        Returns
+        -------
+        results : dict[str, Union[dict, str]]
+            The metadata of the run (`metadata`), and the results of each
+            benchmark (`benchmarks`). The results map each stage to the
+            summary of its timings (see `summarize`), or hold the `error` that
+            interrupted the benchmark.
+        """
+
+        results: dict[str, Union[dict, str]] = {
+            "metadata": self.get_metadata(),
+            "benchmarks": {},
+        }
+
+        for name, source_code in self.benchmarks.items():
+            results["benchmarks"][name] = self.run_benchmark(source_code)
+
+        return results
+
+    def run_benchmark(self, source_code: str) -> dict[str, Union[dict, bool, str]]:
+        """
+        Run a single benchmark: its warmup runs, and then its timed runs.
+
+        Parameters
+        ----------
+        source_code : str
+            The source code of the benchmark.
+
+        Returns
+        -------
+        result : dict[str, Union[dict, bool, str]]
+            Maps each stage to the summary of its timings, and
+            `certificates_match` to whether the certificates match. If some
+            stage fails, only holds the `error`.
+        """
+
+        samples: dict[str, list[float]] = {stage: [] for stage in self.STAGES}
+        certificates_match = False
+
+        try:
+            for run_idx in range(self.warmup + self.repeats):
+                timings, certificates_match = self.run_stages(source_code)
+
+                if run_idx < self.warmup:
+                    continue
+
+                for stage, timing in timings.items():
+                    samples[stage].append(timing)
+
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+
+        return {
+            **{stage: self.summarize(samples[stage]) for stage in self.STAGES},
+            "certificates_match": certificates_match,
+        }
+
+    def run_stages(self, source_code: str) -> tuple[dict[str, float], bool]:
+        """
+        Run every stage of the pipeline once, from scratch, and time them.
+
+        Parameters
+        ----------
+        source_code : str
+            The source code of the program.
+
+        Returns
+        -------
+        timings : dict[str, float]
+            Maps each stage to its duration, in seconds.
+        certificates_match : bool
+            Whether the frontend and the backend certificates match.
+        """
+
+        timings: dict[str, float] = {}
+        stages, state = self._get_stages(source_code)
+
+        # Do not let the garbage of a run be collected during the next one
+        gc.collect()
+
+        for stage, run_stage in stages.items():
+            start = time.perf_counter()
+            run_stage()
+            timings[stage] = time.perf_counter() - start
+
+        return timings, state["frontend_certificate"] == state["backend_certificate"]
+
+    def measure_memory(self, source_code: str) -> dict[str, int]:
+        """
+        Run every stage of the pipeline once, from scratch, and measure the
+        memory they allocate.
+
+        Memory is traced with `tracemalloc`, which slows the stages down, so
+        it is measured apart from the timings.
+
+        Parameters
+        ----------
+        source_code : str
+            The source code of the program.
+
+        Returns
+        -------
+        peaks : dict[str, int]
+            Maps each stage to its peak memory usage, in bytes, on top of the
+            memory in use when it starts.
+        """
+
+        peaks: dict[str, int] = {}
+        stages, _ = self._get_stages(source_code)
+
+        gc.collect()
+        tracemalloc.start()
+
+        try:
+            for stage, run_stage in stages.items():
+                tracemalloc.reset_peak()
+                start_memory, _ = tracemalloc.get_traced_memory()
+
+                run_stage()
+
+                _, peak_memory = tracemalloc.get_traced_memory()
+                peaks[stage] = peak_memory - start_memory
+
+        finally:
+            tracemalloc.stop()
+
+        return peaks
+
+    def _get_stages(
+        self, source_code: str
+    ) -> tuple[dict[str, Callable[[], None]], dict[str, Any]]:
+        """
+        Get the stages of the pipeline for a program, to be run in order.
+
+        Parameters
+        ----------
+        source_code : str
+            The source code of the program.
+
+        Returns
+        -------
+        stages : dict[str, Callable[[], None]]
+            Maps each stage to a function that runs it.
+        state : dict[str, Any]
+            The outputs of the stages, filled as they run.
+        """
+
+        state: dict[str, Any] = {}
+
+        def lexer() -> None:
+            state["parsed_source"] = Lexer(source_code=source_code).parse_source_code()
+
+        def parser() -> None:
+            state["ast"] = AbstractSyntaxTree(source_code=state["parsed_source"])
+            state["ast"].build()
+
+        def code_generator() -> None:
+            state["program"] = CodeGenerator(
+                root=state["ast"].get_root(),
+                optimization_level=self.optimization_level
+            ).generate_code()
+
+        def frontend_certificator() -> None:
+            state["frontend_certificate"] = FrontendCertificator(
+                ast=state["ast"]
+            ).certificate()
+
+        def backend_certificator() -> None:
+            state["backend_certificate"] = BackendCertificator(
+                program=state["program"]
+            ).certificate()
+
+        def virtual_machine() -> None:
+            VirtualMachine(
+                program=state["program"],
+                memory_size=self.get_memory_size(state["program"])
+            ).run()
+
+        stages: dict[str, Callable[[], None]] = {
+            "lexer": lexer,
+            "parser": parser,
+            "code_generator": code_generator,
+            "frontend_certificator": frontend_certificator,
+            "backend_certificator": backend_certificator,
+            "virtual_machine": virtual_machine,
+        }
+
+        return stages, state
+
+    @staticmethod
+    def get_memory_size(program: dict[str, dict], min_size: int = 1024) -> int:
+        """
+        Get the memory size a program needs (i.e., the end of its variable
+        with the highest address), so large programs fit the memory.
+
+        Parameters
+        ----------
+        program : dict[str, dict]
+            The program.
+        min_size : int, optional (default = 1024)
+            The minimum memory size.
+
+        Returns
+        -------
+        : int
+            The memory size, in bytes.
+        """
+
+        return max(
+            [min_size, *(address + size for address, size in program["data"].items())]
+        )
+
+    @staticmethod
+    def summarize(samples: list[float]) -> dict[str, Union[float, int]]:
+        """
+        Summarize the timings of a stage.
+
+        Parameters
+        ----------
+        samples : list[float]
+            The timings, in seconds.
+
+        Returns
+        -------
+        : dict[str, Union[float, int]]
+            The `median`, `mean`, `min` and `max` of the timings, their
+            standard deviation (`stdev`) and interquartile range (`iqr`), and
+            the amount of `samples`.
+        """
+
+        if len(samples) > 1:
+            first_quartile, _, third_quartile = statistics.quantiles(samples, n=4)
+            stdev = statistics.stdev(samples)
+        else:
+            first_quartile, third_quartile, stdev = 0.0, 0.0, 0.0
+
+        return {
+            "median": statistics.median(samples),
+            "mean": statistics.mean(samples),
+            "min": min(samples),
+            "max": max(samples),
+            "stdev": stdev,
+            "iqr": third_quartile - first_quartile,
+            "samples": len(samples),
+        }
+
+    def get_metadata(self) -> dict[str, Union[str, int, None]]:
+        """
+        Get the metadata of a run (i.e., its parameters and environment).
+
+        Returns
+        -------
+        : dict[str, Union[str, int, None]]
+            The metadata.
+        """
+
+        try:
+            commit = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                capture_output=True,
+                text=True,
+                check=True
+            ).stdout.strip()
+
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+
+        return {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": commit,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "optimization_level": self.optimization_level,
+            "repeats": self.repeats,
+            "warmup": self.warmup,
+        }
+
+    @staticmethod
+    def save(results: dict[str, Union[dict, str]], path: str) -> None:
+        """
+        Save the results of a run as JSON.
+
+        Parameters
+        ----------
+        results : dict[str, Union[dict, str]]
+            The results (see `run`).
+        path : str
+            The path of the JSON file.
+        """
+
+        with open(path, "w") as results_file:
+            json.dump(results, results_file, indent=2)
+
+    @staticmethod
+    def load(path: str) -> dict[str, Union[dict, str]]:
+        """
+        Load the results of a run from JSON.
+
+        Parameters
+        ----------
+        path : str
+            The path of the JSON file.
+
+        Returns
+        -------
+        : dict[str, Union[dict, str]]
+            The results (see `run`).
+        """
+
+        with open(path, "r") as results_file:
+            return json.load(results_file)
+
+    @classmethod
+    def compare(
+        cls,
+        baseline: dict[str, Union[dict, str]],
+        results: dict[str, Union[dict, str]],
+        threshold: float = 0.1
+    ) -> list[dict[str, Union[str, float]]]:
+        """
+        Find the regressions between two runs.
+
+        A stage of a benchmark regresses if its median grows by more than
+        `threshold` (relative to the baseline), and the growth is larger than
+        the spread (i.e., the interquartile ranges) of both runs.
+
+        Parameters
+        ----------
+        baseline : dict[str, Union[dict, str]]
+            The results of the baseline run (see `run`).
+        results : dict[str, Union[dict, str]]
+            The results of the run to compare.
+        threshold : float, optional (default = 0.1)
+            The relative growth of the medians tolerated.
+
+        Returns
+        -------
+        regressions : list[dict[str, Union[str, float]]]
+            The `benchmark`, `stage`, `baseline` and current `median`, and
+            `ratio` between them, of each regression.
+        """
+
+        regressions: list[dict[str, Union[str, float]]] = []
+
+        for name, result in results["benchmarks"].items():
+            baseline_result = baseline["benchmarks"].get(name)
+
+            if baseline_result is None or "error" in baseline_result or "error" in result:
+                continue
+
+            for stage in cls.STAGES:
+                baseline_median = baseline_result[stage]["median"]
+                median = result[stage]["median"]
+                spread = baseline_result[stage]["iqr"] + result[stage]["iqr"]
+
+                is_regression = (
+                    median > baseline_median * (1 + threshold)
+                    and median - baseline_median > spread
+                )
+
+                if is_regression:
+                    regressions.append({
+                        "benchmark": name,
+                        "stage": stage,
+                        "baseline": baseline_median,
+                        "median": median,
+                        "ratio": median / baseline_median if baseline_median else float("inf"),
+                    })
+
+        return regressions
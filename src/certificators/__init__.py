@@ -1,4 +1,5 @@
 """Export classes to allow `from src.certificators import ...`."""
 
 from .backend import BackendCertificator
+from .certificate import Certificate
 from .frontend import FrontendCertificator
@@ -1,15 +1,33 @@
 """Base class for Certificator classes (i.e., back and frontends)."""
 
 from abc import abstractmethod
+from typing import Iterable, Union
+
+from src.certificators.certificate import Certificate
 
 
 class AbstractCertificator:
-    """Base class for certificator classes."""
+    """
+    Base class for certificator classes.
+
+    Besides the certificate of the whole program, certificators compute
+    modular certificates: one per function, plus the ones of the definitions
+    of the variables and of the end of the program. `compose` combines them
+    into the certificate of the program, so functions can be certificated
+    independently (e.g., in parallel), and the certificates of unchanged
+    functions can be reused. The modular certificates refer to the primes of
+    the variables of the whole program, so they are only reusable as long as
+    these primes do not change.
+    """
 
     def __init__(self, **kwargs) -> None:
-        self.computed_certificate: list[str] = []
+        self.computed_certificate: Certificate = Certificate()
         self.current_prime: int = 2
 
+        # The names of the functions of the program, in the order they are
+        # defined
+        self.function_names: list[str] = []
+
         # The environment maps variables primes to symbols that represents their
         # associated types. `int x[2]` will be mapped to [3, 3], and
         # `struct { int x; float y; }` will be mapped to [3, 5]. (3 represents
@@ -17,8 +35,92 @@ class AbstractCertificator:
         self.environment: dict[int, int] = {}
 
     @abstractmethod
-    def certificate(self, **kwargs) -> str:
+    def certificate(self, **kwargs) -> Certificate:
+        pass
+
+    def certificate_functions(
+        self, functions: Union[Iterable[str], None] = None
+    ) -> dict[str, Certificate]:
+        """
+        Compute the modular certificates of some functions.
+
+        Parameters
+        ----------
+        functions : Iterable[str] or None, optional (default = None)
+            The names of the functions to certificate. If `None`, every
+            function is certificated.
+
+        Returns
+        -------
+        : dict[str, Certificate]
+            Maps the name of each function to its certificate.
+        """
+
+        if functions is None:
+            functions = self.function_names
+
+        return {
+            function_name: self._certificate_function(function_name)
+            for function_name in functions
+        }
+
+    def compose(self, function_certificates: dict[str, Certificate]) -> Certificate:
+        """
+        Compose the certificate of the program from the modular certificates
+        of its functions.
+
+        The certificates of the definitions of the variables come first, then
+        the ones of the functions (in the order they are defined), and then
+        the one of the end of the program.
+
+        Parameters
+        ----------
+        function_certificates : dict[str, Certificate]
+            Maps the name of each function to its certificate (e.g., as
+            computed by `certificate_functions`).
+
+        Returns
+        -------
+        : Certificate
+            The certificate of the program.
+
+        Raises
+        ------
+        ValueError
+            Raised if the certificate of some function is missing.
+        """
+
+        missing_functions = [
+            function_name
+            for function_name in self.function_names
+            if function_name not in function_certificates
+        ]
+
+        if missing_functions:
+            raise ValueError(
+                f"Missing certificates of the functions: {missing_functions}."
+            )
+
+        return Certificate.compose([
+            self._certificate_var_defs(),
+            *(
+                function_certificates[function_name]
+                for function_name in self.function_names
+            ),
+            self._certificate_program_end(),
+        ])
+
+    @abstractmethod
+    def _certificate_function(self, function_name: str) -> Certificate:
+        pass
+
+    @abstractmethod
+    def _certificate_var_defs(self) -> Certificate:
+        pass
+
+    @abstractmethod
+    def _certificate_program_end(self) -> Certificate:
         pass
 
-    def get_certificate(self) -> str:
+    def get_certificate(self) -> Certificate:
         return self.computed_certificate
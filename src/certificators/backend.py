@@ -1,14 +1,16 @@
 """Certificator for the frontend representation of [C]haron programs."""
 
-from copy import deepcopy
+from bisect import bisect_left, bisect_right
 from typing import Union
 
 from typing_extensions import override
 
 from src.certificators.abstract_certificator import AbstractCertificator
+from src.certificators.certificate import Certificate, Exponent
+from src.prime_provider import SHARED_PRIME_PROVIDER
+from src.register_allocator import RegisterAllocator
 from src.utils import (
     get_certificate_symbol,
-    primes_list,
     INSTRUCTIONS_CATEGORIES,
     TYPE_SYMBOLS_MAP
 )
@@ -22,18 +24,68 @@ class BackendCertificator(AbstractCertificator):
     ----------
     program : dict[str, dict]
         A dictionary with bytecodes and struct metadata generated from some
-        Abstract Syntax Tree representation of a program.
+        Abstract Syntax Tree representation of a program. It is not modified
+        (the state of the certification is kept apart from it), so it can be
+        shared with the virtual machine and other certificators.
     """
 
+    # Types of the variables accessed by fused instructions
+    ABSOLUTE_ACCESS_TYPES = {
+        "LOADA": "int",
+        "LOADFA": "float",
+        "LOADSA": "short",
+        "STOREA": "int",
+        "STOREFA": "float",
+    }
+
+    # Instructions that might be hoisted out of loops (i.e., that compute
+    # values without side effects), the ones among them that fail if their
+    # right hand side is zero, and the ones whose chains might be
+    # reassociated (see `LoopInvariantCodeMotion`)
+    HOISTABLE_INSTRUCTIONS = [
+        "CONSTANT",
+        "LOADA",
+        "LOADFA",
+        "LOADSA",
+        "NOT",
+        *INSTRUCTIONS_CATEGORIES["binops"],
+        *INSTRUCTIONS_CATEGORIES["type_casts"],
+    ]
+    DIVISIONS = ["DIV", "FDIV", "MOD"]
+    ASSOCIATIVE_INSTRUCTIONS = ["ADD", "MULT"]
+
     def __init__(self, program: dict[str, dict]) -> None:
         super().__init__()
 
         # Input
-        self.program = deepcopy(program)
+        self.program = program
         self.bytecode_list = self.program["code"]
 
         self.register_to_bytecode_dependencies = {}
 
+        # Def-use index of the registers, computed once. Maps each register to
+        # the (sorted) indices of the bytecodes that write to it, and the index
+        # of each of these bytecodes to the indices of the bytecodes that read
+        # the value it writes (i.e., until the register is written again)
+        self.register_definitions: dict[int, list[int]] = {}
+        self.definition_uses: dict[int, list[int]] = {}
+
+        # Indices of the jumps that skip the right hand side of logical
+        # operations (i.e., short-circuits), that do not implement conditionals
+        self.short_circuit_jumps: set[int] = set()
+        self.conditionals_insertion_indices: list[int] = []
+        self.absolute_stores_insertion_indices: list[tuple[int, dict[str, dict]]] = []
+
+        # Expressions hoisted out of loops. Maps the index of the `MOV` that
+        # replaced each expression in the loop to the (start, end) indices of
+        # the hoisted code
+        self.hoisted_code: dict[int, tuple[int, int]] = {}
+        self.hoisted_bytecodes_indices: set[int] = set()
+
+        # Sorted base addresses of the variables, to find which variable an
+        # absolute address (from fused instructions, such as `LOADA`) belongs to
+        self.variables_base_addresses: list[int] = sorted(self.program["data"])
+
         self.environment = {
             "functions": {},
             "variables": {},
@@ -48,12 +100,22 @@ class BackendCertificator(AbstractCertificator):
             for bytecode in self.bytecode_list
         }
 
+        # The functions of the program, and the certificates of the ranges of
+        # the code computed so far. Maps the (start, end) indices of each
+        # range to its certificate
+        self.function_names = list(self.program["functions"])
+        self.code_range_certificates: dict[tuple[int, int], Certificate] = {}
+
         # Compute the primes associated with the defined functions, and the
         # primes and identify the types of variables.
+        self._compute_def_use_index()
+        self._preprocess_short_circuits()
         self._compute_register_to_bytecode_dependencies()
         self._preprocess_conditionals()
         self._preprocess_functions()
         self._preprocess_variables()
+        self._preprocess_absolute_stores()
+        self._preprocess_hoisted_code()
 
         self.bytecode_handlers = {
             # Instructions that might implement more than 1 operation, or
@@ -62,6 +124,9 @@ class BackendCertificator(AbstractCertificator):
             "MOV": self._handle_mov,
             "JAL": self._handle_function_call,
             "JZ": self._handle_control_flow,
+            "LOADA": self._handle_absolute_load,
+            "LOADFA": self._handle_absolute_load,
+            "LOADSA": self._handle_absolute_load,
 
             # 1:1 instructions
             **{
@@ -78,6 +143,75 @@ class BackendCertificator(AbstractCertificator):
             },
         }
 
+    def _compute_def_use_index(self) -> None:
+        """
+        Compute the def-use index of the (general purpose) registers.
+
+        The bytecodes are visited in order, so each read of a register is
+        bound to its latest write before it -- the same way the preprocessing
+        steps and handlers look for definitions and uses of registers, as
+        registers are reused after the register allocation.
+        """
+
+        # Maps each register to the index of the bytecode that last wrote to it
+        latest_definitions: dict[int, int] = {}
+
+        for bytecode_idx, bytecode in enumerate(self.bytecode_list):
+            definitions, uses = RegisterAllocator.get_definitions_and_uses(bytecode)
+
+            for register in {bytecode["metadata"][key] for key in uses}:
+                definition_idx = latest_definitions.get(register)
+
+                if definition_idx is not None:
+                    self.definition_uses[definition_idx].append(bytecode_idx)
+
+            for key in definitions:
+                register = bytecode["metadata"][key]
+
+                latest_definitions[register] = bytecode_idx
+                self.register_definitions.setdefault(register, []).append(bytecode_idx)
+                self.definition_uses[bytecode_idx] = []
+
+    def _get_uses(self, bytecode_idx: int, register: int) -> list[int]:
+        """
+        Get the bytecodes that read the value of a register, from some bytecode
+        on (i.e., until the register is written again).
+
+        Parameters
+        ----------
+        bytecode_idx : int
+            The index of the bytecode to start at. If it reads `register`, it is
+            included in the uses.
+        register : int
+            The register of interest.
+
+        Returns
+        -------
+        uses : list[int]
+            The indices of the bytecodes that read the value of `register`, in
+            ascending order.
+        """
+
+        uses: list[int] = []
+
+        bytecode = self.bytecode_list[bytecode_idx]
+        _, uses_keys = RegisterAllocator.get_definitions_and_uses(bytecode)
+
+        if any(bytecode["metadata"][key] == register for key in uses_keys):
+            uses.append(bytecode_idx)
+
+        definitions = self.register_definitions.get(register, [])
+        position = bisect_right(definitions, bytecode_idx) - 1
+
+        if position >= 0:
+            definition_uses = self.definition_uses[definitions[position]]
+
+            uses.extend(
+                definition_uses[bisect_right(definition_uses, bytecode_idx):]
+            )
+
+        return uses
+
     def _compute_register_to_bytecode_dependencies(self) -> None:
         """
         Compute the dependency relation between a register and bytecode IDs.
@@ -86,9 +220,70 @@ class BackendCertificator(AbstractCertificator):
         upon which it depends on. For example, if a register depends on a
         variable to be computed, it will be mapped to the bytecode ID of the
         `CONSTANT` instruction that first obtains the variable's base address.
+
+        As registers are reused, the dependencies of a register are overwritten
+        whenever it is redefined. Thus, the dependencies of the conditional
+        jumps and of the absolute stores (i.e., `STOREA` and `STOREFA`) are also
+        computed here, as the bytecodes are visited in order.
+
+        The value returned by a function call depends on its arguments, and on
+        the `JAL` bytecode itself.
         """
 
-        for bytecode in self.program["code"]:
+        arguments_dependencies: list[int] = []
+        function_call_dependencies: list[int] = []
+
+        for bytecode_idx, bytecode in enumerate(self.program["code"]):
+            is_conditional = (
+                bytecode["instruction"] == "JZ"
+                and bytecode["metadata"]["conditional_register"] != "zero"
+                and bytecode_idx not in self.short_circuit_jumps
+            )
+
+            if is_conditional:
+                register = bytecode["metadata"]["conditional_register"]
+                bytecode_ids_it_depends_on = self.register_to_bytecode_dependencies[register]
+                self.conditionals_insertion_indices.append(
+                    min(bytecode_ids_it_depends_on) - 1
+                )
+
+            # Absolute stores do not compute the address of the variable, so
+            # the certificate of the variable is placed right before the
+            # expression whose value is stored
+            if bytecode["instruction"] in ["STOREA", "STOREFA"]:
+                value_register = bytecode["metadata"]["value"]
+                bytecode_ids_it_depends_on = self.register_to_bytecode_dependencies[value_register]
+                self.absolute_stores_insertion_indices.append(
+                    (min(bytecode_ids_it_depends_on) - 1, bytecode)
+                )
+
+            if bytecode["instruction"] == "JAL":
+                function_call_dependencies = [
+                    *arguments_dependencies,
+                    bytecode["bytecode_id"]
+                ]
+                arguments_dependencies = []
+
+            is_argument = (
+                bytecode["instruction"] == "MOV"
+                and bytecode["metadata"]["register"] == "arg"
+                and isinstance(bytecode["metadata"]["value"], int)
+            )
+
+            if is_argument:
+                arguments_dependencies.extend(
+                    self.register_to_bytecode_dependencies[bytecode["metadata"]["value"]]
+                )
+
+            # Constant arguments might be written straight to `arg`
+            is_constant_argument = (
+                bytecode["instruction"] == "CONSTANT"
+                and bytecode["metadata"]["register"] == "arg"
+            )
+
+            if is_constant_argument:
+                arguments_dependencies.append(bytecode["bytecode_id"])
+
             # We don't care about bytecodes that do not write in a temporary
             # register
             if "register" not in bytecode["metadata"]:
@@ -104,7 +299,18 @@ class BackendCertificator(AbstractCertificator):
             instruction = bytecode["instruction"]
             bytecode_id = bytecode["bytecode_id"]
 
-            if instruction in ["CONSTANT", "MOV"]:
+            is_returned_value = (
+                instruction == "MOV"
+                and bytecode["metadata"]["value"] == "ret_value"
+            )
+
+            if is_returned_value:
+                self.register_to_bytecode_dependencies[register] = [
+                    *function_call_dependencies,
+                    bytecode_id
+                ]
+
+            elif instruction in ["CONSTANT", "MOV", "LOADA", "LOADFA", "LOADSA"]:
                 self.register_to_bytecode_dependencies[register] = [bytecode_id]
 
             elif instruction in INSTRUCTIONS_CATEGORIES["binops"]:
@@ -144,6 +350,87 @@ class BackendCertificator(AbstractCertificator):
                         bytecode_ids_value_depends_on
                     )
 
+    def _preprocess_short_circuits(self) -> None:
+        """
+        Find the jumps that skip the right hand side of logical operations.
+
+        The `ShortCircuitLowering` pass adds `JZ r_lhs` right before the right
+        hand side of an `AND` (or `FAND`), landing on the operation itself, and
+        `JZ r_lhs 2; JZ zero` right before the right hand side of an `OR` (or
+        `FOR`), with the unconditional jump landing on the operation. In both
+        cases, `r_lhs` is the left hand side of the operation.
+        """
+
+        for bytecode_idx, bytecode in enumerate(self.bytecode_list):
+            conditional_register = bytecode["metadata"].get("conditional_register")
+
+            if bytecode["instruction"] != "JZ" or conditional_register == "zero":
+                continue
+
+            target_idx = bytecode_idx + bytecode["metadata"]["jump_size"]
+
+            if self._is_logical_operation(
+                bytecode_idx=target_idx,
+                instructions=["AND", "FAND"],
+                lhs_register=conditional_register
+            ):
+                self.short_circuit_jumps.add(bytecode_idx)
+                continue
+
+            if bytecode["metadata"]["jump_size"] != 2:
+                continue
+
+            next_bytecode = self.bytecode_list[bytecode_idx + 1]
+
+            is_disjunction_short_circuit = (
+                next_bytecode["instruction"] == "JZ"
+                and next_bytecode["metadata"]["conditional_register"] == "zero"
+                and next_bytecode["metadata"]["jump_size"] > 0
+                and self._is_logical_operation(
+                    bytecode_idx=bytecode_idx + 1 + next_bytecode["metadata"]["jump_size"],
+                    instructions=["OR", "FOR"],
+                    lhs_register=conditional_register
+                )
+            )
+
+            if is_disjunction_short_circuit:
+                self.short_circuit_jumps.update([bytecode_idx, bytecode_idx + 1])
+
+    def _is_logical_operation(
+        self,
+        bytecode_idx: int,
+        instructions: list[str],
+        lhs_register: int
+    ) -> bool:
+        """
+        Tell whether a bytecode is a logical operation with a given left hand
+        side.
+
+        Parameters
+        ----------
+        bytecode_idx : int
+            The index of the bytecode in `self.bytecode_list`.
+        instructions : list[str]
+            The instructions of the logical operation.
+        lhs_register : int
+            The register of the left hand side.
+
+        Returns
+        -------
+        : bool
+            `True` if the bytecode matches, `False` otherwise.
+        """
+
+        if not 0 <= bytecode_idx < len(self.bytecode_list):
+            return False
+
+        bytecode = self.bytecode_list[bytecode_idx]
+
+        return (
+            bytecode["instruction"] in instructions
+            and bytecode["metadata"]["lhs_register"] == lhs_register
+        )
+
     def _preprocess_functions(self) -> None:
         """
         Compute the function prime associated with each function.
@@ -156,7 +443,7 @@ class BackendCertificator(AbstractCertificator):
             function_id: {"prime": prime}
 
             for function_id, prime in zip(
-                _functions_ids, primes_list(len(_functions_ids))
+                _functions_ids, SHARED_PRIME_PROVIDER.get_primes(len(_functions_ids))
             )
         }
 
@@ -171,12 +458,45 @@ class BackendCertificator(AbstractCertificator):
 
         temp_variables = {}
 
+        # Base addresses of the variables that are parameters of functions.
+        # They are flagged upfront (instead of when their definitions are
+        # certificated), as the `VAR_DEF` symbols skip them, and functions
+        # might be certificated in any order
+        parameters_base_addresses = set()
+
         for bytecode_idx, bytecode in enumerate(self.bytecode_list):
             # Mark any type-casts as done, as they're handled below
             if bytecode["instruction"] in INSTRUCTIONS_CATEGORIES["type_casts"]:
                 bytecode_id = bytecode["bytecode_id"]
                 self.bytecode_status[bytecode_id] = True
 
+            # Fused instructions access variables at constant addresses, and
+            # tell their types by themselves
+            if bytecode["instruction"] in self.ABSOLUTE_ACCESS_TYPES:
+                var_address = bytecode["metadata"]["address"]
+                var_type = self.ABSOLUTE_ACCESS_TYPES[bytecode["instruction"]]
+
+                is_short_store = (
+                    bytecode["instruction"] == "STOREA"
+                    and self._is_short_value(
+                        bytecode_idx=bytecode_idx,
+                        register=bytecode["metadata"]["value"]
+                    )
+                )
+
+                if is_short_store:
+                    var_type = "short"
+
+                self._record_variable_type(
+                    variables=temp_variables,
+                    var_base_address=self._get_variable_base_address(var_address),
+                    var_address=var_address,
+                    var_type=var_type,
+                    is_dynamically_indexed=False
+                )
+
+                continue
+
             try:
                 next_bytecode_idx = bytecode_idx + 1
                 next_bytecode = self.bytecode_list[next_bytecode_idx]
@@ -194,7 +514,18 @@ class BackendCertificator(AbstractCertificator):
                     and next_bytecode["metadata"]["rhs_register"] == "zero"
                 )
 
-                if not any([is_param, is_variable]):
+                # Without the copy of the base address (i.e., the `ADD` with
+                # `zero`), the `CONSTANT` might still be the base address of an
+                # array indexed by another variable
+                is_dynamic_access_base = (
+                    not any([is_param, is_variable])
+                    and self._match_dynamic_access(bytecode_idx) is not None
+                )
+
+                if is_dynamic_access_base:
+                    next_bytecode_idx, next_bytecode = bytecode_idx, bytecode
+
+                elif not any([is_param, is_variable]):
                     continue
 
                 # Try to infer the variable type
@@ -206,10 +537,15 @@ class BackendCertificator(AbstractCertificator):
                 var_base_address = bytecode["metadata"]["value"]
 
                 var_address_register, var_address = None, None
+                is_offset_in_another_var = False
 
-                _to_analyze = self.bytecode_list[next_bytecode_idx:]
-                for _idx, temp_bytecode in enumerate(_to_analyze):
-                    temp_bytecode_idx = _idx + next_bytecode_idx
+                # Only the bytecodes that read the base address (before the
+                # register is reused) might compute the address
+                for temp_bytecode_idx in self._get_uses(
+                    bytecode_idx=next_bytecode_idx,
+                    register=var_base_address_register
+                ):
+                    temp_bytecode = self.bytecode_list[temp_bytecode_idx]
 
                     # We can only know the offset if it is constant
                     # (that comes right before `ADD`)
@@ -222,7 +558,7 @@ class BackendCertificator(AbstractCertificator):
                     if can_tell_var_offset:
                         var_offset = self.bytecode_list[temp_bytecode_idx - 1]["metadata"]["value"]
                         
-                        var_address = hex(int(var_base_address, 16) + var_offset)
+                        var_address = var_base_address + var_offset
                         var_address_register = temp_bytecode["metadata"]["register"]
 
                         next_bytecode_idx = temp_bytecode_idx
@@ -278,7 +614,12 @@ class BackendCertificator(AbstractCertificator):
                 #    - just a `STOREF`: float
                 #    - `STORE` preceeded by `TRUNC`: short
                 if var_type is None:
-                    for _idx, _bytecode in enumerate(self.bytecode_list):
+                    for _idx in self._get_uses(
+                        bytecode_idx=next_bytecode_idx,
+                        register=var_address_register
+                    ):
+                        _bytecode = self.bytecode_list[_idx]
+
                         found_int_store_bytecode = (
                             _bytecode["instruction"] == "STORE"
                             and _bytecode["metadata"]["register"] == var_address_register
@@ -287,7 +628,10 @@ class BackendCertificator(AbstractCertificator):
                         if found_int_store_bytecode:
                             var_type = (
                                 "short"
-                                if self.bytecode_list[_idx - 1]["instruction"] == "TRUNC"
+                                if self._is_short_value(
+                                    bytecode_idx=_idx,
+                                    register=_bytecode["metadata"]["value"]
+                                )
                                 else "int"
                             )
                             break
@@ -303,27 +647,16 @@ class BackendCertificator(AbstractCertificator):
                 if var_type is None:
                     continue
 
-                if var_base_address in temp_variables:
-                    temp_variables[var_base_address]["addresses"][var_address] = var_type
+                self._record_variable_type(
+                    variables=temp_variables,
+                    var_base_address=var_base_address,
+                    var_address=var_address,
+                    var_type=var_type,
+                    is_dynamically_indexed=is_offset_in_another_var
+                )
 
-                else:
-                    # Initialize all the subaddresses as `unknown`, except if it
-                    # is a dynamically indexed array (then all the types must be
-                    # the same)
-                    _offset = int(var_base_address, 16)
-                    _type = var_type if is_offset_in_another_var else "__unknown_type__"
-                    temp_variables[var_base_address] = {
-                        "addresses": {
-                            hex(address): _type
-                            for address in range(
-                                _offset + 0,
-                                _offset + self.program["data"][var_base_address],
-                                4
-                            )
-                        }
-                    }
-                    
-                    temp_variables[var_base_address]["addresses"][var_address] = var_type
+                if is_param:
+                    parameters_base_addresses.add(var_base_address)
 
             except IndexError:
                 break
@@ -338,14 +671,465 @@ class BackendCertificator(AbstractCertificator):
                 "prime": var_prime
             }
             for key, var_prime in zip(
-                sorted(temp_variables.keys(), key=lambda x: int(x, 16)),
-                primes_list(len(temp_variables.keys()))
+                sorted(temp_variables.keys()),
+                SHARED_PRIME_PROVIDER.get_primes(len(temp_variables.keys()))
             )
         }
 
+        for var_base_address in parameters_base_addresses:
+            variables[var_base_address]["parameter"] = True
+
         self.environment["variables"] = variables
 
-    def _add_to_stash(self, index: int, element: str) -> None:
+    def _is_short_value(self, bytecode_idx: int, register: int) -> bool:
+        """
+        Tell whether the value of a register, as read by a bytecode, is a short.
+
+        Short values are the ones produced by a type-cast to short (`TRUNC`) or
+        read by a `LOADSA`.
+
+        Parameters
+        ----------
+        bytecode_idx : int
+            The index of the bytecode that reads `register`.
+        register : int
+            The register of interest.
+
+        Returns
+        -------
+        : bool
+            `True` if the latest definition of `register` before
+            `bytecode_idx` produces a short value, `False` otherwise.
+        """
+
+        if not isinstance(register, int):
+            return False
+
+        try:
+            definition_idx = self._get_definition_index(
+                bytecode_idx=bytecode_idx,
+                register=register
+            )
+
+        except ValueError:
+            return False
+
+        bytecode = self.bytecode_list[definition_idx]
+
+        # Follow the values of hoisted expressions
+        if bytecode["instruction"] == "MOV" and isinstance(bytecode["metadata"]["value"], int):
+            return self._is_short_value(
+                bytecode_idx=definition_idx,
+                register=bytecode["metadata"]["value"]
+            )
+
+        return bytecode["instruction"] in ["TRUNC", "LOADSA"]
+
+    def _record_variable_type(
+        self,
+        variables: dict[int, dict],
+        var_base_address: int,
+        var_address: int,
+        var_type: str,
+        is_dynamically_indexed: bool
+    ) -> None:
+        """
+        Record the type of a variable (or of one of its elements/attributes).
+
+        Parameters
+        ----------
+        variables : dict[int, dict]
+            Maps the base address of each variable to the types of its
+            addresses. It is modified in place.
+        var_base_address : int
+            The base address of the variable.
+        var_address : int
+            The address of the element/attribute whose type is known.
+        var_type : str
+            The type of the element/attribute.
+        is_dynamically_indexed : bool
+            Whether the variable is an array being indexed by another
+            variable.
+        """
+
+        if var_base_address in variables:
+            variables[var_base_address]["addresses"][var_address] = var_type
+            return
+
+        # Initialize all the subaddresses as `unknown`, except if it is a
+        # dynamically indexed array (then all the types must be the same)
+        _offset = var_base_address
+        _type = var_type if is_dynamically_indexed else "__unknown_type__"
+        variables[var_base_address] = {
+            "addresses": {
+                address: _type
+                for address in range(
+                    _offset + 0,
+                    _offset + self.program["data"][var_base_address],
+                    4
+                )
+            }
+        }
+
+        variables[var_base_address]["addresses"][var_address] = var_type
+
+    def _preprocess_hoisted_code(self) -> None:
+        """
+        Find the expressions hoisted out of loops.
+
+        The `LoopInvariantCodeMotion` pass replaces each hoisted expression,
+        in the loop, with a `MOV` marked as `hoisted`. The hoisted code is the
+        subtree that computes the register this `MOV` reads. It is only
+        accepted if it is invariant in the loop (see `_is_loop_invariant`), so
+        marked `MOV`s that fail the check can't be certificated.
+        """
+
+        for bytecode_idx, bytecode in enumerate(self.bytecode_list):
+            is_hoisted_code_placeholder = (
+                bytecode["instruction"] == "MOV"
+                and bytecode["metadata"].get("hoisted", False)
+                and isinstance(bytecode["metadata"]["register"], int)
+                and isinstance(bytecode["metadata"]["value"], int)
+            )
+
+            if not is_hoisted_code_placeholder:
+                continue
+
+            try:
+                end_idx = self._get_definition_index(
+                    bytecode_idx=bytecode_idx,
+                    register=bytecode["metadata"]["value"]
+                )
+                start_idx = self._get_subtree_start(end_idx)
+
+            except ValueError:
+                continue
+
+            is_invariant = self._is_loop_invariant(
+                bytecode_idx=bytecode_idx,
+                start_idx=start_idx,
+                end_idx=end_idx
+            )
+
+            if not is_invariant:
+                continue
+
+            self.hoisted_code[bytecode_idx] = (start_idx, end_idx)
+            self.hoisted_bytecodes_indices.update(range(start_idx, end_idx + 1))
+
+    def _is_loop_invariant(self, bytecode_idx: int, start_idx: int, end_idx: int) -> bool:
+        """
+        Tell whether some code, hoisted out of a loop, computes the value it
+        would compute in every iteration of the loop.
+
+        The hoisted code must be in the pre-header of the innermost loop with
+        the `MOV` that replaced it (i.e., right before its header, and only
+        reachable from the code before it), and:
+
+        - only compute values from constants and variables (i.e., without side
+        effects), and divide by non-zero constants;
+        - only read variables the loop does not write to. Dynamic stores whose
+        variable is unknown might write to any variable, as well as function
+        calls;
+        - have its value kept in the same register throughout the loop.
+
+        Parameters
+        ----------
+        bytecode_idx : int
+            The index of the `MOV` that replaced the hoisted code in the loop.
+        start_idx : int
+            The index of the first bytecode of the hoisted code.
+        end_idx : int
+            The index of the bytecode that computes the value of the hoisted
+            code.
+
+        Returns
+        -------
+        : bool
+            `True` if the hoisted code is loop-invariant, `False` otherwise.
+        """
+
+        jumps = [
+            (idx, idx + bytecode["metadata"]["jump_size"])
+            for idx, bytecode in enumerate(self.bytecode_list)
+            if bytecode["instruction"] == "JZ"
+        ]
+
+        # Find the innermost loop with the `MOV`, whose header is after the
+        # hoisted code
+        loops = [
+            (target_idx, idx)
+            for idx, target_idx in jumps
+            if self.bytecode_list[idx]["metadata"]["conditional_register"] == "zero"
+            and end_idx < target_idx <= bytecode_idx < idx
+        ]
+
+        if not loops:
+            return False
+
+        header_idx, back_edge_idx = max(loops)
+
+        # The pre-header must only run before the loop
+        if any(
+            start_idx < target_idx <= header_idx and idx != back_edge_idx
+            for idx, target_idx in jumps
+        ):
+            return False
+
+        loaded_variables: set[int] = set()
+
+        for idx in range(start_idx, header_idx):
+            bytecode = self.bytecode_list[idx]
+            instruction = bytecode["instruction"]
+            metadata = bytecode["metadata"]
+
+            if instruction not in self.HOISTABLE_INSTRUCTIONS:
+                return False
+
+            if instruction in self.ABSOLUTE_ACCESS_TYPES:
+                loaded_variables.add(self._get_variable_base_address(metadata["address"]))
+
+            if idx > end_idx:
+                continue
+
+            # Special registers other than `zero` can't be read
+            if any(
+                not isinstance(metadata[key], int) and metadata[key] != "zero"
+                for key in ["lhs_register", "rhs_register", "value"]
+                if key in metadata and instruction != "CONSTANT"
+            ):
+                return False
+
+            _, uses = RegisterAllocator.get_definitions_and_uses(bytecode)
+            definitions = {
+                key: self._get_definition_index(bytecode_idx=idx, register=metadata[key])
+                for key in uses
+            }
+
+            if any(definition_idx < start_idx for definition_idx in definitions.values()):
+                return False
+
+            if instruction in self.DIVISIONS:
+                divisor = self.bytecode_list[definitions.get("rhs_register", idx)]
+
+                is_safe_division = (
+                    divisor["instruction"] == "CONSTANT"
+                    and divisor["metadata"]["value"] != 0
+                )
+
+                if not is_safe_division:
+                    return False
+
+        # The loop must not write to the variables the hoisted code reads
+        for idx in range(header_idx, back_edge_idx + 1):
+            bytecode = self.bytecode_list[idx]
+            instruction = bytecode["instruction"]
+
+            if instruction == "JAL":
+                return False
+
+            if instruction in ["STOREA", "STOREFA"]:
+                stored_variable = self._get_variable_base_address(
+                    bytecode["metadata"]["address"]
+                )
+
+            elif instruction in ["STORE", "STOREF"]:
+                stored_variable = self._get_stored_variable(
+                    bytecode_idx=idx,
+                    address_register=bytecode["metadata"]["register"]
+                )
+
+            else:
+                continue
+
+            if stored_variable is None or stored_variable in loaded_variables:
+                return False
+
+        # The value must not be overwritten before the `MOV` reads it
+        value_register = self.bytecode_list[end_idx]["metadata"]["register"]
+        value_definitions = self.register_definitions[value_register]
+        position = bisect_right(value_definitions, end_idx)
+
+        return position == len(value_definitions) or value_definitions[position] > back_edge_idx
+
+    def _get_stored_variable(
+        self,
+        bytecode_idx: int,
+        address_register: int
+    ) -> Union[int, None]:
+        """
+        Get the variable a dynamic store (i.e., `STORE` or `STOREF`) writes to.
+
+        The address of an array element is computed by adding an offset to the
+        base address of the array, so the base address is found by following
+        the left hand sides of the `ADD` bytecodes up to a `CONSTANT`.
+
+        Parameters
+        ----------
+        bytecode_idx : int
+            The index of the store bytecode.
+        address_register : int
+            The register with the address the value is stored at.
+
+        Returns
+        -------
+        : int or None
+            The base address of the variable. Returns `None` if it is unknown.
+        """
+
+        register = address_register
+
+        while isinstance(register, int):
+            try:
+                bytecode_idx = self._get_definition_index(
+                    bytecode_idx=bytecode_idx,
+                    register=register
+                )
+
+            except ValueError:
+                return None
+
+            bytecode = self.bytecode_list[bytecode_idx]
+
+            if bytecode["instruction"] == "CONSTANT":
+                return self._get_variable_base_address(bytecode["metadata"]["value"])
+
+            if bytecode["instruction"] != "ADD":
+                return None
+
+            register = bytecode["metadata"]["lhs_register"]
+
+        return None
+
+    def _get_definition_index(self, bytecode_idx: int, register: int) -> int:
+        """
+        Get the index of the bytecode that last wrote to a register before
+        some bytecode.
+
+        Parameters
+        ----------
+        bytecode_idx : int
+            The index of the bytecode that reads `register`.
+        register : int
+            The register of interest.
+
+        Returns
+        -------
+        : int
+            The index of the bytecode that wrote to `register`.
+
+        Raises
+        ------
+        ValueError
+            Raised if `register` is not written before `bytecode_idx`.
+        """
+
+        definitions = self.register_definitions.get(register, [])
+        position = bisect_left(definitions, bytecode_idx) - 1
+
+        if position < 0:
+            raise ValueError(f"Register {register} is read before being written.")
+
+        return definitions[position]
+
+    def _get_subtree_start(self, bytecode_idx: int) -> int:
+        """
+        Get the index of the first bytecode of the expression whose value is
+        computed by some bytecode.
+
+        Parameters
+        ----------
+        bytecode_idx : int
+            The index of the bytecode that computes the value of the expression.
+
+        Returns
+        -------
+        start_idx : int
+            The index of the first bytecode of the expression.
+        """
+
+        bytecode = self.bytecode_list[bytecode_idx]
+        _, uses = RegisterAllocator.get_definitions_and_uses(bytecode)
+
+        return min([
+            bytecode_idx,
+            *(
+                self._get_subtree_start(self._get_definition_index(
+                    bytecode_idx=bytecode_idx,
+                    register=bytecode["metadata"][key]
+                ))
+                for key in uses
+            )
+        ])
+
+    def _get_variable_base_address(self, address: int) -> int:
+        """
+        Get the base address of the variable that contains some address.
+
+        Parameters
+        ----------
+        address : int
+            An address within a variable (e.g., of a struct attribute).
+
+        Returns
+        -------
+        : int
+            The base address of the variable.
+        """
+
+        base_address_idx = bisect_right(self.variables_base_addresses, address) - 1
+
+        return self.variables_base_addresses[base_address_idx]
+
+    def _preprocess_absolute_stores(self) -> None:
+        """
+        Preprocess the absolute stores (i.e., `STOREA` and `STOREFA`).
+
+        As these bytecodes do not compute the address of the variable they
+        write to, this method adds the certificate of the variable to the
+        stash, right before the expression whose value is stored. The insertion
+        indices are computed in `_compute_register_to_bytecode_dependencies`.
+        """
+
+        for index, bytecode in self.absolute_stores_insertion_indices:
+            self._add_to_stash(
+                index=index,
+                element=self._get_absolute_access_exponent(
+                    address=bytecode["metadata"]["address"],
+                    context="address"
+                )
+            )
+
+    def _get_absolute_access_exponent(self, address: int, context: str) -> Exponent:
+        """
+        Compute the exponent of an access to a variable at a constant address.
+
+        Parameters
+        ----------
+        address : int
+            The accessed address.
+        context : str
+            Either `value` (the variable is read) or `address` (the variable is
+            written to).
+
+        Returns
+        -------
+        exponent : Exponent
+            The encoding exponent of this variable usage.
+        """
+
+        symbol = get_certificate_symbol(f"VAR_{context.upper()}")
+
+        var_base_address = self._get_variable_base_address(address)
+        var_prime = self.environment["variables"][var_base_address]["prime"]
+
+        # TODO: divide the offset by the size of the variable type (as of now,
+        # all types have 4 bytes)
+        index = (address - var_base_address) // 4
+
+        return (int(symbol), var_prime, 2, index + 1)
+
+    def _add_to_stash(self, index: int, element: Exponent) -> None:
         """
         Add an element to the stash, in the given index.
 
@@ -353,7 +1137,7 @@ class BackendCertificator(AbstractCertificator):
         ----------
         index : int
             The index to add at.
-        element : str
+        element : Exponent
             The element to add at the index.
         """
 
@@ -372,53 +1156,125 @@ class BackendCertificator(AbstractCertificator):
         This method will mark the beginning of every expression that predicate
         conditionals (in the form of `JZ` bytecodes that *do not* evaluate the
         `zero` register) by adding a "pending symbol" to the environment stash.
-        """
 
-        insertion_indices = []
+        The insertion indices are computed in `_compute_register_to_bytecode_dependencies`,
+        as registers might be reused after the conditional jump.
+        """
 
-        for bytecode in self.program["code"]:
-            is_conditional = (
-                bytecode["instruction"] == "JZ"
-                and bytecode["metadata"]["conditional_register"] != "zero"
+        for index in self.conditionals_insertion_indices:
+            self._add_to_stash(
+                index=index,
+                element=(int(get_certificate_symbol("COND")),)
             )
 
-            if not is_conditional:
-                continue
+    @override
+    def certificate(self, **kwargs) -> Certificate:
+        """
+        Certificate the backend code.
+
+        This method iterates over the machine code and annotate each bytecode
+        with its relative position and contents. The certificate is composed
+        from the modular certificates of the functions.
+
+        Returns
+        -------
+        computed_certificate : Certificate
+            The computed certificate.
+
+        Raises
+        ------
+        ValueError
+            Raised if there are unprocessed bytecodes (i.e., not marked as done
+            in `self.bytecode_status`).
+        """
+
+        computed_certificate = self.compose(self.certificate_functions())
+
+        # Assert all the instructions have been accounted for
+        _err_msg = "Certification failed: there are uncertificated instructions."
+        if not(all(self.bytecode_status.values())):
+            print("Instruction IDs with missing certificates:")
+            print([
+                bytecode_id
+                for bytecode_id, status in self.bytecode_status.items()
+                if not status
+            ])
+            raise ValueError(_err_msg)
+
+        self.computed_certificate = computed_certificate
+
+        return self.computed_certificate
+
+    @override
+    def _certificate_function(self, function_name: str) -> Certificate:
+        """
+        Certificate the code of a function.
+
+        Parameters
+        ----------
+        function_name : str
+            The name of the function.
+
+        Returns
+        -------
+        : Certificate
+            The certificate of the function.
+        """
+
+        function_indices = self.program["functions"][function_name]
 
-            register = bytecode["metadata"]["conditional_register"]
+        return self._certificate_code_range(
+            start=function_indices["start"],
+            end=function_indices["end"]
+        )
 
-            bytecode_ids_it_depends_on = self.register_to_bytecode_dependencies[register]
-            insertion_indices.append(min(bytecode_ids_it_depends_on) - 1)
+    @override
+    def _certificate_program_end(self) -> Certificate:
+        """
+        Certificate the end of the program (i.e., the code after the last
+        function, such as the `HALT`).
 
-        for index in insertion_indices:
-            self._add_to_stash(
-                index=index,
-                element=str(get_certificate_symbol("COND"))
-            )
+        Returns
+        -------
+        : Certificate
+            The certificate of the end of the program.
+        """
 
-    @override
-    def certificate(self, **kwargs) -> str:
+        start = max(
+            (
+                function_indices["end"]
+                for function_indices in self.program["functions"].values()
+            ),
+            default=0
+        )
+
+        return self._certificate_code_range(start=start, end=len(self.bytecode_list))
+
+    def _certificate_code_range(self, start: int, end: int) -> Certificate:
         """
-        Certificate the backend code.
+        Certificate a range of the code (only once per range, as certificating
+        a bytecode marks it as done in `self.bytecode_status`).
 
-        This method iterates over the machine code and annotate each bytecode
-        with its relative position and contents.
+        Parameters
+        ----------
+        start : int
+            The index of the first bytecode of the range.
+        end : int
+            The index past the last bytecode of the range.
 
         Returns
         -------
-        computed_certificate : str
-            The computed certificate.
-
-        Raises
-        ------
-        ValueError
-            Raised if there are unprocessed bytecodes (i.e., not marked as done
-            in `self.bytecode_status`).
+        : Certificate
+            The certificate of the range.
         """
 
+        if (start, end) in self.code_range_certificates:
+            return self.code_range_certificates[(start, end)]
+
         computed_exponents = []
 
-        for idx, bytecode in enumerate(self.bytecode_list):
+        for idx in range(start, end):
+            bytecode = self.bytecode_list[idx]
             bytecode_id = bytecode["bytecode_id"]
 
             # First, check if there are any pending exponents for this index
@@ -426,10 +1282,14 @@ class BackendCertificator(AbstractCertificator):
                 pending_exponent = self.environment["stash"][idx]
                 computed_exponents.extend(pending_exponent)
 
-            # Skip instructions that have already been handled.
+            # Skip instructions that have already been handled, or that are
+            # handled later (i.e., hoisted out of a loop)
             if bytecode_id is not None and self.bytecode_status[bytecode_id]:
                 continue
 
+            if idx in self.hoisted_bytecodes_indices:
+                continue
+
             # ...then handle this bytecode
             exponent = self._certificate_instruction(
                 bytecode=bytecode,
@@ -438,36 +1298,17 @@ class BackendCertificator(AbstractCertificator):
 
             computed_exponents.extend(exponent)
 
-        # Assert all the instructions have been accounted for
-        _err_msg = "Certification failed: there are uncertificated instructions."
-        if not(all(self.bytecode_status.values())):
-            print("Instruction IDs with missing certificates:")
-            print([
-                bytecode_id
-                for bytecode_id, status in self.bytecode_status.items()
-                if not status
-            ])
-            raise ValueError(_err_msg)
-        
-        computed_exponents = self._add_var_def_symbols(computed_exponents)
-
-        self.computed_certificate = [
-            f"{positional_prime}^({exponent})"
-            for positional_prime, exponent in zip(
-                primes_list(len(computed_exponents)),
-                computed_exponents
-            )
-        ]
-
-        self.computed_certificate = "*".join(self.computed_certificate)
+        self.code_range_certificates[(start, end)] = Certificate.from_exponents(
+            computed_exponents
+        )
 
-        return self.computed_certificate
+        return self.code_range_certificates[(start, end)]
 
     def _certificate_instruction(
         self,
         bytecode: dict[str, dict],
         bytecode_idx: int
-    ) -> list[str]:
+    ) -> list[Exponent]:
         """
         Compute the certificate of an instruction.
 
@@ -483,7 +1324,7 @@ class BackendCertificator(AbstractCertificator):
 
         Returns
         -------
-        exponent : list[str]
+        exponent : list[Exponent]
             The exponent that encodes the operation this instruction implements.
 
         Raises
@@ -514,7 +1355,7 @@ class BackendCertificator(AbstractCertificator):
         self,
         bytecode: dict[str, dict],
         bytecode_idx: int
-    ) -> list[str]:
+    ) -> list[Exponent]:
         """
         Handle a `CONSTANT` bytecode.
 
@@ -523,9 +1364,12 @@ class BackendCertificator(AbstractCertificator):
         1. If followed by `ADD r_add r_constant zero; LOAD(F) r_var r_add`, it
         is loading the value of a variable into a register;
         2. If followed by `ADD r_add r_constant zero`, it is loading the address
-        of a variable into a register;
+        of a variable into a register (the `ADD` might have been removed by the
+        optimizer, if the variable is a dynamically indexed array);
         3. If followed by `STORE(F) r_constant arg`, it is a function parameter.
-        4. It is a simple constant that will be used in an expression.
+        4. It is a simple constant that will be used in an expression. If it is
+        written straight into `ret_value` or `arg` (by the optimizer), it also
+        implements a `return` statement or an argument of a function call.
 
         So we must handle it accordingly.
 
@@ -538,7 +1382,7 @@ class BackendCertificator(AbstractCertificator):
 
         Returns
         -------
-        exponent : list[str]
+        exponent : list[Exponent]
             The encoding of the operation this `CONSTANT` implements.
         """
 
@@ -549,8 +1393,9 @@ class BackendCertificator(AbstractCertificator):
         # Cases 1 or 2: variable value/address
         is_variable = (
             next_bytecode["instruction"] == "ADD"
+            and next_bytecode["metadata"]["lhs_register"] == bytecode["metadata"]["register"]
             and next_bytecode["metadata"]["rhs_register"] == "zero"
-        )
+        ) or self._match_dynamic_access(bytecode_idx) is not None
 
         is_parameter = (
             next_bytecode["instruction"] in ["STORE", "STOREF"]
@@ -571,20 +1416,69 @@ class BackendCertificator(AbstractCertificator):
             )
         
         # Case 4: just a constant
-        constant_value = bytecode["metadata"]["value"] + 1 # Avoid exp. identity
+        # Avoid the exponentiation identity, as the frontend does
+        constant_value = bytecode["metadata"]["value"]
+        constant_value = constant_value + 1 if constant_value >= 0 else constant_value
         symbol = get_certificate_symbol("CST")
-        exponent = f"({symbol})^({constant_value})"
+        exponent = (int(symbol), constant_value)
 
         # Mark the involved bytecode as done.
         self.bytecode_status[bytecode["bytecode_id"]] = True
 
+        if bytecode["metadata"]["register"] == "ret_value":
+            return [
+                exponent,
+                *self._handle_return(bytecode=bytecode, bytecode_idx=bytecode_idx)
+            ]
+
+        if bytecode["metadata"]["register"] == "arg":
+            return [
+                exponent,
+                *self._handle_function_argument(bytecode=bytecode, bytecode_idx=bytecode_idx)
+            ]
+
+        return [exponent]
+
+    def _handle_absolute_load(
+        self,
+        bytecode: dict[str, dict],
+        bytecode_idx: int
+    ) -> list[Exponent]:
+        """
+        Handle an absolute load (i.e., `LOADA`, `LOADFA` or `LOADSA`).
+
+        These bytecodes read a variable (or a struct attribute/array element
+        with a constant index) at a constant address.
+
+        Parameters
+        ----------
+        bytecode : dict[str, dict]
+            The absolute load bytecode.
+        bytecode_idx : int
+            The index of this `bytecode` in `self.bytecode_list`.
+
+        Returns
+        -------
+        exponent : list[Exponent]
+            The encoding exponent of this variable usage.
+        """
+
+        exponent = self._get_absolute_access_exponent(
+            address=bytecode["metadata"]["address"],
+            context="value"
+        )
+
+        # Mark this bytecode as done
+        bytecode_id = bytecode["bytecode_id"]
+        self.bytecode_status[bytecode_id] = True
+
         return [exponent]
 
     def _handle_variable(
         self,
         bytecode: dict[str, dict],
         bytecode_idx: int,
-    ) -> list[str]:
+    ) -> list[Exponent]:
         """
         Handle a variable use case.
 
@@ -601,7 +1495,7 @@ class BackendCertificator(AbstractCertificator):
 
         Returns
         -------
-        exponent : list[str]
+        exponent : list[Exponent]
             The encoding xponent of this variable usage.
         """
 
@@ -627,12 +1521,7 @@ class BackendCertificator(AbstractCertificator):
             symbol = get_certificate_symbol(f"VAR_{context.upper()}")
             var_prime = self._get_variable_prime(bytecode)
 
-            exponent = (
-                f"({symbol})"
-                + f"^({var_prime})"
-                + "^(2)"
-                + "^(1)"
-            )
+            exponent = (int(symbol), var_prime, 2, 1)
 
             # Mark the involved bytecodes as done.
             if context == "address":
@@ -684,7 +1573,7 @@ class BackendCertificator(AbstractCertificator):
         self,
         bytecode: dict[str, dict],
         bytecode_idx: int,
-    ) -> tuple[Union[str, None], Union[int, None]]:
+    ) -> tuple[Union[Exponent, None], Union[int, None]]:
         """
         Speculate if this variable is a data structure (array/struct).
 
@@ -701,7 +1590,7 @@ class BackendCertificator(AbstractCertificator):
 
         Returns
         -------
-        exponent : str or None
+        exponent : Exponent or None
             The exponent (that will compose the certificate) of this data
             structure. Returns `None` if this is not a data structure.
         bytecodes_to_mark_as_done : int or None
@@ -719,15 +1608,11 @@ class BackendCertificator(AbstractCertificator):
         # the index of the element being accessed.
         following_bytecode_is_add = following_bytecode["instruction"] == "ADD"
 
-        # Early return
-        if not following_bytecode_is_add:
-            return (None, None)
-        
         var_prime = self._get_variable_prime(bytecode)
 
         # Check if it is an access to a struct attribute or to an array element
         # using a constant for index.
-        is_static_array_or_struct = True
+        is_static_array_or_struct = following_bytecode_is_add
 
         # Prevent the speculation of going out of bounds or accessing an
         # unexisting attribute
@@ -776,11 +1661,7 @@ class BackendCertificator(AbstractCertificator):
                 # type # (as of now, all types have 4 bytes)
                 speculated_index = speculated_index // 4
 
-                exponent = (
-                    f"({symbol})"
-                    + f"^({var_prime})"
-                    + f"^(2)^({speculated_index + 1})"
-                )
+                exponent = (int(symbol), var_prime, 2, speculated_index + 1)
 
                 # Account for:
                 #  - 2 bytecodes to obtain the variable base address
@@ -799,146 +1680,203 @@ class BackendCertificator(AbstractCertificator):
 
         # Check if it is an access an array element using another variable for
         # index.
-        is_dinamically_accessed_array = True
-
-        try:
-            # Pattern:
-            # 1. First bytecode: `CONSTANT`, with the base address of the array
-            following_bytecode_idx = bytecode_idx + 1
-            following_bytecode = self.bytecode_list[following_bytecode_idx]
+        dynamic_access = self._match_dynamic_access(bytecode_idx)
 
-            speculated_base_address_register = bytecode["metadata"]["register"]
+        if dynamic_access is None:
+            return (None, None)
 
-            # 2. Following bytecode: `ADD`, with `lhs=speculated_base_address_register`
-            # and `rhs=zero`
-            speculated_var_address_register = following_bytecode["metadata"]["register"]
+        following_bytecode_idx = dynamic_access["last_bytecode_idx"] + 1
+        following_bytecode = self.bytecode_list[following_bytecode_idx]
 
-            is_dinamically_accessed_array = (
-                is_dinamically_accessed_array
-                and following_bytecode["instruction"] == "ADD"
-                and following_bytecode["metadata"]["lhs_register"] == speculated_base_address_register
-                and following_bytecode["metadata"]["rhs_register"] == "zero"
-            )
+        context = (
+            "value" if following_bytecode["instruction"] in ["LOAD", "LOADF"]
+            else "address"
+        )
+        symbol = get_certificate_symbol(f"VAR_{context.upper()}")
 
-            # 3. Following bytecode: `CONSTANT`, with the base address of the
-            # indexing variable.
-            following_bytecode_idx = following_bytecode_idx + 1
-            following_bytecode = self.bytecode_list[following_bytecode_idx]
+        speculated_index_var_base_address = self._get_variable_base_address(
+            dynamic_access["index_var_address"]
+        )
+        speculated_index_var_prime = (
+            self.environment["variables"][speculated_index_var_base_address]["prime"]
+        )
 
-            # This is the base address
-            speculated_index_var_base_address_register = following_bytecode["metadata"]["register"]
-            speculated_index_var_prime = self._get_variable_prime(following_bytecode)
+        exponent = (int(symbol), var_prime, 3, speculated_index_var_prime)
 
-            is_dinamically_accessed_array = (
-                is_dinamically_accessed_array
-                and following_bytecode["instruction"] == "CONSTANT"
-            )
+        # Account for every bytecode from the array base address up to the
+        # element address (i.e., the base address, the value of the index
+        # variable, the type size, and the `MULT` and `ADD` that compute the
+        # element address)
+        bytecodes_to_mark_as_done = following_bytecode_idx - bytecode_idx
 
-            # 4. Following bytecode: `ADD`, with `lhs=speculated_index_var_base_address_register`
-            # and `rhs=zero`
-            following_bytecode_idx = following_bytecode_idx + 1
-            following_bytecode = self.bytecode_list[following_bytecode_idx]
+        # Account for the `LOAD`, if this is a var. value case.
+        if context == "value":
+            bytecodes_to_mark_as_done += 1
 
-            # This is the actual address
-            speculated_index_var_address_register = following_bytecode["metadata"]["register"]
+        return (exponent, bytecodes_to_mark_as_done)
 
-            is_dinamically_accessed_array = (
-                is_dinamically_accessed_array
-                and following_bytecode["instruction"] == "ADD"
-                and following_bytecode["metadata"]["lhs_register"] == speculated_index_var_base_address_register
-                and following_bytecode["metadata"]["rhs_register"] == "zero"
-            )
+    def _match_dynamic_access(
+        self, bytecode_idx: int
+    ) -> Union[dict[str, int], None]:
+        """
+        Match the access to an array element indexed by another variable.
 
-            # 5. Following bytecode: `LOAD`, fetching data from
-            # `speculated_index_address_register`
-            following_bytecode_idx = following_bytecode_idx + 1
-            following_bytecode = self.bytecode_list[following_bytecode_idx]
-            
-            speculated_index_var_value_register = following_bytecode["metadata"]["register"]
+        The pattern starts at `self.bytecode_list[bytecode_idx]`, and is:
 
-            is_dinamically_accessed_array = (
-                is_dinamically_accessed_array
-                and following_bytecode["instruction"] == "LOAD"
-                and following_bytecode["metadata"]["value"] == speculated_index_var_address_register
-            )
+        1. `CONSTANT r_base base_address`;
+        2. `ADD r_address r_base zero` (it might have been removed by the
+        optimizer, in which case `r_address` is `r_base`);
+        3. The value of the index variable: either `CONSTANT`, `ADD` and
+        `LOAD`, or a single `LOADA`;
+        4. `CONSTANT r_size size`;
+        5. `MULT r_offset r_index r_size`;
+        6. `ADD r_element r_address r_offset`.
 
-            # 6. Following bytecode: `CONSTANT` (it has the type size)
-            following_bytecode_idx = following_bytecode_idx + 1
-            following_bytecode = self.bytecode_list[following_bytecode_idx]
+        If the `ADD` of step 2 is missing, the pattern could also be a simple
+        expression (e.g., `0 + i * 4`). In this case, `r_element` must also be
+        used as an address, by a `LOAD` or `STORE`.
 
-            speculated_type_size_register = following_bytecode["metadata"]["register"]
+        Parameters
+        ----------
+        bytecode_idx : int
+            The index of the bytecode to start matching at.
 
-            is_dinamically_accessed_array = (
-                is_dinamically_accessed_array
-                and following_bytecode["instruction"] == "CONSTANT"
-            )
+        Returns
+        -------
+        dynamic_access : dict[str, int] or None
+            The address of the index variable (`index_var_address`), the
+            register with the address of the element (`element_register`) and
+            the index of the last bytecode of the pattern (`last_bytecode_idx`).
+            Returns `None` if there is no match.
+        """
 
-            # 7. Following bytecode: `MULT` (to compute the memory offset)
-            following_bytecode_idx = following_bytecode_idx + 1
-            following_bytecode = self.bytecode_list[following_bytecode_idx]
+        try:
+            # 1. `CONSTANT`, with the base address of the array
+            base_bytecode = self.bytecode_list[bytecode_idx]
 
-            speculated_offset_register = following_bytecode["metadata"]["register"]
+            if base_bytecode["instruction"] != "CONSTANT":
+                return None
 
-            is_dinamically_accessed_array = (
-                is_dinamically_accessed_array
-                and following_bytecode["instruction"] == "MULT"
-                and following_bytecode["metadata"]["lhs_register"] == speculated_index_var_value_register
-                and following_bytecode["metadata"]["rhs_register"] == speculated_type_size_register
-            )
+            address_register = base_bytecode["metadata"]["register"]
 
-            # 8. Following bytecode: `ADD` (to add the base address from
-            # `bytecode` to the `offset`)
-            following_bytecode_idx = following_bytecode_idx + 1
+            # 2. `ADD`, with the base address and `zero`
+            following_bytecode_idx = bytecode_idx + 1
             following_bytecode = self.bytecode_list[following_bytecode_idx]
 
-            is_dinamically_accessed_array = (
-                is_dinamically_accessed_array
-                and following_bytecode["instruction"] == "ADD"
-                and following_bytecode["metadata"]["lhs_register"] == speculated_var_address_register
-                and following_bytecode["metadata"]["rhs_register"] == speculated_offset_register
+            has_address_copy = (
+                following_bytecode["instruction"] == "ADD"
+                and following_bytecode["metadata"]["lhs_register"] == address_register
+                and following_bytecode["metadata"]["rhs_register"] == "zero"
             )
 
-            # If all the conditions held, return the adequate exponent and
-            # number of bytecodes already accounted for
-            if is_dinamically_accessed_array:
+            if has_address_copy:
+                address_register = following_bytecode["metadata"]["register"]
                 following_bytecode_idx = following_bytecode_idx + 1
                 following_bytecode = self.bytecode_list[following_bytecode_idx]
 
-                context = (
-                    "value" if following_bytecode["instruction"] in ["LOAD", "LOADF"]
-                    else "address"
-                )
-                symbol = get_certificate_symbol(f"VAR_{context.upper()}")
-                
-                exponent = (
-                    f"({symbol})"
-                    + f"^({var_prime})"
-                    + f"^(3)^({speculated_index_var_prime})"
+            # 3. The value of the index variable
+            if following_bytecode["instruction"] == "LOADA":
+                index_var_address = following_bytecode["metadata"]["address"]
+                index_register = following_bytecode["metadata"]["register"]
+
+            else:
+                index_base_bytecode = following_bytecode
+                index_address_bytecode = self.bytecode_list[following_bytecode_idx + 1]
+                index_load_bytecode = self.bytecode_list[following_bytecode_idx + 2]
+
+                is_index_variable = (
+                    index_base_bytecode["instruction"] == "CONSTANT"
+                    and index_address_bytecode["instruction"] == "ADD"
+                    and index_address_bytecode["metadata"]["lhs_register"] == index_base_bytecode["metadata"]["register"]
+                    and index_address_bytecode["metadata"]["rhs_register"] == "zero"
+                    and index_load_bytecode["instruction"] == "LOAD"
+                    and index_load_bytecode["metadata"]["value"] == index_address_bytecode["metadata"]["register"]
                 )
 
-                # Account for:
-                #  - 2 bytecodes to obtain the variable base address
-                #  - 3 bytecodes to load the value from the index variable
-                #  - 1 bytecode to obtain the type size
-                #  - 2 bytecodes to compute the element address (`ADD` and `MULT`)
-                bytecodes_to_mark_as_done = 8
+                if not is_index_variable:
+                    return None
+
+                index_var_address = index_base_bytecode["metadata"]["value"]
+                index_register = index_load_bytecode["metadata"]["register"]
+                following_bytecode_idx = following_bytecode_idx + 2
+
+            # 4-6. `CONSTANT`, `MULT` and `ADD`, to compute the element address
+            size_bytecode = self.bytecode_list[following_bytecode_idx + 1]
+            offset_bytecode = self.bytecode_list[following_bytecode_idx + 2]
+            element_bytecode = self.bytecode_list[following_bytecode_idx + 3]
+
+            is_element_address = (
+                size_bytecode["instruction"] == "CONSTANT"
+                and offset_bytecode["instruction"] == "MULT"
+                and offset_bytecode["metadata"]["lhs_register"] == index_register
+                and offset_bytecode["metadata"]["rhs_register"] == size_bytecode["metadata"]["register"]
+                and element_bytecode["instruction"] == "ADD"
+                and element_bytecode["metadata"]["lhs_register"] == address_register
+                and element_bytecode["metadata"]["rhs_register"] == offset_bytecode["metadata"]["register"]
+            )
 
-                # Account for the `LOAD`, if this is a var. value case.
-                if context == "value":
-                    bytecodes_to_mark_as_done += 1
+        except (IndexError, KeyError):
+            return None
 
-                return (exponent, bytecodes_to_mark_as_done)
+        if not is_element_address:
+            return None
 
-        except (IndexError, KeyError):
-            return (None, None)
+        last_bytecode_idx = following_bytecode_idx + 3
+        element_register = element_bytecode["metadata"]["register"]
+
+        if not has_address_copy and not self._is_read_as_address(
+            bytecode_idx=last_bytecode_idx,
+            register=element_register
+        ):
+            return None
+
+        return {
+            "index_var_address": index_var_address,
+            "element_register": element_register,
+            "last_bytecode_idx": last_bytecode_idx,
+        }
+
+    def _is_read_as_address(self, bytecode_idx: int, register: int) -> bool:
+        """
+        Tell whether the value a bytecode writes to a register is used as an
+        address (i.e., by a `LOAD(F)` or as the destination of a `STORE(F)`).
+
+        Parameters
+        ----------
+        bytecode_idx : int
+            The index of the bytecode that writes to `register`.
+        register : int
+            The register of interest.
+
+        Returns
+        -------
+        : bool
+            `True` if the first bytecode that reads `register` uses it as an
+            address, `False` otherwise.
+        """
+
+        uses = [
+            use_idx
+            for use_idx in self._get_uses(bytecode_idx=bytecode_idx, register=register)
+            if use_idx > bytecode_idx
+        ]
+
+        if not uses:
+            return False
+
+        bytecode = self.bytecode_list[uses[0]]
+        instruction = bytecode["instruction"]
+
+        return (
+            (instruction in ["LOAD", "LOADF"] and bytecode["metadata"]["value"] == register)
+            or (instruction in ["STORE", "STOREF"] and bytecode["metadata"]["register"] == register)
+        )
 
-        return (None, None)
-   
     def _handle_parameter(
         self,
         bytecode: dict[str, dict],
         bytecode_idx: int
-    ) -> list[str]:
+    ) -> list[Exponent]:
         """
         Handle function parameter definition.
 
@@ -946,10 +1884,10 @@ class BackendCertificator(AbstractCertificator):
         that transmit data from the `arg` register to a variable within the
         function scope. This is the equivalent of "defining" such variable.
         
-        As variable definitions do not have an intrinsic certificate, we simply
-        flag this variable as a parameter in the certificator environment. The
-        certificator will always emit the `PARAM` symbol after any uses of this
-        variable.
+        As variable definitions do not have an intrinsic certificate, this
+        variable is only flagged as a parameter in the certificator environment
+        (by `_preprocess_variables`). The certificator will always emit the
+        `PARAM` symbol after any uses of this variable.
 
         Parameters
         ----------
@@ -960,22 +1898,19 @@ class BackendCertificator(AbstractCertificator):
 
         Returns
         -------
-        exponent : list[str]
+        exponent : list[Exponent]
             The encoding exponent of this parameter.
         """
 
         param_symbol = get_certificate_symbol("PARAM")
 
-        # Mark this variable as a parameter in the environment. The `CONSTANT`
-        # bytecode has the variable address as its value.
+        # The `CONSTANT` bytecode has the variable address as its value.
         var_address = bytecode["metadata"]["value"]
-        self.environment["variables"][var_address]["parameter"] = True
         var_type = self.environment["variables"][var_address]["addresses"].values()
 
-        exponent = f"({param_symbol})^"
-        exponent += "^".join(
-            f"({TYPE_SYMBOLS_MAP[_type]['type_symbol']})"
-            for _type in list(var_type)
+        exponent = (
+            int(param_symbol),
+            *(TYPE_SYMBOLS_MAP[_type]["type_symbol"] for _type in var_type)
         )
 
         # Mark this `CONSTANT` and the `STORE` as done.
@@ -991,12 +1926,12 @@ class BackendCertificator(AbstractCertificator):
         self,
         bytecode: dict[str, dict],
         bytecode_idx: int
-    ) -> list[str]:
+    ) -> list[Exponent]:
         """
         Handle a `MOV` bytecode.
 
-        This bytecode might implement a `return` statement or the passing of an
-        argument to a function.
+        This bytecode might implement a `return` statement, the passing of an
+        argument to a function, or an expression hoisted out of a loop.
 
         Parameters
         ----------
@@ -1007,7 +1942,7 @@ class BackendCertificator(AbstractCertificator):
 
         Returns
         -------
-        exponent : list[str]
+        exponent : list[Exponent]
             The adequate encoding exponent.
 
         Raises
@@ -1034,16 +1969,171 @@ class BackendCertificator(AbstractCertificator):
                 bytecode_idx=bytecode_idx
             )
         
+        # Case 3: it replaces an expression hoisted out of a loop
+        if bytecode_idx in self.hoisted_code:
+            return self._handle_hoisted_code(
+                bytecode=bytecode,
+                bytecode_idx=bytecode_idx
+            )
+
+        if bytecode["metadata"].get("hoisted", False):
+            err_msg = f"Hoisted expression is not loop-invariant: {bytecode}."
+            raise ValueError(err_msg)
+
         # There are no other known use cases for `MOV` that have not already
         # been covered.
         err_msg = f"Unknown use case of MOV instruction: {bytecode}."
         raise ValueError(err_msg)
         
+    def _handle_hoisted_code(
+        self,
+        bytecode: dict[str, dict],
+        bytecode_idx: int
+    ) -> list[Exponent]:
+        """
+        Handle a `MOV` that replaced an expression hoisted out of a loop.
+
+        The hoisted code is certificated as if it were in the position of the
+        `MOV`. If it groups the `reassociated_operands` of a chain of
+        additions (or multiplications), e.g., `(a + b)` in `i + (a + b)`, the
+        chain is certificated in its original order, i.e., `(i + a) + b`
+        (see `_get_reassociated_operands`).
+
+        Parameters
+        ----------
+        bytecode : dict[str, dict]
+            The `MOV` bytecode.
+        bytecode_idx : int
+            The index of this `bytecode` in `self.bytecode_list`.
+
+        Returns
+        -------
+        exponent : list[Exponent]
+            The encoding of the hoisted expression.
+
+        Raises
+        ------
+        ValueError
+            Raised if the reassociated chain does not match the `MOV`.
+        """
+
+        self.bytecode_status[bytecode["bytecode_id"]] = True
+
+        start_idx, end_idx = self.hoisted_code[bytecode_idx]
+        operands_ranges = [(start_idx, end_idx)]
+        operation_exponent: list[Exponent] = []
+
+        if "reassociated_operands" in bytecode["metadata"]:
+            operands_ranges, instruction = self._get_reassociated_operands(
+                bytecode=bytecode,
+                bytecode_idx=bytecode_idx
+            )
+            operation_exponent = [(int(get_certificate_symbol(instruction)),)]
+
+        exponent: list[Exponent] = []
+
+        for operand_idx, (operand_start_idx, operand_end_idx) in enumerate(operands_ranges):
+            if operand_idx > 0:
+                exponent.extend(operation_exponent)
+
+            for idx in range(operand_start_idx, operand_end_idx + 1):
+                hoisted_bytecode = self.bytecode_list[idx]
+
+                if self.bytecode_status[hoisted_bytecode["bytecode_id"]]:
+                    continue
+
+                exponent.extend(self._certificate_instruction(
+                    bytecode=hoisted_bytecode,
+                    bytecode_idx=idx
+                ))
+
+        # The operations that grouped the operands are accounted for above
+        for idx in range(start_idx, end_idx + 1):
+            self.bytecode_status[self.bytecode_list[idx]["bytecode_id"]] = True
+
+        return exponent
+
+    def _get_reassociated_operands(
+        self,
+        bytecode: dict[str, dict],
+        bytecode_idx: int
+    ) -> tuple[list[tuple[int, int]], str]:
+        """
+        Get the operands of a chain of additions (or multiplications) that
+        were grouped and hoisted out of a loop.
+
+        The `LoopInvariantCodeMotion` pass rewrites `((i op a) op b) op c` as
+        `i op ((a op b) op c)`, and hoists `(a op b) op c`. The hoisted code
+        must be a left-associative chain of the same operation, whose value is
+        only read as the right hand side of that operation, so the chain can
+        be certificated in its original order.
+
+        Parameters
+        ----------
+        bytecode : dict[str, dict]
+            The `MOV` bytecode.
+        bytecode_idx : int
+            The index of this `bytecode` in `self.bytecode_list`.
+
+        Returns
+        -------
+        operands_ranges : list[tuple[int, int]]
+            The (start, end) indices of the code of each operand, in order.
+        instruction : str
+            The operation of the chain.
+
+        Raises
+        ------
+        ValueError
+            Raised if the hoisted code does not match the `MOV`.
+        """
+
+        _, end_idx = self.hoisted_code[bytecode_idx]
+        instruction = self.bytecode_list[end_idx]["instruction"]
+
+        uses = self._get_uses(
+            bytecode_idx=bytecode_idx + 1,
+            register=bytecode["metadata"]["register"]
+        )
+
+        is_chain_operand = (
+            instruction in self.ASSOCIATIVE_INSTRUCTIONS
+            and len(uses) == 1
+            and self.bytecode_list[uses[0]]["instruction"] == instruction
+            and self.bytecode_list[uses[0]]["metadata"]["rhs_register"]
+            == bytecode["metadata"]["register"]
+        )
+
+        operands_ranges: list[tuple[int, int]] = []
+        idx = end_idx
+
+        for _ in range(bytecode["metadata"]["reassociated_operands"] - 1):
+            operation = self.bytecode_list[idx]
+
+            if not is_chain_operand or operation["instruction"] != instruction:
+                err_msg = f"Hoisted expression is not a chain of {instruction}: {bytecode}."
+                raise ValueError(err_msg)
+
+            rhs_idx = self._get_definition_index(
+                bytecode_idx=idx,
+                register=operation["metadata"]["rhs_register"]
+            )
+            operands_ranges.append((self._get_subtree_start(rhs_idx), rhs_idx))
+
+            idx = self._get_definition_index(
+                bytecode_idx=idx,
+                register=operation["metadata"]["lhs_register"]
+            )
+
+        operands_ranges.append((self._get_subtree_start(idx), idx))
+
+        return operands_ranges[::-1], instruction
+
     def _handle_return(
         self,
         bytecode: dict[str, dict],
         bytecode_idx: int
-    ) -> list[str]:
+    ) -> list[Exponent]:
         """
         Handle the `return` statement of a function.
 
@@ -1056,13 +2146,13 @@ class BackendCertificator(AbstractCertificator):
 
         Returns
         -------
-        exponent : list[str]
+        exponent : list[Exponent]
             The encoding exponent.
         """
 
         # Produce the exponent
         symbol = get_certificate_symbol("RET_SYM")
-        exponent = f"{symbol}"
+        exponent = (int(symbol),)
 
         # Mark this bytecode and the next -- `JR` -- as done.
         current_bytecode_id = bytecode["bytecode_id"]
@@ -1077,7 +2167,7 @@ class BackendCertificator(AbstractCertificator):
         self,
         bytecode: dict[str, dict],
         bytecode_idx: int
-    ) -> list[str]:
+    ) -> list[Exponent]:
         """
         Handle the passing of a value as an argument to a function call.
 
@@ -1093,13 +2183,13 @@ class BackendCertificator(AbstractCertificator):
 
         Returns
         -------
-        exponent : list[str]
+        exponent : list[Exponent]
             The encoding exponent.
         """
 
         # Produce the certificate
         symbol = get_certificate_symbol("ARG")
-        exponent = f"{symbol}"
+        exponent = (int(symbol),)
 
         # Mark this bytecode as done
         bytecode_id = bytecode["bytecode_id"]
@@ -1111,7 +2201,7 @@ class BackendCertificator(AbstractCertificator):
         self,
         bytecode: dict[str, dict],
         bytecode_idx: int
-    ) -> list[str]:
+    ) -> list[Exponent]:
         """
         Handle the function call operation.
 
@@ -1127,7 +2217,7 @@ class BackendCertificator(AbstractCertificator):
 
         Returns
         -------
-        exponent : list[str]
+        exponent : list[Exponent]
             The encoding exponent.
 
         Raises
@@ -1156,7 +2246,7 @@ class BackendCertificator(AbstractCertificator):
         function_id = bytecode["metadata"]["value"]
         function_prime = self.environment["functions"][function_id]["prime"]
 
-        exponent = f"({symbol})^({function_prime})"
+        exponent = (int(symbol), function_prime)
 
         # Mark this bytecode and the next -- `MOV` -- as done.
         current_bytecode_id = bytecode["bytecode_id"]
@@ -1171,7 +2261,7 @@ class BackendCertificator(AbstractCertificator):
         self,
         bytecode: dict[str, dict],
         bytecode_idx: int
-    ) -> list[str]:
+    ) -> list[Exponent]:
         """
         Handle control flow constructs.
 
@@ -1187,7 +2277,7 @@ class BackendCertificator(AbstractCertificator):
 
         Returns
         -------
-        exponent : list[str]
+        exponent : list[Exponent]
             The encoding exponent.
 
         Raises
@@ -1196,6 +2286,12 @@ class BackendCertificator(AbstractCertificator):
             Raised if this `JZ` does not match any known patterns.
         """
 
+        # Short-circuits are part of the logical operation they skip the right
+        # hand side of, and have no symbol of their own
+        if bytecode_idx in self.short_circuit_jumps:
+            self.bytecode_status[bytecode["bytecode_id"]] = True
+            return []
+
         # Identify the construct
         _control_flow = self._identify_control_flow(
             bytecode=bytecode,
@@ -1281,7 +2377,7 @@ class BackendCertificator(AbstractCertificator):
         self,
         bytecode: dict[str, dict],
         bytecode_idx: int
-    ) -> str:
+    ) -> list[Exponent]:
         """
         Handle a `IF` control flow from a `JZ` bytecode.
 
@@ -1296,22 +2392,22 @@ class BackendCertificator(AbstractCertificator):
 
         Returns
         -------
-        exponent : list[str]
+        exponent : list[Exponent]
             The encoding exponent.
         """
 
         # Add the `IF_END` symbol to the stash
         jump_size = bytecode["metadata"]["jump_size"]
         idx_to_stash_at = bytecode_idx + jump_size
-        if_end_symbol = str(get_certificate_symbol("IF_END"))
+        if_end_exponent = (int(get_certificate_symbol("IF_END")),)
         self._add_to_stash(
             index=idx_to_stash_at,
-            element=if_end_symbol
+            element=if_end_exponent
         )
 
         # Produce the exponent
         symbol = get_certificate_symbol("IF")
-        exponent = f"{symbol}"
+        exponent = (int(symbol),)
 
         # Mark this bytecode as done
         bytecode_id = bytecode["bytecode_id"]
@@ -1323,7 +2419,7 @@ class BackendCertificator(AbstractCertificator):
         self,
         bytecode: dict[str, dict],
         bytecode_idx: int
-    ) -> str:
+    ) -> list[Exponent]:
         """
         Handle a `IF/ELSE` control flow from a `JZ` bytecode.
 
@@ -1338,32 +2434,32 @@ class BackendCertificator(AbstractCertificator):
 
         Returns
         -------
-        exponent : list[str]
+        exponent : list[Exponent]
             The encoding exponent.
         """
 
         # Add the `IF_END` symbol to the stash
         if_jump_size = bytecode["metadata"]["jump_size"]
         idx_to_stash_if_end_at = bytecode_idx + if_jump_size
-        if_end_symbol = str(get_certificate_symbol("IF_END"))
+        if_end_exponent = (int(get_certificate_symbol("IF_END")),)
         self._add_to_stash(
             index=idx_to_stash_if_end_at,
-            element=if_end_symbol
+            element=if_end_exponent
         )
 
         # Add the `ELSE_END` symbol to the stash
         else_bytecode = self.bytecode_list[bytecode_idx + if_jump_size - 1]
         else_jump_size = else_bytecode["metadata"]["jump_size"]
         idx_to_stash_else_end_at = bytecode_idx + if_jump_size - 1 + else_jump_size
-        else_end_symbol = str(get_certificate_symbol("ELSE_END"))
+        else_end_exponent = (int(get_certificate_symbol("ELSE_END")),)
         self._add_to_stash(
             index=idx_to_stash_else_end_at,
-            element=else_end_symbol
+            element=else_end_exponent
         )
 
         # Produce the exponent
         symbol = get_certificate_symbol("IF")
-        exponent = f"{symbol}"
+        exponent = (int(symbol),)
 
         # Mark both jump bytecodes as done
         if_bytecode_id = bytecode["bytecode_id"]
@@ -1378,7 +2474,7 @@ class BackendCertificator(AbstractCertificator):
         self,
         bytecode: dict[str, dict],
         bytecode_idx: int
-    ) -> str:
+    ) -> list[Exponent]:
         """
         Handle a `WHILE` control flow from a `JZ` bytecode.
 
@@ -1393,22 +2489,22 @@ class BackendCertificator(AbstractCertificator):
 
         Returns
         -------
-        exponent : list[str]
+        exponent : list[Exponent]
             The encoding exponent.
         """
 
         # Add the `WHILE_END` symbol to the stash
         jump_size = bytecode["metadata"]["jump_size"]
         idx_to_stash_while_end_at = bytecode_idx + jump_size
-        while_end_symbol = str(get_certificate_symbol("WHILE_END"))
+        while_end_exponent = (int(get_certificate_symbol("WHILE_END")),)
         self._add_to_stash(
             index=idx_to_stash_while_end_at,
-            element=while_end_symbol
+            element=while_end_exponent
         )
 
         # Produce the exponent
         symbol = get_certificate_symbol("WHILE")
-        exponent = f"{symbol}"
+        exponent = (int(symbol),)
 
         # Mark both jump bytecodes as done
         if_bytecode_id = bytecode["bytecode_id"]
@@ -1425,7 +2521,7 @@ class BackendCertificator(AbstractCertificator):
         self,
         bytecode: dict[str, dict],
         bytecode_idx: int
-    ) -> list[str]:
+    ) -> list[Exponent]:
         """
         Handle a simple bytecode.
 
@@ -1441,7 +2537,7 @@ class BackendCertificator(AbstractCertificator):
 
         Returns
         -------
-        exponent : list[str]
+        exponent : list[Exponent]
             The encoding exponent.
         """
 
@@ -1449,7 +2545,7 @@ class BackendCertificator(AbstractCertificator):
 
         # Produce the exponent
         symbol = get_certificate_symbol(instruction)
-        exponent = f"{symbol}"
+        exponent = (int(symbol),)
 
         # Mark this bytecode as done
         bytecode_id = bytecode["bytecode_id"]
@@ -1457,34 +2553,29 @@ class BackendCertificator(AbstractCertificator):
 
         return [exponent]
 
-    def _add_var_def_symbols(self, computed_exponents: list[str]) -> list[str]:
+    @override
+    def _certificate_var_defs(self) -> Certificate:
         """
-        Add `VAR_DEF` symbols to the beginning of `computed_exponents`.
-
-        Parameters
-        ----------
-        computed_exponents : list[str]
-            The list of exponents obtained from the machine code.
+        Certificate the definitions of the variables (i.e., `VAR_DEF` symbols).
 
         Returns
         -------
-        computed_exponents : list[str]
-            The list of exponents obtained from the machine code, added with
-            `VAR_DEF` labels.
+        : Certificate
+            The certificate of the definitions of the variables.
         """
 
         var_def_exponents = []
-        var_def_base_symbol = get_certificate_symbol("VAR_DEF")
+        var_def_base_symbol = int(get_certificate_symbol("VAR_DEF"))
 
         for var_data in self.environment["variables"].values():
             if var_data.get("parameter", False):
                 continue
 
-            type_symbols = "^".join([
-                f'({TYPE_SYMBOLS_MAP[_type]["type_symbol"]})'
+            type_symbols = tuple(
+                TYPE_SYMBOLS_MAP[_type]["type_symbol"]
                 for _type in var_data["addresses"].values()
-            ])
+            )
 
-            var_def_exponents.append(f"({var_def_base_symbol})^{type_symbols}")
+            var_def_exponents.append((var_def_base_symbol, *type_symbols))
 
-        return [*var_def_exponents, *computed_exponents]
+        return Certificate.from_exponents(var_def_exponents)
@@ -0,0 +1,353 @@
+"""Implement the structured representation of certificates."""
+
+from typing import Iterable, Iterator, Union
+
+from src.certificators.fingerprint import FINGERPRINT_MODULI, compute_fingerprint
+from src.prime_provider import SHARED_PRIME_PROVIDER
+
+
+Exponent = tuple[Union[int, float], ...]
+CertificateEntry = tuple[int, Exponent]
+
+
+class Certificate:
+    """
+    Structured representation of a certificate.
+
+    A certificate is a product of positional primes, each raised to an
+    exponent that encodes an element of the program. Instead of keeping the
+    product as a string (e.g., `2^((13)^(3))*3^(67)`), this class keeps it as
+    a tuple of `(positional_prime, exponent)` entries, where each exponent is
+    the tuple of the numbers in its chain of exponentiations (e.g., `(13, 3)`
+    and `(67,)`).
+
+    Certificates are immutable: they can be compared, hashed and sliced
+    without rendering them, and are only rendered to the string format with
+    `str(certificate)`. Floating point numbers (e.g., the exponent of a `float`
+    constant) are told apart from integers with the same value, as they are
+    rendered differently.
+
+    Certificates can also be compared by their fingerprints (i.e., their Gödel
+    numbers modulo a few large primes) with `matches`: equal fingerprints are
+    accepted right away (with a negligible chance of a false positive), and
+    the entries are only compared when the fingerprints differ.
+
+    Certificates of parts of a program (e.g., of its functions) are combined
+    into the certificate of the program with `compose`.
+
+    Parameters
+    ----------
+    entries : tuple[CertificateEntry, ...], optional (default = ())
+        The `(positional_prime, exponent)` entries of the certificate.
+    """
+
+    def __init__(self, entries: tuple[CertificateEntry, ...] = ()) -> None:
+        self.entries: tuple[CertificateEntry, ...] = tuple(entries)
+
+        # The (entry, element) positions of the floating point numbers, as
+        # `1 == 1.0` but `1` and `1.0` are different exponents
+        self.float_positions: tuple[tuple[int, int], ...] = tuple(
+            (entry_idx, element_idx)
+            for entry_idx, (_, exponent) in enumerate(self.entries)
+            for element_idx, element in enumerate(exponent)
+            if isinstance(element, float)
+        )
+
+        self._hash: Union[int, None] = None
+
+        # Maps each tuple of moduli to the fingerprint modulo them
+        self._fingerprints: dict[tuple[int, ...], tuple[int, ...]] = {}
+
+    @classmethod
+    def from_exponents(cls, exponents: list[Exponent]) -> "Certificate":
+        """
+        Create a certificate from the exponents computed by a certificator.
+
+        The positional primes are assigned in order, starting at 2.
+
+        Parameters
+        ----------
+        exponents : list[Exponent]
+            The exponents (e.g., `(13, 3)` or `(67,)`).
+
+        Returns
+        -------
+        : Certificate
+            The certificate.
+        """
+
+        return cls(tuple(
+            zip(SHARED_PRIME_PROVIDER.get_primes(len(exponents)), exponents)
+        ))
+
+    @classmethod
+    def compose(cls, certificates: Iterable["Certificate"]) -> "Certificate":
+        """
+        Compose a certificate from the certificates of its parts.
+
+        The exponents of the parts are concatenated, in order, and the
+        positional primes are assigned again, starting at 2 (i.e., the
+        positional primes of the parts are dropped).
+
+        Parameters
+        ----------
+        certificates : Iterable[Certificate]
+            The certificates of the parts, in order.
+
+        Returns
+        -------
+        : Certificate
+            The composed certificate.
+        """
+
+        exponents = [
+            exponent
+            for certificate in certificates
+            for _, exponent in certificate.entries
+        ]
+
+        return cls(tuple(
+            zip(SHARED_PRIME_PROVIDER.get_primes(len(exponents)), exponents)
+        ))
+
+    @classmethod
+    def from_string(cls, certificate: str) -> "Certificate":
+        """
+        Create a certificate from its string format.
+
+        Parameters
+        ----------
+        certificate : str
+            The certificate, in the string format (e.g., `2^((13)^(3))*3^(67)`).
+
+        Returns
+        -------
+        : Certificate
+            The certificate.
+        """
+
+        if not certificate:
+            return cls()
+
+        entries: list[CertificateEntry] = []
+
+        for token in certificate.split("*"):
+            positional_prime, exponent = token.split("^", 1)
+
+            # Remove the parenthesis around the exponent
+            entries.append((int(positional_prime), cls.parse_exponent(exponent[1:-1])))
+
+        return cls(tuple(entries))
+
+    @staticmethod
+    def parse_exponent(exponent: str) -> Exponent:
+        """
+        Parse an exponent from the string format.
+
+        Parameters
+        ----------
+        exponent : str
+            The exponent, in the string format (e.g., `(13)^(3)` or `67`).
+
+        Returns
+        -------
+        : Exponent
+            The numbers of the chain of exponentiations (e.g., `(13, 3)` or
+            `(67,)`).
+        """
+
+        elements: list[Union[int, float]] = []
+
+        for element in exponent.split("^"):
+            element = element.strip("()")
+
+            try:
+                elements.append(int(element))
+            except ValueError:
+                elements.append(float(element))
+
+        return tuple(elements)
+
+    @staticmethod
+    def render_exponent(exponent: Exponent) -> str:
+        """
+        Render an exponent to the string format.
+
+        Parameters
+        ----------
+        exponent : Exponent
+            The numbers of the chain of exponentiations.
+
+        Returns
+        -------
+        : str
+            The exponent, in the string format.
+        """
+
+        if len(exponent) == 1:
+            return f"{exponent[0]}"
+
+        return "^".join(f"({element})" for element in exponent)
+
+    def fingerprint(
+        self, moduli: tuple[int, ...] = FINGERPRINT_MODULI
+    ) -> tuple[int, ...]:
+        """
+        Compute the Gödel number of this Certificate modulo each of `moduli`
+        (only once per tuple of moduli, as it is immutable).
+
+        Parameters
+        ----------
+        moduli : tuple[int, ...], optional (default = FINGERPRINT_MODULI)
+            The moduli. Must be large primes.
+
+        Returns
+        -------
+        : tuple[int, ...]
+            The fingerprint.
+        """
+
+        if moduli not in self._fingerprints:
+            self._fingerprints[moduli] = compute_fingerprint(self.entries, moduli)
+
+        return self._fingerprints[moduli]
+
+    def matches(self, other: "Certificate", strict: bool = False) -> bool:
+        """
+        Check whether this Certificate matches another one.
+
+        By default, the fingerprints of the certificates are compared first,
+        and the match is accepted if they are equal. Otherwise, or if `strict`
+        is set, the entries are compared.
+
+        Parameters
+        ----------
+        other : Certificate
+            The other certificate.
+        strict : bool, optional (default = False)
+            Whether to skip the fingerprints, and always compare the entries.
+
+        Returns
+        -------
+        : bool
+            `True` if the certificates match, `False` otherwise.
+        """
+
+        if not strict and self.fingerprint() == other.fingerprint():
+            return True
+
+        return self == other
+
+    def __str__(self) -> str:
+        """
+        Render this certificate to the string format.
+
+        Returns
+        -------
+        : str
+            The certificate, in the string format.
+        """
+
+        return "*".join(
+            f"{positional_prime}^({self.render_exponent(exponent)})"
+            for positional_prime, exponent in self.entries
+        )
+
+    def __repr__(self) -> str:
+        """
+        Implement the representation of a Certificate.
+
+        Returns
+        -------
+        : str
+            The representation of this Certificate.
+        """
+
+        return f"Certificate({len(self.entries)} entries)"
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Implement the equality comparison between Certificate instances.
+
+        Parameters
+        ----------
+        other : object
+            The right hand side of the comparison.
+
+        Returns
+        -------
+        : bool
+            `True` if both certificates have the same entries, `False`
+            otherwise.
+        """
+
+        if not isinstance(other, Certificate):
+            return NotImplemented
+
+        return (
+            self.entries == other.entries
+            and self.float_positions == other.float_positions
+        )
+
+    def __hash__(self) -> int:
+        """
+        Compute the hash of this Certificate (only once, as it is immutable).
+
+        Returns
+        -------
+        : int
+            The hash.
+        """
+
+        if self._hash is None:
+            self._hash = hash((self.entries, self.float_positions))
+
+        return self._hash
+
+    def __len__(self) -> int:
+        """
+        Get the number of entries of this Certificate.
+
+        Returns
+        -------
+        : int
+            The number of entries.
+        """
+
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[CertificateEntry]:
+        """
+        Iterate over the entries of this Certificate.
+
+        Returns
+        -------
+        : Iterator[CertificateEntry]
+            An iterator over the `(positional_prime, exponent)` entries.
+        """
+
+        return iter(self.entries)
+
+    def __getitem__(
+        self, key: Union[int, slice]
+    ) -> Union[CertificateEntry, "Certificate"]:
+        """
+        Get an entry, or a slice of this Certificate.
+
+        Slices keep the positional primes of their entries.
+
+        Parameters
+        ----------
+        key : Union[int, slice]
+            The index of the entry, or the slice.
+
+        Returns
+        -------
+        : Union[CertificateEntry, Certificate]
+            The entry, or a Certificate with the sliced entries.
+        """
+
+        if isinstance(key, slice):
+            return Certificate(self.entries[key])
+
+        return self.entries[key]
@@ -0,0 +1,257 @@
+"""Compute modular fingerprints of the Gödel numbers of certificates."""
+
+import struct
+from typing import Iterable, Union
+
+
+# Pierpont primes (i.e., `2^a * 3^b + 1`): the totients along the chain of
+# each of them are 3-smooth, so they are cheap to compute by trial division
+FINGERPRINT_MODULI: tuple[int, ...] = (
+    2**56 * 3**3 + 1,
+    2**19 * 3**44 + 1,
+    2**101 * 3**16 + 1,
+)
+
+# Towers whose values reach this bound are "large": their exponents can be
+# reduced with Euler's theorem for any modulus with up to 64 bits' worth of
+# repeated prime factors
+TOWER_CAP: int = 2**64
+
+# Offsets to map exponents that are not natural numbers (i.e., negative and
+# floating point constants) to natural numbers that no realistic constant
+# reaches
+NEGATIVE_OFFSET: int = 2**128
+FLOAT_OFFSET: int = 2**129
+
+# Maps numbers to their totients
+_totients: dict[int, int] = {}
+
+
+def compute_fingerprint(
+    entries: Iterable[tuple[int, tuple[Union[int, float], ...]]],
+    moduli: tuple[int, ...] = FINGERPRINT_MODULI
+) -> tuple[int, ...]:
+    """
+    Compute the Gödel number of a certificate modulo each of `moduli`.
+
+    The Gödel number is the product of the positional primes, each raised to
+    the power tower of its exponent (e.g., `(13)^(3)^(5)` is `13^(3^5)`).
+    Towers are evaluated with modular exponentiation, and their exponents are
+    reduced with the (generalized) Euler's theorem.
+
+    Parameters
+    ----------
+    entries : Iterable[tuple[int, tuple[Union[int, float], ...]]]
+        The `(positional_prime, exponent)` entries of the certificate.
+    moduli : tuple[int, ...], optional (default = FINGERPRINT_MODULI)
+        The moduli. Must be primes larger than the positional primes, whose
+        chains of totients only have small prime factors.
+
+    Returns
+    -------
+    fingerprint : tuple[int, ...]
+        The Gödel number modulo each of `moduli`.
+    """
+
+    # The moduli are primes, so there is no need to factor them
+    for modulus in moduli:
+        _totients.setdefault(modulus, modulus - 1)
+
+    fingerprint: list[int] = [1] * len(moduli)
+
+    for positional_prime, exponent in entries:
+        tower = (positional_prime, *(_to_natural(element) for element in exponent))
+        capped_towers = _compute_capped_towers(tower)
+
+        for idx, modulus in enumerate(moduli):
+            fingerprint[idx] = (
+                fingerprint[idx]
+                * power_tower_mod(tower, modulus, capped_towers)
+            ) % modulus
+
+    return tuple(fingerprint)
+
+
+def power_tower_mod(
+    tower: tuple[int, ...],
+    modulus: int,
+    capped_towers: Union[list[int], None] = None
+) -> int:
+    """
+    Compute a power tower (e.g., `a^(b^c)`) modulo some number.
+
+    If the exponent of the tower (e.g., `b^c`) is small, it is computed
+    exactly. Otherwise, it is reduced modulo the totient of `modulus`, and the
+    totient is added back, as `a^e = a^(e mod phi(n) + phi(n)) (mod n)` for
+    any `a` and large enough `e`.
+
+    Parameters
+    ----------
+    tower : tuple[int, ...]
+        The numbers of the tower, from the base up. Must be natural numbers.
+    modulus : int
+        The modulus.
+    capped_towers : list[int] or None, optional (default = None)
+        The value of the tower that starts at each index, capped at
+        `TOWER_CAP`. Computed if `None`.
+
+    Returns
+    -------
+    : int
+        The value of the tower modulo `modulus`.
+    """
+
+    if capped_towers is None:
+        capped_towers = _compute_capped_towers(tower)
+
+    return _power_tower_mod(tower, 0, modulus, capped_towers)
+
+
+def _power_tower_mod(
+    tower: tuple[int, ...],
+    start: int,
+    modulus: int,
+    capped_towers: list[int]
+) -> int:
+    """
+    Compute the power tower that starts at some index modulo some number.
+
+    Parameters
+    ----------
+    tower : tuple[int, ...]
+        The numbers of the tower, from the base up.
+    start : int
+        The index of the base of the tower to compute.
+    modulus : int
+        The modulus.
+    capped_towers : list[int]
+        The value of the tower that starts at each index, capped at
+        `TOWER_CAP`.
+
+    Returns
+    -------
+    : int
+        The value of the tower modulo `modulus`.
+    """
+
+    if modulus == 1:
+        return 0
+
+    base = tower[start]
+
+    if start == len(tower) - 1:
+        return base % modulus
+
+    exponent = capped_towers[start + 1]
+
+    if exponent < TOWER_CAP:
+        return pow(base, exponent, modulus)
+
+    modulus_totient = totient(modulus)
+    reduced_exponent = _power_tower_mod(tower, start + 1, modulus_totient, capped_towers)
+
+    return pow(base, reduced_exponent + modulus_totient, modulus)
+
+
+def _compute_capped_towers(tower: tuple[int, ...]) -> list[int]:
+    """
+    Compute the value of the tower that starts at each index, capped at
+    `TOWER_CAP`.
+
+    Parameters
+    ----------
+    tower : tuple[int, ...]
+        The numbers of the tower, from the base up.
+
+    Returns
+    -------
+    capped_towers : list[int]
+        The capped value of the tower that starts at each index.
+    """
+
+    capped_towers: list[int] = [0] * len(tower)
+    capped_towers[-1] = min(tower[-1], TOWER_CAP)
+
+    for idx in reversed(range(len(tower) - 1)):
+        base, exponent = tower[idx], capped_towers[idx + 1]
+
+        if base <= 1 or exponent == 0:
+            capped_towers[idx] = base ** min(exponent, 1)
+
+        elif exponent >= TOWER_CAP.bit_length():
+            capped_towers[idx] = TOWER_CAP
+
+        else:
+            capped_towers[idx] = min(base ** exponent, TOWER_CAP)
+
+    return capped_towers
+
+
+def totient(number: int) -> int:
+    """
+    Compute Euler's totient of a number, by trial division.
+
+    Results are cached, as the same chains of totients are computed for every
+    tower.
+
+    Parameters
+    ----------
+    number : int
+        The number.
+
+    Returns
+    -------
+    result : int
+        The amount of numbers up to `number` that are coprime with it.
+    """
+
+    if number in _totients:
+        return _totients[number]
+
+    result = number
+    remaining = number
+    factor = 2
+
+    while factor * factor <= remaining:
+        if remaining % factor == 0:
+            while remaining % factor == 0:
+                remaining //= factor
+
+            result -= result // factor
+
+        factor += 1 if factor == 2 else 2
+
+    if remaining > 1:
+        result -= result // remaining
+
+    _totients[number] = result
+
+    return result
+
+
+def _to_natural(element: Union[int, float]) -> int:
+    """
+    Map an element of an exponent to a natural number.
+
+    Natural numbers are kept. Negative numbers and floating point numbers
+    (by their IEEE 754 representation) are mapped past `NEGATIVE_OFFSET` and
+    `FLOAT_OFFSET`, respectively.
+
+    Parameters
+    ----------
+    element : Union[int, float]
+        The element.
+
+    Returns
+    -------
+    : int
+        The natural number that represents the element.
+    """
+
+    if isinstance(element, float):
+        return FLOAT_OFFSET + int.from_bytes(struct.pack("<d", element), "little")
+
+    if element < 0:
+        return NEGATIVE_OFFSET - element
+
+    return element
@@ -1,17 +1,15 @@
 """Certificator for the frontend representation of [C]haron programs."""
 
-import re
+from typing import Iterable, Union
 
 from typing_extensions import override
 
 from src.abstract_syntax_tree import AbstractSyntaxTree
+from src.ast_nodes import FUNC_DEF, VariablePrimeLabel
 from src.certificators.abstract_certificator import AbstractCertificator
-from src.utils import (
-    primes_list,
-    next_prime,
-    get_certificate_symbol,
-    TYPE_SYMBOLS_MAP
-)
+from src.certificators.certificate import Certificate, Exponent
+from src.prime_provider import SHARED_PRIME_PROVIDER
+from src.utils import get_certificate_symbol, TYPE_SYMBOLS_MAP
 
 
 class FrontendCertificator(AbstractCertificator):
@@ -29,132 +27,165 @@ class FrontendCertificator(AbstractCertificator):
 
         self.ast: AbstractSyntaxTree = ast
 
+        # Maps the name of each function to its `FUNC_DEF` node
+        self.function_nodes: dict[str, FUNC_DEF] = {
+            node.get_function_name(): node
+            for node in self.ast.root.children
+            if isinstance(node, FUNC_DEF)
+        }
+        self.function_names = list(self.function_nodes)
+
+        # Whether the AST has been certificated (i.e., the labels of its nodes
+        # and the primes of its variables have been computed)
+        self.is_ast_certificated: bool = False
+
     @override
-    def certificate(self, **kwargs) -> str:
+    def certificate(self, **kwargs) -> Certificate:
         """
         Certificate the frontend code.
 
         This method traverses the AST and annotate each node with its relative
-        position and contents.
+        position and contents. The certificate is composed from the modular
+        certificates of the functions.
 
         Returns
         -------
-        computed_certificate : str
-            The the computed certificate.
+        computed_certificate : Certificate
+            The computed certificate.
         """
 
-        computed_exponents = self._certificate_ast()
-        computed_exponents = self._handle_variables_primes(computed_exponents)
-        computed_exponents = self._add_var_def_symbols(computed_exponents)
-
-        self.computed_certificate = [
-            f"{positional_prime}^({exponent})"
-            for positional_prime, exponent in zip(
-                primes_list(len(computed_exponents)),
-                computed_exponents
-            )
-        ]
-
-        self.computed_certificate = "*".join(self.computed_certificate)
+        self.computed_certificate = self.compose(self.certificate_functions())
 
         return self.computed_certificate
 
-    def _certificate_ast(self) -> list[str]:
+    @override
+    def _certificate_function(self, function_name: str) -> Certificate:
         """
-        Certificate the Abstract Syntax Tree.
+        Certificate the subtree of a function.
 
-        Notice that the certificate generated by this method is incomplete: it
-        lacks symbols for the types.
+        Parameters
+        ----------
+        function_name : str
+            The name of the function.
 
         Returns
         -------
-        ast_certificate : list[str]
-            The list of labels of the AST certificate.
+        : Certificate
+            The certificate of the function.
         """
 
-        self.environment = self.ast.root.certificate(
-            certificator_env=self.environment
+        self._certificate_ast()
+
+        computed_exponents = self._handle_variables_primes(
+            self.function_nodes[function_name].iter_certificate_label()
         )
-        ast_certificate = self.ast.root.get_certificate_label()
 
-        return ast_certificate
-    
-    def _handle_variables_primes(self, computed_exponents: list[str]) -> list[str]:
-        """
-        Handle variables primes by emitting it only for active variables.
-        
-        This method also replaces all the placeholders in `computed_exponents`
-        with emitted primes.
+        return Certificate.from_exponents(computed_exponents)
 
-        Parameters
-        ----------
-        computed_exponents : list[str]
-            The list of labels of the AST certificate.
+    @override
+    def _certificate_program_end(self) -> Certificate:
+        """
+        Certificate the end of the program (i.e., the `PROG` node itself).
 
         Returns
         -------
-        computed_exponents : list[str]
-            The list of labels of the AST certificate, after replacing
-            placeholders.
+        : Certificate
+            The certificate of the end of the program.
+        """
+
+        self._certificate_ast()
+
+        computed_exponents = self._handle_variables_primes(
+            self.ast.root.certificate_label
+        )
+
+        return Certificate.from_exponents(computed_exponents)
+
+    def _certificate_ast(self) -> None:
         """
+        Certificate the Abstract Syntax Tree, and emit the primes of its
+        variables (only once).
+
+        Notice that the labels of the nodes are incomplete: they lack the
+        primes of the variables, that are filled by `_handle_variables_primes`
+        as the labels are streamed from the AST.
+        """
+
+        if self.is_ast_certificated:
+            return
+
+        self.environment = self.ast.root.certificate(
+            certificator_env=self.environment
+        )
 
         # Emit primes for "alive" variables
         for var_id, entry in self.environment.items():
             if entry["active"]:
                 self.environment[var_id]["prime"] = self.current_prime
-                self.current_prime = next_prime(self.current_prime)
+                self.current_prime = SHARED_PRIME_PROVIDER.next_prime(self.current_prime)
 
-        # Replace placeholders
-        pattern = r"VAR_(\d+)_PRIME_PLACEHOLDER"
+        self.is_ast_certificated = True
 
-        for idx, element in enumerate(computed_exponents):
-            matches = re.finditer(pattern, element)
+    def _handle_variables_primes(
+        self,
+        computed_exponents: Iterable[Union[Exponent, VariablePrimeLabel]]
+    ) -> list[Exponent]:
+        """
+        Fill the slots of the labels in `computed_exponents` with the primes
+        of the variables, in a single pass.
 
-            for match in matches:
-                string_with_placeholder = match.group(0)
-                var_id = int(match.group(1))
-                var_prime = self.environment[var_id]["prime"]
-                computed_exponents[idx] = computed_exponents[idx].replace(
-                    string_with_placeholder,
-                    f"{var_prime}"
-                )
+        Parameters
+        ----------
+        computed_exponents : Iterable[Union[Exponent, VariablePrimeLabel]]
+            The labels of the AST certificate.
 
-        return computed_exponents
-    
-    def _add_var_def_symbols(self, computed_exponents: list[str]) -> list[str]:
+        Returns
+        -------
+        : list[Exponent]
+            The list of labels of the AST certificate, after filling the
+            slots.
         """
-        Add `VAR_DEF` symbols to the beginning of `computed_exponents`.
+
+        return [
+            (
+                element.resolve(self.environment)
+                if isinstance(element, VariablePrimeLabel)
+                else element
+            )
+            for element in computed_exponents
+        ]
+
+    @override
+    def _certificate_var_defs(self) -> Certificate:
+        """
+        Certificate the definitions of the variables (i.e., `VAR_DEF` symbols).
 
         Only variables that are `active` in the certificator environment will
         be considered.
 
-        Parameters
-        ----------
-        computed_exponents : list[str]
-            The list of labels of the AST certificate.
-
         Returns
         -------
-        computed_exponents : list[str]
-            The list of labels of the AST certificate, added with `VAR_DEF`
-            labels.
+        : Certificate
+            The certificate of the definitions of the variables.
         """
 
+        self._certificate_ast()
+
         var_def_exponents = []
-        var_def_base_symbol = get_certificate_symbol("VAR_DEF")
+        var_def_base_symbol = int(get_certificate_symbol("VAR_DEF"))
 
         for var_data in self.environment.values():
             if any([not var_data["active"], var_data.get("parameter", False)]):
                 continue
 
-            type_symbols = "^".join([
-                f'({TYPE_SYMBOLS_MAP[_type]["type_symbol"]})'
+            type_symbols = tuple(
+                TYPE_SYMBOLS_MAP[_type]["type_symbol"]
                 for _type in var_data["type"]
-            ])
+            )
 
-            var_def_exponents.append(f"({var_def_base_symbol})^{type_symbols}")
+            var_def_exponents.append((var_def_base_symbol, *type_symbols))
 
-        return [*var_def_exponents, *computed_exponents]
+        return Certificate.from_exponents(var_def_exponents)
 
     def _add_types_certificates(self, certificate: str) -> str:
         """
@@ -179,7 +210,7 @@ class FrontendCertificator(AbstractCertificator):
             type_certificate = "*".join(
                 f"({position_prime}^{type_symbol})"
                 for position_prime, type_symbol in zip(
-                    primes_list(len(type_symbols)),       
+                    SHARED_PRIME_PROVIDER.get_primes(len(type_symbols)),
                     type_symbols
                 )
             )
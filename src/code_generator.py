@@ -6,6 +6,17 @@ from src.ast_nodes.basic.PROG import PROG
 from src.ast_nodes.functions.FUNC_DEF import FUNC_DEF
 from src.ast_nodes.variables.STRUCT_DEF import STRUCT_DEF
 from src.ast_nodes.variables.VAR_DEF import VAR_DEF
+from src.optimizations import (
+    AbsoluteLoadRule,
+    AbsoluteStoreRule,
+    ConstantCopyRule,
+    ConstantFolder,
+    InvariantReassociator,
+    LoopInvariantCodeMotion,
+    PeepholeOptimizer,
+    ShortCircuitLowering
+)
+from src.register_allocator import RegisterAllocator
 
 
 class CodeGenerator:
@@ -18,12 +29,37 @@ class CodeGenerator:
     root : PROG
         The root of an Abstract Syntax Tree generated by the
         `src.abstract_syntax_tree.AbstractSyntaxTree`. class
+    optimization_level : int, optional (default = 0)
+        The optimization level. If `0`, the code is not optimized. If `1` or
+        higher, the code of each function goes through the peephole optimizer,
+        that fuses the accesses to variables at constant addresses into
+        superinstructions, and writes constants straight into the registers
+        they are copied to. The right hand sides of logical operations are
+        also skipped whenever their left hand sides determine the result
+        (i.e., short-circuited). If `2` or higher, loop-invariant expressions
+        are hoisted out of `WHILE` loops.
+    trust_ast_optimizations : bool, optional (default = False)
+        Whether to also optimize the AST before the code is generated, if the
+        optimization level is `2` or higher: its constant subtrees are folded,
+        and the loop-invariant operands of its expressions are grouped, so
+        they can be hoisted out of loops.
+        These optimizations are trusted, not validated: they rewrite the AST
+        in place, so the frontend certificate is computed from the optimized
+        AST, and a bug in them would be certified as correct.
     """
 
-    def __init__(self, root: PROG) -> None:
+    def __init__(
+        self,
+        root: PROG,
+        optimization_level: int = 0,
+        trust_ast_optimizations: bool = False
+    ) -> None:
         self.root: PROG = root
+        self.optimization_level: int = optimization_level
+        self.trust_ast_optimizations: bool = trust_ast_optimizations
         self.program: dict[str, Union[list, dict]] = {
             "functions": {},
+            "function_table": {},
             "global_vars": [],
             "data": {},
             "code": [],
@@ -46,6 +82,31 @@ class CodeGenerator:
             The string representation of a CodeGenerator object.
         """
 
+        return self.format()
+
+    def format(self, annotations: Union[dict[int, str], None] = None) -> str:
+        """
+        Format the generated code as a listing, optionally annotated.
+
+        Parameters
+        ----------
+        annotations : dict[int, str] or None, optional (default = None)
+            Maps the indices of the bytecodes (in `self.program["code"]`) to
+            annotations (e.g., the profile of their execution, from the
+            `ExecutionProfiler.get_annotations` method), shown to their left.
+
+        Returns
+        -------
+        _str : str
+            The listing.
+        """
+
+        annotations = annotations or {}
+        annotation_width: int = max(
+            (len(annotation) for annotation in annotations.values()),
+            default=0
+        )
+
         _str: str = ""
         indent: int = 1
 
@@ -71,6 +132,10 @@ class CodeGenerator:
             for index in range(start_index, end_index):
                 instruction = self.program["code"][index]
                 _str += "\n"
+
+                if annotations:
+                    _str += f"{annotations.get(index, ''):>{annotation_width}} "
+
                 _str += "  " * indent
                 _str += str(instruction)
 
@@ -97,14 +162,17 @@ class CodeGenerator:
             Abstract Syntax Tree representation of a program.
         """
 
+        self.optimize_ast()
         self.parse_global_variables()
         self.parse_functions()
+        self._export_data()
+        self.optimize()
+        self.allocate_registers()
 
         # Add the HALT instruction at the end of the generated code.
         self.program["code"].append({"instruction": "HALT", "metadata": {}})
 
         self._add_ids_to_source()
-        self._export_data()
 
         return self.program
 
@@ -127,6 +195,14 @@ class CodeGenerator:
     def parse_functions(self) -> None:
         """
         Generate code for each function and add it to the generated program.
+
+        Registers are numbered per function: the numbering restarts at every
+        function, and every intermediate value gets a new register (they are
+        only reused after `allocate_registers`). The number of parameters a
+        function takes is stored along with its indices.
+
+        This method also builds the function table, that maps the function IDs
+        (i.e., the order in which they are defined) to their entry addresses.
         """
 
         index: int = len(self.program["code"])
@@ -135,20 +211,88 @@ class CodeGenerator:
             node for node in self.root.children if isinstance(node, FUNC_DEF)
         ]
 
-        for function_def in function_def_nodes:
+        for function_id, function_def in enumerate(function_def_nodes, start=1):
             function_name = function_def.get_function_name()
             function_indices = {"start": index}
 
+            self.register = 0
             code, self.register, self.environment = function_def.generate_code(
                 register=self.register,
                 environment=self.environment
             )
+
             self.program["code"].extend(code)
 
             index += len(code)
 
             function_indices["end"] = index
+            function_indices["parameters"] = len(function_def.parameters)
             self.program["functions"][function_name] = function_indices
+            self.program["function_table"][function_id] = function_indices["start"]
+
+    def optimize_ast(self) -> None:
+        """
+        Optimize the AST, according to `self.optimization_level`.
+
+        The AST is modified in place, so its frontend certificate matches the
+        generated code. This method must run before the code is generated.
+
+        These optimizations are trusted (i.e., not validated), so they only
+        run if `self.trust_ast_optimizations` is set.
+        """
+
+        if self.optimization_level < 2 or not self.trust_ast_optimizations:
+            return
+
+        constant_folder = ConstantFolder(root=self.root)
+        self.root = constant_folder.fold()
+
+        # Group the loop-invariant operands, so they can be hoisted later
+        invariant_reassociator = InvariantReassociator(root=self.root)
+        self.root = invariant_reassociator.reassociate()
+
+    def optimize(self) -> None:
+        """
+        Optimize the generated code, according to `self.optimization_level`.
+
+        This method must run before `allocate_registers`.
+        """
+
+        if self.optimization_level < 1:
+            return
+
+        peephole_optimizer = PeepholeOptimizer(
+            program=self.program,
+            rules=[
+                AbsoluteLoadRule(),
+                AbsoluteStoreRule(),
+                ConstantCopyRule(),
+            ]
+        )
+        self.program = peephole_optimizer.optimize()
+
+        short_circuit_lowering = ShortCircuitLowering(program=self.program)
+        self.program = short_circuit_lowering.optimize()
+
+        if self.optimization_level < 2:
+            return
+
+        loop_invariant_code_motion = LoopInvariantCodeMotion(program=self.program)
+        self.program = loop_invariant_code_motion.optimize()
+
+    def allocate_registers(self) -> None:
+        """
+        Allocate the registers of each function with the `RegisterAllocator`.
+
+        The number of registers each function uses is stored along with its
+        indices.
+        """
+
+        for function_indices in self.program["functions"].values():
+            code = self.program["code"][function_indices["start"]:function_indices["end"]]
+
+            register_allocator = RegisterAllocator(code=code)
+            function_indices["registers"] = register_allocator.allocate()
 
     def get_program(self) -> dict[str, dict]:
         """
@@ -0,0 +1,278 @@
+"""Implement a profiler of the execution of programs on the virtual machine."""
+
+from typing import Union
+
+
+class ExecutionProfiler:
+    """
+    Profiler of the execution of a program on the `VirtualMachine`.
+
+    The virtual machine counts how many times each bytecode runs: the counts
+    per opcode and per function are derived from these after the execution.
+    The time spent in each function is measured only when functions are
+    called (`JAL`) and return (`JR ret_address`): the exclusive time of a
+    function excludes the time spent in the functions it calls, and its
+    inclusive time does not (recursive calls are only counted once).
+
+    Counts and times accumulate over every run of the virtual machine.
+
+    Parameters
+    ----------
+    program : dict[str, Union[list, dict]]
+        The program generated by the `CodeGenerator.generate_code` method.
+    """
+
+    def __init__(self, program: dict[str, Union[list, dict]]) -> None:
+        self.program: dict[str, Union[list, dict]] = program
+
+        code_length = len(program["code"])
+
+        # Maps each bytecode to the amount of times it ran, and to the name of
+        # the function it belongs to (`None` for the final `HALT`)
+        self.counts: list[int] = [0] * code_length
+        self.bytecode_functions: list[Union[str, None]] = [None] * code_length
+
+        for function_name, function in program["functions"].items():
+            for bytecode_idx in range(function["start"], function["end"]):
+                self.bytecode_functions[bytecode_idx] = function_name
+
+        # Maps the index of each `JAL` to the name of the function it calls
+        functions_starts = {
+            function["start"]: function_name
+            for function_name, function in program["functions"].items()
+        }
+        self.call_targets: dict[int, str] = {}
+
+        # Whether each bytecode calls or returns from a function
+        self.is_event: list[bool] = [False] * code_length
+
+        for bytecode_idx, bytecode in enumerate(program["code"]):
+            instruction = bytecode["instruction"]
+            metadata = bytecode["metadata"]
+
+            if instruction == "JAL":
+                function_start = program["function_table"][metadata["value"]]
+                self.call_targets[bytecode_idx] = functions_starts[function_start]
+                self.is_event[bytecode_idx] = True
+
+            elif instruction == "JR" and metadata["register"] == "ret_address":
+                self.is_event[bytecode_idx] = True
+
+        self.calls: dict[str, int] = {name: 0 for name in program["functions"]}
+        self.inclusive_time: dict[str, float] = {name: 0.0 for name in program["functions"]}
+        self.exclusive_time: dict[str, float] = {name: 0.0 for name in program["functions"]}
+
+        # The functions being run (and when they were called), innermost last
+        self.call_stack: list[tuple[str, float]] = []
+
+        # How many times each function is in `self.call_stack`
+        self.active_calls: dict[str, int] = {name: 0 for name in program["functions"]}
+
+        # When the exclusive time of the innermost function was last updated
+        self.last_time: float = 0.0
+
+    def start(self, now: float) -> None:
+        """
+        Handle the start of the execution, at the `main` function.
+
+        Parameters
+        ----------
+        now : float
+            The current time, in seconds.
+        """
+
+        self.last_time = now
+        self._enter("main", now)
+
+    def stop(self, now: float) -> None:
+        """
+        Handle the end of the execution (i.e., return from every function that
+        is still running).
+
+        Parameters
+        ----------
+        now : float
+            The current time, in seconds.
+        """
+
+        while self.call_stack:
+            self._leave(now)
+
+    def handle_event(self, bytecode_idx: int, now: float) -> None:
+        """
+        Handle a call to (`JAL`) or a return from (`JR ret_address`) a
+        function, right before it runs.
+
+        Parameters
+        ----------
+        bytecode_idx : int
+            The index of the `JAL` or `JR` bytecode.
+        now : float
+            The current time, in seconds.
+        """
+
+        if bytecode_idx in self.call_targets:
+            self._enter(self.call_targets[bytecode_idx], now)
+
+        elif self.call_stack:
+            self._leave(now)
+
+    def get_opcode_counts(self) -> dict[str, int]:
+        """
+        Get the amount of times each opcode ran.
+
+        Returns
+        -------
+        opcode_counts : dict[str, int]
+            Maps each opcode that ran to its count, from the most to the least
+            frequent.
+        """
+
+        opcode_counts: dict[str, int] = {}
+
+        for bytecode, count in zip(self.program["code"], self.counts):
+            if count:
+                instruction = bytecode["instruction"]
+                opcode_counts[instruction] = opcode_counts.get(instruction, 0) + count
+
+        return dict(sorted(opcode_counts.items(), key=lambda item: -item[1]))
+
+    def get_function_stats(self) -> dict[str, dict[str, Union[int, float]]]:
+        """
+        Get the statistics of each function.
+
+        Returns
+        -------
+        function_stats : dict[str, dict[str, Union[int, float]]]
+            Maps each function to its amount of `calls`, the amount of
+            `instructions` run in its body, and its `inclusive_time` and
+            `exclusive_time` (in seconds). Sorted from the largest to the
+            smallest exclusive time.
+        """
+
+        instructions: dict[str, int] = {name: 0 for name in self.program["functions"]}
+
+        for function_name, count in zip(self.bytecode_functions, self.counts):
+            if function_name is not None:
+                instructions[function_name] += count
+
+        function_stats = {
+            function_name: {
+                "calls": self.calls[function_name],
+                "instructions": instructions[function_name],
+                "inclusive_time": self.inclusive_time[function_name],
+                "exclusive_time": self.exclusive_time[function_name],
+            }
+            for function_name in self.program["functions"]
+        }
+
+        return dict(
+            sorted(function_stats.items(), key=lambda item: -item[1]["exclusive_time"])
+        )
+
+    def get_annotations(self) -> dict[int, str]:
+        """
+        Get the annotation of each bytecode: the amount of times it ran, and
+        its share of all the bytecodes that ran.
+
+        Returns
+        -------
+        : dict[int, str]
+            Maps the index of each bytecode to its annotation.
+        """
+
+        total = sum(self.counts) or 1
+
+        return {
+            bytecode_idx: f"{count:>10} {count / total:>7.2%}"
+            for bytecode_idx, count in enumerate(self.counts)
+        }
+
+    def format(self) -> str:
+        """
+        Format the counts per opcode and the statistics per function as
+        tables.
+
+        Returns
+        -------
+        : str
+            The tables.
+        """
+
+        lines = [f"{'opcode':<12}{'count':>12}"]
+
+        for opcode, count in self.get_opcode_counts().items():
+            lines.append(f"{opcode:<12}{count:>12}")
+
+        lines.append("")
+        lines.append(
+            f"{'function':<20}{'calls':>10}{'instructions':>14}"
+            f"{'inclusive (ms)':>16}{'exclusive (ms)':>16}"
+        )
+
+        for function_name, stats in self.get_function_stats().items():
+            lines.append(
+                f"{function_name:<20}{stats['calls']:>10}{stats['instructions']:>14}"
+                f"{stats['inclusive_time'] * 1e3:>16.3f}"
+                f"{stats['exclusive_time'] * 1e3:>16.3f}"
+            )
+
+        return "\n".join(lines)
+
+    def print(self) -> None:
+        """Print the counts per opcode and the statistics per function."""
+
+        print(self.format())
+
+    def _enter(self, function_name: str, now: float) -> None:
+        """
+        Handle the call of a function.
+
+        Parameters
+        ----------
+        function_name : str
+            The name of the called function.
+        now : float
+            The current time, in seconds.
+        """
+
+        self._update_exclusive_time(now)
+
+        self.calls[function_name] += 1
+        self.active_calls[function_name] += 1
+        self.call_stack.append((function_name, now))
+
+    def _leave(self, now: float) -> None:
+        """
+        Handle the return from the innermost function.
+
+        Parameters
+        ----------
+        now : float
+            The current time, in seconds.
+        """
+
+        self._update_exclusive_time(now)
+
+        function_name, call_time = self.call_stack.pop()
+        self.active_calls[function_name] -= 1
+
+        # Only the outermost call of recursive functions counts
+        if not self.active_calls[function_name]:
+            self.inclusive_time[function_name] += now - call_time
+
+    def _update_exclusive_time(self, now: float) -> None:
+        """
+        Charge the time since the last event to the innermost function.
+
+        Parameters
+        ----------
+        now : float
+            The current time, in seconds.
+        """
+
+        if self.call_stack:
+            innermost_function, _ = self.call_stack[-1]
+            self.exclusive_time[innermost_function] += now - self.last_time
+
+        self.last_time = now
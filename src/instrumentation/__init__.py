@@ -0,0 +1,7 @@
+"""Export classes to allow `from src.instrumentation import ...`."""
+
+from .abstract_subscriber import AbstractSubscriber
+from .instrumentation import SHARED_INSTRUMENTATION, Instrumentation
+from .json_lines_subscriber import JSONLinesSubscriber
+from .stage_event import StageEvent
+from .summary_subscriber import SummarySubscriber
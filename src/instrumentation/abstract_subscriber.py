@@ -0,0 +1,27 @@
+"""Base class for subscribers of the instrumentation of the pipeline."""
+
+from abc import abstractmethod
+
+from src.instrumentation.stage_event import StageEvent
+
+
+class AbstractSubscriber:
+    """
+    Base class for subscribers of the instrumentation of the pipeline.
+
+    Subscribers are registered with `Instrumentation.subscribe`, and are
+    notified of the start and of the end of each stage.
+    """
+
+    @abstractmethod
+    def on_event(self, event: StageEvent) -> None:
+        """
+        Handle an event.
+
+        Parameters
+        ----------
+        event : StageEvent
+            The event.
+        """
+
+        pass
@@ -0,0 +1,199 @@
+"""Implement the instrumentation of the stages of the pipeline."""
+
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Iterator
+
+from src.instrumentation.abstract_subscriber import AbstractSubscriber
+from src.instrumentation.stage_event import StageEvent
+
+
+# Returned by `Instrumentation.stage` when there are no subscribers
+_NULL_STAGE: ContextManager[None] = nullcontext()
+
+
+class Instrumentation:
+    """
+    Emit events when the stages of the pipeline start and end.
+
+    The pipeline wraps each of its stages with `stage`, and every subscriber
+    is notified with a `StageEvent` when it starts and when it ends. End
+    events carry the wall time, the CPU time and (if `trace_memory` is set)
+    the `tracemalloc` peak of the stage. Memory is only traced while stages
+    run, and tracing it slows them down, so it can be disabled to get
+    accurate timings.
+
+    When there are no subscribers, `stage` returns a shared no-op context
+    manager, so an idle instrumentation costs a single check per stage.
+
+    Stages may be nested: the memory peak of a stage accounts for the peaks
+    of the stages nested in it.
+
+    The pipeline is instrumented through `SHARED_INSTRUMENTATION` by default.
+
+    Parameters
+    ----------
+    trace_memory : bool, optional (default = True)
+        Whether to measure the memory peak of each stage.
+    """
+
+    def __init__(self, trace_memory: bool = True) -> None:
+        self.trace_memory: bool = trace_memory
+        self.subscribers: list[AbstractSubscriber] = []
+
+        # The memory in use when each running stage started, and the largest
+        # peak of the stages nested in it, innermost last
+        self.memory_stack: list[list[int]] = []
+        self.is_tracing_memory: bool = False
+
+    def subscribe(self, subscriber: AbstractSubscriber) -> AbstractSubscriber:
+        """
+        Register a subscriber.
+
+        Parameters
+        ----------
+        subscriber : AbstractSubscriber
+            The subscriber.
+
+        Returns
+        -------
+        subscriber : AbstractSubscriber
+            The same subscriber, for convenience.
+        """
+
+        self.subscribers.append(subscriber)
+
+        return subscriber
+
+    def unsubscribe(self, subscriber: AbstractSubscriber) -> None:
+        """
+        Unregister a subscriber.
+
+        Parameters
+        ----------
+        subscriber : AbstractSubscriber
+            The subscriber.
+
+        Raises
+        ------
+        ValueError
+            Raised if the subscriber is not registered.
+        """
+
+        self.subscribers.remove(subscriber)
+
+    def stage(self, name: str) -> ContextManager[None]:
+        """
+        Instrument a stage of the pipeline, that runs in the returned context.
+
+        Parameters
+        ----------
+        name : str
+            The name of the stage.
+
+        Returns
+        -------
+        : ContextManager[None]
+            The context to run the stage in.
+        """
+
+        if not self.subscribers:
+            return _NULL_STAGE
+
+        return self._instrument_stage(name)
+
+    def emit(self, event: StageEvent) -> None:
+        """
+        Notify every subscriber of an event.
+
+        Parameters
+        ----------
+        event : StageEvent
+            The event.
+        """
+
+        for subscriber in self.subscribers:
+            subscriber.on_event(event)
+
+    @contextmanager
+    def _instrument_stage(self, name: str) -> Iterator[None]:
+        """
+        Emit the start and end events of a stage around its execution.
+
+        Parameters
+        ----------
+        name : str
+            The name of the stage.
+        """
+
+        self.emit(StageEvent(stage=name, kind=StageEvent.START, timestamp=time.time()))
+
+        if self.trace_memory:
+            self._start_memory_trace()
+
+        start_wall_time = time.perf_counter()
+        start_cpu_time = time.process_time()
+
+        try:
+            yield
+
+        finally:
+            wall_time = time.perf_counter() - start_wall_time
+            cpu_time = time.process_time() - start_cpu_time
+            memory_peak = self._stop_memory_trace() if self.trace_memory else None
+
+            self.emit(
+                StageEvent(
+                    stage=name,
+                    kind=StageEvent.END,
+                    timestamp=time.time(),
+                    wall_time=wall_time,
+                    cpu_time=cpu_time,
+                    memory_peak=memory_peak
+                )
+            )
+
+    def _start_memory_trace(self) -> None:
+        """Start tracing the memory of a stage."""
+
+        if not self.memory_stack and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.is_tracing_memory = True
+
+        current_memory, peak_memory = tracemalloc.get_traced_memory()
+
+        # Save the peak of the enclosing stage before resetting it
+        if self.memory_stack:
+            self.memory_stack[-1][1] = max(self.memory_stack[-1][1], peak_memory)
+
+        tracemalloc.reset_peak()
+        self.memory_stack.append([current_memory, current_memory])
+
+    def _stop_memory_trace(self) -> int:
+        """
+        Stop tracing the memory of a stage.
+
+        Returns
+        -------
+        : int
+            The peak memory usage of the stage, on top of the memory in use
+            when it started.
+        """
+
+        _, peak_memory = tracemalloc.get_traced_memory()
+        start_memory, nested_peak_memory = self.memory_stack.pop()
+        peak_memory = max(peak_memory, nested_peak_memory)
+
+        # Account for this peak in the enclosing stage
+        if self.memory_stack:
+            self.memory_stack[-1][1] = max(self.memory_stack[-1][1], peak_memory)
+
+        elif self.is_tracing_memory:
+            tracemalloc.stop()
+            self.is_tracing_memory = False
+
+        return peak_memory - start_memory
+
+
+SHARED_INSTRUMENTATION: Instrumentation = Instrumentation()
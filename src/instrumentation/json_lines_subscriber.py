@@ -0,0 +1,31 @@
+"""Implement a subscriber that writes the events to a JSON lines file."""
+
+import json
+
+from typing_extensions import override
+
+from src.instrumentation.abstract_subscriber import AbstractSubscriber
+from src.instrumentation.stage_event import StageEvent
+
+
+class JSONLinesSubscriber(AbstractSubscriber):
+    """
+    Subscriber that appends each event, as a JSON object, to a file.
+
+    The file is opened on each event (so the subscriber holds no open file,
+    and can be copied to worker processes), and is never truncated: traces of
+    several runs accumulate.
+
+    Parameters
+    ----------
+    path : str
+        The path of the trace file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+
+    @override
+    def on_event(self, event: StageEvent) -> None:
+        with open(self.path, "a") as trace_file:
+            trace_file.write(json.dumps(event.to_dict()) + "\n")
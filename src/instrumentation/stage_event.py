@@ -0,0 +1,71 @@
+"""Implement the events emitted by the instrumentation of the pipeline."""
+
+from typing import Union
+
+
+class StageEvent:
+    """
+    Event emitted when a stage of the pipeline starts or ends.
+
+    Parameters
+    ----------
+    stage : str
+        The name of the stage (e.g., `lex`, `codegen` or `run`).
+    kind : str
+        Whether the stage has started (`start`) or ended (`end`).
+    timestamp : float
+        The wall clock time of the event, in seconds since the epoch.
+    wall_time : float, optional (default = 0.0)
+        The elapsed wall time of the stage, in seconds. Only set on `end`.
+    cpu_time : float, optional (default = 0.0)
+        The CPU time of the stage (of this process), in seconds. Only set on
+        `end`.
+    memory_peak : int or None, optional (default = None)
+        The peak memory usage of the stage, in bytes, on top of the memory in
+        use when it started. Only set on `end`, and if memory is traced.
+    """
+
+    START: str = "start"
+    END: str = "end"
+
+    def __init__(
+        self,
+        stage: str,
+        kind: str,
+        timestamp: float,
+        wall_time: float = 0.0,
+        cpu_time: float = 0.0,
+        memory_peak: Union[int, None] = None
+    ) -> None:
+        self.stage: str = stage
+        self.kind: str = kind
+        self.timestamp: float = timestamp
+        self.wall_time: float = wall_time
+        self.cpu_time: float = cpu_time
+        self.memory_peak: Union[int, None] = memory_peak
+
+    def to_dict(self) -> dict[str, Union[str, float, int, None]]:
+        """
+        Get the fields of this event, e.g. to serialize it.
+
+        Returns
+        -------
+        : dict[str, Union[str, float, int, None]]
+            Maps the name of each field to its value.
+        """
+
+        return {
+            "stage": self.stage,
+            "kind": self.kind,
+            "timestamp": self.timestamp,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "memory_peak": self.memory_peak,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"StageEvent(stage={self.stage!r}, kind={self.kind!r}, "
+            f"wall_time={self.wall_time}, cpu_time={self.cpu_time}, "
+            f"memory_peak={self.memory_peak})"
+        )
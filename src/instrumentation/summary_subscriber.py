@@ -0,0 +1,89 @@
+"""Implement a subscriber that summarizes the time and memory of each stage."""
+
+from typing import Union
+
+from typing_extensions import override
+
+from src.instrumentation.abstract_subscriber import AbstractSubscriber
+from src.instrumentation.stage_event import StageEvent
+
+
+class SummarySubscriber(AbstractSubscriber):
+    """
+    Subscriber that accumulates the time and the memory of each stage, and
+    formats them as a table.
+
+    Stages are listed in the order they first ended. Their times are summed
+    over every time they ran, and their memory peaks are the largest ones.
+    """
+
+    def __init__(self) -> None:
+        self.summary: dict[str, dict[str, Union[int, float, None]]] = {}
+
+    @override
+    def on_event(self, event: StageEvent) -> None:
+        if event.kind != StageEvent.END:
+            return
+
+        stage_summary = self.summary.setdefault(
+            event.stage,
+            {"calls": 0, "wall_time": 0.0, "cpu_time": 0.0, "memory_peak": None}
+        )
+
+        stage_summary["calls"] += 1
+        stage_summary["wall_time"] += event.wall_time
+        stage_summary["cpu_time"] += event.cpu_time
+
+        if event.memory_peak is not None:
+            stage_summary["memory_peak"] = max(
+                stage_summary["memory_peak"] or 0, event.memory_peak
+            )
+
+    def get_summary(self) -> dict[str, dict[str, Union[int, float, None]]]:
+        """
+        Get the summary of each stage.
+
+        Returns
+        -------
+        : dict[str, dict[str, Union[int, float, None]]]
+            Maps each stage to its amount of `calls`, its total `wall_time`
+            and `cpu_time` (in seconds), and its largest `memory_peak` (in
+            bytes, `None` if memory was not traced).
+        """
+
+        return self.summary
+
+    def format(self) -> str:
+        """
+        Format the summary as a table.
+
+        Returns
+        -------
+        : str
+            The table.
+        """
+
+        lines = [
+            f"{'stage':<20}{'calls':>8}{'wall (ms)':>14}{'cpu (ms)':>14}{'peak (KiB)':>14}"
+        ]
+
+        for stage, stage_summary in self.summary.items():
+            memory_peak = (
+                "-"
+                if stage_summary["memory_peak"] is None
+                else f"{stage_summary['memory_peak'] / 1024:.1f}"
+            )
+
+            lines.append(
+                f"{stage:<20}{stage_summary['calls']:>8}"
+                f"{stage_summary['wall_time'] * 1e3:>14.3f}"
+                f"{stage_summary['cpu_time'] * 1e3:>14.3f}"
+                f"{memory_peak:>14}"
+            )
+
+        return "\n".join(lines)
+
+    def print(self) -> None:
+        """Print the summary as a table."""
+
+        print(self.format())
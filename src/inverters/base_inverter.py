@@ -3,6 +3,7 @@
 from abc import abstractmethod
 from typing import Union
 
+from src.certificators.certificate import Certificate
 from src.utils import INVERTED_SYMBOLS_MAP
 
 
@@ -12,12 +13,16 @@ class BaseInverter:
 
     Parameters
     ----------
-    certificate : str
-        The certificate produced from a `Certificator` class.
+    certificate : Union[Certificate, str]
+        The certificate produced from a `Certificator` class (or its string
+        format).
     """
 
-    def __init__(self, certificate: str) -> None:
-        self.original_certificate: str = certificate
+    def __init__(self, certificate: Union[Certificate, str]) -> None:
+        if isinstance(certificate, str):
+            certificate = Certificate.from_string(certificate)
+
+        self.original_certificate: Certificate = certificate
         self.certificate: list[dict[str, Union[str, dict]]] = self._preprocess_certificate()
         self.ir: list[dict[str, Union[str, dict]]] = self._get_intermediate_representation()
 
@@ -35,18 +40,13 @@ class BaseInverter:
             The preprocessed certificate, as a list of dictionaries.
         """
 
-        split_certificate = [
-            list(map(int, token.replace("(", "").replace(")", "").split("^")))
-            for token in self.original_certificate.split("*")
-        ]
-
         preprocessed_certificate = [
             {
                 "positional_prime": positional_prime,
                 "symbol": symbol,
-                "additional_info": additional_info
+                "additional_info": list(additional_info)
             }
-            for positional_prime, symbol, *additional_info in split_certificate
+            for positional_prime, (symbol, *additional_info) in self.original_certificate
         ]
 
         return preprocessed_certificate
@@ -92,8 +92,10 @@ class BaseInverter:
 
         constant_value = certificate_token["additional_info"].pop()
 
-        # Constants are always added with 1 to prevent the exponentiation identity
-        constant_value -= 1
+        # Non-negative constants are added with 1 to prevent the exponentiation
+        # identity
+        if constant_value > 0:
+            constant_value -= 1
 
         return {
             "value": constant_value
@@ -9,8 +9,9 @@ class CertificateToHighLevel(BaseInverter):
 
     Parameters
     ----------
-    certificate : str
-        The certificate produced from a `Certificator` class.
+    certificate : Union[Certificate, str]
+        The certificate produced from a `Certificator` class (or its string
+        format).
     """
 
     ir_to_high_level = {
@@ -3,7 +3,8 @@
 from copy import deepcopy
 from typing import Union
 
-from src.utils import primes_list, TYPE_SYMBOLS_MAP
+from src.prime_provider import SHARED_PRIME_PROVIDER
+from src.utils import TYPE_SYMBOLS_MAP
 
 
 class Lexer:
@@ -141,7 +142,7 @@ class Lexer:
                 functions_scopes.keys(),
                 zip(
                     range(1, len(functions_scopes) + 1),
-                    primes_list(len(functions_scopes)),
+                    SHARED_PRIME_PROVIDER.get_primes(len(functions_scopes)),
                 ),
             )
         }
@@ -0,0 +1,188 @@
+"""Implement the memory subsystem of the virtual machine."""
+
+from typing import Iterator, Union
+
+
+class Memory:
+    """
+    Flat, array-backed memory addressed by integers.
+
+    Every address holds a 64-bit slot in a contiguous buffer, which is exposed
+    both as an integer view and as a float view. A separate buffer keeps track
+    of the type of the value stored at each address, so empty positions can be
+    told apart from positions that hold zeros.
+
+    Integers are unbounded in the language, so the ones that do not fit in a
+    64-bit slot are kept apart, in `big_integers`, and their addresses are
+    typed `BIG_INT`.
+
+    Parameters
+    ----------
+    size : int
+        The memory size, in bytes (i.e., the number of addresses).
+    """
+
+    EMPTY: int = 0
+    INT: int = 1
+    FLOAT: int = 2
+    BIG_INT: int = 3
+
+    SLOT_SIZE: int = 8
+
+    def __init__(self, size: int) -> None:
+        self.size: int = size
+
+        self.buffer: bytearray = bytearray(size * self.SLOT_SIZE)
+        self.integers: memoryview = memoryview(self.buffer).cast("q")
+        self.floats: memoryview = memoryview(self.buffer).cast("d")
+        self.types: bytearray = bytearray(size)
+
+        # The integers that do not fit in 64 bits, mapped from their addresses
+        self.big_integers: dict[int, int] = {}
+
+    def __eq__(self, other: "Memory") -> bool:
+        """
+        Implement the equality comparison between Memory instances.
+
+        Parameters
+        ----------
+        other : Memory
+            The right hand side Memory of the comparison.
+
+        Returns
+        -------
+        : bool
+            `True` if all the attributes are equal, `False` otherwise.
+        """
+
+        return (
+            self.size == other.size
+            and self.types == other.types
+            and self.buffer == other.buffer
+            and self.get_big_integers() == other.get_big_integers()
+        )
+
+    def __getstate__(self) -> dict[str, Union[int, bytearray]]:
+        """
+        Get the state of this Memory to pickle (e.g., to send it to another
+        process), without the views of the buffer.
+
+        Returns
+        -------
+        : dict[str, Union[int, bytearray, dict]]
+            The size, the buffer, the types and the big integers of this
+            Memory.
+        """
+
+        return {
+            "size": self.size,
+            "buffer": self.buffer,
+            "types": self.types,
+            "big_integers": self.get_big_integers(),
+        }
+
+    def __setstate__(self, state: dict[str, Union[int, bytearray]]) -> None:
+        """
+        Restore the state of an unpickled Memory, and recreate the views of
+        the buffer.
+
+        Parameters
+        ----------
+        state : dict[str, Union[int, bytearray, dict]]
+            The size, the buffer, the types and the big integers of the
+            Memory.
+        """
+
+        self.size = state["size"]
+
+        self.buffer = state["buffer"]
+        self.integers = memoryview(self.buffer).cast("q")
+        self.floats = memoryview(self.buffer).cast("d")
+        self.types = state["types"]
+        self.big_integers = state.get("big_integers", {})
+
+    def __getitem__(self, address: int) -> Union[int, float, None]:
+        """
+        Read the value stored at `address`.
+
+        Parameters
+        ----------
+        address : int
+            The address to read from.
+
+        Returns
+        -------
+        : Union[int, float, None]
+            The value stored at `address`, or `None` if it is empty.
+        """
+
+        _type = self.types[address]
+
+        if _type == self.INT:
+            return self.integers[address]
+
+        if _type == self.FLOAT:
+            return self.floats[address]
+
+        if _type == self.BIG_INT:
+            return self.big_integers[address]
+
+        return None
+
+    def __setitem__(self, address: int, value: Union[int, float]) -> None:
+        """
+        Write `value` to `address`.
+
+        Parameters
+        ----------
+        address : int
+            The address to write to.
+        value : Union[int, float]
+            The value to store.
+        """
+
+        if isinstance(value, float):
+            self.floats[address] = value
+            self.types[address] = self.FLOAT
+
+        else:
+            try:
+                self.integers[address] = value
+                self.types[address] = self.INT
+
+            # The integer does not fit in 64 bits
+            except ValueError:
+                self.big_integers[address] = value
+                self.types[address] = self.BIG_INT
+
+    def get_big_integers(self) -> dict[int, int]:
+        """
+        Get the integers that do not fit in 64 bits, and are still stored
+        (i.e., that have not been overwritten).
+
+        Returns
+        -------
+        : dict[int, int]
+            Maps the addresses to the integers stored in them.
+        """
+
+        return {
+            address: value
+            for address, value in self.big_integers.items()
+            if self.types[address] == self.BIG_INT
+        }
+
+    def items(self) -> Iterator[tuple[int, Union[int, float]]]:
+        """
+        Iterate over the non-empty addresses and their values.
+
+        Yields
+        ------
+        : tuple[int, Union[int, float]]
+            The address and the value stored in it, in increasing address
+            order.
+        """
+
+        for address, _type in enumerate(self.types):
+            if _type != self.EMPTY:
+                yield address, self[address]
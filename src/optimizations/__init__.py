@@ -0,0 +1,12 @@
+"""Export classes to allow `from src.optimizations import ...`."""
+
+from .absolute_load import AbsoluteLoadRule
+from .absolute_store import AbsoluteStoreRule
+from .abstract_function_pass import AbstractFunctionPass
+from .abstract_peephole_rule import AbstractPeepholeRule
+from .constant_copy import ConstantCopyRule
+from .constant_folder import ConstantFolder
+from .invariant_reassociator import InvariantReassociator
+from .loop_invariant_code_motion import LoopInvariantCodeMotion
+from .peephole_optimizer import PeepholeOptimizer
+from .short_circuit_lowering import ShortCircuitLowering
@@ -0,0 +1,109 @@
+"""Peephole rule that fuses variable reads into absolute loads."""
+
+from typing import Union
+
+from typing_extensions import override
+
+from src.optimizations.abstract_peephole_rule import AbstractPeepholeRule
+from src.optimizations.utils import match_absolute_address
+
+
+class AbsoluteLoadRule(AbstractPeepholeRule):
+    """
+    Fuse the reads of variables at constant addresses into a single bytecode.
+
+    The pattern `CONSTANT r_base address; ADD r_address r_base zero;
+    LOAD r_value r_address` (optionally with a constant offset added to
+    `r_address`) is replaced by:
+
+    - `LOADA r_value address`, for `int` variables;
+    - `LOADFA r_value address`, for `float` variables (i.e., `LOADF`);
+    - `LOADSA r_short address`, for `short` variables (i.e., `LOAD` followed
+    by `TRUNC r_short r_value`).
+    """
+
+    @override
+    def match(
+        self,
+        code: list[dict[str, dict]],
+        bytecode_idx: int,
+        register_uses: dict[int, list[int]]
+    ) -> Union[dict[int, Union[dict[str, dict], None]], None]:
+        """
+        Try to match this rule at `code[bytecode_idx]`.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+        bytecode_idx : int
+            The index, in `code`, of the bytecode to start matching at.
+        register_uses : dict[int, list[int]]
+            Maps each register to the indices of the bytecodes that read it.
+
+        Returns
+        -------
+        rewrite : dict[int, Union[dict[str, dict], None]] or None
+            Maps the indices of the bytecodes to rewrite to their replacements
+            (`None` to remove the bytecode). Returns `None` if the rule does
+            not match.
+        """
+
+        absolute_address = match_absolute_address(
+            code=code,
+            bytecode_idx=bytecode_idx,
+            register_uses=register_uses
+        )
+
+        if absolute_address is None:
+            return None
+
+        address, address_register, last_bytecode_idx = absolute_address
+
+        load_bytecode_idx = last_bytecode_idx + 1
+
+        try:
+            load_bytecode = code[load_bytecode_idx]
+        except IndexError:
+            return None
+
+        is_load = (
+            load_bytecode["instruction"] in ["LOAD", "LOADF"]
+            and load_bytecode["metadata"]["value"] == address_register
+            and register_uses.get(address_register) == [load_bytecode_idx]
+        )
+
+        if not is_load:
+            return None
+
+        rewrite: dict[int, Union[dict[str, dict], None]] = {
+            idx: None
+            for idx in range(bytecode_idx, load_bytecode_idx)
+        }
+
+        value_register = load_bytecode["metadata"]["register"]
+        instruction = "LOADA" if load_bytecode["instruction"] == "LOAD" else "LOADFA"
+
+        # `short` variables are truncated right after being loaded
+        truncate_bytecode_idx = load_bytecode_idx + 1
+        is_short = (
+            instruction == "LOADA"
+            and truncate_bytecode_idx < len(code)
+            and code[truncate_bytecode_idx]["instruction"] == "TRUNC"
+            and code[truncate_bytecode_idx]["metadata"]["value"] == value_register
+            and register_uses.get(value_register) == [truncate_bytecode_idx]
+        )
+
+        if is_short:
+            rewrite[load_bytecode_idx] = None
+
+            load_bytecode_idx = truncate_bytecode_idx
+            value_register = code[truncate_bytecode_idx]["metadata"]["register"]
+            instruction = "LOADSA"
+
+        rewrite[load_bytecode_idx] = {
+            "instruction": instruction,
+            "metadata": {"register": value_register, "address": address},
+        }
+
+        return rewrite
@@ -0,0 +1,96 @@
+"""Peephole rule that fuses variable writes into absolute stores."""
+
+from typing import Union
+
+from typing_extensions import override
+
+from src.optimizations.abstract_peephole_rule import AbstractPeepholeRule
+from src.optimizations.utils import match_absolute_address
+
+
+class AbsoluteStoreRule(AbstractPeepholeRule):
+    """
+    Fuse the writes to variables at constant addresses into a single bytecode.
+
+    The pattern `CONSTANT r_base address; ADD r_address r_base zero` (optionally
+    with a constant offset added to `r_address`), whose only use is a
+    `STORE r_address r_value` some bytecodes later, is replaced by
+    `STOREA address r_value` (or `STOREFA`, for `STOREF`). The bytecodes that
+    compute `r_value` are kept as they are.
+
+    Stores of function parameters (i.e., from the `arg` register) are not
+    fused.
+    """
+
+    @override
+    def match(
+        self,
+        code: list[dict[str, dict]],
+        bytecode_idx: int,
+        register_uses: dict[int, list[int]]
+    ) -> Union[dict[int, Union[dict[str, dict], None]], None]:
+        """
+        Try to match this rule at `code[bytecode_idx]`.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+        bytecode_idx : int
+            The index, in `code`, of the bytecode to start matching at.
+        register_uses : dict[int, list[int]]
+            Maps each register to the indices of the bytecodes that read it.
+
+        Returns
+        -------
+        rewrite : dict[int, Union[dict[str, dict], None]] or None
+            Maps the indices of the bytecodes to rewrite to their replacements
+            (`None` to remove the bytecode). Returns `None` if the rule does
+            not match.
+        """
+
+        absolute_address = match_absolute_address(
+            code=code,
+            bytecode_idx=bytecode_idx,
+            register_uses=register_uses
+        )
+
+        if absolute_address is None:
+            return None
+
+        address, address_register, last_bytecode_idx = absolute_address
+
+        address_uses = register_uses.get(address_register, [])
+
+        if len(address_uses) != 1:
+            return None
+
+        store_bytecode_idx = address_uses[0]
+        store_bytecode = code[store_bytecode_idx]
+
+        is_store = (
+            store_bytecode["instruction"] in ["STORE", "STOREF"]
+            and store_bytecode["metadata"]["register"] == address_register
+            and isinstance(store_bytecode["metadata"]["value"], int)
+            and store_bytecode["metadata"]["value"] != address_register
+        )
+
+        if not is_store:
+            return None
+
+        rewrite: dict[int, Union[dict[str, dict], None]] = {
+            idx: None
+            for idx in range(bytecode_idx, last_bytecode_idx + 1)
+        }
+
+        instruction = "STOREA" if store_bytecode["instruction"] == "STORE" else "STOREFA"
+
+        rewrite[store_bytecode_idx] = {
+            "instruction": instruction,
+            "metadata": {
+                "address": address,
+                "value": store_bytecode["metadata"]["value"]
+            },
+        }
+
+        return rewrite
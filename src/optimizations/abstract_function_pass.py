@@ -0,0 +1,90 @@
+"""Base class for optimization passes over the code of each function."""
+
+from abc import abstractmethod
+from typing import Union
+
+
+class AbstractFunctionPass:
+    """
+    Base class for optimization passes that rewrite the code of each function
+    of a program independently.
+
+    After the code of every function is rewritten, the `start`/`end` indices of
+    the functions and the function table are recomputed, as the code of each
+    function might have changed in size. Passes must keep the relative
+    `jump_size` of the `JZ` bytecodes of the functions they rewrite correct.
+
+    Parameters
+    ----------
+    program : dict[str, Union[list, dict]]
+        The program generated by the `CodeGenerator`. It is modified in place.
+    """
+
+    def __init__(self, program: dict[str, Union[list, dict]]) -> None:
+        self.program: dict[str, Union[list, dict]] = program
+
+    def optimize(self) -> dict[str, Union[list, dict]]:
+        """
+        Optimize the code of every function of the program.
+
+        Returns
+        -------
+        program : dict[str, Union[list, dict]]
+            The optimized program.
+        """
+
+        code: list[dict[str, dict]] = self.program["code"]
+        optimized_code: list[dict[str, dict]] = []
+
+        # Maps the old entry address of each function to the new one
+        new_starts: dict[int, int] = {}
+
+        functions = sorted(
+            self.program["functions"].values(),
+            key=lambda function: function["start"]
+        )
+
+        last_end: int = 0
+
+        for function in functions:
+            function_code = self.optimize_function(
+                code=code[function["start"]:function["end"]]
+            )
+
+            new_starts[function["start"]] = len(optimized_code)
+            last_end = max(last_end, function["end"])
+
+            function["start"] = len(optimized_code)
+            optimized_code.extend(function_code)
+            function["end"] = len(optimized_code)
+
+        # Keep anything that comes after the functions (e.g., `HALT`)
+        optimized_code.extend(code[last_end:])
+
+        self.program["code"] = optimized_code
+        self.program["function_table"] = {
+            function_id: new_starts[start]
+            for function_id, start in self.program["function_table"].items()
+        }
+
+        return self.program
+
+    @abstractmethod
+    def optimize_function(
+        self, code: list[dict[str, dict]]
+    ) -> list[dict[str, dict]]:
+        """
+        Optimize the code of a function.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+
+        Returns
+        -------
+        code : list[dict[str, dict]]
+            The optimized code.
+        """
+
+        pass
@@ -0,0 +1,42 @@
+"""Base class for peephole optimization rules."""
+
+from abc import abstractmethod
+from typing import Union
+
+
+class AbstractPeepholeRule:
+    """
+    Base class for peephole optimization rules.
+
+    A rule inspects the code of a function starting at some bytecode and, if it
+    recognizes a pattern there, returns the rewrite that optimizes it.
+    """
+
+    @abstractmethod
+    def match(
+        self,
+        code: list[dict[str, dict]],
+        bytecode_idx: int,
+        register_uses: dict[int, list[int]]
+    ) -> Union[dict[int, Union[dict[str, dict], None]], None]:
+        """
+        Try to match this rule at `code[bytecode_idx]`.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+        bytecode_idx : int
+            The index, in `code`, of the bytecode to start matching at.
+        register_uses : dict[int, list[int]]
+            Maps each register to the indices of the bytecodes that read it.
+
+        Returns
+        -------
+        rewrite : dict[int, Union[dict[str, dict], None]] or None
+            Maps the indices of the bytecodes to rewrite to their replacements
+            (`None` to remove the bytecode). Returns `None` if the rule does
+            not match.
+        """
+
+        pass
@@ -0,0 +1,94 @@
+"""Peephole rule that writes constants straight into their destinations."""
+
+from typing import Union
+
+from typing_extensions import override
+
+from src.optimizations.abstract_peephole_rule import AbstractPeepholeRule
+
+
+class ConstantCopyRule(AbstractPeepholeRule):
+    """
+    Write constants that are used only once straight into the register they
+    are copied to.
+
+    The pattern `CONSTANT r_constant value`, whose only use is a copy right
+    after it -- either `ADD r_copy r_constant zero` or `MOV r_copy r_constant`
+    -- is replaced by `CONSTANT r_copy value`. `r_copy` might be a special
+    register (e.g., `ret_value` or `arg`, for constants that are returned or
+    passed as arguments).
+    """
+
+    @override
+    def match(
+        self,
+        code: list[dict[str, dict]],
+        bytecode_idx: int,
+        register_uses: dict[int, list[int]]
+    ) -> Union[dict[int, Union[dict[str, dict], None]], None]:
+        """
+        Try to match this rule at `code[bytecode_idx]`.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+        bytecode_idx : int
+            The index, in `code`, of the bytecode to start matching at.
+        register_uses : dict[int, list[int]]
+            Maps each register to the indices of the bytecodes that read it.
+
+        Returns
+        -------
+        rewrite : dict[int, Union[dict[str, dict], None]] or None
+            Maps the indices of the bytecodes to rewrite to their replacements
+            (`None` to remove the bytecode). Returns `None` if the rule does
+            not match.
+        """
+
+        try:
+            constant_bytecode = code[bytecode_idx]
+            copy_bytecode = code[bytecode_idx + 1]
+        except IndexError:
+            return None
+
+        if constant_bytecode["instruction"] != "CONSTANT":
+            return None
+
+        constant_register = constant_bytecode["metadata"]["register"]
+        copy_metadata = copy_bytecode["metadata"]
+
+        is_add_zero = (
+            copy_bytecode["instruction"] == "ADD"
+            and copy_metadata["lhs_register"] == constant_register
+            and copy_metadata["rhs_register"] == "zero"
+        )
+
+        is_move = (
+            copy_bytecode["instruction"] == "MOV"
+            and copy_metadata["value"] == constant_register
+        )
+
+        is_single_use_copy = (
+            isinstance(constant_register, int)
+            and (is_add_zero or is_move)
+            and register_uses.get(constant_register) == [bytecode_idx + 1]
+        )
+
+        if not is_single_use_copy:
+            return None
+
+        # Keep the argument position, if the constant is passed as an argument
+        metadata = {
+            key: value
+            for key, value in copy_metadata.items()
+            if key in ["register", "argument"]
+        }
+
+        return {
+            bytecode_idx: None,
+            bytecode_idx + 1: {
+                "instruction": "CONSTANT",
+                "metadata": {**metadata, "value": constant_bytecode["metadata"]["value"]},
+            },
+        }
@@ -0,0 +1,220 @@
+"""Implement a constant folder for the Abstract Syntax Tree."""
+
+from math import isfinite
+from typing import Union
+
+from src.ast_nodes import *
+from src.utils import TYPE_SYMBOLS_MAP
+from src.virtual_machine import VirtualMachine
+
+
+class ConstantFolder:
+    """
+    Constant Folder that evaluates the constant subtrees of an Abstract Syntax
+    Tree, and simplifies algebraic identities (e.g., `x * 1` and `x + 0`).
+
+    Constant subtrees are evaluated with the same semantics the Virtual Machine
+    uses to compute them (i.e., the operands are cast to the type of the
+    operation, and then the operation is computed). Operations that would fail
+    at runtime (e.g., divisions by zero) are kept as they are.
+
+    Comparisons and logical operations are computed in the type of their
+    operands, but their results are always `int` (i.e., `0` or `1`), so they
+    are folded into `int` constants. Operations on `short` values are computed
+    as `int` operations, as the Virtual Machine does: values are only
+    truncated when `short` variables are loaded.
+
+    Identities are only simplified if the type of the remaining operand is the
+    type of the operation, so the type casts of the enclosing nodes are still
+    valid.
+
+    The AST is modified in place. Thus, the frontend certificate of the AST
+    matches the code generated from it.
+
+    Parameters
+    ----------
+    root : PROG
+        The root of an Abstract Syntax Tree generated by the
+        `src.abstract_syntax_tree.AbstractSyntaxTree` class.
+    """
+
+    # Maps operations to the constants that are neutral when they are on the
+    # right and on the left hand sides (`None` if there isn't any).
+    IDENTITIES: dict[type, tuple[Union[int, None], Union[int, None]]] = {
+        ADD: (0, 0),
+        SUB: (0, None),
+        MULT: (1, 1),
+        DIV: (1, None),
+        LSHIFT: (0, None),
+        RSHIFT: (0, None),
+        BITOR: (0, 0),
+    }
+
+    # Instructions whose results are `0` or `1`, whatever their operands' type
+    BOOLEAN_INSTRUCTIONS: set[str] = {
+        "AND", "EQ", "GT", "LT", "NEQ", "OR",
+        "FAND", "FEQ", "FGT", "FLT", "FNEQ", "FOR",
+    }
+
+    def __init__(self, root: PROG) -> None:
+        self.root: PROG = root
+
+    def fold(self) -> PROG:
+        """
+        Fold the constants of every node of the AST.
+
+        Returns
+        -------
+        root : PROG
+            The root of the folded AST.
+        """
+
+        self.root.children = [self._fold(child) for child in self.root.children]
+
+        return self.root
+
+    def _fold(self, node: Node) -> Node:
+        """
+        Fold the constants of the subtree rooted at `node`.
+
+        Parameters
+        ----------
+        node : Node
+            The root of the subtree.
+
+        Returns
+        -------
+        node : Node
+            The node that replaces `node` in the AST (might be `node` itself).
+        """
+
+        if isinstance(node, SEQ):
+            node.children = [self._fold(child) for child in node.children]
+
+        elif isinstance(node, FUNC_DEF):
+            node.statements = self._fold(node.statements)
+
+        elif isinstance(node, Conditional):
+            node.parenthesis_expression = self._fold(node.parenthesis_expression)
+            node.statement_if_true = self._fold(node.statement_if_true)
+
+            if isinstance(node, IFELSE):
+                node.statement_if_false = self._fold(node.statement_if_false)
+
+        elif isinstance(node, RET_SYM):
+            node.returned_value = self._fold(node.returned_value)
+
+        # The left hand side of an assignment is a variable: only the assigned
+        # value can be folded
+        elif isinstance(node, ASSIGN):
+            node.rhs = self._fold(node.rhs)
+
+        elif isinstance(node, Operation):
+            node.lhs = self._fold(node.lhs)
+            node.rhs = self._fold(node.rhs)
+
+            return self._fold_operation(node)
+
+        elif isinstance(node, NOT):
+            node.expression = self._fold(node.expression)
+
+            if isinstance(node.expression, CST):
+                value = VirtualMachine.unary_operations["NOT"](node.expression.get_value())
+                return self._make_constant(node.get_type(), value)
+
+        return node
+
+    def _fold_operation(self, operation: Operation) -> Node:
+        """
+        Evaluate an operation whose children are constants, or simplify it if
+        it is an identity.
+
+        Parameters
+        ----------
+        operation : Operation
+            The operation, with its children already folded.
+
+        Returns
+        -------
+        node : Node
+            The node that replaces `operation` in the AST (might be `operation`
+            itself).
+        """
+
+        lhs, rhs = operation.lhs, operation.rhs
+        operation_type = operation.get_type()
+
+        if operation_type not in ["short", "int", "float"]:
+            return operation
+
+        enforce_type: callable = TYPE_SYMBOLS_MAP[operation_type]["enforce"]
+
+        if isinstance(lhs, CST) and isinstance(rhs, CST):
+            compute = VirtualMachine.binary_operations[operation.instruction]
+
+            try:
+                value = compute(
+                    enforce_type(lhs.get_value()),
+                    enforce_type(rhs.get_value())
+                )
+            except (ArithmeticError, ValueError):
+                return operation
+
+            if not isfinite(value):
+                return operation
+
+            result_type = (
+                "int"
+                if operation.instruction in self.BOOLEAN_INSTRUCTIONS
+                else operation_type
+            )
+
+            return self._make_constant(result_type, value)
+
+        rhs_identity, lhs_identity = self.IDENTITIES.get(type(operation), (None, None))
+
+        is_rhs_identity = (
+            isinstance(rhs, CST)
+            and rhs_identity is not None
+            and enforce_type(rhs.get_value()) == rhs_identity
+            and lhs.get_type() == operation_type
+        )
+
+        if is_rhs_identity:
+            return lhs
+
+        is_lhs_identity = (
+            isinstance(lhs, CST)
+            and lhs_identity is not None
+            and enforce_type(lhs.get_value()) == lhs_identity
+            and rhs.get_type() == operation_type
+        )
+
+        if is_lhs_identity:
+            return rhs
+
+        return operation
+
+    @staticmethod
+    def _make_constant(constant_type: str, value: Union[int, float]) -> CST:
+        """
+        Make a constant node, with its value coerced to its type.
+
+        Parameters
+        ----------
+        constant_type : str
+            The type of the constant.
+        value : Union[int, float]
+            The value of the constant.
+
+        Returns
+        -------
+        : CST
+            The constant node.
+        """
+
+        enforce_type: callable = TYPE_SYMBOLS_MAP[constant_type]["enforce"]
+
+        return CST(
+            constant_metadata={"type": constant_type, "value": enforce_type(value)}
+        )
@@ -0,0 +1,261 @@
+"""Implement the reassociation of loop-invariant operands in the AST."""
+
+from typing import Union
+
+from src.ast_nodes import *
+
+
+class InvariantReassociator:
+    """
+    Invariant Reassociator that groups the loop-invariant operands of chains of
+    integer additions and multiplications within `WHILE` loops.
+
+    Chains are left-associative, so the invariant operands of an expression
+    such as `i + avg + scaled` (i.e., `(i + avg) + scaled`) are not a subtree
+    of it. This class rewrites it as `i + (avg + scaled)`, so the invariant
+    subtree can be hoisted out of the loop by `LoopInvariantCodeMotion`.
+
+    Integer additions and multiplications are associative in the Virtual
+    Machine (registers hold unbounded integers, and values are only truncated
+    when stored), so the reassociation does not change the results.
+
+    Loops with function calls are kept as they are, as the called function
+    might write to any variable. The AST is modified in place, so its frontend
+    certificate matches the code generated from it.
+
+    Parameters
+    ----------
+    root : PROG
+        The root of an Abstract Syntax Tree generated by the
+        `src.abstract_syntax_tree.AbstractSyntaxTree` class.
+    """
+
+    ASSOCIATIVE_OPERATIONS: tuple[type] = (ADD, MULT)
+
+    def __init__(self, root: PROG) -> None:
+        self.root: PROG = root
+
+    def reassociate(self) -> PROG:
+        """
+        Reassociate the operations of every loop of the AST.
+
+        Returns
+        -------
+        root : PROG
+            The root of the reassociated AST.
+        """
+
+        for child in self.root.children:
+            self._visit(node=child, written_variables=None)
+
+        return self.root
+
+    def _visit(self, node: Node, written_variables: Union[set[int], None]) -> Node:
+        """
+        Reassociate the operations of the subtree rooted at `node`.
+
+        Parameters
+        ----------
+        node : Node
+            The root of the subtree.
+        written_variables : set[int] or None
+            The IDs of the variables written by the innermost loop `node` is
+            in. `None` if `node` is not in a loop (or in a loop that can't be
+            optimized).
+
+        Returns
+        -------
+        node : Node
+            The node that replaces `node` in the AST (might be `node` itself).
+        """
+
+        if isinstance(node, WHILE):
+            written_variables = self._get_written_variables(node)
+
+        if isinstance(node, SEQ):
+            node.children = [
+                self._visit(node=child, written_variables=written_variables)
+                for child in node.children
+            ]
+
+        elif isinstance(node, FUNC_DEF):
+            node.statements = self._visit(node=node.statements, written_variables=None)
+
+        elif isinstance(node, Conditional):
+            node.parenthesis_expression = self._visit(
+                node=node.parenthesis_expression,
+                written_variables=written_variables
+            )
+            node.statement_if_true = self._visit(
+                node=node.statement_if_true,
+                written_variables=written_variables
+            )
+
+            if isinstance(node, IFELSE):
+                node.statement_if_false = self._visit(
+                    node=node.statement_if_false,
+                    written_variables=written_variables
+                )
+
+        elif isinstance(node, RET_SYM):
+            node.returned_value = self._visit(
+                node=node.returned_value,
+                written_variables=written_variables
+            )
+
+        elif isinstance(node, ASSIGN):
+            node.rhs = self._visit(node=node.rhs, written_variables=written_variables)
+
+        elif isinstance(node, Operation):
+            node.lhs = self._visit(node=node.lhs, written_variables=written_variables)
+            node.rhs = self._visit(node=node.rhs, written_variables=written_variables)
+
+            if written_variables is not None:
+                return self._reassociate_operation(
+                    operation=node,
+                    written_variables=written_variables
+                )
+
+        elif isinstance(node, NOT):
+            node.expression = self._visit(
+                node=node.expression,
+                written_variables=written_variables
+            )
+
+        return node
+
+    def _reassociate_operation(
+        self,
+        operation: Operation,
+        written_variables: set[int]
+    ) -> Operation:
+        """
+        Rewrite `(variant op invariant) op invariant` as
+        `variant op (invariant op invariant)`.
+
+        Parameters
+        ----------
+        operation : Operation
+            The operation, with its children already reassociated.
+        written_variables : set[int]
+            The IDs of the variables written by the loop.
+
+        Returns
+        -------
+        operation : Operation
+            The node that replaces `operation` in the AST (might be `operation`
+            itself).
+        """
+
+        lhs = operation.lhs
+
+        is_reassociable = (
+            isinstance(operation, self.ASSOCIATIVE_OPERATIONS)
+            and type(lhs) is type(operation)
+            and operation.get_type() == "int"
+            and lhs.get_type() == "int"
+            and lhs.lhs.get_type() == "int"
+            and lhs.rhs.get_type() == "int"
+            and operation.rhs.get_type() == "int"
+            and not self._is_invariant(lhs.lhs, written_variables)
+            and self._is_invariant(lhs.rhs, written_variables)
+            and self._is_invariant(operation.rhs, written_variables)
+        )
+
+        if not is_reassociable:
+            return operation
+
+        operation_class = type(operation)
+
+        return operation_class(
+            lhs=lhs.lhs,
+            rhs=operation_class(lhs=lhs.rhs, rhs=operation.rhs)
+        )
+
+    def _is_invariant(self, node: Node, written_variables: set[int]) -> bool:
+        """
+        Tell whether an expression has the same value on every iteration of a
+        loop.
+
+        Parameters
+        ----------
+        node : Node
+            The root of the expression.
+        written_variables : set[int]
+            The IDs of the variables written by the loop.
+
+        Returns
+        -------
+        : bool
+            `True` if the expression is invariant, `False` otherwise.
+        """
+
+        if isinstance(node, CST):
+            return True
+
+        if isinstance(node, VAR):
+            return node.get_id() not in written_variables
+
+        if isinstance(node, Operation) and not isinstance(node, ASSIGN):
+            return (
+                self._is_invariant(node.lhs, written_variables)
+                and self._is_invariant(node.rhs, written_variables)
+            )
+
+        if isinstance(node, NOT):
+            return self._is_invariant(node.expression, written_variables)
+
+        return False
+
+    def _get_written_variables(self, node: Node) -> Union[set[int], None]:
+        """
+        Get the IDs of the variables written within a subtree.
+
+        Parameters
+        ----------
+        node : Node
+            The root of the subtree.
+
+        Returns
+        -------
+        written_variables : set[int] or None
+            The IDs of the written variables. `None` if the subtree calls a
+            function (i.e., any variable might be written).
+        """
+
+        written_variables: set[int] = set()
+        pending: list[Node] = [node]
+
+        while pending:
+            current = pending.pop()
+
+            if isinstance(current, FUNC_CALL):
+                return None
+
+            if isinstance(current, ASSIGN):
+                variable = current.lhs
+
+                if isinstance(variable, ELEMENT_ACCESS):
+                    variable = variable.variable
+
+                written_variables.add(variable.get_id())
+
+            if isinstance(current, (SEQ, PROG)):
+                pending.extend(current.children)
+
+            elif isinstance(current, Conditional):
+                pending.extend([current.parenthesis_expression, current.statement_if_true])
+
+                if isinstance(current, IFELSE):
+                    pending.append(current.statement_if_false)
+
+            elif isinstance(current, RET_SYM):
+                pending.append(current.returned_value)
+
+            elif isinstance(current, Operation):
+                pending.extend([current.lhs, current.rhs])
+
+            elif isinstance(current, NOT):
+                pending.append(current.expression)
+
+        return written_variables
@@ -0,0 +1,810 @@
+"""Implement loop-invariant code motion for `WHILE` loops."""
+
+from bisect import bisect_right
+from typing import Union
+
+from typing_extensions import override
+
+from src.optimizations.abstract_function_pass import AbstractFunctionPass
+from src.optimizations.peephole_optimizer import PeepholeOptimizer
+from src.register_allocator import RegisterAllocator
+from src.virtual_machine import VirtualMachine
+
+
+class LoopInvariantCodeMotion(AbstractFunctionPass):
+    """
+    Loop-Invariant Code Motion pass, that hoists the expressions of a `WHILE`
+    loop that compute the same value on every iteration into a pre-header.
+
+    A loop is the code between the unconditional backwards jump generated by
+    `WHILE` and the bytecode it lands on. An expression is hoisted if:
+
+    - it is a whole subtree of the original expression (i.e., a contiguous
+    range of bytecodes whose intermediate values are only used within it),
+    with at least 2 bytecodes;
+    - it only reads constants and variables the loop does not write to;
+    - it can't fail (e.g., divisions are only hoisted if the divisor is a
+    non-zero constant), as the pre-header runs even if the loop does not.
+
+    Chains of integer additions and multiplications are left-associative, so
+    the invariant operands of an expression such as `i + a + b` (i.e.,
+    `(i + a) + b`) are not a subtree of it. These chains are reassociated
+    (e.g., into `i + (a + b)`) first, so their invariant operands can be
+    hoisted together. Integer additions and multiplications are associative
+    in the Virtual Machine, as registers hold unbounded integers.
+
+    Each hoisted expression writes its value to a new register in the
+    pre-header, and is replaced, in the loop, by a `MOV` from that register.
+    The `MOV` is marked as `hoisted` in its metadata, along with the number of
+    `reassociated_operands` if it replaces the invariant operands of a chain.
+    It keeps the position of the expression in the loop, so the backend
+    certificator can check the hoisted code and certificate it in its
+    original position (and order).
+
+    Only innermost loops without function calls (as the called function might
+    write to any variable) are optimized, and expressions that compute
+    addresses are kept, as the backend certificator relies on the patterns of
+    variable accesses.
+
+    The pass must run before the register allocation, as it relies on each
+    register being written only once. It also relies on the `data` section of
+    the program, to tell which variable each address belongs to.
+
+    Parameters
+    ----------
+    program : dict[str, Union[list, dict]]
+        The program generated by the `CodeGenerator`. It is modified in place.
+    """
+
+    # Instructions that only compute values from registers (no side effects),
+    # and the ones among them that fail if their right hand side is zero
+    PURE_INSTRUCTIONS: list[str] = [
+        *VirtualMachine.binary_operations.keys(),
+        *VirtualMachine.unary_operations.keys(),
+        "MOV",
+    ]
+    DIVISIONS: list[str] = ["DIV", "FDIV", "MOD"]
+    ASSOCIATIVE_INSTRUCTIONS: list[str] = ["ADD", "MULT"]
+
+    ABSOLUTE_LOADS: list[str] = ["LOADA", "LOADFA", "LOADSA"]
+    ABSOLUTE_STORES: list[str] = ["STOREA", "STOREFA"]
+
+    def __init__(self, program: dict[str, Union[list, dict]]) -> None:
+        super().__init__(program=program)
+
+        self.variables_base_addresses: list[int] = sorted(program["data"])
+
+    @override
+    def optimize_function(
+        self, code: list[dict[str, dict]]
+    ) -> list[dict[str, dict]]:
+        """
+        Hoist the loop-invariant expressions of every innermost loop of a
+        function.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+
+        Returns
+        -------
+        code : list[dict[str, dict]]
+            The optimized code.
+        """
+
+        # Hoisting code out of a loop only moves the code from its header
+        # onwards, so the loops are visited backwards
+        for header_idx, back_edge_idx in reversed(self._find_innermost_loops(code)):
+            code = self._hoist_invariant_code(
+                code=code,
+                header_idx=header_idx,
+                back_edge_idx=back_edge_idx
+            )
+
+        return code
+
+    @staticmethod
+    def _find_innermost_loops(code: list[dict[str, dict]]) -> list[tuple[int, int]]:
+        """
+        Find the loops of a function that do not contain other loops.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+
+        Returns
+        -------
+        loops : list[tuple[int, int]]
+            The (header, back edge) indices of each loop, sorted by header.
+        """
+
+        loops: list[tuple[int, int]] = []
+
+        for bytecode_idx, bytecode in enumerate(code):
+            is_back_edge = (
+                bytecode["instruction"] == "JZ"
+                and bytecode["metadata"]["conditional_register"] == "zero"
+                and bytecode["metadata"]["jump_size"] < 0
+            )
+
+            if is_back_edge:
+                loops.append((bytecode_idx + bytecode["metadata"]["jump_size"], bytecode_idx))
+
+        return sorted(
+            (header_idx, back_edge_idx)
+            for header_idx, back_edge_idx in loops
+            if not any(
+                header_idx <= other_header_idx and other_back_edge_idx < back_edge_idx
+                for other_header_idx, other_back_edge_idx in loops
+            )
+        )
+
+    def _hoist_invariant_code(
+        self,
+        code: list[dict[str, dict]],
+        header_idx: int,
+        back_edge_idx: int
+    ) -> list[dict[str, dict]]:
+        """
+        Hoist the invariant expressions of a loop into its pre-header.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+        header_idx : int
+            The index of the first bytecode of the loop.
+        back_edge_idx : int
+            The index of the jump back to `header_idx`.
+
+        Returns
+        -------
+        code : list[dict[str, dict]]
+            The code with the pre-header before `header_idx`.
+        """
+
+        loop_indices = range(header_idx, back_edge_idx + 1)
+
+        if any(code[idx]["instruction"] == "JAL" for idx in loop_indices):
+            return code
+
+        definitions = self._compute_register_definitions(code)
+        register_uses = PeepholeOptimizer._compute_register_uses(code)
+
+        # Find what the loop writes to, and what computes addresses in it
+        stored_variables: set[Union[int, None]] = set()
+        address_computations: set[int] = set()
+
+        for idx in loop_indices:
+            bytecode = code[idx]
+            instruction = bytecode["instruction"]
+
+            if instruction in self.ABSOLUTE_STORES:
+                stored_variables.add(self._get_variable_base_address(bytecode["metadata"]["address"]))
+                continue
+
+            address_key = {
+                "LOAD": "value",
+                "LOADF": "value",
+                "STORE": "register",
+                "STOREF": "register",
+            }.get(instruction)
+
+            if address_key is None:
+                continue
+
+            address_register = bytecode["metadata"][address_key]
+            address_computations |= self._get_subtree(
+                code=code,
+                bytecode_idx=definitions[address_register],
+                definitions=definitions
+            )
+
+            if instruction in ["STORE", "STOREF"]:
+                stored_variables.add(self._get_stored_variable(
+                    code=code,
+                    address_register=address_register,
+                    definitions=definitions
+                ))
+
+        # Unknown store targets might alias any variable
+        if None in stored_variables:
+            stored_variables = set(self.variables_base_addresses)
+
+        is_invariant = self._compute_invariance(
+            code=code,
+            loop_indices=loop_indices,
+            definitions=definitions,
+            address_computations=address_computations,
+            stored_variables=stored_variables
+        )
+
+        # Group the invariant operands of chains of associative operations
+        chain_lengths = self._reassociate_invariant_operands(
+            code=code,
+            loop_indices=loop_indices,
+            definitions=definitions,
+            register_uses=register_uses,
+            is_invariant=is_invariant,
+            address_computations=address_computations
+        )
+
+        if chain_lengths:
+            definitions = self._compute_register_definitions(code)
+            register_uses = PeepholeOptimizer._compute_register_uses(code)
+            is_invariant = self._compute_invariance(
+                code=code,
+                loop_indices=loop_indices,
+                definitions=definitions,
+                address_computations=address_computations,
+                stored_variables=stored_variables
+            )
+
+        # Find the largest invariant subtrees, from the end of the loop
+        blocks: list[tuple[int, int]] = []
+        end_idx = back_edge_idx
+
+        while end_idx >= header_idx:
+            start_idx = self._get_block_start(
+                code=code,
+                end_idx=end_idx,
+                definitions=definitions,
+                register_uses=register_uses,
+                is_invariant=is_invariant
+            )
+
+            if start_idx is not None and start_idx < end_idx:
+                blocks.append((start_idx, end_idx))
+                end_idx = start_idx - 1
+
+            else:
+                end_idx -= 1
+
+        if not blocks:
+            return code
+
+        return self._move_blocks(
+            code=code,
+            blocks=sorted(blocks),
+            header_idx=header_idx,
+            back_edge_idx=back_edge_idx,
+            chain_lengths=chain_lengths
+        )
+
+    def _compute_invariance(
+        self,
+        code: list[dict[str, dict]],
+        loop_indices: range,
+        definitions: dict[int, int],
+        address_computations: set[int],
+        stored_variables: set[int]
+    ) -> dict[int, bool]:
+        """
+        Tell whether each bytecode of a loop is invariant (see
+        `_is_invariant`).
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+        loop_indices : range
+            The indices of the bytecodes of the loop.
+        definitions : dict[int, int]
+            Maps each register to the index of the bytecode that writes it.
+        address_computations : set[int]
+            The indices of the bytecodes of the loop that compute addresses.
+        stored_variables : set[int]
+            The base addresses of the variables written by the loop.
+
+        Returns
+        -------
+        is_invariant : dict[int, bool]
+            Tells whether each bytecode of the loop is invariant.
+        """
+
+        is_invariant: dict[int, bool] = {}
+
+        for idx in loop_indices:
+            is_invariant[idx] = idx not in address_computations and self._is_invariant(
+                code=code,
+                bytecode_idx=idx,
+                definitions=definitions,
+                is_invariant=is_invariant,
+                stored_variables=stored_variables
+            )
+
+        return is_invariant
+
+    def _reassociate_invariant_operands(
+        self,
+        code: list[dict[str, dict]],
+        loop_indices: range,
+        definitions: dict[int, int],
+        register_uses: dict[int, list[int]],
+        is_invariant: dict[int, bool],
+        address_computations: set[int]
+    ) -> dict[int, int]:
+        """
+        Reassociate the chains of a loop whose right hand side operands are
+        invariant, so these operands form an invariant subtree.
+
+        Each `(v op a) op b`, where `op` is an integer addition or
+        multiplication, `v` is not invariant, and `a` and `b` are, is
+        rewritten as `v op (a op b)`: `b` is moved before the inner `op`, that
+        now computes `a op b` (in the register that held `v op a`). Longer
+        chains are reassociated step by step, from their innermost operation.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function. It is modified in place.
+        loop_indices : range
+            The indices of the bytecodes of the loop.
+        definitions : dict[int, int]
+            Maps each register to the index of the bytecode that writes it.
+            It is updated in place.
+        register_uses : dict[int, list[int]]
+            Maps each register to the indices of the bytecodes that read it.
+        is_invariant : dict[int, bool]
+            Tells whether each bytecode of the loop is invariant. It is
+            updated in place.
+        address_computations : set[int]
+            The indices of the bytecodes of the loop that compute addresses.
+
+        Returns
+        -------
+        chain_lengths : dict[int, int]
+            Maps the register of each grouped operation (e.g., `a op b`) to
+            the number of operands it groups.
+        """
+
+        chain_lengths: dict[int, int] = {}
+
+        for idx in loop_indices:
+            bytecode = code[idx]
+            metadata = bytecode["metadata"]
+
+            if bytecode["instruction"] not in self.ASSOCIATIVE_INSTRUCTIONS:
+                continue
+
+            if is_invariant[idx] or idx in address_computations:
+                continue
+
+            lhs_idx = definitions.get(metadata["lhs_register"])
+            rhs_idx = definitions.get(metadata["rhs_register"])
+
+            if lhs_idx not in loop_indices or rhs_idx not in loop_indices:
+                continue
+
+            lhs_bytecode = code[lhs_idx]
+            lhs_metadata = lhs_bytecode["metadata"]
+
+            # The left hand side must be an operation of the same chain, only
+            # used by this bytecode, with an invariant right hand side
+            is_chain = (
+                lhs_bytecode["instruction"] == bytecode["instruction"]
+                and lhs_idx not in address_computations
+                and register_uses.get(lhs_metadata["register"]) == [idx]
+                and is_invariant.get(definitions.get(lhs_metadata["rhs_register"]), False)
+            )
+
+            if not is_chain or not is_invariant[rhs_idx]:
+                continue
+
+            # The right hand side must be the code between both operations
+            rhs_subtree = self._get_subtree(
+                code=code,
+                bytecode_idx=rhs_idx,
+                definitions=definitions
+            )
+
+            if rhs_subtree != set(range(lhs_idx + 1, idx)):
+                continue
+
+            if address_computations.intersection(rhs_subtree):
+                continue
+
+            grouped_operation = {
+                **lhs_bytecode,
+                "metadata": {
+                    **lhs_metadata,
+                    "lhs_register": lhs_metadata["rhs_register"],
+                    "rhs_register": metadata["rhs_register"],
+                },
+            }
+            chain_operation = {
+                **bytecode,
+                "metadata": {
+                    **metadata,
+                    "lhs_register": lhs_metadata["lhs_register"],
+                    "rhs_register": lhs_metadata["register"],
+                },
+            }
+
+            code[lhs_idx:idx + 1] = [*code[lhs_idx + 1:idx], grouped_operation, chain_operation]
+
+            for moved_idx in range(lhs_idx, idx - 1):
+                definitions[code[moved_idx]["metadata"]["register"]] = moved_idx
+                is_invariant[moved_idx] = True
+
+            definitions[lhs_metadata["register"]] = idx - 1
+            is_invariant[idx - 1] = True
+
+            chain_lengths[lhs_metadata["register"]] = 1 + chain_lengths.get(
+                lhs_metadata["rhs_register"], 1
+            )
+
+        return chain_lengths
+
+    def _is_invariant(
+        self,
+        code: list[dict[str, dict]],
+        bytecode_idx: int,
+        definitions: dict[int, int],
+        is_invariant: dict[int, bool],
+        stored_variables: set[int]
+    ) -> bool:
+        """
+        Tell whether a bytecode of a loop computes the same value on every
+        iteration, and can be safely hoisted.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+        bytecode_idx : int
+            The index of the bytecode.
+        definitions : dict[int, int]
+            Maps each register to the index of the bytecode that writes it.
+        is_invariant : dict[int, bool]
+            Tells whether each bytecode of the loop that comes before
+            `bytecode_idx` is invariant.
+        stored_variables : set[int]
+            The base addresses of the variables written by the loop.
+
+        Returns
+        -------
+        : bool
+            `True` if the bytecode is invariant, `False` otherwise.
+        """
+
+        bytecode = code[bytecode_idx]
+        instruction = bytecode["instruction"]
+        metadata = bytecode["metadata"]
+
+        if not isinstance(metadata.get("register"), int):
+            return False
+
+        if instruction == "CONSTANT":
+            return True
+
+        if instruction in self.ABSOLUTE_LOADS:
+            return self._get_variable_base_address(metadata["address"]) not in stored_variables
+
+        if instruction not in self.PURE_INSTRUCTIONS:
+            return False
+
+        if instruction in self.DIVISIONS:
+            divisor_idx = definitions.get(metadata["rhs_register"])
+
+            is_safe_division = (
+                divisor_idx is not None
+                and code[divisor_idx]["instruction"] == "CONSTANT"
+                and code[divisor_idx]["metadata"]["value"] != 0
+            )
+
+            if not is_safe_division:
+                return False
+
+        _, uses = RegisterAllocator.get_definitions_and_uses(bytecode)
+
+        # Special registers other than `zero` (e.g., `ret_value`) can't be read
+        # from outside the loop
+        if any(
+            not isinstance(metadata[key], int) and metadata[key] != "zero"
+            for key in ["lhs_register", "rhs_register", "value"]
+            if key in metadata
+        ):
+            return False
+
+        return all(
+            is_invariant.get(definitions.get(metadata[key]), False)
+            for key in uses
+        )
+
+    def _get_block_start(
+        self,
+        code: list[dict[str, dict]],
+        end_idx: int,
+        definitions: dict[int, int],
+        register_uses: dict[int, list[int]],
+        is_invariant: dict[int, bool]
+    ) -> Union[int, None]:
+        """
+        Get the start of the invariant subtree that ends at some bytecode.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+        end_idx : int
+            The index of the bytecode that computes the value of the subtree.
+        definitions : dict[int, int]
+            Maps each register to the index of the bytecode that writes it.
+        register_uses : dict[int, list[int]]
+            Maps each register to the indices of the bytecodes that read it.
+        is_invariant : dict[int, bool]
+            Tells whether each bytecode of the loop is invariant.
+
+        Returns
+        -------
+        start_idx : int or None
+            The index of the first bytecode of the subtree. Returns `None` if
+            the bytecode is not invariant, or if the subtree can't be moved as
+            a whole.
+        """
+
+        if not is_invariant.get(end_idx, False):
+            return None
+
+        subtree = self._get_subtree(
+            code=code,
+            bytecode_idx=end_idx,
+            definitions=definitions
+        )
+        start_idx = min(subtree)
+
+        # The subtree must be contiguous...
+        if subtree != set(range(start_idx, end_idx + 1)):
+            return None
+
+        # ...and its intermediate values must only be used within it
+        for idx in range(start_idx, end_idx):
+            register = code[idx]["metadata"]["register"]
+
+            if any(use_idx not in subtree for use_idx in register_uses.get(register, [])):
+                return None
+
+        return start_idx
+
+    @staticmethod
+    def _get_subtree(
+        code: list[dict[str, dict]],
+        bytecode_idx: int,
+        definitions: dict[int, int]
+    ) -> set[int]:
+        """
+        Get the indices of the bytecodes that compute the value of a bytecode.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+        bytecode_idx : int
+            The index of the bytecode.
+        definitions : dict[int, int]
+            Maps each register to the index of the bytecode that writes it.
+
+        Returns
+        -------
+        subtree : set[int]
+            The indices of the bytecodes of the subtree, including
+            `bytecode_idx`.
+        """
+
+        subtree: set[int] = set()
+        pending: list[int] = [bytecode_idx]
+
+        while pending:
+            idx = pending.pop()
+            subtree.add(idx)
+
+            bytecode = code[idx]
+            _, uses = RegisterAllocator.get_definitions_and_uses(bytecode)
+
+            pending.extend(
+                definitions[bytecode["metadata"][key]]
+                for key in uses
+                if bytecode["metadata"][key] in definitions
+            )
+
+        return subtree
+
+    def _get_stored_variable(
+        self,
+        code: list[dict[str, dict]],
+        address_register: int,
+        definitions: dict[int, int]
+    ) -> Union[int, None]:
+        """
+        Get the variable a dynamic store (i.e., `STORE` or `STOREF`) writes to.
+
+        The address of an array element is computed by adding an offset to the
+        base address of the array, so the base address is found by following
+        the left hand sides of the `ADD` bytecodes up to a `CONSTANT`.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+        address_register : int
+            The register with the address the value is stored at.
+        definitions : dict[int, int]
+            Maps each register to the index of the bytecode that writes it.
+
+        Returns
+        -------
+        var_base_address : int or None
+            The base address of the variable. Returns `None` if it is unknown.
+        """
+
+        register = address_register
+
+        while register in definitions:
+            bytecode = code[definitions[register]]
+
+            if bytecode["instruction"] == "CONSTANT":
+                return self._get_variable_base_address(bytecode["metadata"]["value"])
+
+            if bytecode["instruction"] != "ADD":
+                break
+
+            register = bytecode["metadata"]["lhs_register"]
+
+        return None
+
+    def _get_variable_base_address(self, address: int) -> int:
+        """
+        Get the base address of the variable some address belongs to.
+
+        Parameters
+        ----------
+        address : int
+            The address.
+
+        Returns
+        -------
+        var_base_address : int
+            The base address of the variable.
+        """
+
+        idx = bisect_right(self.variables_base_addresses, address) - 1
+
+        return self.variables_base_addresses[max(idx, 0)]
+
+    @staticmethod
+    def _compute_register_definitions(code: list[dict[str, dict]]) -> dict[int, int]:
+        """
+        Map each register to the index of the bytecode that writes it.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+
+        Returns
+        -------
+        definitions : dict[int, int]
+            Maps each register to the index of the bytecode that writes it.
+        """
+
+        definitions: dict[int, int] = {}
+
+        for bytecode_idx, bytecode in enumerate(code):
+            _definitions, _ = RegisterAllocator.get_definitions_and_uses(bytecode)
+
+            for key in _definitions:
+                definitions[bytecode["metadata"][key]] = bytecode_idx
+
+        return definitions
+
+    @staticmethod
+    def _move_blocks(
+        code: list[dict[str, dict]],
+        blocks: list[tuple[int, int]],
+        header_idx: int,
+        back_edge_idx: int,
+        chain_lengths: dict[int, int]
+    ) -> list[dict[str, dict]]:
+        """
+        Move the blocks of a loop into its pre-header, and fix the jumps.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+        blocks : list[tuple[int, int]]
+            The (start, end) indices of the blocks to hoist, sorted.
+        header_idx : int
+            The index of the first bytecode of the loop.
+        back_edge_idx : int
+            The index of the jump back to `header_idx`.
+        chain_lengths : dict[int, int]
+            Maps the register of each reassociated operation to the number of
+            operands it groups (see `_reassociate_invariant_operands`).
+
+        Returns
+        -------
+        new_code : list[dict[str, dict]]
+            The code with the pre-header before `header_idx`.
+        """
+
+        next_register = 1 + max(
+            (
+                bytecode["metadata"][key]
+                for bytecode in code
+                for key in RegisterAllocator.get_definitions_and_uses(bytecode)[0]
+            ),
+            default=-1
+        )
+
+        pre_header: list[dict[str, dict]] = []
+        rewrites: dict[int, Union[dict[str, dict], None]] = {}
+
+        for start_idx, end_idx in blocks:
+            result_bytecode = code[end_idx]
+
+            pre_header.extend(code[start_idx:end_idx])
+            pre_header.append({
+                **result_bytecode,
+                "metadata": {**result_bytecode["metadata"], "register": next_register},
+            })
+
+            result_register = result_bytecode["metadata"]["register"]
+            metadata = {"register": result_register, "value": next_register, "hoisted": True}
+
+            if result_register in chain_lengths:
+                metadata["reassociated_operands"] = chain_lengths[result_register]
+
+            rewrites.update({idx: None for idx in range(start_idx, end_idx)})
+            rewrites[end_idx] = {"instruction": "MOV", "metadata": metadata}
+
+            next_register += 1
+
+        new_code: list[dict[str, dict]] = []
+
+        # Maps each old index to its new index. Removed bytecodes are mapped to
+        # the next bytecode that is kept.
+        new_indices: list[int] = []
+        jumps: list[tuple[int, int]] = []
+
+        for bytecode_idx, bytecode in enumerate(code):
+            if bytecode_idx == header_idx:
+                new_code.extend(pre_header)
+
+            new_indices.append(len(new_code))
+
+            bytecode = rewrites.get(bytecode_idx, bytecode)
+
+            if bytecode is None:
+                continue
+
+            if bytecode["instruction"] == "JZ":
+                jumps.append((bytecode_idx, len(new_code)))
+
+            new_code.append(bytecode)
+
+        new_indices.append(len(new_code))
+
+        # The back edge keeps jumping to the loop, but other jumps to the loop
+        # must run its pre-header first
+        for bytecode_idx, new_bytecode_idx in jumps:
+            jump = new_code[new_bytecode_idx]
+            target_idx = bytecode_idx + jump["metadata"]["jump_size"]
+
+            if target_idx == header_idx and bytecode_idx != back_edge_idx:
+                new_target_idx = header_idx
+            else:
+                new_target_idx = new_indices[target_idx]
+
+            new_code[new_bytecode_idx] = {
+                **jump,
+                "metadata": {
+                    **jump["metadata"],
+                    "jump_size": new_target_idx - new_bytecode_idx
+                },
+            }
+
+        return new_code
@@ -0,0 +1,238 @@
+"""Implement a peephole optimizer for the generated code."""
+
+from typing import Union
+
+from typing_extensions import override
+
+from src.optimizations.abstract_function_pass import AbstractFunctionPass
+from src.optimizations.abstract_peephole_rule import AbstractPeepholeRule
+from src.register_allocator import RegisterAllocator
+
+
+class PeepholeOptimizer(AbstractFunctionPass):
+    """
+    Peephole Optimizer that rewrites the code of each function with a set of
+    pluggable rules.
+
+    The rules are applied repeatedly, until none of them matches. After each
+    pass, the relative `jump_size` of the `JZ` bytecodes is recomputed to
+    account for the removed bytecodes.
+
+    The optimizer must run before the register allocation, as rules rely on
+    each register being written only once.
+
+    Parameters
+    ----------
+    program : dict[str, Union[list, dict]]
+        The program generated by the `CodeGenerator`. It is modified in place.
+    rules : list[AbstractPeepholeRule]
+        The rules to apply, in order of priority.
+    """
+
+    def __init__(
+        self,
+        program: dict[str, Union[list, dict]],
+        rules: list[AbstractPeepholeRule]
+    ) -> None:
+        super().__init__(program=program)
+
+        self.rules: list[AbstractPeepholeRule] = rules
+
+    @override
+    def optimize_function(
+        self, code: list[dict[str, dict]]
+    ) -> list[dict[str, dict]]:
+        """
+        Apply the rules to the code of a function until none of them matches.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+
+        Returns
+        -------
+        code : list[dict[str, dict]]
+            The optimized code.
+        """
+
+        while True:
+            rewrites = self._match_rules(code)
+
+            if not rewrites:
+                return code
+
+            code = self._apply_rewrites(code=code, rewrites=rewrites)
+
+    def _match_rules(
+        self, code: list[dict[str, dict]]
+    ) -> dict[int, Union[dict[str, dict], None]]:
+        """
+        Match the rules over the code of a function.
+
+        A rewrite is only accepted if it does not touch any bytecode or
+        register touched by a rewrite accepted before it in the same pass, as
+        the rules match against the code as it was before the pass.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+
+        Returns
+        -------
+        rewrites : dict[int, Union[dict[str, dict], None]]
+            Maps the indices of the bytecodes to rewrite to their replacements
+            (`None` to remove the bytecode).
+        """
+
+        register_uses = self._compute_register_uses(code)
+
+        rewrites: dict[int, Union[dict[str, dict], None]] = {}
+        touched_registers: set[int] = set()
+
+        for bytecode_idx in range(len(code)):
+            if bytecode_idx in rewrites:
+                continue
+
+            for rule in self.rules:
+                rewrite = rule.match(
+                    code=code,
+                    bytecode_idx=bytecode_idx,
+                    register_uses=register_uses
+                )
+
+                if rewrite is None:
+                    continue
+
+                rewrite_registers = self._get_registers(
+                    [
+                        *(code[idx] for idx in rewrite),
+                        *(bytecode for bytecode in rewrite.values() if bytecode)
+                    ]
+                )
+
+                is_independent = (
+                    not any(idx in rewrites for idx in rewrite)
+                    and not rewrite_registers & touched_registers
+                )
+
+                if is_independent:
+                    rewrites.update(rewrite)
+                    touched_registers |= rewrite_registers
+
+                break
+
+        return rewrites
+
+    @staticmethod
+    def _apply_rewrites(
+        code: list[dict[str, dict]],
+        rewrites: dict[int, Union[dict[str, dict], None]]
+    ) -> list[dict[str, dict]]:
+        """
+        Apply rewrites to the code of a function and fix its jumps.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+        rewrites : dict[int, Union[dict[str, dict], None]]
+            Maps the indices of the bytecodes to rewrite to their replacements
+            (`None` to remove the bytecode).
+
+        Returns
+        -------
+        new_code : list[dict[str, dict]]
+            The rewritten code.
+        """
+
+        new_code: list[dict[str, dict]] = []
+
+        # Maps each old index to its new index. Removed bytecodes are mapped to
+        # the next bytecode that is kept.
+        new_indices: list[int] = []
+        jumps: list[tuple[int, int]] = []
+
+        for bytecode_idx, bytecode in enumerate(code):
+            new_indices.append(len(new_code))
+
+            bytecode = rewrites.get(bytecode_idx, bytecode)
+
+            if bytecode is None:
+                continue
+
+            if bytecode["instruction"] == "JZ":
+                jumps.append((bytecode_idx, len(new_code)))
+
+            new_code.append(bytecode)
+
+        new_indices.append(len(new_code))
+
+        # Jump targets might be removed, or have bytecodes removed before them
+        for bytecode_idx, new_bytecode_idx in jumps:
+            jump = new_code[new_bytecode_idx]
+            target_idx = bytecode_idx + jump["metadata"]["jump_size"]
+
+            new_code[new_bytecode_idx] = {
+                **jump,
+                "metadata": {
+                    **jump["metadata"],
+                    "jump_size": new_indices[target_idx] - new_bytecode_idx
+                },
+            }
+
+        return new_code
+
+    @staticmethod
+    def _compute_register_uses(
+        code: list[dict[str, dict]]
+    ) -> dict[int, list[int]]:
+        """
+        Map each register to the indices of the bytecodes that read it.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+
+        Returns
+        -------
+        register_uses : dict[int, list[int]]
+            Maps each register to the indices of the bytecodes that read it.
+        """
+
+        register_uses: dict[int, list[int]] = {}
+
+        for bytecode_idx, bytecode in enumerate(code):
+            _, uses = RegisterAllocator.get_definitions_and_uses(bytecode)
+
+            for key in uses:
+                register = bytecode["metadata"][key]
+                register_uses.setdefault(register, []).append(bytecode_idx)
+
+        return register_uses
+
+    @staticmethod
+    def _get_registers(bytecodes: list[dict[str, dict]]) -> set[int]:
+        """
+        Get the registers read or written by a list of bytecodes.
+
+        Parameters
+        ----------
+        bytecodes : list[dict[str, dict]]
+            The bytecodes to analyze.
+
+        Returns
+        -------
+        registers : set[int]
+            The registers read or written by `bytecodes`.
+        """
+
+        registers: set[int] = set()
+
+        for bytecode in bytecodes:
+            definitions, uses = RegisterAllocator.get_definitions_and_uses(bytecode)
+            registers |= {bytecode["metadata"][key] for key in [*definitions, *uses]}
+
+        return registers
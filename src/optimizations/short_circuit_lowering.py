@@ -0,0 +1,265 @@
+"""Implement the short-circuit lowering of logical operations."""
+
+from typing import Union
+
+from typing_extensions import override
+
+from src.optimizations.abstract_function_pass import AbstractFunctionPass
+from src.optimizations.loop_invariant_code_motion import LoopInvariantCodeMotion
+
+
+class ShortCircuitLowering(AbstractFunctionPass):
+    """
+    Short-Circuit Lowering pass, that skips the evaluation of the right hand
+    side of logical operations (`AND`, `OR`, `FAND` and `FOR`) whenever their
+    left hand side alone determines the result.
+
+    The result of `lhs and rhs` is `0` whenever `lhs` is zero, and the result
+    of `lhs or rhs` only depends on `lhs` whenever it is *not* zero (as the
+    virtual machine follows Python's semantics). So, the operation itself is
+    kept, and only the code that computes its right hand side is jumped over:
+
+    - `AND`: `lhs; JZ lhs, k; rhs; AND` -- i.e., jump straight to the `AND` if
+    `lhs` is zero;
+    - `OR`: `lhs; JZ lhs, 2; JZ zero, k; rhs; OR` -- i.e., evaluate the `rhs`
+    if `lhs` is zero, and jump straight to the `OR` otherwise.
+
+    When the right hand side is skipped, its register holds a stale value,
+    which the operation ignores. Only right hand sides without side effects
+    (e.g., function calls) are skipped, so the results of the program do not
+    change, and only if they are long enough to pay for the added jumps.
+
+    The pass must run before the register allocation, as it relies on each
+    register being written only once.
+
+    Parameters
+    ----------
+    program : dict[str, Union[list, dict]]
+        The program generated by the `CodeGenerator`. It is modified in place.
+    """
+
+    CONJUNCTIONS: list[str] = ["AND", "FAND"]
+    DISJUNCTIONS: list[str] = ["OR", "FOR"]
+
+    # Instructions that can be skipped without changing the results
+    SKIPPABLE_INSTRUCTIONS: list[str] = [
+        *LoopInvariantCodeMotion.PURE_INSTRUCTIONS,
+        "CONSTANT",
+        "LOAD",
+        "LOADF",
+        "LOADA",
+        "LOADFA",
+        "LOADSA",
+    ]
+
+    # The minimum size of a right hand side worth skipping
+    MIN_SKIPPED_BYTECODES: int = 3
+
+    @override
+    def optimize_function(
+        self, code: list[dict[str, dict]]
+    ) -> list[dict[str, dict]]:
+        """
+        Add short-circuit jumps to the logical operations of a function.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+
+        Returns
+        -------
+        code : list[dict[str, dict]]
+            The optimized code.
+        """
+
+        definitions = LoopInvariantCodeMotion._compute_register_definitions(code)
+
+        # Maps the index of the first bytecode of each right hand side to skip
+        # to the index of its logical operation
+        skippable_operands: dict[int, int] = {}
+
+        for bytecode_idx, bytecode in enumerate(code):
+            if bytecode["instruction"] not in [*self.CONJUNCTIONS, *self.DISJUNCTIONS]:
+                continue
+
+            rhs_start_idx = self._get_skippable_rhs_start(
+                code=code,
+                bytecode_idx=bytecode_idx,
+                definitions=definitions
+            )
+
+            if rhs_start_idx is not None:
+                skippable_operands[rhs_start_idx] = bytecode_idx
+
+        if not skippable_operands:
+            return code
+
+        return self._add_jumps(code=code, skippable_operands=skippable_operands)
+
+    def _get_skippable_rhs_start(
+        self,
+        code: list[dict[str, dict]],
+        bytecode_idx: int,
+        definitions: dict[int, int]
+    ) -> Union[int, None]:
+        """
+        Get the start of the right hand side of a logical operation, if it can
+        be skipped.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+        bytecode_idx : int
+            The index of the logical operation.
+        definitions : dict[int, int]
+            Maps each register to the index of the bytecode that writes it.
+
+        Returns
+        -------
+        rhs_start_idx : int or None
+            The index of the first bytecode of the right hand side. Returns
+            `None` if it can't (or is not worth to) be skipped.
+        """
+
+        metadata = code[bytecode_idx]["metadata"]
+
+        lhs_end_idx = definitions.get(metadata["lhs_register"])
+        rhs_end_idx = definitions.get(metadata["rhs_register"])
+
+        if lhs_end_idx is None or rhs_end_idx is None:
+            return None
+
+        rhs_start_idx = lhs_end_idx + 1
+        rhs_indices = range(rhs_start_idx, bytecode_idx)
+
+        if len(rhs_indices) < self.MIN_SKIPPED_BYTECODES:
+            return None
+
+        # The right hand side must be exactly the code that computes its
+        # value...
+        rhs_subtree = LoopInvariantCodeMotion._get_subtree(
+            code=code,
+            bytecode_idx=rhs_end_idx,
+            definitions=definitions
+        )
+
+        if rhs_subtree != set(rhs_indices):
+            return None
+
+        # ...and must not have side effects
+        if any(
+            code[idx]["instruction"] not in self.SKIPPABLE_INSTRUCTIONS
+            for idx in rhs_indices
+        ):
+            return None
+
+        return rhs_start_idx
+
+    def _add_jumps(
+        self,
+        code: list[dict[str, dict]],
+        skippable_operands: dict[int, int]
+    ) -> list[dict[str, dict]]:
+        """
+        Add the short-circuit jumps before the right hand sides to skip, and
+        fix the other jumps.
+
+        Parameters
+        ----------
+        code : list[dict[str, dict]]
+            The code of a function.
+        skippable_operands : dict[int, int]
+            Maps the index of the first bytecode of each right hand side to
+            skip to the index of its logical operation.
+
+        Returns
+        -------
+        new_code : list[dict[str, dict]]
+            The code with the short-circuit jumps.
+        """
+
+        new_code: list[dict[str, dict]] = []
+
+        # Maps each old index to its new index (i.e., to the short-circuit
+        # jumps added before it, if any), and to the new index of the bytecode
+        # itself
+        new_indices: list[int] = []
+        positions: list[int] = []
+
+        # (new index, old target index) of the jumps that already existed, and
+        # (new index, old target index) of the added ones
+        jumps: list[tuple[int, int]] = []
+        short_circuit_jumps: list[tuple[int, int]] = []
+
+        for bytecode_idx, bytecode in enumerate(code):
+            new_indices.append(len(new_code))
+
+            operation_idx = skippable_operands.get(bytecode_idx)
+
+            if operation_idx is not None:
+                operation = code[operation_idx]
+                lhs_register = operation["metadata"]["lhs_register"]
+
+                if operation["instruction"] in self.CONJUNCTIONS:
+                    short_circuit_jumps.append((len(new_code), operation_idx))
+                    new_code.append(self._get_jump(lhs_register))
+
+                else:
+                    short_circuit_jumps.append((len(new_code), bytecode_idx))
+                    new_code.append(self._get_jump(lhs_register))
+
+                    short_circuit_jumps.append((len(new_code), operation_idx))
+                    new_code.append(self._get_jump("zero"))
+
+            positions.append(len(new_code))
+
+            if bytecode["instruction"] == "JZ":
+                jumps.append((len(new_code), bytecode_idx + bytecode["metadata"]["jump_size"]))
+
+            new_code.append(bytecode)
+
+        new_indices.append(len(new_code))
+
+        for new_bytecode_idx, target_idx in jumps:
+            jump = new_code[new_bytecode_idx]
+
+            new_code[new_bytecode_idx] = {
+                **jump,
+                "metadata": {
+                    **jump["metadata"],
+                    "jump_size": new_indices[target_idx] - new_bytecode_idx
+                },
+            }
+
+        for new_bytecode_idx, target_idx in short_circuit_jumps:
+            new_code[new_bytecode_idx]["metadata"]["jump_size"] = (
+                positions[target_idx] - new_bytecode_idx
+            )
+
+        return new_code
+
+    @staticmethod
+    def _get_jump(conditional_register: Union[int, str]) -> dict[str, dict]:
+        """
+        Get a `JZ` bytecode, whose `jump_size` is set later on.
+
+        Parameters
+        ----------
+        conditional_register : Union[int, str]
+            The register the jump evaluates.
+
+        Returns
+        -------
+        jump : dict[str, dict]
+            The `JZ` bytecode.
+        """
+
+        return {
+            "instruction": "JZ",
+            "metadata": {
+                "conditional_register": conditional_register,
+                "jump_size": None
+            },
+        }
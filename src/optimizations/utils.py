@@ -0,0 +1,81 @@
+"""Utilitary functions shared by the optimization passes."""
+
+from typing import Union
+
+
+def match_absolute_address(
+    code: list[dict[str, dict]],
+    bytecode_idx: int,
+    register_uses: dict[int, list[int]]
+) -> Union[tuple[int, int, int], None]:
+    """
+    Match the computation of a constant address at `code[bytecode_idx]`.
+
+    The code generator computes the address of a variable as
+    `CONSTANT r_base address; ADD r_address r_base zero`. Struct attributes
+    and array elements accessed with a constant index add an offset to it:
+    `CONSTANT r_offset offset; ADD r_element r_address r_offset`.
+
+    The address is only considered constant if every intermediate register is
+    read exactly once, by the next bytecode of the pattern.
+
+    Parameters
+    ----------
+    code : list[dict[str, dict]]
+        The code of a function.
+    bytecode_idx : int
+        The index, in `code`, of the `CONSTANT` bytecode with the base address.
+    register_uses : dict[int, list[int]]
+        Maps each register to the indices of the bytecodes that read it.
+
+    Returns
+    -------
+    match : tuple[int, int, int] or None
+        The absolute address, the register that holds it, and the index of
+        the last bytecode of the pattern. Returns `None` if there is no match.
+    """
+
+    try:
+        base_bytecode = code[bytecode_idx]
+        add_bytecode = code[bytecode_idx + 1]
+    except IndexError:
+        return None
+
+    is_variable_address = (
+        base_bytecode["instruction"] == "CONSTANT"
+        and add_bytecode["instruction"] == "ADD"
+        and add_bytecode["metadata"]["lhs_register"] == base_bytecode["metadata"]["register"]
+        and add_bytecode["metadata"]["rhs_register"] == "zero"
+        and register_uses.get(base_bytecode["metadata"]["register"]) == [bytecode_idx + 1]
+    )
+
+    if not is_variable_address:
+        return None
+
+    address: int = base_bytecode["metadata"]["value"]
+    address_register: int = add_bytecode["metadata"]["register"]
+    last_bytecode_idx: int = bytecode_idx + 1
+
+    # Check if there is a constant offset (i.e., an access to a struct
+    # attribute or to an array element with a constant index)
+    try:
+        offset_bytecode = code[bytecode_idx + 2]
+        element_bytecode = code[bytecode_idx + 3]
+    except IndexError:
+        return address, address_register, last_bytecode_idx
+
+    is_constant_offset = (
+        offset_bytecode["instruction"] == "CONSTANT"
+        and element_bytecode["instruction"] == "ADD"
+        and element_bytecode["metadata"]["lhs_register"] == address_register
+        and element_bytecode["metadata"]["rhs_register"] == offset_bytecode["metadata"]["register"]
+        and register_uses.get(address_register) == [bytecode_idx + 3]
+        and register_uses.get(offset_bytecode["metadata"]["register"]) == [bytecode_idx + 3]
+    )
+
+    if is_constant_offset:
+        address += offset_bytecode["metadata"]["value"]
+        address_register = element_bytecode["metadata"]["register"]
+        last_bytecode_idx = bytecode_idx + 3
+
+    return address, address_register, last_bytecode_idx
@@ -0,0 +1,154 @@
+"""Implement a shared, memoized provider of prime numbers."""
+
+from bisect import bisect_left, bisect_right
+from itertools import compress
+
+
+class PrimeProvider:
+    """
+    Provider of prime numbers backed by an incremental segmented sieve.
+
+    The primes found so far are cached in a sorted table, that grows on demand
+    one segment at a time: each new segment is sieved with the primes already
+    in the table, so previously computed primes are never computed again.
+
+    Certificates use a positional prime per element, so a single provider is
+    shared by every certificator (and by the `Lexer`) through
+    `SHARED_PRIME_PROVIDER`.
+
+    Parameters
+    ----------
+    segment_size : int, optional (default = 32768)
+        The maximum amount of numbers sieved each time the table grows.
+    """
+
+    def __init__(self, segment_size: int = 32768) -> None:
+        self.segment_size: int = segment_size
+
+        # All the primes below `self.limit`, sorted
+        self.primes: list[int] = [2]
+        self.limit: int = 3
+
+    def get_primes(self, length: int) -> list[int]:
+        """
+        Get the first `length` primes.
+
+        Parameters
+        ----------
+        length : int
+            The amount of primes.
+
+        Returns
+        -------
+        primes : list[int]
+            The first `length` primes, starting at 2.
+        """
+
+        while len(self.primes) < length:
+            self._sieve_next_segment()
+
+        return self.primes[:length]
+
+    def is_prime(self, number: int) -> bool:
+        """
+        Check whether the given `number` is a prime.
+
+        Parameters
+        ----------
+        number : int
+            The number to test.
+
+        Returns
+        -------
+        : bool
+            The verdict.
+        """
+
+        if number < 2:
+            return False
+
+        while self.limit <= number:
+            self._sieve_next_segment()
+
+        idx = bisect_left(self.primes, number)
+
+        return idx < len(self.primes) and self.primes[idx] == number
+
+    def next_prime(self, number: int) -> int:
+        """
+        Get the first prime after `number`.
+
+        Parameters
+        ----------
+        number : int
+            The reference number.
+
+        Returns
+        -------
+        : int
+            The first prime after `number`.
+        """
+
+        while self.primes[-1] <= number:
+            self._sieve_next_segment()
+
+        return self.primes[bisect_right(self.primes, number)]
+
+    def previous_prime(self, number: int) -> int:
+        """
+        Get the prime immediately before `number`.
+
+        Parameters
+        ----------
+        number : int
+            The reference number.
+
+        Returns
+        -------
+        : int
+            The first prime before `number`.
+
+        Raises
+        ------
+        ValueError
+            Raised if there are no primes before `number`.
+        """
+
+        if number <= 2:
+            raise ValueError(f"There are no primes before {number}.")
+
+        while self.limit < number:
+            self._sieve_next_segment()
+
+        return self.primes[bisect_left(self.primes, number) - 1]
+
+    def _sieve_next_segment(self) -> None:
+        """
+        Sieve the numbers right after `self.limit`, and add the primes among
+        them to the table.
+
+        The segment never goes beyond `self.limit ** 2`, so every composite
+        number in it has a prime factor that is already in the table.
+        """
+
+        low = self.limit
+        high = min(low + self.segment_size, low * low)
+
+        segment = bytearray([1]) * (high - low)
+
+        for prime in self.primes:
+            if prime * prime >= high:
+                break
+
+            # The first multiple of `prime` in the segment (smaller multiples
+            # were already crossed out by smaller primes)
+            first_multiple = max(prime * prime, -(-low // prime) * prime)
+            multiples = range(first_multiple - low, high - low, prime)
+
+            segment[first_multiple - low::prime] = bytes(len(multiples))
+
+        self.primes.extend(compress(range(low, high), segment))
+        self.limit = high
+
+
+SHARED_PRIME_PROVIDER: PrimeProvider = PrimeProvider()
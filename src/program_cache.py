@@ -0,0 +1,296 @@
+"""Implement a content-addressed, on-disk cache of compiled programs."""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import zlib
+from typing import Union
+
+
+# The directory with the source code of the compiler (i.e., the `src` package)
+COMPILER_DIRECTORY: str = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_CACHE_DIRECTORY: str = os.path.join(
+    os.path.expanduser("~"), ".cache", "charon"
+)
+
+
+class ProgramCache:
+    """
+    Content-addressed, size-bounded cache of compiled programs on disk.
+
+    Each entry is keyed by a hash of the source code of a program, its
+    optimization level and the version of the compiler (i.e., a hash of the
+    source code of the `src` package), so entries are never stale: any change
+    to the program or to the compiler yields a new key. Entries hold the
+    compiled `program`, both certificates and the memory image produced by the
+    global variables initialization, and are stored as compressed pickles (so
+    the cache directory must only be writable by trusted users).
+
+    The total size of the entries is bounded by `max_size`: whenever it is
+    exceeded, the least recently used entries (i.e., the ones with the oldest
+    modification times, which are refreshed on every hit) are evicted.
+
+    Parameters
+    ----------
+    directory : str, optional (default = DEFAULT_CACHE_DIRECTORY)
+        The directory to store the entries in. Created if it does not exist.
+    max_size : int, optional (default = 64 * 2**20)
+        The maximum total size of the entries, in bytes.
+    """
+
+    FILE_EXTENSION: str = ".charon"
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIRECTORY,
+        max_size: int = 64 * 2**20
+    ) -> None:
+        self.directory: str = directory
+        self.max_size: int = max_size
+        self.compiler_version: str = self.compute_compiler_version()
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def compute_compiler_version() -> str:
+        """
+        Compute the version of the compiler, as a hash of the source code of
+        the `src` package.
+
+        Returns
+        -------
+        : str
+            The hexadecimal digest of the hash.
+        """
+
+        compiler_hash = hashlib.sha256()
+
+        for root, directories, files in os.walk(COMPILER_DIRECTORY):
+            # Visit the directories in a deterministic order
+            directories.sort()
+
+            for file_name in sorted(files):
+                if not file_name.endswith(".py"):
+                    continue
+
+                path = os.path.join(root, file_name)
+
+                compiler_hash.update(
+                    os.path.relpath(path, COMPILER_DIRECTORY).encode()
+                )
+
+                with open(path, "rb") as source_file:
+                    compiler_hash.update(source_file.read())
+
+        return compiler_hash.hexdigest()
+
+    def get_key(
+        self,
+        source_code: str,
+        optimization_level: int = 0,
+        trust_ast_optimizations: bool = False
+    ) -> str:
+        """
+        Compute the key of a program.
+
+        Parameters
+        ----------
+        source_code : str
+            The source code of the program.
+        optimization_level : int, optional (default = 0)
+            The optimization level of the generated code.
+        trust_ast_optimizations : bool, optional (default = False)
+            Whether the AST optimizations (that are not validated) are run.
+
+        Returns
+        -------
+        : str
+            The hexadecimal digest of the key.
+        """
+
+        key_hash = hashlib.sha256()
+
+        key_hash.update(self.compiler_version.encode())
+        key_hash.update(f"-O{optimization_level}".encode())
+
+        if trust_ast_optimizations:
+            key_hash.update(b"-trust-ast-optimizations")
+        key_hash.update(source_code.encode())
+
+        return key_hash.hexdigest()
+
+    def get(self, key: str) -> Union[dict, None]:
+        """
+        Get the entry of some key, and mark it as the most recently used.
+
+        Entries that can't be read (e.g., corrupted ones) are evicted.
+
+        Parameters
+        ----------
+        key : str
+            The key of the entry.
+
+        Returns
+        -------
+        entry : dict or None
+            The entry. Returns `None` if there is no entry for `key`.
+        """
+
+        path = self._get_path(key)
+
+        try:
+            with open(path, "rb") as entry_file:
+                entry = pickle.loads(zlib.decompress(entry_file.read()))
+
+        except FileNotFoundError:
+            return None
+
+        except (OSError, zlib.error, pickle.UnpicklingError, EOFError):
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+        return entry
+
+    def put(self, key: str, entry: dict) -> None:
+        """
+        Store the entry of some key, and evict the least recently used entries
+        if the cache grows larger than `self.max_size`.
+
+        The entry is written to a temporary file first, and then moved into
+        place, so concurrent readers never see partial entries.
+
+        Parameters
+        ----------
+        key : str
+            The key of the entry.
+        entry : dict
+            The entry. Must be picklable.
+        """
+
+        data = zlib.compress(pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory)
+
+        try:
+            with os.fdopen(file_descriptor, "wb") as entry_file:
+                entry_file.write(data)
+
+            os.replace(temporary_path, self._get_path(key))
+
+        except BaseException:
+            self._remove(temporary_path)
+            raise
+
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove every entry of the cache."""
+
+        for path in self._get_entries_paths():
+            self._remove(path)
+
+    def get_size(self) -> int:
+        """
+        Get the total size of the entries of the cache.
+
+        Returns
+        -------
+        : int
+            The total size, in bytes.
+        """
+
+        return sum(size for _, _, size in self._get_entries_stats())
+
+    def _evict(self) -> None:
+        """
+        Evict the least recently used entries, until the total size of the
+        cache is at most `self.max_size`.
+        """
+
+        entries_stats = sorted(self._get_entries_stats())
+        total_size = sum(size for _, _, size in entries_stats)
+
+        for _, path, size in entries_stats:
+            if total_size <= self.max_size:
+                break
+
+            self._remove(path)
+            total_size -= size
+
+    def _get_entries_stats(self) -> list[tuple[float, str, int]]:
+        """
+        Get the modification time, the path and the size of each entry.
+
+        Returns
+        -------
+        entries_stats : list[tuple[float, str, int]]
+            The `(modification_time, path, size)` of each entry.
+        """
+
+        entries_stats: list[tuple[float, str, int]] = []
+
+        for path in self._get_entries_paths():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+
+            entries_stats.append((stat.st_mtime, path, stat.st_size))
+
+        return entries_stats
+
+    def _get_entries_paths(self) -> list[str]:
+        """
+        Get the paths of the entries of the cache.
+
+        Returns
+        -------
+        : list[str]
+            The paths of the entries.
+        """
+
+        return [
+            os.path.join(self.directory, file_name)
+            for file_name in os.listdir(self.directory)
+            if file_name.endswith(self.FILE_EXTENSION)
+        ]
+
+    def _get_path(self, key: str) -> str:
+        """
+        Get the path of the entry of some key.
+
+        Parameters
+        ----------
+        key : str
+            The key of the entry.
+
+        Returns
+        -------
+        : str
+            The path of the entry.
+        """
+
+        return os.path.join(self.directory, f"{key}{self.FILE_EXTENSION}")
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        """
+        Remove a file, if it exists.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        """
+
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,599 @@
+"""Implement a generator of synthetic [C]haron programs."""
+
+import random
+
+
+class ProgramGenerator:
+    """
+    Generate valid, terminating [C]haron programs of parameterized size and
+    shape, for scaling benchmarks.
+
+    The program defines `structs` struct types, and `functions` functions
+    besides `main`. The first half of the functions are leaves; each of the
+    others calls `call_fan_out` leaves (so the amount of calls executed grows
+    linearly with the parameters), and `main` calls each of the functions
+    once. Each function declares and initializes its variables (`variables`
+    integers, `arrays` integer arrays, and an instance of each struct type),
+    and then runs `statements` statements: assignments of expressions with
+    `expression_depth` levels of operations, and `if`/`while` statements
+    nested up to `nesting_depth` levels.
+
+    Every variable is initialized before it is read, integer values are kept
+    small (i.e., modulo a prime) so they never overflow, there are no
+    divisions by zero, array indices are always in bounds, and every loop
+    runs `loop_iterations` times.
+
+    Parameters
+    ----------
+    functions : int, optional (default = 4)
+        The amount of functions, besides `main`.
+    statements : int, optional (default = 16)
+        The amount of statements of each function (counting the ones nested
+        in `if` and `while` statements).
+    expression_depth : int, optional (default = 2)
+        The depth of the expressions (i.e., how many levels of operations).
+    nesting_depth : int, optional (default = 2)
+        The maximum nesting of `if` and `while` statements.
+    arrays : int, optional (default = 1)
+        The amount of arrays of each function.
+    structs : int, optional (default = 1)
+        The amount of struct types (each function has an instance of each).
+    call_fan_out : int, optional (default = 2)
+        The amount of calls of each function that is not a leaf.
+    variables : int, optional (default = 4)
+        The amount of integer variables of each function.
+    loop_iterations : int, optional (default = 2)
+        The amount of iterations of each loop.
+    seed : int, optional (default = 0)
+        The seed of the pseudorandom choices, so programs are reproducible.
+    """
+
+    ARRAY_SIZE: int = 4
+    PARAMETERS: int = 2
+
+    # Integer values are kept modulo this prime
+    MODULUS: int = 997
+
+    ARITHMETIC_OPERATORS: list[str] = ["+", "-", "*", "&", "|"]
+    RELATIONAL_OPERATORS: list[str] = ["<", ">", "==", "!="]
+    LOGICAL_OPERATORS: list[str] = ["&&", "||"]
+
+    def __init__(
+        self,
+        functions: int = 4,
+        statements: int = 16,
+        expression_depth: int = 2,
+        nesting_depth: int = 2,
+        arrays: int = 1,
+        structs: int = 1,
+        call_fan_out: int = 2,
+        variables: int = 4,
+        loop_iterations: int = 2,
+        seed: int = 0
+    ) -> None:
+        if variables < 1:
+            raise ValueError("Functions must have at least one variable.")
+
+        if loop_iterations > self.ARRAY_SIZE:
+            raise ValueError(
+                f"Loops can't run more than {self.ARRAY_SIZE} iterations, as "
+                "their counters index the arrays."
+            )
+
+        self.functions: int = functions
+        self.statements: int = statements
+        self.expression_depth: int = expression_depth
+        self.nesting_depth: int = nesting_depth
+        self.arrays: int = arrays
+        self.structs: int = structs
+        self.call_fan_out: int = call_fan_out
+        self.variables: int = variables
+        self.loop_iterations: int = loop_iterations
+        self.seed: int = seed
+
+        self.random: random.Random = random.Random(seed)
+
+    def generate(self) -> str:
+        """
+        Generate the source code of a program.
+
+        Returns
+        -------
+        : str
+            The source code.
+        """
+
+        # Restart the pseudorandom choices, so the same program is generated
+        # every time
+        self.random = random.Random(self.seed)
+
+        leaves = max(1, (self.functions + 1) // 2)
+        lines: list[str] = []
+
+        for struct_idx in range(self.structs):
+            lines.extend([
+                f"struct s{struct_idx} {{",
+                "    int m0;",
+                "    float m1;",
+                "    short m2;",
+                "};",
+                "",
+            ])
+
+        for function_idx in range(self.functions):
+            callees = (
+                []
+                if function_idx < leaves
+                else [
+                    self.random.randrange(leaves)
+                    for _ in range(self.call_fan_out)
+                ]
+            )
+
+            lines.extend(self._generate_function(function_idx, callees))
+            lines.append("")
+
+        lines.extend(self._generate_main())
+
+        return "\n".join(lines) + "\n"
+
+    def _generate_function(self, function_idx: int, callees: list[int]) -> list[str]:
+        """
+        Generate a function.
+
+        Parameters
+        ----------
+        function_idx : int
+            The index of the function (i.e., its name is `f{function_idx}`).
+        callees : list[int]
+            The indices of the functions it calls.
+
+        Returns
+        -------
+        lines : list[str]
+            The lines of the function.
+        """
+
+        parameters = ", ".join(f"int p{idx}" for idx in range(self.PARAMETERS))
+
+        lines = [f"int f{function_idx}({parameters}) {{"]
+
+        # Declarations
+        lines.extend(f"    int v{idx};" for idx in range(self.variables))
+        lines.extend(f"    int c{level};" for level in range(self.nesting_depth + 1))
+        lines.extend(
+            f"    int a{idx}[{self.ARRAY_SIZE}];" for idx in range(self.arrays)
+        )
+        lines.extend(f"    s{idx} t{idx};" for idx in range(self.structs))
+
+        # Initializations
+        lines.extend(
+            f"    v{idx} = p{idx % self.PARAMETERS} + {idx};"
+            for idx in range(self.variables)
+        )
+
+        for idx in range(self.arrays):
+            lines.extend(
+                f"    a{idx}[{element_idx}] = {element_idx};"
+                for element_idx in range(self.ARRAY_SIZE)
+            )
+
+        for idx in range(self.structs):
+            lines.extend([
+                f"    t{idx}.m0 = {idx};",
+                f"    t{idx}.m1 = 1.5;",
+                f"    t{idx}.m2 = {idx};",
+            ])
+
+        # Calls
+        for callee_idx in callees:
+            lines.append(
+                f"    v{self.random.randrange(self.variables)} = "
+                f"f{callee_idx}({self._generate_arguments(loop_level=0)});"
+            )
+
+        lines.extend(self._generate_block(budget=self.statements, level=0, loop_level=0))
+
+        lines.append(f"    return v{self.random.randrange(self.variables)};")
+        lines.append("}")
+
+        return lines
+
+    def _generate_main(self) -> list[str]:
+        """
+        Generate the `main` function, that calls each of the other functions.
+
+        Returns
+        -------
+        lines : list[str]
+            The lines of `main`.
+        """
+
+        lines = ["int main() {", "    int result;", "    result = 0;"]
+
+        for function_idx in range(self.functions):
+            lines.append(
+                f"    result = (result + f{function_idx}(result, {function_idx})) "
+                f"% {self.MODULUS};"
+            )
+
+        lines.extend(["    return 0;", "}"])
+
+        return lines
+
+    def _generate_block(self, budget: int, level: int, loop_level: int) -> list[str]:
+        """
+        Generate a block of statements.
+
+        Parameters
+        ----------
+        budget : int
+            The amount of statements of the block, counting the nested ones.
+        level : int
+            The nesting level of the block.
+        loop_level : int
+            The amount of loops the block is nested in.
+
+        Returns
+        -------
+        lines : list[str]
+            The lines of the block.
+        """
+
+        lines: list[str] = []
+        indent = "    " * (level + 1)
+
+        while budget > 0:
+            is_compound = (
+                level < self.nesting_depth
+                and budget > 1
+                and self.random.random() < 0.3
+            )
+
+            if not is_compound:
+                lines.append(indent + self._generate_assignment(loop_level))
+                budget -= 1
+                continue
+
+            inner_budget = self.random.randint(1, budget - 1)
+            budget -= inner_budget + 1
+
+            if self.random.random() < 0.5:
+                lines.extend(self._generate_while(inner_budget, level, loop_level))
+            else:
+                lines.extend(self._generate_if(inner_budget, level, loop_level))
+
+        return lines
+
+    def _generate_while(self, budget: int, level: int, loop_level: int) -> list[str]:
+        """
+        Generate a `while` statement, that runs `self.loop_iterations` times.
+
+        The counter of the loop is `c{loop_level}`, and is only written by the
+        loop itself.
+
+        Parameters
+        ----------
+        budget : int
+            The amount of statements of the body.
+        level : int
+            The nesting level of the statement.
+        loop_level : int
+            The amount of loops the statement is nested in.
+
+        Returns
+        -------
+        lines : list[str]
+            The lines of the statement.
+        """
+
+        indent = "    " * (level + 1)
+        counter = f"c{loop_level}"
+
+        return [
+            f"{indent}{counter} = 0;",
+            f"{indent}while ({counter} < {self.loop_iterations}) {{",
+            *self._generate_block(budget, level + 1, loop_level + 1),
+            f"{indent}    {counter} = {counter} + 1;",
+            f"{indent}}}",
+        ]
+
+    def _generate_if(self, budget: int, level: int, loop_level: int) -> list[str]:
+        """
+        Generate an `if` (or `if`/`else`) statement.
+
+        The branches always end with an assignment, as the certificators
+        disagree on branches that end with a `while` statement.
+
+        Parameters
+        ----------
+        budget : int
+            The amount of statements of the branches.
+        level : int
+            The nesting level of the statement.
+        loop_level : int
+            The amount of loops the statement is nested in.
+
+        Returns
+        -------
+        lines : list[str]
+            The lines of the statement.
+        """
+
+        indent = "    " * (level + 1)
+        condition = self._generate_condition(loop_level)
+
+        if budget < 2 or self.random.random() < 0.5:
+            return [
+                f"{indent}if ({condition}) {{",
+                *self._generate_branch(budget, level + 1, loop_level),
+                f"{indent}}}",
+            ]
+
+        if_budget = self.random.randint(1, budget - 1)
+
+        return [
+            f"{indent}if ({condition}) {{",
+            *self._generate_branch(if_budget, level + 1, loop_level),
+            f"{indent}}}",
+            f"{indent}else {{",
+            *self._generate_branch(budget - if_budget, level + 1, loop_level),
+            f"{indent}}}",
+        ]
+
+    def _generate_branch(self, budget: int, level: int, loop_level: int) -> list[str]:
+        """
+        Generate a branch of an `if` statement: a block of statements that
+        ends with an assignment.
+
+        Parameters
+        ----------
+        budget : int
+            The amount of statements of the branch.
+        level : int
+            The nesting level of the branch.
+        loop_level : int
+            The amount of loops the branch is nested in.
+
+        Returns
+        -------
+        : list[str]
+            The lines of the branch.
+        """
+
+        indent = "    " * (level + 1)
+
+        return [
+            *self._generate_block(budget - 1, level, loop_level),
+            indent + self._generate_assignment(loop_level),
+        ]
+
+    def _generate_assignment(self, loop_level: int) -> str:
+        """
+        Generate an assignment to a variable, an element of an array or a
+        member of a struct.
+
+        Parameters
+        ----------
+        loop_level : int
+            The amount of loops the assignment is nested in.
+
+        Returns
+        -------
+        : str
+            The assignment.
+        """
+
+        targets = ["variable"]
+
+        if self.arrays:
+            targets.append("array")
+
+        if self.structs:
+            targets.extend(["struct", "float"])
+
+        target = self.random.choice(targets)
+
+        # Floating point members only get floating point values
+        if target == "float":
+            struct_idx = self.random.randrange(self.structs)
+            return f"t{struct_idx}.m1 = t{struct_idx}.m1 * 0.5 + 1.5;"
+
+        value = f"({self._generate_expression(self.expression_depth, loop_level)}) % {self.MODULUS}"
+
+        if target == "array":
+            return f"{self._generate_array_element(loop_level)} = {value};"
+
+        if target == "struct":
+            member = self.random.choice(["m0", "m2"])
+            return f"t{self.random.randrange(self.structs)}.{member} = {value};"
+
+        return f"v{self.random.randrange(self.variables)} = {value};"
+
+    def _generate_condition(self, loop_level: int) -> str:
+        """
+        Generate the condition of an `if` statement.
+
+        Parameters
+        ----------
+        loop_level : int
+            The amount of loops the condition is nested in.
+
+        Returns
+        -------
+        : str
+            The condition.
+        """
+
+        depth = max(0, self.expression_depth - 1)
+
+        def comparison() -> str:
+            return (
+                f"({self._generate_expression(depth, loop_level)}) "
+                f"{self.random.choice(self.RELATIONAL_OPERATORS)} "
+                f"({self._generate_expression(depth, loop_level)})"
+            )
+
+        condition = comparison()
+
+        if self.random.random() < 0.3:
+            condition = (
+                f"({condition}) {self.random.choice(self.LOGICAL_OPERATORS)} "
+                f"({comparison()})"
+            )
+
+        if self.random.random() < 0.1:
+            condition = f"!({condition})"
+
+        return condition
+
+    def _generate_expression(self, depth: int, loop_level: int) -> str:
+        """
+        Generate an integer expression.
+
+        Parameters
+        ----------
+        depth : int
+            The depth of the expression (i.e., how many levels of operations).
+        loop_level : int
+            The amount of loops the expression is nested in.
+
+        Returns
+        -------
+        : str
+            The expression.
+        """
+
+        if depth == 0:
+            return self._generate_operand(loop_level)
+
+        lhs = self._generate_expression(depth - 1, loop_level)
+        rhs = self._generate_expression(depth - 1, loop_level)
+
+        # Divide only by (non-zero) constants
+        if self.random.random() < 0.1:
+            return f"({lhs}) / {self.random.randint(1, 9)}"
+
+        return f"({lhs}) {self.random.choice(self.ARITHMETIC_OPERATORS)} ({rhs})"
+
+    def _generate_arguments(self, loop_level: int) -> str:
+        """
+        Generate the arguments of a function call: constants, variables,
+        parameters or loop counters (as arguments can't be expressions, nor
+        elements of arrays or structs).
+
+        Parameters
+        ----------
+        loop_level : int
+            The amount of loops the call is nested in.
+
+        Returns
+        -------
+        : str
+            The comma-separated arguments.
+        """
+
+        arguments: list[str] = []
+
+        for _ in range(self.PARAMETERS):
+            operand = self._generate_operand(loop_level)
+
+            # Constants, variables, parameters and counters are alphanumeric
+            if not operand.isalnum():
+                operand = f"v{self.random.randrange(self.variables)}"
+
+            arguments.append(operand)
+
+        return ", ".join(arguments)
+
+    def _generate_operand(self, loop_level: int) -> str:
+        """
+        Generate an integer operand: a constant, a variable, a parameter, a
+        loop counter, an element of an array, or a member of a struct.
+
+        Parameters
+        ----------
+        loop_level : int
+            The amount of loops the operand is nested in.
+
+        Returns
+        -------
+        : str
+            The operand.
+        """
+
+        kinds = ["constant", "variable", "variable", "parameter"]
+
+        if loop_level:
+            kinds.append("counter")
+
+        if self.arrays:
+            kinds.append("array")
+
+        if self.structs:
+            kinds.append("struct")
+
+        kind = self.random.choice(kinds)
+
+        if kind == "constant":
+            return f"{self.random.randint(0, 99)}"
+
+        if kind == "parameter":
+            return f"p{self.random.randrange(self.PARAMETERS)}"
+
+        if kind == "counter":
+            return f"c{self.random.randrange(loop_level)}"
+
+        if kind == "array":
+            return self._generate_array_element(loop_level)
+
+        if kind == "struct":
+            return f"t{self.random.randrange(self.structs)}.m0"
+
+        return f"v{self.random.randrange(self.variables)}"
+
+    def _generate_array_element(self, loop_level: int) -> str:
+        """
+        Generate an access to an element of an array, either by a constant
+        index or by a loop counter.
+
+        Parameters
+        ----------
+        loop_level : int
+            The amount of loops the access is nested in.
+
+        Returns
+        -------
+        : str
+            The access.
+        """
+
+        array = f"a{self.random.randrange(self.arrays)}"
+
+        if loop_level and self.random.random() < 0.5:
+            return f"{array}[c{self.random.randrange(loop_level)}]"
+
+        return f"{array}[{self.random.randrange(self.ARRAY_SIZE)}]"
+
+    def get_parameters(self) -> dict[str, int]:
+        """
+        Get the parameters of this generator.
+
+        Returns
+        -------
+        : dict[str, int]
+            Maps the name of each parameter to its value.
+        """
+
+        return {
+            "functions": self.functions,
+            "statements": self.statements,
+            "expression_depth": self.expression_depth,
+            "nesting_depth": self.nesting_depth,
+            "arrays": self.arrays,
+            "structs": self.structs,
+            "call_fan_out": self.call_fan_out,
+            "variables": self.variables,
+            "loop_iterations": self.loop_iterations,
+            "seed": self.seed,
+        }
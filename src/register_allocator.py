@@ -0,0 +1,245 @@
+"""Implement a liveness-based register allocator for generated code."""
+
+from typing import Union
+
+
+class RegisterAllocator:
+    """
+    Register Allocator that maps the registers of a function to a small set of
+    reusable registers.
+
+    The code generator hands out a new register to every intermediate value.
+    This class computes the liveness of each of these registers over the
+    control flow graph of the function, and then assigns registers with a
+    linear scan over their live intervals: two registers share the same
+    number only if their live intervals do not overlap.
+
+    Special registers (`zero`, `arg`, `ret_value` and `ret_address`) are kept
+    untouched.
+
+    Parameters
+    ----------
+    code : list[dict[str, dict]]
+        The code of a single function. It is modified in place by the
+        `allocate` method.
+    """
+
+    def __init__(self, code: list[dict[str, dict]]) -> None:
+        self.code: list[dict[str, dict]] = code
+
+        self.live_in: list[set[int]] = [set() for _ in code]
+        self.live_out: list[set[int]] = [set() for _ in code]
+        self.register_count: int = 0
+
+    def allocate(self) -> int:
+        """
+        Allocate registers for `self.code`, rewriting it in place.
+
+        Returns
+        -------
+        register_count : int
+            The number of registers used by the code after the allocation.
+        """
+
+        self._compute_liveness()
+
+        intervals = self._compute_live_intervals()
+        allocation = self._linear_scan(intervals)
+
+        for bytecode in self.code:
+            metadata = bytecode["metadata"]
+            definitions, uses = self.get_definitions_and_uses(bytecode)
+
+            for key in [*definitions, *uses]:
+                metadata[key] = allocation[metadata[key]]
+
+        self.register_count = len(set(allocation.values()))
+
+        return self.register_count
+
+    @staticmethod
+    def get_definitions_and_uses(
+        bytecode: dict[str, dict]
+    ) -> tuple[list[str], list[str]]:
+        """
+        Get the metadata keys of the registers a bytecode defines and uses.
+
+        Only keys that hold general purpose (i.e., integer) registers are
+        returned.
+
+        Parameters
+        ----------
+        bytecode : dict[str, dict]
+            The bytecode to analyze.
+
+        Returns
+        -------
+        definitions : list[str]
+            The metadata keys of the registers written by this bytecode.
+        uses : list[str]
+            The metadata keys of the registers read by this bytecode.
+        """
+
+        instruction: str = bytecode["instruction"]
+        metadata: dict[str, Union[int, float, str]] = bytecode["metadata"]
+
+        if instruction in ["JAL", "JR", "HALT"]:
+            definitions, uses = [], []
+
+        elif instruction in ["CONSTANT", "LOADA", "LOADFA", "LOADSA"]:
+            definitions, uses = ["register"], []
+
+        elif instruction == "JZ":
+            definitions, uses = [], ["conditional_register"]
+
+        elif instruction in ["STORE", "STOREF"]:
+            definitions, uses = [], ["register", "value"]
+
+        elif instruction in ["STOREA", "STOREFA"]:
+            definitions, uses = [], ["value"]
+
+        elif "lhs_register" in metadata:
+            definitions, uses = ["register"], ["lhs_register", "rhs_register"]
+
+        else:
+            definitions, uses = ["register"], ["value"]
+
+        definitions = [key for key in definitions if isinstance(metadata[key], int)]
+        uses = [key for key in uses if isinstance(metadata[key], int)]
+
+        return definitions, uses
+
+    def _get_successors(self, bytecode_idx: int) -> list[int]:
+        """
+        Get the indices of the bytecodes that might run after some bytecode.
+
+        Parameters
+        ----------
+        bytecode_idx : int
+            The index of the bytecode in `self.code`.
+
+        Returns
+        -------
+        successors : list[int]
+            The indices of the successors of the bytecode, within `self.code`.
+        """
+
+        bytecode = self.code[bytecode_idx]
+        instruction = bytecode["instruction"]
+
+        if instruction in ["JR", "HALT"]:
+            return []
+
+        successors: list[int] = []
+
+        if instruction == "JZ":
+            successors.append(bytecode_idx + bytecode["metadata"]["jump_size"])
+
+            # Unconditional jumps never fall through
+            if bytecode["metadata"]["conditional_register"] == "zero":
+                return successors
+
+        successors.append(bytecode_idx + 1)
+
+        return [
+            successor
+            for successor in successors
+            if 0 <= successor < len(self.code)
+        ]
+
+    def _compute_liveness(self) -> None:
+        """
+        Compute the registers that are live at the entry and exit of each
+        bytecode, with a backwards dataflow analysis.
+        """
+
+        definitions: list[set[int]] = []
+        uses: list[set[int]] = []
+
+        for bytecode in self.code:
+            _definitions, _uses = self.get_definitions_and_uses(bytecode)
+            definitions.append({bytecode["metadata"][key] for key in _definitions})
+            uses.append({bytecode["metadata"][key] for key in _uses})
+
+        successors = [self._get_successors(idx) for idx in range(len(self.code))]
+
+        changed = True
+        while changed:
+            changed = False
+
+            for idx in reversed(range(len(self.code))):
+                live_out = set().union(
+                    *(self.live_in[successor] for successor in successors[idx])
+                )
+                live_in = uses[idx] | (live_out - definitions[idx])
+
+                if live_in != self.live_in[idx] or live_out != self.live_out[idx]:
+                    self.live_in[idx] = live_in
+                    self.live_out[idx] = live_out
+                    changed = True
+
+    def _compute_live_intervals(self) -> dict[int, tuple[int, int]]:
+        """
+        Compute the live interval of each register.
+
+        The live interval of a register spans from the first to the last
+        bytecode in which it is either defined or live.
+
+        Returns
+        -------
+        intervals : dict[int, tuple[int, int]]
+            Maps each register to its (start, end) live interval.
+        """
+
+        intervals: dict[int, tuple[int, int]] = {}
+
+        for idx, bytecode in enumerate(self.code):
+            definitions, _ = self.get_definitions_and_uses(bytecode)
+            registers = {bytecode["metadata"][key] for key in definitions}
+
+            for register in registers | self.live_in[idx]:
+                start, _ = intervals.get(register, (idx, idx))
+                intervals[register] = (start, idx)
+
+        return intervals
+
+    @staticmethod
+    def _linear_scan(intervals: dict[int, tuple[int, int]]) -> dict[int, int]:
+        """
+        Assign registers to live intervals with a linear scan.
+
+        Parameters
+        ----------
+        intervals : dict[int, tuple[int, int]]
+            Maps each register to its (start, end) live interval.
+
+        Returns
+        -------
+        allocation : dict[int, int]
+            Maps each register to its allocated register.
+        """
+
+        allocation: dict[int, int] = {}
+        active: list[tuple[int, int]] = []
+        free_registers: set[int] = set()
+        next_register: int = 0
+
+        for register, (start, end) in sorted(intervals.items(), key=lambda x: x[1]):
+            # Release the registers whose intervals have already ended
+            for active_end, active_register in list(active):
+                if active_end < start:
+                    active.remove((active_end, active_register))
+                    free_registers.add(active_register)
+
+            if free_registers:
+                allocated_register = min(free_registers)
+                free_registers.remove(allocated_register)
+
+            else:
+                allocated_register = next_register
+                next_register += 1
+
+            allocation[register] = allocated_register
+            active.append((end, allocated_register))
+
+        return allocation
@@ -0,0 +1,168 @@
+"""Implement the register file of the virtual machine."""
+
+from typing import Union
+
+
+class RegisterFile:
+    """
+    List-backed register file, split in frames.
+
+    Each function call runs in its own frame: a window of `frame_size`
+    values of a single list, `values`, that starts at the `frame` base. A
+    frame is laid out as:
+
+    - the `ret_value` slot, that holds the value returned by the function;
+    - `argument_slots` argument slots (i.e., the `arg` register, indexed by
+    the argument position), that hold the arguments of the function;
+    - the `zero` register;
+    - `size` general purpose registers, indexed by the register number.
+
+    A function call (see `push_frame`) advances the base by `frame_size`,
+    and a return (see `pop_frame`) moves it back, so the registers of the
+    caller are never copied. The caller passes the arguments through the
+    `arg` slots of the frame of the called function, and reads the returned
+    value from its `ret_value` slot (see `index`).
+
+    Return addresses are kept in a stack, `return_addresses`.
+
+    Parameters
+    ----------
+    size : int
+        The number of general purpose registers.
+    argument_slots : int, optional (default = 0)
+        The number of argument slots.
+    """
+
+    def __init__(self, size: int, argument_slots: int = 0) -> None:
+        self.size: int = size
+        self.argument_slots: int = argument_slots
+        self.frame_size: int = 1 + argument_slots + 1 + size
+
+        # The current frame and the frame of the next call (whose `arg` and
+        # `ret_value` slots are written and read by the current frame)
+        self.values: list[Union[int, float]] = [0] * (2 * self.frame_size)
+
+        # The base of the current frame, in a list so it can be shared
+        # (e.g., by the handlers of the VirtualMachine)
+        self.frame: list[int] = [0]
+        self.return_addresses: list[int] = []
+
+    def __eq__(self, other: "RegisterFile") -> bool:
+        """
+        Implement the equality comparison between RegisterFile instances.
+
+        Parameters
+        ----------
+        other : RegisterFile
+            The right hand side RegisterFile of the comparison.
+
+        Returns
+        -------
+        : bool
+            `True` if all the attributes are equal, `False` otherwise.
+        """
+
+        return (
+            self.size == other.size
+            and self.argument_slots == other.argument_slots
+            and self.values == other.values
+            and self.frame == other.frame
+            and self.return_addresses == other.return_addresses
+        )
+
+    def __getitem__(self, register: Union[int, str]) -> Union[int, float, list]:
+        """
+        Read a register of the current frame, as an instruction would.
+
+        Parameters
+        ----------
+        register : Union[int, str]
+            The register number, or the name of a special register.
+
+        Returns
+        -------
+        : Union[int, float, list]
+            The register contents. `ret_address` and `arg` are returned as
+            lists (the return addresses stack, and the arguments of the
+            current function).
+        """
+
+        if register == "ret_address":
+            return self.return_addresses
+
+        if register == "arg":
+            start: int = self.frame[0] + self.index("arg")
+            return self.values[start:start + self.argument_slots]
+
+        return self.values[self.frame[0] + self.index(register)]
+
+    def __setitem__(self, register: Union[int, str], value: Union[int, float]) -> None:
+        """
+        Write to a register of the current frame, as an instruction would.
+
+        Parameters
+        ----------
+        register : Union[int, str]
+            The register number, or `ret_value`.
+        value : Union[int, float]
+            The value to write.
+        """
+
+        self.values[self.frame[0] + self.index(register, is_written=True)] = value
+
+    def index(
+        self,
+        register: Union[int, str],
+        argument: int = 0,
+        is_written: bool = False
+    ) -> int:
+        """
+        Get the position of a register in a frame (i.e., relative to the
+        base of the frame).
+
+        A function reads its arguments and writes its returned value in its
+        own frame, while its caller writes the arguments and reads the
+        returned value in the frame of the call. Thus, `arg` and `ret_value`
+        are in the next frame when the caller accesses them.
+
+        Parameters
+        ----------
+        register : Union[int, str]
+            The register number, or the name of a special register (`zero`,
+            `ret_value` or `arg`).
+        argument : int, optional (default = 0)
+            The argument position, if `register` is `arg`.
+        is_written : bool, optional (default = False)
+            Whether the register is written (or read).
+
+        Returns
+        -------
+        : int
+            The position of the register in a frame.
+        """
+
+        if register == "ret_value":
+            return 0 if is_written else self.frame_size
+
+        if register == "arg":
+            return 1 + argument + (self.frame_size if is_written else 0)
+
+        if register == "zero":
+            return 1 + self.argument_slots
+
+        return 2 + self.argument_slots + register
+
+    def push_frame(self) -> None:
+        """Enter the frame of a function call."""
+
+        base: int = self.frame[0] + self.frame_size
+        self.frame[0] = base
+
+        # Keep room for the frame of the next call
+        if base + 2 * self.frame_size > len(self.values):
+            self.values.extend([0] * len(self.values))
+
+    def pop_frame(self) -> None:
+        """Go back to the frame of the caller, e.g., when returning."""
+
+        self.frame[0] -= self.frame_size
@@ -1,11 +1,14 @@
 """Generate a runner for Charon programs."""
 
-from copy import deepcopy
+from multiprocessing import Pool
+from typing import Any, Union
 
 from src.abstract_syntax_tree import AbstractSyntaxTree
-from src.certificators import BackendCertificator, FrontendCertificator
+from src.certificators import BackendCertificator, Certificate, FrontendCertificator
 from src.code_generator import CodeGenerator
+from src.instrumentation import SHARED_INSTRUMENTATION, Instrumentation
 from src.lexer import Lexer
+from src.program_cache import ProgramCache
 from src.virtual_machine import VirtualMachine
 
 
@@ -20,39 +23,173 @@ class Charon:
     The goal of this class is to centralize all of this generated metadata in a
     single object.
 
+    The instance is lazy: each of these stages is only computed the first
+    time it is accessed (either as an attribute or with its getter), and then
+    kept. Accessing a stage computes the stages it depends on first (see
+    `get_dependencies`), so running a program never builds the certificators, and
+    certificating it never builds the Virtual Machine. Stages can also be
+    given already computed (e.g., loaded from a `ProgramCache`), or replaced
+    by assigning their attributes.
+
     Parameters
     ----------
-    parsed_source : dict[str, dict]
-        The source code after being tokenized and parsed by the Lexer.
-    ast : AbstractSyntaxTree
-        The Abstract Syntax Tree of this progrma.
-    program : dict[str, dict]
-        The compiled program, to be executed by the Virtual Machine.
-    vm : VirtualMachine
-        An instance of `VirtualMachine` loaded with the `program`.
-    frontend_certificator : FrontendCertificator
-        An instance of `FrontendCertificator` loaded with the `ast`.
-    backend_certificator : BackendCertificator
-        An instance of `BackendCertificator` loaded with the `program`.
+    source_code : str
+        The source code of the program.
+    optimization_level : int, optional (default = 0)
+        The optimization level of the generated code. Check the
+        `CodeGenerator` documentation for the available levels.
+    trust_ast_optimizations : bool, optional (default = False)
+        Whether to run the AST optimizations, that are not validated. Check
+        the `CodeGenerator` documentation.
+    instrumentation : Instrumentation, optional (default = SHARED_INSTRUMENTATION)
+        The instrumentation of the stages.
+    profile : bool, optional (default = False)
+        Whether the Virtual Machine profiles the execution of the program.
+    stages : dict[str, Any] or None, optional (default = None)
+        The stages that have already been computed, mapped to their values.
+
+    Raises
+    ------
+    ValueError
+        Raised if `stages` has unknown stages.
     """
 
+    # Maps each stage to the stages it always depends on
+    STAGES: dict[str, list[str]] = {
+        "parsed_source": [],
+        "ast": ["parsed_source"],
+        "code_generator": ["ast"],
+        "program": ["code_generator"],
+        "vm": ["program"],
+        "frontend_certificator": ["ast"],
+        "backend_certificator": ["program"],
+        "frontend_certificate": ["frontend_certificator"],
+        "backend_certificate": ["backend_certificator"],
+    }
+
     def __init__(
         self,
-        parsed_source: dict[str, dict],
-        ast: AbstractSyntaxTree,
-        code_generator: CodeGenerator,
-        program: dict[str, dict],
-        vm: VirtualMachine,
-        frontend_certificator: FrontendCertificator,
-        backend_certificator: BackendCertificator,
+        source_code: str,
+        optimization_level: int = 0,
+        trust_ast_optimizations: bool = False,
+        instrumentation: Instrumentation = SHARED_INSTRUMENTATION,
+        profile: bool = False,
+        stages: Union[dict[str, Any], None] = None,
     ) -> None:
-        self.parsed_source = parsed_source
-        self.ast = ast
-        self.code_generator = code_generator
-        self.program = program
-        self.vm = vm
-        self.frontend_certificator = frontend_certificator
-        self.backend_certificator = backend_certificator
+        self.source_code = source_code
+        self.optimization_level = optimization_level
+        self.trust_ast_optimizations = trust_ast_optimizations
+        self.instrumentation = instrumentation
+        self.profile = profile
+
+        stages = stages or {}
+        unknown_stages = [stage for stage in stages if stage not in self.STAGES]
+
+        if unknown_stages:
+            raise ValueError(f"Unknown stages: {', '.join(unknown_stages)}.")
+
+        # The computed stages are plain attributes: missing ones are computed
+        # by `__getattr__`
+        for stage, value in stages.items():
+            setattr(self, stage, value)
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Compute a stage that has not been computed yet.
+
+        Only called for attributes that are not set (i.e., stages that have
+        not been computed).
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute.
+
+        Returns
+        -------
+        : Any
+            The value of the stage.
+
+        Raises
+        ------
+        AttributeError
+            Raised if `name` is not a stage.
+        """
+
+        if name not in Charon.STAGES:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        return self.compute(name)
+
+    def is_computed(self, stage: str) -> bool:
+        """
+        Check whether a stage has been computed.
+
+        Parameters
+        ----------
+        stage : str
+            The stage.
+
+        Returns
+        -------
+        : bool
+            `True` if the stage has been computed, `False` otherwise.
+        """
+
+        return stage in vars(self)
+
+    def get_dependencies(self, stage: str) -> list[str]:
+        """
+        Get the stages a stage depends on.
+
+        The code generator optimizes the AST in place (at level 2, if its
+        optimizations are trusted), so the frontend is then certificated
+        after the code is generated.
+
+        Parameters
+        ----------
+        stage : str
+            The stage.
+
+        Returns
+        -------
+        : list[str]
+            The stages `stage` depends on.
+        """
+
+        if stage == "frontend_certificator" and self._is_ast_optimized():
+            return [*self.STAGES[stage], "code_generator"]
+
+        return self.STAGES[stage]
+
+    def compute(self, stage: str) -> Any:
+        """
+        Compute a stage (and the stages it depends on), unless it has already
+        been computed.
+
+        Parameters
+        ----------
+        stage : str
+            The stage.
+
+        Returns
+        -------
+        : Any
+            The value of the stage.
+        """
+
+        if self.is_computed(stage):
+            return vars(self)[stage]
+
+        for dependency in self.get_dependencies(stage):
+            self.compute(dependency)
+
+        value = getattr(self, f"_compute_{stage}")()
+        setattr(self, stage, value)
+
+        return value
 
     def get_parsed_source(self) -> dict[str, dict]:
         """Get the `parsed_source` attribute."""
@@ -60,7 +197,16 @@ class Charon:
         return self.parsed_source
 
     def get_ast(self) -> AbstractSyntaxTree:
-        """Get the `ast` attribute."""
+        """
+        Get the `ast` attribute.
+
+        The code generator optimizes the AST in place (at level 2, if its
+        optimizations are trusted), so the code is generated first, for the
+        AST to match it.
+        """
+
+        if self._is_ast_optimized():
+            self.compute("code_generator")
 
         return self.ast
     
@@ -89,45 +235,466 @@ class Charon:
 
         return self.backend_certificator
 
+    def get_frontend_certificate(self) -> Certificate:
+        """Get the `frontend_certificate` attribute."""
+
+        return self.frontend_certificate
+
+    def get_backend_certificate(self) -> Certificate:
+        """Get the `backend_certificate` attribute."""
+
+        return self.backend_certificate
+
+    def certificate(self) -> tuple[Certificate, Certificate]:
+        """
+        Compute the frontend and backend certificates, one after another
+        (unless they have already been computed).
+
+        Returns
+        -------
+        : tuple[Certificate, Certificate]
+            The frontend and the backend certificates.
+        """
+
+        return self.frontend_certificate, self.backend_certificate
+
+    def run(self) -> None:
+        """Run the program on the Virtual Machine."""
+
+        vm = self.vm
+
+        with self.instrumentation.stage("run"):
+            vm.run()
+
+    def validate_and_run(
+        self,
+        parallel: bool = True,
+        run_vm: bool = True,
+        max_workers: Union[int, None] = None,
+        fingerprint: bool = False
+    ) -> bool:
+        """
+        Certificate the frontend and the backend, and run the program if the
+        certificates match.
+
+        Once the program is generated, the certification of the frontend, the
+        certification of the backend and the execution of the program are
+        independent of each other. So, in parallel mode, the three of them run
+        at once in a process pool, and the execution is speculative: its
+        results are only kept if the certificates match.
+
+        The worker processes get a copy of this instance when they start
+        (which is free where processes are forked), with the program already
+        generated. Each of them builds what it needs (a certificator, or the
+        virtual machine), and only the results are brought back: the computed
+        certificates, and the virtual machine after the execution. The workers
+        are terminated as soon as the result is known, so a speculative
+        execution that would not end (or that is discarded) does not outlive
+        this method.
+
+        Certificates that have already been computed (e.g., loaded from a
+        `ProgramCache`) are not computed again.
+
+        In parallel mode, the `certification` and `run` stages are
+        instrumented from this process: their wall times are the waits for
+        the workers, and their CPU times and memory peaks don't account for
+        the work done by the workers.
+
+        Parameters
+        ----------
+        parallel : bool, optional (default = True)
+            Whether to run the stages in a process pool, or one after another.
+        run_vm : bool, optional (default = True)
+            Whether to run the program on the virtual machine.
+        max_workers : int or None, optional (default = None)
+            The maximum amount of worker processes. Defaults to one per stage.
+        fingerprint : bool, optional (default = False)
+            Whether to accept certificates with equal fingerprints, rather
+            than always comparing their entries (see `Certificate.matches`).
+
+        Returns
+        -------
+        : bool
+            `True` if the certificates match, `False` otherwise.
+        """
+
+        is_certificated = (
+            self.is_computed("frontend_certificate")
+            and self.is_computed("backend_certificate")
+        )
+
+        if not parallel or is_certificated:
+            frontend_certificate, backend_certificate = self.certificate()
+
+            if not frontend_certificate.matches(
+                backend_certificate, strict=not fingerprint
+            ):
+                return False
+
+            if run_vm:
+                self.run()
+
+            return True
+
+        # Generate the program once, rather than in every worker
+        self.compute("program")
+
+        pool = Pool(
+            processes=max_workers or 3,
+            initializer=_load_worker_instance,
+            initargs=(self,)
+        )
+
+        try:
+            frontend_result = pool.apply_async(_compute_frontend_certificate)
+            backend_result = pool.apply_async(_compute_backend_certificate)
+            vm_result = pool.apply_async(_run_vm) if run_vm else None
+
+            with self.instrumentation.stage("certification"):
+                self.frontend_certificate = frontend_result.get()
+                self.backend_certificate = backend_result.get()
+
+            for certificator, certificate in [
+                ("frontend_certificator", self.frontend_certificate),
+                ("backend_certificator", self.backend_certificate),
+            ]:
+                if self.is_computed(certificator):
+                    getattr(self, certificator).computed_certificate = certificate
+
+            if not self.frontend_certificate.matches(
+                self.backend_certificate, strict=not fingerprint
+            ):
+                return False
+
+            if vm_result is not None:
+                with self.instrumentation.stage("run"):
+                    self.vm = vm_result.get()
+
+                # Keep sharing the same program with the certificators
+                self.vm.program = self.program
+
+            return True
+
+        finally:
+            # Kill the workers, rather than waiting for a speculative execution
+            # whose results are discarded (e.g., that might never end)
+            pool.terminate()
+            pool.join()
+
+    def _is_ast_optimized(self) -> bool:
+        """
+        Tell whether the code generator optimizes the AST (see
+        `CodeGenerator.optimize_ast`).
+
+        Returns
+        -------
+        : bool
+            `True` if the AST is optimized, `False` otherwise.
+        """
+
+        return self.trust_ast_optimizations and self.optimization_level >= 2
+
+    def _compute_parsed_source(self) -> dict[str, dict]:
+        """
+        Tokenize and parse the source code.
+
+        Returns
+        -------
+        : dict[str, dict]
+            The parsed source.
+        """
+
+        with self.instrumentation.stage("lex"):
+            return Lexer(source_code=self.source_code).parse_source_code()
+
+    def _compute_ast(self) -> AbstractSyntaxTree:
+        """
+        Build the Abstract Syntax Tree.
+
+        Returns
+        -------
+        ast : AbstractSyntaxTree
+            The Abstract Syntax Tree.
+        """
+
+        with self.instrumentation.stage("ast_build"):
+            ast = AbstractSyntaxTree(source_code=self.parsed_source)
+            ast.build()
+
+        return ast
+
+    def _compute_code_generator(self) -> CodeGenerator:
+        """
+        Generate the code of the program.
+
+        Returns
+        -------
+        generator : CodeGenerator
+            The code generator, with the generated program.
+        """
+
+        with self.instrumentation.stage("codegen"):
+            generator = CodeGenerator(
+                root=self.ast.get_root(),
+                optimization_level=self.optimization_level,
+                trust_ast_optimizations=self.trust_ast_optimizations
+            )
+            generator.generate_code()
+
+        return generator
+
+    def _compute_program(self) -> dict[str, dict]:
+        """
+        Get the program generated by the code generator.
+
+        Returns
+        -------
+        : dict[str, dict]
+            The program.
+        """
+
+        return self.code_generator.get_program()
+
+    def _compute_vm(self) -> VirtualMachine:
+        """
+        Load the program on a Virtual Machine.
+
+        Returns
+        -------
+        : VirtualMachine
+            The Virtual Machine.
+        """
+
+        with self.instrumentation.stage("vm_construction"):
+            return VirtualMachine(program=self.program, profile=self.profile)
+
+    def _compute_frontend_certificator(self) -> FrontendCertificator:
+        """
+        Load the Abstract Syntax Tree on a frontend certificator.
+
+        Returns
+        -------
+        certificator : FrontendCertificator
+            The certificator.
+        """
+
+        with self.instrumentation.stage("certificator_construction"):
+            certificator = FrontendCertificator(ast=self.ast)
+
+        # Keep the certificator in sync with a certificate that was computed
+        # elsewhere (e.g., by a worker process)
+        if self.is_computed("frontend_certificate"):
+            certificator.computed_certificate = self.frontend_certificate
+
+        return certificator
+
+    def _compute_backend_certificator(self) -> BackendCertificator:
+        """
+        Load the program on a backend certificator.
+
+        Returns
+        -------
+        certificator : BackendCertificator
+            The certificator.
+        """
+
+        with self.instrumentation.stage("certificator_construction"):
+            certificator = BackendCertificator(program=self.program)
+
+        if self.is_computed("backend_certificate"):
+            certificator.computed_certificate = self.backend_certificate
 
-def create_instance(source_code: str) -> Charon:
+        return certificator
+
+    def _compute_frontend_certificate(self) -> Certificate:
+        """
+        Certificate the frontend.
+
+        Returns
+        -------
+        : Certificate
+            The frontend certificate.
+        """
+
+        with self.instrumentation.stage("certification"):
+            return self.frontend_certificator.certificate()
+
+    def _compute_backend_certificate(self) -> Certificate:
+        """
+        Certificate the backend.
+
+        Returns
+        -------
+        : Certificate
+            The backend certificate.
+        """
+
+        with self.instrumentation.stage("certification"):
+            return self.backend_certificator.certificate()
+
+
+# The instance loaded by each worker process of `Charon.validate_and_run`
+_worker_instance: Union[Charon, None] = None
+
+
+def _load_worker_instance(instance: Charon) -> None:
     """
-    Create an instance that certificates and runs the input `source_code`.
+    Load the instance of a worker process of `Charon.validate_and_run`.
 
     Parameters
     ----------
-    source_code : str
-        The source code to parse and load on the Virtual Machine.
+    instance : Charon
+        The instance.
+    """
+
+    global _worker_instance
+    _worker_instance = instance
+
+    # The stages run by the workers are instrumented from the parent process
+    # (the subscribers, e.g., files, are not meant to be shared)
+    _worker_instance.instrumentation.subscribers.clear()
+
+
+def _compute_frontend_certificate() -> Certificate:
+    """
+    Compute the frontend certificate of the instance of this worker process.
 
     Returns
     -------
-    instance : Charon
-        An instance of this [C]haron program.
+    : Certificate
+        The computed certificate.
     """
 
-    lexer = Lexer(source_code=source_code)
-    parsed_source = lexer.parse_source_code()
+    return _worker_instance.frontend_certificator.certificate()
+
 
-    _parsed_source = deepcopy(parsed_source)
-    ast = AbstractSyntaxTree(source_code=_parsed_source)
-    ast.build()
+def _compute_backend_certificate() -> Certificate:
+    """
+    Compute the backend certificate of the instance of this worker process.
 
-    generator = CodeGenerator(root=ast.get_root())
-    program = generator.generate_code()
+    Returns
+    -------
+    : Certificate
+        The computed certificate.
+    """
 
-    vm = VirtualMachine(program=program)
+    return _worker_instance.backend_certificator.certificate()
 
-    frontend_certificator = FrontendCertificator(ast=ast)
-    backend_certificator = BackendCertificator(program=program)
 
-    _instance = {
-        "parsed_source": parsed_source,
-        "ast": ast,
-        "code_generator": generator,
-        "program": program,
-        "vm": vm,
-        "frontend_certificator": frontend_certificator,
-        "backend_certificator": backend_certificator,
+def _run_vm() -> VirtualMachine:
+    """
+    Run the program of the instance of this worker process.
+
+    Returns
+    -------
+    vm : VirtualMachine
+        The virtual machine, after the execution.
+    """
+
+    vm = _worker_instance.vm
+    vm.run()
+
+    return vm
+
+
+def create_instance(
+    source_code: str,
+    optimization_level: int = 0,
+    trust_ast_optimizations: bool = False,
+    cache: Union[ProgramCache, None] = None,
+    instrumentation: Instrumentation = SHARED_INSTRUMENTATION,
+    profile: bool = False
+) -> Charon:
+    """
+    Create an instance that certificates and runs the input `source_code`.
+
+    The instance is lazy: nothing is computed until it is needed (see
+    `Charon`).
+
+    If a `cache` is given, it is consulted first: on a hit, the instance is
+    loaded from it, with the program, the certificates, and the Virtual
+    Machine (with the global variables already initialized). On a miss, the
+    program is compiled and certificated (and its global variables are
+    initialized) right away, and the results are stored in it.
+
+    Parameters
+    ----------
+    source_code : str
+        The source code to parse and load on the Virtual Machine.
+    optimization_level : int, optional (default = 0)
+        The optimization level of the generated code. Check the
+        `CodeGenerator` documentation for the available levels.
+    trust_ast_optimizations : bool, optional (default = False)
+        Whether to run the AST optimizations, that are not validated. Check
+        the `CodeGenerator` documentation.
+    cache : ProgramCache or None, optional (default = None)
+        The cache of compiled programs.
+    instrumentation : Instrumentation, optional (default = SHARED_INSTRUMENTATION)
+        The instrumentation of the stages of the pipeline (`lex`,
+        `ast_build`, `codegen`, `vm_construction`,
+        `certificator_construction`, `certification` and `run`). Its
+        subscribers are notified when each stage starts and ends.
+    profile : bool, optional (default = False)
+        Whether the Virtual Machine profiles the execution of the program.
+
+    Returns
+    -------
+    instance : Charon
+        An instance of this [C]haron program.
+    """
+
+    instance_params = {
+        "source_code": source_code,
+        "optimization_level": optimization_level,
+        "trust_ast_optimizations": trust_ast_optimizations,
+        "instrumentation": instrumentation,
+        "profile": profile,
     }
 
-    return Charon(**_instance)
+    if cache is None:
+        return Charon(**instance_params)
+
+    cache_key = cache.get_key(
+        source_code=source_code,
+        optimization_level=optimization_level,
+        trust_ast_optimizations=trust_ast_optimizations
+    )
+    cache_entry = cache.get(cache_key)
+
+    if cache_entry is not None:
+        with instrumentation.stage("vm_construction"):
+            vm = VirtualMachine(
+                program=cache_entry["program"],
+                profile=profile,
+                memory=cache_entry["memory"]
+            )
+            vm.are_globals_initialized = True
+
+        return Charon(
+            **instance_params,
+            stages={
+                "program": cache_entry["program"],
+                "vm": vm,
+                "frontend_certificate": cache_entry["frontend_certificate"],
+                "backend_certificate": cache_entry["backend_certificate"],
+            }
+        )
+
+    instance = Charon(**instance_params)
+
+    frontend_certificate, backend_certificate = instance.certificate()
+
+    vm = instance.get_vm()
+    vm.initialize_globals()
+
+    cache.put(
+        key=cache_key,
+        entry={
+            "program": instance.get_program(),
+            "frontend_certificate": frontend_certificate,
+            "backend_certificate": backend_certificate,
+            "memory": vm.memory,
+        }
+    )
+
+    return instance
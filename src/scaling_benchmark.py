@@ -0,0 +1,272 @@
+"""Implement a benchmark of how each stage of the pipeline scales."""
+
+import math
+import statistics
+from typing import Union
+
+from src.abstract_syntax_tree import AbstractSyntaxTree
+from src.benchmark_runner import BenchmarkRunner
+from src.code_generator import CodeGenerator
+from src.lexer import Lexer
+from src.program_generator import ProgramGenerator
+
+
+class ScalingBenchmark:
+    """
+    Measure how the time and the memory of each stage of the pipeline grow
+    with the size of the programs.
+
+    For each size, a synthetic program is generated (see `ProgramGenerator`)
+    with the scaled `parameter` set to the size, and the other parameters set
+    to `generator_parameters`. Each stage is then timed (as in
+    `BenchmarkRunner`) and its peak memory usage measured. Finally, a power
+    law `value = coefficient * lines ** exponent` is fitted to the time and
+    the memory of each stage, against the lines of source code of the
+    programs: an exponent of 1 means the stage is linear, 2 means quadratic,
+    and so on.
+
+    Parameters
+    ----------
+    sizes : list[int]
+        The values of the scaled parameter.
+    parameter : str, optional (default = "statements")
+        The scaled parameter of the generator.
+    generator_parameters : dict[str, int], optional (default = None)
+        The other parameters of the generator. Uses its defaults if `None`.
+    optimization_level : int, optional (default = 0)
+        The optimization level of the generated code.
+    repeats : int, optional (default = 3)
+        The amount of timed runs of each program.
+    warmup : int, optional (default = 1)
+        The amount of untimed runs of each program, before the timed ones.
+    """
+
+    def __init__(
+        self,
+        sizes: list[int],
+        parameter: str = "statements",
+        generator_parameters: Union[dict[str, int], None] = None,
+        optimization_level: int = 0,
+        repeats: int = 3,
+        warmup: int = 1
+    ) -> None:
+        scalable_parameters = [
+            name
+            for name in ProgramGenerator().get_parameters()
+            if name != "seed"
+        ]
+
+        if parameter not in scalable_parameters:
+            raise ValueError(
+                f"Can't scale `{parameter}`. Expected one of: "
+                f"{', '.join(scalable_parameters)}."
+            )
+
+        if len(sizes) < 2:
+            raise ValueError("At least two sizes are required to fit the growth.")
+
+        self.sizes: list[int] = sorted(sizes)
+        self.parameter: str = parameter
+        self.generator_parameters: dict[str, int] = generator_parameters or {}
+        self.runner: BenchmarkRunner = BenchmarkRunner(
+            benchmarks={},
+            optimization_level=optimization_level,
+            repeats=repeats,
+            warmup=warmup
+        )
+
+    def run(self) -> dict[str, Union[dict, list, str]]:
+        """
+        Run the benchmark over every size, and fit the growth of each stage.
+
+        Returns
+        -------
+        results : dict[str, Union[dict, list, str]]
+            The metadata of the run (`metadata`), the scaled `parameter`, the
+            measurements of each size (`points`, see `run_size`), and the
+            power laws fitted to the time and the memory of each stage
+            (`fits`, see `fit`).
+        """
+
+        metadata = self.runner.get_metadata()
+        metadata["generator_parameters"] = self.generator_parameters
+
+        points = [self.run_size(size) for size in self.sizes]
+
+        return {
+            "metadata": metadata,
+            "parameter": self.parameter,
+            "points": points,
+            "fits": self.fit(points),
+        }
+
+    def run_size(self, size: int) -> dict[str, Union[dict, int, bool]]:
+        """
+        Generate a program of some size, and measure each stage over it.
+
+        Parameters
+        ----------
+        size : int
+            The value of the scaled parameter.
+
+        Returns
+        -------
+        point : dict[str, Union[dict, int, bool]]
+            The `size`, the `lines` of source code and the amount of
+            `instructions` of the program, the median `time` (in seconds)
+            and the peak `memory` (in bytes) of each stage, and whether the
+            certificates match (`certificates_match`).
+        """
+
+        source_code = self.generate_program(size)
+        result = self.runner.run_benchmark(source_code)
+
+        if "error" in result:
+            raise RuntimeError(
+                f"Failed to run the program of size {size}: {result['error']}"
+            )
+
+        return {
+            "size": size,
+            "lines": len(source_code.splitlines()),
+            "instructions": self.count_instructions(source_code),
+            "time": {
+                stage: result[stage]["median"]
+                for stage in self.runner.STAGES
+            },
+            "memory": self.runner.measure_memory(source_code),
+            "certificates_match": result["certificates_match"],
+        }
+
+    def generate_program(self, size: int) -> str:
+        """
+        Generate the program of some size.
+
+        Parameters
+        ----------
+        size : int
+            The value of the scaled parameter.
+
+        Returns
+        -------
+        : str
+            The source code of the program.
+        """
+
+        generator = ProgramGenerator(
+            **{**self.generator_parameters, self.parameter: size}
+        )
+
+        return generator.generate()
+
+    def count_instructions(self, source_code: str) -> int:
+        """
+        Count the instructions generated for a program.
+
+        Parameters
+        ----------
+        source_code : str
+            The source code of the program.
+
+        Returns
+        -------
+        : int
+            The amount of instructions.
+        """
+
+        ast = AbstractSyntaxTree(
+            source_code=Lexer(source_code=source_code).parse_source_code()
+        )
+        ast.build()
+
+        program = CodeGenerator(
+            root=ast.get_root(),
+            optimization_level=self.runner.optimization_level
+        ).generate_code()
+
+        return len(program["code"])
+
+    def fit(
+        self, points: list[dict[str, Union[dict, int, bool]]]
+    ) -> dict[str, dict[str, dict[str, float]]]:
+        """
+        Fit a power law to the time and the memory of each stage, against
+        the lines of source code of the programs.
+
+        Parameters
+        ----------
+        points : list[dict[str, Union[dict, int, bool]]]
+            The measurements of each size (see `run_size`).
+
+        Returns
+        -------
+        fits : dict[str, dict[str, dict[str, float]]]
+            Maps `time` and `memory` to the fit of each stage (i.e., its
+            `coefficient` and `exponent`).
+        """
+
+        lines = [point["lines"] for point in points]
+        fits: dict[str, dict[str, dict[str, float]]] = {}
+
+        for metric in ["time", "memory"]:
+            fits[metric] = {}
+
+            for stage in self.runner.STAGES:
+                coefficient, exponent = self.fit_power_law(
+                    lines, [point[metric][stage] for point in points]
+                )
+
+                fits[metric][stage] = {
+                    "coefficient": coefficient,
+                    "exponent": exponent,
+                }
+
+        return fits
+
+    @staticmethod
+    def fit_power_law(
+        sizes: list[Union[int, float]], values: list[Union[int, float]]
+    ) -> tuple[float, float]:
+        """
+        Fit `value = coefficient * size ** exponent` with a least squares
+        linear regression over the logarithms of the sizes and the values.
+
+        Values that are not positive (e.g., stages that allocated no memory)
+        can't be fitted, and are clamped to a tiny positive value.
+
+        Parameters
+        ----------
+        sizes : list[Union[int, float]]
+            The sizes. Must be positive, and not all equal.
+        values : list[Union[int, float]]
+            The value measured for each size.
+
+        Returns
+        -------
+        coefficient : float
+            The coefficient of the power law.
+        exponent : float
+            The exponent of the power law.
+        """
+
+        log_sizes = [math.log(size) for size in sizes]
+        log_values = [math.log(max(value, 1e-12)) for value in values]
+
+        slope, intercept = statistics.linear_regression(log_sizes, log_values)
+
+        return math.exp(intercept), slope
+
+    @staticmethod
+    def save(results: dict[str, Union[dict, list, str]], path: str) -> None:
+        """
+        Save the results of a run as JSON.
+
+        Parameters
+        ----------
+        results : dict[str, Union[dict, list, str]]
+            The results (see `run`).
+        path : str
+            The path of the JSON file.
+        """
+
+        BenchmarkRunner.save(results, path)
@@ -2,6 +2,8 @@
 
 from typing import Union
 
+from src.prime_provider import SHARED_PRIME_PROVIDER
+
 
 builtin_types: dict[str, Union[int, None]] = {
     "short": 4,
@@ -26,14 +28,7 @@ def is_prime(number: int) -> bool:
         The verdict.
     """
 
-    if number < 2:
-        return False
-
-    for i in range(2, int(number**0.5) + 1):
-        if number % i == 0:
-            return False
-
-    return True
+    return SHARED_PRIME_PROVIDER.is_prime(number)
 
 
 def next_prime(number: int) -> int:
@@ -51,13 +46,7 @@ def next_prime(number: int) -> int:
         The first prime after `number`.
     """
 
-    next_number = number + 1
-
-    while True:
-        if is_prime(next_number):
-            return next_number
-
-        next_number += 1
+    return SHARED_PRIME_PROVIDER.next_prime(number)
 
 
 def previous_prime(number: int) -> int:
@@ -75,13 +64,7 @@ def previous_prime(number: int) -> int:
         The first prime before `number`.
     """
 
-    previous_number = number - 1
-
-    while True:
-        if is_prime(previous_number):
-            return previous_number
-
-        previous_number -= 1
+    return SHARED_PRIME_PROVIDER.previous_prime(number)
 
 
 def primes_list(length: int) -> list[int]:
@@ -101,16 +84,7 @@ def primes_list(length: int) -> list[int]:
         A list of integers containing the specified amount of primes.
     """
 
-    _primes: set[int] = set()
-    current_number = 1
-
-    while len(_primes) < length:
-        _primes.add(next_prime(current_number))
-        current_number += 1
-
-    primes = list(_primes)
-
-    return sorted(primes)
+    return SHARED_PRIME_PROVIDER.get_primes(length)
 
 
 def type_cast(
@@ -250,13 +224,13 @@ def flatten_list(list_of_lists: list[list], drop_duplicates: bool = True) -> lis
 __TYPE_CASTS = ["FPTOSI", "SIGNEXT", "SITOFP", "TRUNC"]
 
 
-__VARIABLES = {"VAR_DEF": [], "VAR_VALUE": ["LOAD", "LOADF"], "VAR_ADDRESS": []}
+__VARIABLES = {"VAR_DEF": [], "VAR_VALUE": ["LOAD", "LOADF", "LOADA", "LOADFA", "LOADSA"], "VAR_ADDRESS": []}
 
 
 __CONSTANTS = {"CST": ["CONSTANT"]}
 
 
-__UNOPS = {"ASSIGN": ["STORE", "STOREF"], "NOT": ["NOT"]}
+__UNOPS = {"ASSIGN": ["STORE", "STOREF", "STOREA", "STOREFA"], "NOT": ["NOT"]}
 
 
 __BINOPS = {
@@ -333,7 +307,7 @@ SYMBOLS_MAP = {
     certificate: str(base)
     for certificate, base in zip(
         NODE_TO_INSTRUCTION_MAPPING.keys(),
-        sorted(primes_list(len(NODE_TO_INSTRUCTION_MAPPING.keys()))),
+        primes_list(len(NODE_TO_INSTRUCTION_MAPPING.keys())),
     )
 }
 
@@ -1,6 +1,35 @@
 """Implement a virtual machine that computes generated code."""
 
-from typing import Union
+import operator
+import time
+from typing import Callable, Union
+
+from src.execution_profiler import ExecutionProfiler
+from src.memory import Memory
+from src.register_file import RegisterFile
+
+
+def _truncate(value: int) -> int:
+    """
+    Truncate a 32-bit value to 16 bits.
+
+    Parameters
+    ----------
+    value : int
+        The value to truncate.
+
+    Returns
+    -------
+    truncated_value : int
+        The truncated value.
+    """
+
+    truncated_value: int = value & 0xFFFF
+
+    if truncated_value & 0x8000:
+        truncated_value -= 0x100000
+
+    return truncated_value
 
 
 class VirtualMachine:
@@ -13,30 +42,105 @@ class VirtualMachine:
         The program generated by the `CodeGenerator.generate_code` method.
     memory_size : int, optional (default = 1024)
         The memory size, in bytes, to use.
+    profile : bool, optional (default = False)
+        Whether to profile the execution (see `ExecutionProfiler`). The
+        profile is kept in the `profiler` attribute.
+    memory : Union[Memory, None], optional (default = None)
+        The memory to run the program on (e.g., a memory image whose global
+        variables are already initialized). If `None`, a new memory of
+        `memory_size` bytes is used.
     """
 
+    # Instructions that compute `register = f(lhs_register, rhs_register)`,
+    # mapped to the function `f` that implements them. Used by the decoder.
+    binary_operations: dict[str, Callable] = {
+        "ADD": operator.add,
+        "AND": lambda lhs, rhs: 1 if (lhs and rhs) > 0 else 0,
+        "BITAND": operator.and_,
+        "BITOR": operator.or_,
+        "DIV": lambda lhs, rhs: int(lhs / rhs),
+        "EQ": lambda lhs, rhs: int(lhs == rhs),
+        "FADD": operator.add,
+        "FAND": lambda lhs, rhs: 1 if (lhs and rhs) > 0 else 0,
+        "FDIV": operator.truediv,
+        "FEQ": lambda lhs, rhs: int(lhs == rhs),
+        "FGT": lambda lhs, rhs: int(lhs > rhs),
+        "FLT": lambda lhs, rhs: int(lhs < rhs),
+        "FMULT": operator.mul,
+        "FNEQ": lambda lhs, rhs: int(lhs != rhs),
+        "FOR": lambda lhs, rhs: 1 if (lhs or rhs) > 0 else 0,
+        "FSUB": operator.sub,
+        "GT": lambda lhs, rhs: int(lhs > rhs),
+        "LSHIFT": operator.lshift,
+        "LT": lambda lhs, rhs: int(lhs < rhs),
+        "MOD": operator.mod,
+        "MULT": operator.mul,
+        "NEQ": lambda lhs, rhs: int(lhs != rhs),
+        "OR": lambda lhs, rhs: 1 if (lhs or rhs) > 0 else 0,
+        "RSHIFT": operator.rshift,
+        "SUB": operator.sub,
+    }
+
+    # Instructions that compute `register = f(value)`, where `value` is a
+    # register, mapped to the function `f` that implements them.
+    unary_operations: dict[str, Callable] = {
+        "FPTOSI": int,
+        "NOT": lambda value: int(not value),
+        "SIGNEXT": lambda value: value,
+        "SITOFP": float,
+        "TRUNC": _truncate,
+    }
+
     def __init__(
-        self, program: dict[str, Union[list, dict]], memory_size: int = 1024
+        self,
+        program: dict[str, Union[list, dict]],
+        memory_size: int = 1024,
+        profile: bool = False,
+        memory: Union[Memory, None] = None
     ) -> None:
         self.program: dict[str, Union[list, dict]] = program
 
+        # Function table (i.e., the entry address of each function ID)
+        self.function_table: dict[int, int] = dict(program["function_table"])
+
         # Memory (i.e., storage for variables)
-        self.memory: dict[str, Union[int, float, str, None]] = {
-            hex(_byte): None for _byte in range(memory_size)
-        }
+        self.memory: Memory = Memory(size=memory_size) if memory is None else memory
         self.memory_size: int = memory_size
         self.memory_pointer: int = 0x0
 
         # Program execution variables
         self.program_counter: int = 0
-        self.registers: dict[Union[int, str], Union[int, float]] = {
-            "arg": [],
-            "ret_address": [],
-            "ret_value": [],
-            "zero": 0,
-        }
+        register_count: int = max(
+            (function["registers"] for function in program["functions"].values()),
+            default=0
+        )
+        argument_slots: int = max(
+            (function["parameters"] for function in program["functions"].values()),
+            default=0
+        )
+        self.registers: RegisterFile = RegisterFile(
+            size=register_count,
+            argument_slots=argument_slots
+        )
         self.variables: dict[int, str] = {}
 
+        # Whether the global variables have been initialized (i.e., whether
+        # the `global_vars` section of the program has run)
+        self.are_globals_initialized: bool = False
+
+        self.profiler: Union[ExecutionProfiler, None] = (
+            ExecutionProfiler(program=program) if profile else None
+        )
+
+        # The program is decoded once, as its handlers are bound to the
+        # memory and the register file of this VirtualMachine
+        self.handlers: list[Callable[[], Union[int, None]]] = self._decode(
+            program["code"]
+        )
+        self.global_vars_handlers: list[Callable[[], Union[int, None]]] = self._decode(
+            program["global_vars"]
+        )
+
     def __eq__(self, other: "VirtualMachine") -> bool:
         """
         Implement the equality comparison between VirtualMachine instances.
@@ -62,6 +166,40 @@ class VirtualMachine:
 
         return is_equal
 
+    def __getstate__(self) -> dict[str, object]:
+        """
+        Get the state of this VirtualMachine to pickle (e.g., to send it to
+        another process), without its decoded handlers.
+
+        Returns
+        -------
+        state : dict[str, object]
+            The attributes of this VirtualMachine, except for its handlers.
+        """
+
+        state: dict[str, object] = self.__dict__.copy()
+
+        del state["handlers"]
+        del state["global_vars_handlers"]
+
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        """
+        Restore the state of an unpickled VirtualMachine, and decode its
+        program again.
+
+        Parameters
+        ----------
+        state : dict[str, object]
+            The attributes of the VirtualMachine, except for its handlers.
+        """
+
+        self.__dict__.update(state)
+
+        self.handlers = self._decode(self.program["code"])
+        self.global_vars_handlers = self._decode(self.program["global_vars"])
+
     def __str__(self) -> str:
         """
         Generate a string representation of the VirtualMachine object.
@@ -81,38 +219,28 @@ class VirtualMachine:
         _str += "\n\n"
 
         # VM Memory state (only non-`None` positions)
-        memory_info = {
-            address: value
-            for address, value in self.memory.items()
-            if value is not None
-        }
-        
         _str += "Memory (non-null only):\n  "
         _str += "\n  ".join(
-            f"Address: {address}\tData: {data}"
-            for address, data in memory_info.items()
+            f"Address: {hex(address)}\tData: {data}"
+            for address, data in self.memory.items()
         )
 
         return _str
 
-    def get_memory(self) -> dict[str, Union[int, float, str]]:
+    def get_memory(self) -> dict[int, Union[int, float]]:
         """
-        Get the `self.memory` dictionary.
+        Get the contents of `self.memory` as a dictionary.
 
         This method only returns valid memory addresses: i.e., addresses that
         do not contain `None`.
 
         Returns
         -------
-        memory : dict[str, Union[int, float, str]]
-            The memory dictionary, filtered out of `None` elements.
+        memory : dict[int, Union[int, float]]
+            The {address: value} dictionary, filtered out of `None` elements.
         """
 
-        memory = {
-            address: value
-            for address, value in self.memory.items()
-            if value is not None
-        }
+        memory = dict(self.memory.items())
 
         return memory
 
@@ -122,908 +250,588 @@ class VirtualMachine:
         print(self)
 
     def run(self) -> None:
-        """Run the program on the virtual machine."""
+        """
+        Run the program on the virtual machine.
+
+        The program is decoded once, when the VirtualMachine is created, into
+        a list of handlers (see `_decode`). Each handler executes its
+        instruction and returns the index of the next instruction to run.
 
-        # Run the instructions related to global vars (that are stored in a
-        # different section of the program text)
-        for global_var_instruction in self.program["global_vars"]:
-            instruction = global_var_instruction["instruction"]
-            instruction_params = global_var_instruction["metadata"]
+        If profiling, a separate loop also counts the bytecodes that run and
+        reports the function calls and returns to the `profiler`, so the
+        loop without profiling does not pay for it.
+        """
 
-            instruction_handler = getattr(self, instruction)
-            instruction_handler(instruction_params)
+        self.initialize_globals()
 
         # Set the `program_counter` to the beginning of the `main` function
         try:
-            self.program_counter = self.program["functions"]["main"]["start"]
+            program_counter = self.program["functions"]["main"]["start"]
         except KeyError:
             raise SyntaxError("No main function found. Execution aborted.")
 
-        # Run the actual program
-        while True:
-            code_metadata = self.program["code"][self.program_counter]
-
-            instruction = code_metadata[("instruction")]
-            instruction_params = code_metadata[("metadata")]
-
-            if instruction == "HALT":
-                break
-
-            self.program_counter += 1
-
-            instruction_handler = getattr(self, instruction)
-
-            try:
-                instruction_handler(instruction_params)
-            except Exception as e:
-                print("Bad instruction:", instruction, instruction_params)
-                raise e
+        handlers = self.handlers
 
-    def ADD(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `ADD` bytecode.
-
-        This method handles the addition between two integers.
-
-        `short`-typed values will also use this method.
-
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
-
-        store_as_str: bool = False
-
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
-
-        # Handle address operations
-        if isinstance(lhs, str):
-            lhs = int(lhs, 16)
-            store_as_str = True
-
-        if isinstance(rhs, str):
-            rhs = int(rhs, 16)
-            store_as_str = True
-
-        result = lhs + rhs
-
-        if store_as_str:
-            result = hex(result)
-
-        self.registers[instruction_params["register"]] = result
-
-    def AND(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `AND` bytecode.
-
-        This method handles the "logical and" operation between two integers.
-
-        `short`-typed values will also use this method.
+        # Run the actual program. The `HALT` handler returns `None`.
+        try:
+            if self.profiler is None:
+                while program_counter is not None:
+                    program_counter = handlers[program_counter]()
 
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
+            else:
+                profiler = self.profiler
+                counts = profiler.counts
+                is_event = profiler.is_event
+                clock = time.perf_counter
 
-        Notes
-        -----
-        This method writes `1` in the target `register` if Python's evaluation
-        of `lhs and rhs` results in anything different from `0`. This is due to
-        the fact that the language does not support boolean literals (`True` and
-        `False`).
-        """
+                profiler.start(clock())
 
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
+                try:
+                    while program_counter is not None:
+                        counts[program_counter] += 1
 
-        self.registers[instruction_params["register"]] = 1 if (lhs and rhs) > 0 else 0
+                        if is_event[program_counter]:
+                            profiler.handle_event(program_counter, clock())
 
-    def BITAND(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `BITAND` bytecode.
+                        program_counter = handlers[program_counter]()
 
-        This method handles the bit-wise "and" operation between two integers.
+                finally:
+                    profiler.stop(clock())
 
-        `short`-typed values will also use this method.
+        except Exception as e:
+            bytecode = self.program["code"][program_counter]
+            print("Bad instruction:", bytecode["instruction"], bytecode["metadata"])
+            raise e
 
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
+    def initialize_globals(self) -> None:
         """
+        Run the instructions related to global vars (that are stored in a
+        different section of the program text), only once.
 
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
-
-        self.registers[instruction_params["register"]] = lhs & rhs
-
-    def BITOR(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
+        The memory image they produce can be saved and loaded back (e.g., by a
+        `ProgramCache`), along with `are_globals_initialized`, to skip this
+        section.
         """
-        Handle a `BITOR` bytecode.
-
-        This method handles the bit-wise "or" operation between two integers.
-
-        `short`-typed values will also use this method.
 
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
+        if self.are_globals_initialized:
+            return
 
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
+        for global_var_handler in self.global_vars_handlers:
+            global_var_handler()
 
-        self.registers[instruction_params["register"]] = lhs | rhs
+        self.are_globals_initialized = True
 
-    def CONSTANT(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
+    def _decode(
+        self, bytecodes: list[dict[str, dict]]
+    ) -> list[Callable[[], Union[int, None]]]:
         """
-        Handle a `CONSTANT` bytecode.
+        Decode a list of bytecodes into a list of handlers.
 
-        This method saves the constant in some register.
+        Each handler is a closure with its operands (registers, constants and
+        jump targets) already resolved, so executing an instruction does not
+        require looking up its name or its metadata.
 
         Parameters
         ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
-
-        register: int = instruction_params["register"]
-        constant_value: int = instruction_params["value"]
-
-        self.registers[register] = constant_value
-
-    def DIV(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `DIV` bytecode.
+        bytecodes : list[dict[str, dict]]
+            The bytecodes to decode.
 
-        This method handles the division between two integers.
-
-        `short`-typed values will also use this method.
-
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
-
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
-
-        self.registers[instruction_params["register"]] = int(lhs / rhs)
-
-    def EQ(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `EQ` bytecode.
-
-        This method handles the "is equal" comparison between two integers.
-
-        `short`-typed values will also use this method.
-
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-
-        Notes
-        -----
-        This method writes `1` in the target `register` if the expression
-        evaluates to `True`, and `0` other wise. This is due to the fact that
-        the language does not support boolean literals (`True` and `False`).
+        Returns
+        -------
+        handlers : list[Callable[[], Union[int, None]]]
+            The handlers, in the same order as `bytecodes`.
         """
 
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
-
-        self.registers[instruction_params["register"]] = int(lhs == rhs)
+        return [
+            self._decode_instruction(bytecode=bytecode, bytecode_idx=idx)
+            for idx, bytecode in enumerate(bytecodes)
+        ]
 
-    def FADD(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
+    def _decode_instruction(
+        self, bytecode: dict[str, dict], bytecode_idx: int
+    ) -> Callable[[], Union[int, None]]:
         """
-        Handle a `FADD` bytecode.
+        Decode a single bytecode into a handler.
 
-        This method handles the addition between two floating point numbers.
+        The handler executes the instruction and returns the index of the next
+        instruction to be executed (or `None`, for `HALT`). Each family of
+        instructions has its own decoder method, so a handler only holds the
+        operands it uses, and decoding a bytecode stays cheap (most programs
+        run each instruction only a few times).
 
         Parameters
         ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
-
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
+        bytecode : dict[str, dict]
+            The bytecode to decode.
+        bytecode_idx : int
+            The index of the bytecode in its section of the program.
 
-        self.registers[instruction_params["register"]] = lhs + rhs
-
-    def FAND(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
+        Returns
+        -------
+        : Callable[[], Union[int, None]]
+            The handler of this bytecode.
         """
-        Handle a `FAND` bytecode.
 
-        This method handles the "logical and" operation between two floating
-        point numbers.
+        instruction: str = bytecode["instruction"]
+        instruction_params: dict[str, Union[int, float, str]] = bytecode["metadata"]
 
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-
-        Notes
-        -----
-        This method writes `1` in the target `register` if Python's evaluation
-        of `lhs and rhs` results in anything different from `0`. This is due to
-        the fact that the language does not support boolean literals (`True` and
-        `False`).
-        """
+        if instruction in self.binary_operations:
+            return self._decode_binary_operation(
+                self.binary_operations[instruction], instruction_params, bytecode_idx
+            )
 
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
+        if instruction in self.unary_operations:
+            return self._decode_unary_operation(
+                self.unary_operations[instruction], instruction_params, bytecode_idx
+            )
 
-        self.registers[instruction_params["register"]] = 1 if (lhs and rhs) > 0 else 0
+        if instruction == "CONSTANT":
+            return self._decode_constant(instruction_params, bytecode_idx)
 
-    def FDIV(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `FDIV` bytecode.
+        if instruction == "MOV":
+            return self._decode_move(instruction_params, bytecode_idx)
 
-        This method handles the division between two floating point numbers.
+        if instruction in ["LOAD", "LOADF", "LOADA", "LOADFA", "LOADSA"]:
+            return self._decode_load(instruction, instruction_params, bytecode_idx)
 
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
+        if instruction in ["STORE", "STOREF", "STOREA", "STOREFA"]:
+            return self._decode_store(instruction, instruction_params, bytecode_idx)
 
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
+        if instruction in ["JZ", "JR", "JAL", "HALT"]:
+            return self._decode_jump(instruction, instruction_params, bytecode_idx)
 
-        self.registers[instruction_params["register"]] = lhs / rhs
+        raise ValueError(f"Unknown instruction: {instruction}")
 
-    def FEQ(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
+    def _decode_binary_operation(
+        self,
+        operation: Callable,
+        instruction_params: dict[str, Union[int, float, str]],
+        bytecode_idx: int
+    ) -> Callable[[], int]:
         """
-        Handle a `FEQ` bytecode.
+        Decode a bytecode that computes `register = f(lhs_register,
+        rhs_register)` (see `binary_operations`).
 
-        This method handles the "is equal" comparison between two floating point
-        numbers.
+        Register operands are resolved to their positions in a frame of the
+        register file (see `RegisterFile.index`), so the handler only adds
+        the base of the current frame to them.
 
         Parameters
         ----------
+        operation : Callable
+            The function `f` that implements the instruction.
         instruction_params : dict[str, Union[int, float, str]]
             The bytecode metadata.
+        bytecode_idx : int
+            The index of the bytecode in its section of the program.
 
-        Notes
-        -----
-        This method writes `1` in the target `register` if the expression
-        evaluates to `True`, and `0` other wise. This is due to the fact that
-        the language does not support boolean literals (`True` and `False`).
-        """
-
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
-
-        self.registers[instruction_params["register"]] = int(lhs == rhs)
-
-    def FGT(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
+        Returns
+        -------
+        : Callable[[], int]
+            The handler of the bytecode.
         """
-        Handle a `FGT` bytecode.
 
-        This method handles the "greater than" comparison between two floating
-        point numbers.
+        registers = self.registers.values
+        frame = self.registers.frame
+        next_idx = bytecode_idx + 1
 
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-
-        Notes
-        -----
-        This method writes `1` in the target `register` if the expression
-        evaluates to `True`, and `0` other wise. This is due to the fact that
-        the language does not support boolean literals (`True` and `False`).
-        """
+        argument = instruction_params.get("argument", 0)
+        register = self.registers.index(
+            instruction_params["register"], argument, is_written=True
+        )
+        lhs_register = self.registers.index(instruction_params["lhs_register"], argument)
+        rhs_register = self.registers.index(instruction_params["rhs_register"], argument)
 
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
+        def handler() -> int:
+            base = frame[0]
+            registers[base + register] = operation(
+                registers[base + lhs_register], registers[base + rhs_register]
+            )
+            return next_idx
 
-        self.registers[instruction_params["register"]] = int(lhs > rhs)
+        return handler
 
-    def FLT(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
+    def _decode_unary_operation(
+        self,
+        operation: Callable,
+        instruction_params: dict[str, Union[int, float, str]],
+        bytecode_idx: int
+    ) -> Callable[[], int]:
         """
-        Handle a `FLT` bytecode.
-
-        This method handles the "less than" comparison between two floating
-        point numbers.
+        Decode a bytecode that computes `register = f(value)` (see
+        `unary_operations`).
 
         Parameters
         ----------
+        operation : Callable
+            The function `f` that implements the instruction.
         instruction_params : dict[str, Union[int, float, str]]
             The bytecode metadata.
+        bytecode_idx : int
+            The index of the bytecode in its section of the program.
 
-        Notes
-        -----
-        This method writes `1` in the target `register` if the expression
-        evaluates to `True`, and `0` other wise. This is due to the fact that
-        the language does not support boolean literals (`True` and `False`).
-        """
-
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
-
-        self.registers[instruction_params["register"]] = int(lhs < rhs)
-
-    def FMULT(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
+        Returns
+        -------
+        : Callable[[], int]
+            The handler of the bytecode.
         """
-        Handle a `FMULT` bytecode.
 
-        This method handles the multiplication between two floating point
-        numbers.
+        registers = self.registers.values
+        frame = self.registers.frame
+        next_idx = bytecode_idx + 1
 
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
+        argument = instruction_params.get("argument", 0)
+        register = self.registers.index(
+            instruction_params["register"], argument, is_written=True
+        )
+        value = self.registers.index(instruction_params["value"], argument)
 
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
+        def handler() -> int:
+            base = frame[0]
+            registers[base + register] = operation(registers[base + value])
+            return next_idx
 
-        self.registers[instruction_params["register"]] = lhs * rhs
+        return handler
 
-    def FNEQ(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
+    def _decode_constant(
+        self, instruction_params: dict[str, Union[int, float, str]], bytecode_idx: int
+    ) -> Callable[[], int]:
         """
-        Handle a `FNEQ` bytecode.
-
-        This method handles the "is not equal" comparison between two floating
-        point numbers.
+        Decode a `CONSTANT` bytecode, that writes a constant to a register.
 
         Parameters
         ----------
         instruction_params : dict[str, Union[int, float, str]]
             The bytecode metadata.
+        bytecode_idx : int
+            The index of the bytecode in its section of the program.
 
-        Notes
-        -----
-        This method writes `1` in the target `register` if the expression
-        evaluates to `True`, and `0` other wise. This is due to the fact that
-        the language does not support boolean literals (`True` and `False`).
-        """
-
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
-
-        self.registers[instruction_params["register"]] = int(lhs != rhs)
-
-    def FOR(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
+        Returns
+        -------
+        : Callable[[], int]
+            The handler of the bytecode.
         """
-        Handle a `FOR` bytecode.
 
-        This method handles the "logical or" operation between two floating
-        point numbers.
-
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
+        registers = self.registers.values
+        frame = self.registers.frame
+        next_idx = bytecode_idx + 1
 
-        Notes
-        -----
-        This method writes `1` in the target `register` if Python's evaluation
-        of `lhs or rhs` results in anything different from `0`. This is due to
-        the fact that the language does not support boolean literals (`True` and
-        `False`).
-        """
+        register = self.registers.index(
+            instruction_params["register"],
+            instruction_params.get("argument", 0),
+            is_written=True
+        )
+        constant_value = instruction_params["value"]
 
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
+        def handler() -> int:
+            registers[frame[0] + register] = constant_value
+            return next_idx
 
-        self.registers[instruction_params["register"]] = 1 if (lhs or rhs) > 0 else 0
+        return handler
 
-    def FPTOSI(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
+    def _decode_move(
+        self, instruction_params: dict[str, Union[int, float, str]], bytecode_idx: int
+    ) -> Callable[[], int]:
         """
-        Handle a `FPTOSI` bytecode.
-
-        This method type casts a floating point to signed integer. For the sake
-        of simplicity, we'll use Python's conversion.
+        Decode a `MOV` bytecode, that copies a register to another one.
 
         Parameters
         ----------
         instruction_params : dict[str, Union[int, float, str]]
             The bytecode metadata.
-        """
+        bytecode_idx : int
+            The index of the bytecode in its section of the program.
 
-        register: int = instruction_params["register"]
-        value: int = instruction_params["value"]
-
-        self.registers[register] = int(self.registers[value])
-
-    def FSUB(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
+        Returns
+        -------
+        : Callable[[], int]
+            The handler of the bytecode.
         """
-        Handle a `FSUB` bytecode.
 
-        This method handles the subtraction between two floating point numbers.
+        registers = self.registers.values
+        frame = self.registers.frame
+        next_idx = bytecode_idx + 1
 
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
+        argument = instruction_params.get("argument", 0)
+        register = self.registers.index(
+            instruction_params["register"], argument, is_written=True
+        )
+        value = self.registers.index(instruction_params["value"], argument)
 
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
+        def handler() -> int:
+            base = frame[0]
+            registers[base + register] = registers[base + value]
+            return next_idx
 
-        self.registers[instruction_params["register"]] = lhs - rhs
+        return handler
 
-    def GT(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
+    def _decode_load(
+        self,
+        instruction: str,
+        instruction_params: dict[str, Union[int, float, str]],
+        bytecode_idx: int
+    ) -> Callable[[], int]:
         """
-        Handle a `GT` bytecode.
-
-        This method handles the "greater than" comparison between two integers.
+        Decode a bytecode that loads a value from memory to a register.
 
-        `short`-typed values will also use this method.
+        `LOAD` and `LOADF` read the address from a register, while `LOADA`,
+        `LOADFA` and `LOADSA` (that also truncates the value to a `short`)
+        have it in their metadata.
 
         Parameters
         ----------
+        instruction : str
+            The instruction of the bytecode.
         instruction_params : dict[str, Union[int, float, str]]
             The bytecode metadata.
+        bytecode_idx : int
+            The index of the bytecode in its section of the program.
 
-        Notes
-        -----
-        This method writes `1` in the target `register` if the expression
-        evaluates to `True`, and `0` other wise. This is due to the fact that
-        the language does not support boolean literals (`True` and `False`).
-        """
-
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
-
-        self.registers[instruction_params["register"]] = int(lhs > rhs)
-
-    def HALT(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `HALT` bytecode.
-
-        This method handles the end of the execution of a program. For this
-        instruction, the `instruction_params` is ignored.
-        """
-
-        return
-
-    def JAL(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
+        Returns
+        -------
+        : Callable[[], int]
+            The handler of the bytecode.
         """
-        Handle a `JAL` bytecode.
 
-        This method handles jump-and-link instructions.
+        registers = self.registers.values
+        frame = self.registers.frame
+        memory_types = self.memory.types
+        big_integers = self.memory.big_integers
+        BIG_INT = Memory.BIG_INT
+        next_idx = bytecode_idx + 1
 
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
+        argument = instruction_params.get("argument", 0)
+        register = self.registers.index(
+            instruction_params["register"], argument, is_written=True
+        )
 
-        # Handle the `program_counter` for it to point to the function code
-        called_function_id: int = instruction_params["value"]
-        called_function_name: str = list(self.program["functions"].keys())[
-            called_function_id - 1
-        ]
-        called_function_start: int = self.program["functions"][called_function_name][
-            "start"
-        ]
+        if instruction in ["LOAD", "LOADF"]:
+            register_with_source_address = self.registers.index(
+                instruction_params["value"], argument
+            )
 
-        # Set the return address
-        self.registers["ret_address"].append(self.program_counter)
-        self.program_counter = called_function_start
+            if instruction == "LOAD":
+                memory_view = self.memory.integers
 
-    def JR(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `JR` bytecode.
+                def handler() -> int:
+                    base = frame[0]
+                    source_address = registers[base + register_with_source_address]
 
-        This method jumps to an address stored in a register.
+                    if memory_types[source_address] == BIG_INT:
+                        registers[base + register] = big_integers[source_address]
+                    else:
+                        registers[base + register] = memory_view[source_address]
 
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
+                    return next_idx
 
-        register_with_address: Union[int, str] = instruction_params["register"]
-        address_to_jump_to: int = self.registers[register_with_address]
-
-        # Handle lists
-        if isinstance(address_to_jump_to, list):
-            # Handle the `return` statement from the end of the program: when
-            # reaching the final `return`, there won't be an address to jump
-            # to at `registers["ret_address"]`. Thus, jump to the last
-            # instruction.
-            if address_to_jump_to:
-                address_to_jump_to = address_to_jump_to.pop()
             else:
-                address_to_jump_to = len(self.program["code"]) - 1
-
-        self.program_counter = address_to_jump_to
-
-    def JZ(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `JZ` bytecode.
-
-        This method handles conditional jumps: if the evaluated value is zero,
-        jump some amount of instructions.
-
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
-
-        conditional_register: int = instruction_params["conditional_register"]
-        condition: int = self.registers[conditional_register]
-
-        if not condition:
-            jump_size: int = instruction_params["jump_size"]
-            self.program_counter += jump_size - 1
-
-    def LOAD(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `LOAD` bytecode.
-
-        This method loads the value at some memory address into a register.
-
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
-
-        register_with_source_address: str = instruction_params["value"]
-        value_to_load_address = self.registers[register_with_source_address]
-        value_to_load = self.memory[value_to_load_address]
-
-        dest_register: int = instruction_params["register"]
-
-        self.registers[dest_register] = value_to_load
+                memory_view = self.memory.floats
 
-    def LOADF(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `LOADF` bytecode.
-
-        This is the `float`-only equivalent of `LOAD`.
-
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
-
-        register_with_source_address: str = instruction_params["value"]
-        value_to_load_address = self.registers[register_with_source_address]
-        value_to_load = self.memory[value_to_load_address]
-
-        dest_register: int = instruction_params["register"]
-
-        self.registers[dest_register] = value_to_load
-
-    def LSHIFT(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `LSHIFT` bytecode.
-
-        This method handles the left bit-shift operation between two integers.
-
-        `short`-typed values will also use this method.
-
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
-
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
-
-        self.registers[instruction_params["register"]] = lhs << rhs
-
-    def LT(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `LT` bytecode.
-
-        This method handles the "less than" comparison between two integers.
-
-        `short`-typed values will also use this method.
-
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-
-        Notes
-        -----
-        This method writes `1` in the target `register` if the expression
-        evaluates to `True`, and `0` other wise. This is due to the fact that
-        the language does not support boolean literals (`True` and `False`).
-        """
-
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
-
-        self.registers[instruction_params["register"]] = int(lhs < rhs)
+                def handler() -> int:
+                    base = frame[0]
+                    source_address = registers[base + register_with_source_address]
+                    registers[base + register] = memory_view[source_address]
+                    return next_idx
 
-    def MOD(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `MOD` bytecode.
-
-        This method handles the module operation between two integers.
-
-        `short`-typed values will also use this method.
-
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
+            return handler
 
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
+        source_address = instruction_params["address"]
 
-        self.registers[instruction_params["register"]] = lhs % rhs
+        if instruction == "LOADA":
+            memory_view = self.memory.integers
 
-    def MOV(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `MOV` bytecode.
-
-        This method copies the value of one register into another.
+            def handler() -> int:
+                if memory_types[source_address] == BIG_INT:
+                    registers[frame[0] + register] = big_integers[source_address]
+                else:
+                    registers[frame[0] + register] = memory_view[source_address]
 
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
+                return next_idx
 
-        lhs_register: Union[int, str] = instruction_params["register"]
-        rhs_register: Union[int, str] = instruction_params["value"]
+        elif instruction == "LOADFA":
+            memory_view = self.memory.floats
 
-        # Always insert at the beginning of the list! Appending to the end
-        # causes parameter handling to receive arguments in inverted order.
-        if lhs_register == "arg":
-            self.registers["arg"].insert(0, self.registers[rhs_register])
-        elif lhs_register == "ret_value":
-            self.registers["ret_value"].append(self.registers[rhs_register])
+            def handler() -> int:
+                registers[frame[0] + register] = memory_view[source_address]
+                return next_idx
 
         else:
-            self.registers[lhs_register] = self.registers["ret_value"].pop()
-
-    def MULT(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `MULT` bytecode.
-
-        This method handles the multiplication between two integers.
-
-        `short`-typed values will also use this method.
-
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
-
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
-
-        self.registers[instruction_params["register"]] = lhs * rhs
-
-    def NEQ(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `NEQ` bytecode.
-
-        This method handles the "is not equal" comparison between two integers.
-
-        `short`-typed values will also use this method.
-
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
+            memory_view = self.memory.integers
 
-        Notes
-        -----
-        This method writes `1` in the target `register` if the expression
-        evaluates to `True`, and `0` other wise. This is due to the fact that
-        the language does not support boolean literals (`True` and `False`).
-        """
+            def handler() -> int:
+                if memory_types[source_address] == BIG_INT:
+                    value = big_integers[source_address]
+                else:
+                    value = memory_view[source_address]
 
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
+                registers[frame[0] + register] = _truncate(value)
+                return next_idx
 
-        self.registers[instruction_params["register"]] = int(lhs != rhs)
+        return handler
 
-    def NOT(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
+    def _decode_store(
+        self,
+        instruction: str,
+        instruction_params: dict[str, Union[int, float, str]],
+        bytecode_idx: int
+    ) -> Callable[[], int]:
         """
-        Handle a `NOT` bytecode.
-
-        This method handles the "logical not" of an integer.
+        Decode a bytecode that stores the value of a register to memory.
 
-        `short`-typed values will also use this method.
+        `STORE` and `STOREF` read the address from a register, while `STOREA`
+        and `STOREFA` have it in their metadata. Integers that do not fit in
+        64 bits are stored apart (see `Memory`).
 
         Parameters
         ----------
+        instruction : str
+            The instruction of the bytecode.
         instruction_params : dict[str, Union[int, float, str]]
             The bytecode metadata.
+        bytecode_idx : int
+            The index of the bytecode in its section of the program.
 
-        Notes
-        -----
-        This method writes `1` in the target `register` if the expression
-        evaluates to `False`, and `0` other wise. This is due to the fact that
-        the language does not support boolean literals (`True` and `False`).
+        Returns
+        -------
+        : Callable[[], int]
+            The handler of the bytecode.
         """
 
-        expression = self.registers[instruction_params["value"]]
+        registers = self.registers.values
+        frame = self.registers.frame
+        memory = self.memory
+        memory_types = memory.types
+        next_idx = bytecode_idx + 1
 
-        self.registers[instruction_params["register"]] = int(not expression)
+        argument = instruction_params.get("argument", 0)
+        value_to_store_register = self.registers.index(
+            instruction_params["value"], argument
+        )
 
-    def OR(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `OR` bytecode.
+        if instruction in ["STORE", "STOREA"]:
+            memory_view, memory_type = memory.integers, Memory.INT
+        else:
+            memory_view, memory_type = memory.floats, Memory.FLOAT
 
-        This method handles the "logical or" operation between two integers.
+        if instruction in ["STOREA", "STOREFA"]:
+            dest_address = instruction_params["address"]
 
-        `short`-typed values will also use this method.
+            def handler() -> int:
+                value = registers[frame[0] + value_to_store_register]
 
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
+                try:
+                    memory_view[dest_address] = value
+                    memory_types[dest_address] = memory_type
 
-        Notes
-        -----
-        This method writes `1` in the target `register` if Python's evaluation
-        of `lhs or rhs` results in anything different from `0`. This is due to
-        the fact that the language does not support boolean literals (`True` and
-        `False`).
-        """
+                except ValueError:
+                    memory[dest_address] = value
 
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
+                return next_idx
 
-        self.registers[instruction_params["register"]] = 1 if (lhs or rhs) > 0 else 0
+            return handler
 
-    def RSHIFT(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `RSHIFT` bytecode.
+        register_with_dest_address = self.registers.index(
+            instruction_params["register"], argument
+        )
 
-        This method handles the right bit-shift operation between two integers.
+        def handler() -> int:
+            base = frame[0]
+            dest_address = registers[base + register_with_dest_address]
+            value = registers[base + value_to_store_register]
 
-        `short`-typed values will also use this method.
+            try:
+                memory_view[dest_address] = value
+                memory_types[dest_address] = memory_type
 
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
+            except ValueError:
+                memory[dest_address] = value
 
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
+            return next_idx
 
-        self.registers[instruction_params["register"]] = lhs >> rhs
+        return handler
 
-    def SIGNEXT(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
+    def _decode_jump(
+        self,
+        instruction: str,
+        instruction_params: dict[str, Union[int, float, str]],
+        bytecode_idx: int
+    ) -> Callable[[], Union[int, None]]:
         """
-        Handle a `SIGNEXT` bytecode.
+        Decode a bytecode that changes the control flow (i.e., `JZ`, `JR`,
+        `JAL` and `HALT`).
 
-        This method extends a 16-bit value to 32 bits. As we are dealing with
-        registers, and not the memory directly, the value to extend is simply
-        copied to the destination register.
+        Function calls (`JAL`) enter a new frame of the register file, and
+        returns (`JR` to `ret_address`) go back to the frame of the caller.
 
         Parameters
         ----------
+        instruction : str
+            The instruction of the bytecode.
         instruction_params : dict[str, Union[int, float, str]]
             The bytecode metadata.
-        """
-
-        register: int = instruction_params["register"]
-        value: int = instruction_params["value"]
-
-        self.registers[register] = self.registers[value]
+        bytecode_idx : int
+            The index of the bytecode in its section of the program.
 
-    def SITOFP(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `SITOFP` bytecode.
-
-        This method type casts a signed integer to floating point. For the sake
-        of simplicity, we'll use Python's conversion.
-
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
+        Returns
+        -------
+        : Callable[[], Union[int, None]]
+            The handler of the bytecode.
         """
 
-        register: int = instruction_params["register"]
-        value: int = instruction_params["value"]
+        registers = self.registers.values
+        frame = self.registers.frame
+        return_addresses = self.registers.return_addresses
+        next_idx = bytecode_idx + 1
 
-        self.registers[register] = float(self.registers[value])
+        if instruction == "JZ":
+            conditional_register = instruction_params["conditional_register"]
+            jump_target = bytecode_idx + instruction_params["jump_size"]
 
-    def STORE(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `STORE` bytecode.
+            # Unconditional jumps do not need to evaluate the `zero` register
+            if conditional_register == "zero":
+                def handler() -> int:
+                    return jump_target
 
-        This method stores the contents of a register into a memory address.
+            else:
+                conditional_register_index = self.registers.index(conditional_register)
 
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
+                def handler() -> int:
+                    if registers[frame[0] + conditional_register_index]:
+                        return next_idx
 
-        register_with_dest_address: str = instruction_params["register"]
-        dest_address: str = self.registers[register_with_dest_address]
+                    return jump_target
 
-        value_to_store_register = instruction_params["value"]
+        elif instruction == "JAL":
+            called_function_start = self.function_table[instruction_params["value"]]
+            push_frame = self.registers.push_frame
 
-        if value_to_store_register == "arg":
-            value_to_store: Union[int, float] = self.registers["arg"].pop()
-        else:
-            value_to_store: Union[int, float] = self.registers[value_to_store_register]
+            def handler() -> int:
+                return_addresses.append(next_idx)
+                push_frame()
+                return called_function_start
 
-        self.memory[dest_address] = value_to_store
+        elif instruction == "JR" and instruction_params["register"] == "ret_address":
+            pop_frame = self.registers.pop_frame
 
-    def STOREF(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `STORE` bytecode.
+            # The final `return` (from `main`) jumps to the last instruction
+            halt_idx = len(self.program["code"]) - 1
 
-        This is the `float`-only equivalent of `LOAD`.
+            def handler() -> int:
+                if not return_addresses:
+                    return halt_idx
 
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
+                pop_frame()
+                return return_addresses.pop()
 
-        register_with_dest_address: str = instruction_params["register"]
-        dest_address: str = self.registers[register_with_dest_address]
+        # Jump to the address stored in a general purpose register
+        elif instruction == "JR":
+            register_with_address = self.registers.index(instruction_params["register"])
 
-        value_to_store_register = instruction_params["value"]
+            def handler() -> int:
+                return registers[frame[0] + register_with_address]
 
-        if value_to_store_register == "arg":
-            value_to_store: Union[int, float] = self.registers["arg"].pop()
         else:
-            value_to_store: Union[int, float] = self.registers[value_to_store_register]
-
-        self.memory[dest_address] = value_to_store
-
-    def SUB(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `SUB` bytecode.
-
-        This method handles the subtraction between two integers.
-
-        `short`-typed values will also use this method.
-
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
-
-        lhs = self.registers[instruction_params["lhs_register"]]
-        rhs = self.registers[instruction_params["rhs_register"]]
-
-        self.registers[instruction_params["register"]] = lhs - rhs
-
-    def TRUNC(self, instruction_params: dict[str, Union[int, float, str]]) -> None:
-        """
-        Handle a `TRUNC` bytecode.
-
-        This method truncates a 32-bit value to 16 bits.
-
-        Parameters
-        ----------
-        instruction_params : dict[str, Union[int, float, str]]
-            The bytecode metadata.
-        """
-
-        register: int = instruction_params["register"]
-        value: int = instruction_params["value"]
-
-        value_to_truncate: int = self.registers[value]
-        truncated_value: int = value_to_truncate & 0xFFFF
-
-        if truncated_value & 0x8000:
-            truncated_value -= 0x100000
+            def handler() -> None:
+                self.program_counter = bytecode_idx
 
-        self.registers[register] = truncated_value
+        return handler
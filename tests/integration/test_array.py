@@ -1,5 +1,7 @@
 """Integration test for a simple array manipulation."""
 
+import pytest
+
 from src.certificators import BackendCertificator, FrontendCertificator
 from src.runner import create_instance
 
@@ -24,30 +26,38 @@ int main() {
 """
 
 
-def test_array():
+@pytest.mark.parametrize("optimization_level", [0, 1])
+def test_array(optimization_level: int):
     """Test a simple array."""
 
-    instance = create_instance(source_code=SOURCE_CODE)
+    instance = create_instance(
+        source_code=SOURCE_CODE,
+        optimization_level=optimization_level
+    )
     vm = instance.get_vm()
     vm.run()
 
     expected_memory = {
-        "0x0": 0,
-        "0x4": 2,
-        "0x8": 8,
-        "0xc": 24,
-        "0x10": 64,
-        "0x14": 5,
-        "0x18": 11,
+        0x0: 0,
+        0x4: 2,
+        0x8: 8,
+        0xc: 24,
+        0x10: 64,
+        0x14: 5,
+        0x18: 11,
     }
 
     assert vm.get_memory() == expected_memory
 
 
-def test_array_certification() -> None:
+@pytest.mark.parametrize("optimization_level", [0, 1])
+def test_array_certification(optimization_level: int) -> None:
     """Test the front and backend certification."""
 
-    instance = create_instance(source_code=SOURCE_CODE)
+    instance = create_instance(
+        source_code=SOURCE_CODE,
+        optimization_level=optimization_level
+    )
 
     ast = instance.get_ast()
     frontend_certificate = FrontendCertificator(ast=ast).certificate()
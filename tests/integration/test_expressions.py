@@ -1,5 +1,7 @@
 """Integration test to showcase expressions."""
 
+import pytest
+
 from src.certificators import BackendCertificator, FrontendCertificator
 from src.runner import create_instance
 
@@ -20,21 +22,29 @@ int main() {
 """
 
 
-def test_expression():
+@pytest.mark.parametrize("optimization_level", [0, 2])
+def test_expression(optimization_level: int):
     """Test multiple expressions."""
 
-    instance = create_instance(source_code=SOURCE_CODE)
+    instance = create_instance(
+        source_code=SOURCE_CODE,
+        optimization_level=optimization_level
+    )
     vm = instance.get_vm()
     vm.run()
 
-    expected_memory = {"0x0": 23, "0x4": 46, "0x8": 0}
+    expected_memory = {0x0: 23, 0x4: 46, 0x8: 0}
     assert vm.get_memory() == expected_memory
 
 
-def test_expressions_certification() -> None:
+@pytest.mark.parametrize("optimization_level", [0, 2])
+def test_expressions_certification(optimization_level: int) -> None:
     """Test the front and backend certification."""
 
-    instance = create_instance(source_code=SOURCE_CODE)
+    instance = create_instance(
+        source_code=SOURCE_CODE,
+        optimization_level=optimization_level
+    )
 
     ast = instance.get_ast()
     frontend_certificate = FrontendCertificator(ast=ast).certificate()
@@ -34,7 +34,7 @@ def test_function_call():
     vm = instance.get_vm()
     vm.run()
 
-    expected_memory = {"0x0": 0, "0x4": 120, "0x8": 120}
+    expected_memory = {0x0: 0, 0x4: 120, 0x8: 120}
     assert vm.get_memory() == expected_memory
 
 
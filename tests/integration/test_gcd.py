@@ -32,7 +32,7 @@ def test_gcd() -> None:
     vm = instance.get_vm()
     vm.run()
 
-    expected_memory = {"0x0": 25, "0x4": 25}
+    expected_memory = {0x0: 25, 0x4: 25}
     assert vm.get_memory() == expected_memory
 
 
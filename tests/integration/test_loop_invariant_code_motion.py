@@ -0,0 +1,205 @@
+"""Integration test for the hoisting of loop-invariant expressions."""
+
+from copy import deepcopy
+
+import pytest
+
+from src.certificators import BackendCertificator, FrontendCertificator
+from src.runner import create_instance
+
+
+SOURCE_CODE = """
+int main() {
+    int a;
+    int b;
+    int n;
+    int i;
+    int x;
+    short s;
+    float f;
+    int v[4];
+
+    a = 3;
+    b = 4;
+    n = 2;
+    i = 0;
+
+    if (a > 1) {
+        x = 1;
+    }
+
+    while (i < n * 2) {
+        x = i + a * b + 3;
+        s = a + b;
+        f = a * 2.5;
+        v[i] = a * b;
+        i = i + 1;
+    }
+
+    return 0;
+}
+"""
+
+
+def test_loop_invariant_code_motion() -> None:
+    """Test that hoisting loop-invariant expressions keeps the results."""
+
+    instance = create_instance(source_code=SOURCE_CODE)
+    vm = instance.get_vm()
+    vm.run()
+
+    optimized_instance = create_instance(
+        source_code=SOURCE_CODE,
+        optimization_level=2
+    )
+    optimized_vm = optimized_instance.get_vm()
+    optimized_vm.run()
+
+    assert optimized_vm.get_memory() == vm.get_memory()
+
+    # Each hoisted expression leaves a `MOV` in the loop
+    hoisted_expressions = [
+        bytecode
+        for bytecode in optimized_instance.get_program()["code"]
+        if bytecode["instruction"] == "MOV"
+        and bytecode["metadata"].get("hoisted", False)
+    ]
+    assert len(hoisted_expressions) == 5
+
+
+def test_loop_invariant_code_motion_certification() -> None:
+    """Test the front and backend certification of hoisted expressions."""
+
+    instance = create_instance(source_code=SOURCE_CODE, optimization_level=2)
+
+    ast = instance.get_ast()
+    frontend_certificate = FrontendCertificator(ast=ast).certificate()
+
+    program = instance.get_program()
+    backend_certificate = BackendCertificator(program=program).certificate()
+
+    assert frontend_certificate == backend_certificate
+
+
+@pytest.mark.parametrize("trust_ast_optimizations", [False, True])
+def test_loop_invariant_code_motion_reassociation(trust_ast_optimizations: bool) -> None:
+    """
+    Test that loop-invariant operands are grouped and hoisted, either by the
+    AST optimizations (if trusted) or by the `LoopInvariantCodeMotion` pass.
+    """
+
+    source_code = """
+    int main() {
+        int a;
+        int b;
+        int i;
+        int x;
+
+        a = 3;
+        b = 4;
+        i = 0;
+
+        while (i < 4) {
+            x = i + a + b;
+            i = i + 1;
+        }
+
+        return 0;
+    }
+    """
+    instance = create_instance(
+        source_code=source_code,
+        optimization_level=2,
+        trust_ast_optimizations=trust_ast_optimizations
+    )
+    frontend_certificate, backend_certificate = instance.certificate()
+
+    assert frontend_certificate == backend_certificate
+
+    # `a + b` is hoisted once it is grouped
+    hoisted_expressions = [
+        bytecode
+        for bytecode in instance.get_program()["code"]
+        if bytecode["instruction"] == "MOV"
+        and bytecode["metadata"].get("hoisted", False)
+    ]
+    assert len(hoisted_expressions) == 1
+
+
+def test_loop_invariant_code_motion_written_variable() -> None:
+    """Test that hoisted expressions that read variables the loop writes to are rejected."""
+
+    instance = create_instance(source_code=SOURCE_CODE, optimization_level=2)
+    program = deepcopy(instance.get_program())
+
+    # Make the loop write to `a` (at address 0), which the hoisted `a * b` reads
+    stores = [
+        bytecode
+        for bytecode in program["code"]
+        if bytecode["instruction"] == "STOREA"
+        and bytecode["metadata"]["address"] == 16
+    ]
+    stores[-1]["metadata"]["address"] = 0
+
+    with pytest.raises(ValueError, match="not loop-invariant"):
+        BackendCertificator(program=program).certificate()
+
+
+def test_loop_invariant_code_motion_reassociation_profile() -> None:
+    """Test that grouping loop-invariant operands saves instructions."""
+
+    source_code = """
+    int main() {
+        int i;
+        int x;
+        int avg;
+        int scaled;
+        int factor;
+
+        factor = 1;
+
+        avg = (72 + 85 + 90 + 60 + 88) / 5;
+        scaled = avg / factor;
+
+        i = 0;
+        while (i < 5) {
+            x = i + avg + scaled;
+            i = i + 1;
+        }
+
+        return 0;
+    }
+    """
+    instances = [
+        create_instance(
+            source_code=source_code,
+            optimization_level=optimization_level,
+            profile=True
+        )
+        for optimization_level in [1, 2]
+    ]
+
+    for instance in instances:
+        frontend_certificate, backend_certificate = instance.certificate()
+        assert frontend_certificate == backend_certificate
+
+        instance.get_vm().run()
+
+    assert instances[0].get_vm().get_memory() == instances[1].get_vm().get_memory()
+
+    # `avg + scaled` is hoisted out of the loop...
+    hoisted_expressions = [
+        bytecode
+        for bytecode in instances[1].get_program()["code"]
+        if bytecode["instruction"] == "MOV"
+        and bytecode["metadata"].get("reassociated_operands") == 2
+    ]
+    assert len(hoisted_expressions) == 1
+
+    # ...so each of the 5 iterations runs 2 instructions less (`LOADA` and
+    # `ADD` are replaced by a `MOV`), and the pre-header runs 3 instructions
+    dynamic_instructions_counts = [
+        sum(instance.get_vm().profiler.counts)
+        for instance in instances
+    ]
+    assert dynamic_instructions_counts[1] == dynamic_instructions_counts[0] - 2 * 5 + 3
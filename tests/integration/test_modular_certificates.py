@@ -0,0 +1,91 @@
+"""Test the per-function (i.e., modular) certification of programs."""
+
+import pytest
+
+from src.runner import create_instance
+
+SOURCE_CODE = """
+int x;
+
+int square(int n) {
+    return n * n;
+}
+
+float half(float f) {
+    return f / 2.0;
+}
+
+int main() {
+    float y;
+
+    x = square(7);
+    y = half(3.0);
+
+    return 0;
+}
+"""
+
+
+@pytest.mark.parametrize("optimization_level", [0, 1, 2])
+def test_certificate_functions(optimization_level: int) -> None:
+    """Test that per-function certificates compose the program certificate."""
+
+    instance = create_instance(
+        source_code=SOURCE_CODE,
+        optimization_level=optimization_level
+    )
+
+    frontend_certificator = instance.get_frontend_certificator()
+    backend_certificator = instance.get_backend_certificator()
+
+    # Certificate the functions in reverse order
+    frontend_function_certificates = frontend_certificator.certificate_functions(
+        ["main", "half", "square"]
+    )
+    backend_function_certificates = backend_certificator.certificate_functions(
+        ["main", "half", "square"]
+    )
+
+    assert list(frontend_function_certificates) == ["main", "half", "square"]
+    assert frontend_function_certificates == backend_function_certificates
+
+    frontend_certificate = frontend_certificator.compose(frontend_function_certificates)
+    backend_certificate = backend_certificator.compose(backend_function_certificates)
+
+    other_instance = create_instance(
+        source_code=SOURCE_CODE,
+        optimization_level=optimization_level
+    )
+
+    assert frontend_certificate == backend_certificate
+    assert frontend_certificate == (
+        other_instance.get_frontend_certificator().certificate()
+    )
+
+
+def test_reuse_function_certificates() -> None:
+    """Test reusing the certificates of unchanged functions."""
+
+    instance = create_instance(source_code=SOURCE_CODE)
+    changed_instance = create_instance(
+        source_code=SOURCE_CODE.replace("f / 2.0", "f / 4.0")
+    )
+
+    function_certificates = instance.get_backend_certificator().certificate_functions()
+
+    changed_certificator = changed_instance.get_backend_certificator()
+    changed_function_certificates = changed_certificator.certificate_functions(["half"])
+
+    assert changed_function_certificates["half"] != function_certificates["half"]
+
+    changed_certificate = changed_certificator.compose({
+        **function_certificates,
+        **changed_function_certificates,
+    })
+
+    assert changed_certificate == (
+        changed_instance.get_frontend_certificator().certificate()
+    )
+
+    with pytest.raises(ValueError):
+        changed_certificator.compose(changed_function_certificates)
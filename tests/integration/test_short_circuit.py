@@ -0,0 +1,88 @@
+"""Integration test for the short-circuit evaluation of logical operations."""
+
+import pytest
+
+from src.certificators import BackendCertificator, FrontendCertificator
+from src.runner import create_instance
+
+
+SOURCE_CODE = """
+int grade(int score) {
+    if (score > 90 || score == 90) {
+        return 1;
+    } else if (score > 75 || score == 75) {
+        return 2;
+    }
+    return 3;
+}
+
+int main() {
+    int a;
+    int b;
+    int c;
+    int r;
+    float f;
+    float g;
+
+    a = 3;
+    b = 0;
+    c = -2;
+    f = 1.5;
+    g = 0.0;
+
+    r = (a > b || c < b + a * 2) && (a == 3 && a + b + c > 0);
+    b = b * a || c + a * 2;
+    f = f + (g && f * 2.0 > 1.0);
+    g = (g || f + 1.0 > 2.0) + g;
+    c = grade(75) + grade(a);
+
+    return 0;
+}
+"""
+
+
+def test_short_circuit() -> None:
+    """Test that short-circuiting logical operations keeps the results."""
+
+    instance = create_instance(source_code=SOURCE_CODE)
+    vm = instance.get_vm()
+    vm.run()
+
+    optimized_instance = create_instance(
+        source_code=SOURCE_CODE,
+        optimization_level=1
+    )
+    optimized_vm = optimized_instance.get_vm()
+    optimized_vm.run()
+
+    assert optimized_vm.get_memory() == vm.get_memory()
+
+    # The optimized code has the short-circuit jumps
+    conditional_jumps = [
+        bytecode
+        for bytecode in optimized_instance.get_program()["code"]
+        if bytecode["instruction"] == "JZ"
+    ]
+    assert len(conditional_jumps) > len([
+        bytecode
+        for bytecode in instance.get_program()["code"]
+        if bytecode["instruction"] == "JZ"
+    ])
+
+
+@pytest.mark.parametrize("optimization_level", [1, 2])
+def test_short_circuit_certification(optimization_level: int) -> None:
+    """Test the front and backend certification of short-circuits."""
+
+    instance = create_instance(
+        source_code=SOURCE_CODE,
+        optimization_level=optimization_level
+    )
+
+    ast = instance.get_ast()
+    frontend_certificate = FrontendCertificator(ast=ast).certificate()
+
+    program = instance.get_program()
+    backend_certificate = BackendCertificator(program=program).certificate()
+
+    assert frontend_certificate == backend_certificate
@@ -0,0 +1,103 @@
+"""Integration test for the fusion of variable accesses into superinstructions."""
+
+from copy import deepcopy
+
+from src.abstract_syntax_tree import AbstractSyntaxTree
+from src.certificators import BackendCertificator, FrontendCertificator
+from src.code_generator import CodeGenerator
+from src.lexer import Lexer
+from src.virtual_machine import VirtualMachine
+
+
+SOURCE_CODE = """
+struct point {
+    int x;
+    float y;
+    short z;
+};
+
+int square(int value) {
+    return value * value;
+}
+
+int main() {
+    point p;
+    int values[4];
+    short s;
+    float f;
+    int i;
+
+    p.x = 3;
+    p.y = 1.5;
+    p.z = p.x * 30000;
+    s = 40000;
+    f = p.y * 2.0;
+    i = 0;
+
+    while (i < 4) {
+        values[i] = square(i);
+        i = i + 1;
+    }
+
+    i = p.x;
+    if (square(i) > 5) {
+        values[1] = s;
+    }
+    else {
+        values[1] = 0;
+    }
+
+    s = values[2] + p.x;
+
+    return 0;
+}
+"""
+
+
+def _build(optimization_level: int) -> tuple[AbstractSyntaxTree, dict[str, dict]]:
+    """Build the AST and the program of `SOURCE_CODE`."""
+
+    parsed_source = Lexer(source_code=SOURCE_CODE).parse_source_code()
+
+    ast = AbstractSyntaxTree(source_code=deepcopy(parsed_source))
+    ast.build()
+
+    generator = CodeGenerator(
+        root=ast.get_root(),
+        optimization_level=optimization_level
+    )
+    program = generator.generate_code()
+
+    return ast, program
+
+
+def test_superinstructions() -> None:
+    """Test that fused instructions produce the same results."""
+
+    _, program = _build(optimization_level=0)
+    vm = VirtualMachine(program=program)
+    vm.run()
+
+    _, optimized_program = _build(optimization_level=1)
+    optimized_vm = VirtualMachine(program=optimized_program)
+    optimized_vm.run()
+
+    assert optimized_vm.get_memory() == vm.get_memory()
+    assert len(optimized_program["code"]) < len(program["code"])
+
+    instructions = {bytecode["instruction"] for bytecode in optimized_program["code"]}
+    assert {"LOADA", "LOADFA", "STOREA", "STOREFA"} <= instructions
+
+    # Floats are only read from constant addresses
+    assert "LOADF" not in instructions
+
+
+def test_superinstructions_certification() -> None:
+    """Test the front and backend certification of fused instructions."""
+
+    ast, program = _build(optimization_level=1)
+
+    frontend_certificate = FrontendCertificator(ast=ast).certificate()
+    backend_certificate = BackendCertificator(program=program).certificate()
+
+    assert frontend_certificate == backend_certificate
@@ -0,0 +1,118 @@
+"""Test the certification and execution of programs in a single step."""
+
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from src.runner import create_instance
+from src.certificators import BackendCertificator
+
+SOURCE_CODE = """
+int main() {
+    int i;
+    i = 125;
+
+    int j;
+    j = 100;
+
+    while (i - j) {
+        if (i < j) {
+            j = j - i;
+        }
+        else {
+            i = i - j;
+        }
+    }
+
+    return 0;
+}
+"""
+
+
+@pytest.mark.parametrize("fingerprint", [False, True])
+@pytest.mark.parametrize("parallel", [False, True])
+def test_validate_and_run(parallel: bool, fingerprint: bool) -> None:
+    """Test certificating and running a program."""
+
+    instance = create_instance(source_code=SOURCE_CODE)
+
+    assert instance.validate_and_run(parallel=parallel, fingerprint=fingerprint)
+
+    frontend_certificate = instance.get_frontend_certificator().get_certificate()
+    backend_certificate = instance.get_backend_certificator().get_certificate()
+
+    assert len(frontend_certificate) > 0
+    assert frontend_certificate == backend_certificate
+
+    vm = instance.get_vm()
+
+    assert vm.get_memory() == {0x0: 25, 0x4: 25}
+    assert vm.program is instance.get_program()
+
+
+@pytest.mark.parametrize("fingerprint", [False, True])
+@pytest.mark.parametrize("parallel", [False, True])
+def test_validate_and_run_mismatch(parallel: bool, fingerprint: bool) -> None:
+    """Test that programs whose certificates do not match are not run."""
+
+    instance = create_instance(source_code=SOURCE_CODE)
+    other_instance = create_instance(source_code=SOURCE_CODE.replace("125", "20"))
+
+    instance.backend_certificator = BackendCertificator(
+        program=other_instance.get_program()
+    )
+
+    assert not instance.validate_and_run(parallel=parallel, fingerprint=fingerprint)
+    assert instance.get_vm().get_memory() == {}
+
+
+def test_validate_and_run_mismatch_non_terminating() -> None:
+    """
+    Test that the speculative execution of a program that does not terminate
+    is stopped when its certificates do not match.
+    """
+
+    # Run in a separate interpreter, as it would hang at exit if the
+    # execution was not stopped
+    script = textwrap.dedent('''
+        from src.certificators import BackendCertificator
+        from src.runner import create_instance
+
+        SOURCE_CODE = """
+        int main() {
+            int i;
+            i = 0;
+
+            while (i < 1) {
+                i = i - 1;
+            }
+
+            return 0;
+        }
+        """
+
+        instance = create_instance(source_code=SOURCE_CODE)
+        other_instance = create_instance(
+            source_code=SOURCE_CODE.replace("i - 1", "i - 2")
+        )
+
+        instance.backend_certificator = BackendCertificator(
+            program=other_instance.get_program()
+        )
+
+        print(instance.validate_and_run(parallel=True))
+    ''')
+
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).parents[2],
+        capture_output=True,
+        text=True,
+        timeout=60
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
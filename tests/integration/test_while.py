@@ -25,7 +25,7 @@ def test_simple_while() -> None:
     vm = instance.get_vm()
     vm.run()
 
-    expected_memory = {"0x0": 128}
+    expected_memory = {0x0: 128}
     assert vm.get_memory() == expected_memory
 
 
@@ -716,167 +716,168 @@ ABSTRACT_SYNTAX_TREE_ROOT = ABSTRACT_SYNTAX_TREE.build()
 
 ENVIRONMENT = {
     'variables': {
-        1: {'address': '0x0', 'size': 40},
-        2: {'address': '0x28', 'size': 8}
+        1: {'address': 0x0, 'size': 40},
+        2: {'address': 0x28, 'size': 8}
     },
     'functions': {}
 }
 
 MACHINE_CODE = {
     "functions": {
-        "function_that_returns_struct": {"start": 0, "end": 27},
-        "some_simple_function": {"start": 27, "end": 42},
-        "abc": {"start": 42, "end": 86},
-        "main": {"start": 86, "end": 151},
+        "function_that_returns_struct": {"start": 0, "end": 27, "registers": 4, "parameters": 2},
+        "some_simple_function": {"start": 27, "end": 42, "registers": 3, "parameters": 2},
+        "abc": {"start": 42, "end": 86, "registers": 4, "parameters": 2},
+        "main": {"start": 86, "end": 151, "registers": 4, "parameters": 0},
     },
+    "function_table": {1: 0, 2: 27, 3: 42, 4: 86},
     "global_vars": [],
     "data": {
-        "0x0": 40,
-        "0x28": 8,
-        "0x30": 4,
-        "0x34": 4,
-        "0x38": 4,
-        "0x3c": 4,
-        "0x40": 4,
-        "0x44": 4,
-        "0x48": 4,
-        "0x4c": 4,
-        "0x50": 4,
-        "0x54": 4,
-        "0x58": 8,
-        "0x60": 4,
-        "0x64": 40,
-        "0x8c": 4,
+        0x0: 40,
+        0x28: 8,
+        0x30: 4,
+        0x34: 4,
+        0x38: 4,
+        0x3c: 4,
+        0x40: 4,
+        0x44: 4,
+        0x48: 4,
+        0x4c: 4,
+        0x50: 4,
+        0x54: 4,
+        0x58: 8,
+        0x60: 4,
+        0x64: 40,
+        0x8c: 4,
     },
     "code": [
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 0, "value": "0x30"},
+            "metadata": {"register": 0, "value": 0x30},
             "bytecode_id": 1,
         },
         {
             "instruction": "STORE",
-            "metadata": {"register": 0, "value": "arg"},
+            "metadata": {"register": 0, "value": "arg", "argument": 0},
             "bytecode_id": 2,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 1, "value": "0x34"},
+            "metadata": {"register": 0, "value": 0x34},
             "bytecode_id": 3,
         },
         {
             "instruction": "STORE",
-            "metadata": {"register": 1, "value": "arg"},
+            "metadata": {"register": 0, "value": "arg", "argument": 1},
             "bytecode_id": 4,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 2, "value": "0x38"},
+            "metadata": {"register": 0, "value": 0x38},
             "bytecode_id": 5,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 3, "lhs_register": 2, "rhs_register": "zero"},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 6,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 4, "value": "0x30"},
+            "metadata": {"register": 0, "value": 0x30},
             "bytecode_id": 7,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 5, "lhs_register": 4, "rhs_register": "zero"},
+            "metadata": {"register": 2, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 8,
         },
         {
             "instruction": "LOAD",
-            "metadata": {"register": 6, "value": 5},
+            "metadata": {"register": 0, "value": 2},
             "bytecode_id": 9,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 7, "value": "0x34"},
+            "metadata": {"register": 2, "value": 0x34},
             "bytecode_id": 10,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 8, "lhs_register": 7, "rhs_register": "zero"},
+            "metadata": {"register": 3, "lhs_register": 2, "rhs_register": "zero"},
             "bytecode_id": 11,
         },
         {
             "instruction": "LOAD",
-            "metadata": {"register": 9, "value": 8},
+            "metadata": {"register": 2, "value": 3},
             "bytecode_id": 12,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 10, "lhs_register": 6, "rhs_register": 9},
+            "metadata": {"register": 3, "lhs_register": 0, "rhs_register": 2},
             "bytecode_id": 13,
         },
         {
             "instruction": "STORE",
-            "metadata": {"register": 3, "value": 10},
+            "metadata": {"register": 1, "value": 3},
             "bytecode_id": 14,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 11, "value": "0x28"},
+            "metadata": {"register": 0, "value": 0x28},
             "bytecode_id": 15,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 12, "lhs_register": 11, "rhs_register": "zero"},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 16,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 13, "value": 0},
+            "metadata": {"register": 0, "value": 0},
             "bytecode_id": 17,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 14, "lhs_register": 12, "rhs_register": 13},
+            "metadata": {"register": 2, "lhs_register": 1, "rhs_register": 0},
             "bytecode_id": 18,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 15, "value": "0x38"},
+            "metadata": {"register": 0, "value": 0x38},
             "bytecode_id": 19,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 16, "lhs_register": 15, "rhs_register": "zero"},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 20,
         },
         {
             "instruction": "LOAD",
-            "metadata": {"register": 17, "value": 16},
+            "metadata": {"register": 0, "value": 1},
             "bytecode_id": 21,
         },
         {
             "instruction": "STORE",
-            "metadata": {"register": 14, "value": 17},
+            "metadata": {"register": 2, "value": 0},
             "bytecode_id": 22,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 18, "value": "0x28"},
+            "metadata": {"register": 0, "value": 0x28},
             "bytecode_id": 23,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 19, "lhs_register": 18, "rhs_register": "zero"},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 24,
         },
         {
             "instruction": "LOAD",
-            "metadata": {"register": 20, "value": 19},
+            "metadata": {"register": 0, "value": 1},
             "bytecode_id": 25,
         },
         {
             "instruction": "MOV",
-            "metadata": {"register": "ret_value", "value": 20},
+            "metadata": {"register": "ret_value", "value": 0},
             "bytecode_id": 26,
         },
         {
@@ -886,72 +887,72 @@ MACHINE_CODE = {
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 21, "value": "0x3c"},
+            "metadata": {"register": 0, "value": 0x3c},
             "bytecode_id": 28,
         },
         {
             "instruction": "STOREF",
-            "metadata": {"register": 21, "value": "arg"},
+            "metadata": {"register": 0, "value": "arg", "argument": 0},
             "bytecode_id": 29,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 22, "value": "0x40"},
+            "metadata": {"register": 0, "value": 0x40},
             "bytecode_id": 30,
         },
         {
             "instruction": "STORE",
-            "metadata": {"register": 22, "value": "arg"},
+            "metadata": {"register": 0, "value": "arg", "argument": 1},
             "bytecode_id": 31,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 23, "value": "0x3c"},
+            "metadata": {"register": 0, "value": 0x3c},
             "bytecode_id": 32,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 24, "lhs_register": 23, "rhs_register": "zero"},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 33,
         },
         {
             "instruction": "LOADF",
-            "metadata": {"register": 25, "value": 24},
+            "metadata": {"register": 0, "value": 1},
             "bytecode_id": 34,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 26, "value": "0x40"},
+            "metadata": {"register": 1, "value": 0x40},
             "bytecode_id": 35,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 27, "lhs_register": 26, "rhs_register": "zero"},
+            "metadata": {"register": 2, "lhs_register": 1, "rhs_register": "zero"},
             "bytecode_id": 36,
         },
         {
             "instruction": "LOAD",
-            "metadata": {"register": 28, "value": 27},
+            "metadata": {"register": 1, "value": 2},
             "bytecode_id": 37,
         },
         {
             "instruction": "SITOFP",
-            "metadata": {"register": 29, "value": 28},
+            "metadata": {"register": 2, "value": 1},
             "bytecode_id": 38,
         },
         {
             "instruction": "FDIV",
-            "metadata": {"register": 30, "lhs_register": 25, "rhs_register": 29},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": 2},
             "bytecode_id": 39,
         },
         {
             "instruction": "FPTOSI",
-            "metadata": {"register": 31, "value": 30},
+            "metadata": {"register": 0, "value": 1},
             "bytecode_id": 40,
         },
         {
             "instruction": "MOV",
-            "metadata": {"register": "ret_value", "value": 31},
+            "metadata": {"register": "ret_value", "value": 0},
             "bytecode_id": 41,
         },
         {
@@ -961,213 +962,213 @@ MACHINE_CODE = {
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 32, "value": "0x44"},
+            "metadata": {"register": 0, "value": 0x44},
             "bytecode_id": 43,
         },
         {
             "instruction": "STORE",
-            "metadata": {"register": 32, "value": "arg"},
+            "metadata": {"register": 0, "value": "arg", "argument": 0},
             "bytecode_id": 44,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 33, "value": "0x48"},
+            "metadata": {"register": 0, "value": 0x48},
             "bytecode_id": 45,
         },
         {
             "instruction": "STORE",
-            "metadata": {"register": 33, "value": "arg"},
+            "metadata": {"register": 0, "value": "arg", "argument": 1},
             "bytecode_id": 46,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 34, "value": "0x4c"},
+            "metadata": {"register": 0, "value": 0x4c},
             "bytecode_id": 47,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 35, "lhs_register": 34, "rhs_register": "zero"},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 48,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 36, "value": 1},
+            "metadata": {"register": 0, "value": 1},
             "bytecode_id": 49,
         },
         {
             "instruction": "STORE",
-            "metadata": {"register": 35, "value": 36},
+            "metadata": {"register": 1, "value": 0},
             "bytecode_id": 50,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 37, "value": "0x50"},
+            "metadata": {"register": 0, "value": 0x50},
             "bytecode_id": 51,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 38, "lhs_register": 37, "rhs_register": "zero"},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 52,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 39, "value": 2.0},
+            "metadata": {"register": 0, "value": 2.0},
             "bytecode_id": 53,
         },
         {
             "instruction": "STOREF",
-            "metadata": {"register": 38, "value": 39},
+            "metadata": {"register": 1, "value": 0},
             "bytecode_id": 54,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 40, "value": "0x58"},
+            "metadata": {"register": 0, "value": 0x58},
             "bytecode_id": 55,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 41, "lhs_register": 40, "rhs_register": "zero"},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 56,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 42, "value": 0},
+            "metadata": {"register": 0, "value": 0},
             "bytecode_id": 57,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 43, "lhs_register": 41, "rhs_register": 42},
+            "metadata": {"register": 2, "lhs_register": 1, "rhs_register": 0},
             "bytecode_id": 58,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 44, "value": 1},
+            "metadata": {"register": 0, "value": 1},
             "bytecode_id": 59,
         },
         {
             "instruction": "STORE",
-            "metadata": {"register": 43, "value": 44},
+            "metadata": {"register": 2, "value": 0},
             "bytecode_id": 60,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 45, "value": "0x4c"},
+            "metadata": {"register": 0, "value": 0x4c},
             "bytecode_id": 61,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 46, "lhs_register": 45, "rhs_register": "zero"},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 62,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 47, "value": "0x4c"},
+            "metadata": {"register": 0, "value": 0x4c},
             "bytecode_id": 63,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 48, "lhs_register": 47, "rhs_register": "zero"},
+            "metadata": {"register": 2, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 64,
         },
         {
             "instruction": "LOAD",
-            "metadata": {"register": 49, "value": 48},
+            "metadata": {"register": 0, "value": 2},
             "bytecode_id": 65,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 50, "value": "0x50"},
+            "metadata": {"register": 2, "value": 0x50},
             "bytecode_id": 66,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 51, "lhs_register": 50, "rhs_register": "zero"},
+            "metadata": {"register": 3, "lhs_register": 2, "rhs_register": "zero"},
             "bytecode_id": 67,
         },
         {
             "instruction": "LOADF",
-            "metadata": {"register": 52, "value": 51},
+            "metadata": {"register": 2, "value": 3},
             "bytecode_id": 68,
         },
         {
             "instruction": "MOV",
-            "metadata": {"register": "arg", "value": 52},
+            "metadata": {"register": "arg", "value": 2, "argument": 0},
             "bytecode_id": 69,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 53, "value": 123},
+            "metadata": {"register": 2, "value": 123},
             "bytecode_id": 70,
         },
         {
             "instruction": "MOV",
-            "metadata": {"register": "arg", "value": 53},
+            "metadata": {"register": "arg", "value": 2, "argument": 1},
             "bytecode_id": 71,
         },
         {"instruction": "JAL", "metadata": {"value": 2}, "bytecode_id": 72},
         {
             "instruction": "MOV",
-            "metadata": {"register": 54, "value": "ret_value"},
+            "metadata": {"register": 2, "value": "ret_value"},
             "bytecode_id": 73,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 55, "lhs_register": 49, "rhs_register": 54},
+            "metadata": {"register": 3, "lhs_register": 0, "rhs_register": 2},
             "bytecode_id": 74,
         },
         {
             "instruction": "STORE",
-            "metadata": {"register": 46, "value": 55},
+            "metadata": {"register": 1, "value": 3},
             "bytecode_id": 75,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 56, "value": "0x50"},
+            "metadata": {"register": 0, "value": 0x50},
             "bytecode_id": 76,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 57, "lhs_register": 56, "rhs_register": "zero"},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 77,
         },
         {
             "instruction": "LOADF",
-            "metadata": {"register": 58, "value": 57},
+            "metadata": {"register": 0, "value": 1},
             "bytecode_id": 78,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 59, "value": "0x4c"},
+            "metadata": {"register": 1, "value": 0x4c},
             "bytecode_id": 79,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 60, "lhs_register": 59, "rhs_register": "zero"},
+            "metadata": {"register": 2, "lhs_register": 1, "rhs_register": "zero"},
             "bytecode_id": 80,
         },
         {
             "instruction": "LOAD",
-            "metadata": {"register": 61, "value": 60},
+            "metadata": {"register": 1, "value": 2},
             "bytecode_id": 81,
         },
         {
             "instruction": "SITOFP",
-            "metadata": {"register": 62, "value": 61},
+            "metadata": {"register": 2, "value": 1},
             "bytecode_id": 82,
         },
         {
             "instruction": "FADD",
-            "metadata": {"register": 63, "lhs_register": 58, "rhs_register": 62},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": 2},
             "bytecode_id": 83,
         },
         {
             "instruction": "FPTOSI",
-            "metadata": {"register": 64, "value": 63},
+            "metadata": {"register": 0, "value": 1},
             "bytecode_id": 84,
         },
         {
             "instruction": "MOV",
-            "metadata": {"register": "ret_value", "value": 64},
+            "metadata": {"register": "ret_value", "value": 0},
             "bytecode_id": 85,
         },
         {
@@ -1177,213 +1178,213 @@ MACHINE_CODE = {
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 65, "value": "0x60"},
+            "metadata": {"register": 0, "value": 0x60},
             "bytecode_id": 87,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 66, "lhs_register": 65, "rhs_register": "zero"},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 88,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 67, "value": 1},
+            "metadata": {"register": 0, "value": 1},
             "bytecode_id": 89,
         },
         {
             "instruction": "MOV",
-            "metadata": {"register": "arg", "value": 67},
+            "metadata": {"register": "arg", "value": 0, "argument": 0},
             "bytecode_id": 90,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 68, "value": 2},
+            "metadata": {"register": 0, "value": 2},
             "bytecode_id": 91,
         },
         {
             "instruction": "MOV",
-            "metadata": {"register": "arg", "value": 68},
+            "metadata": {"register": "arg", "value": 0, "argument": 1},
             "bytecode_id": 92,
         },
         {"instruction": "JAL", "metadata": {"value": 3}, "bytecode_id": 93},
         {
             "instruction": "MOV",
-            "metadata": {"register": 69, "value": "ret_value"},
+            "metadata": {"register": 0, "value": "ret_value"},
             "bytecode_id": 94,
         },
         {
             "instruction": "STORE",
-            "metadata": {"register": 66, "value": 69},
+            "metadata": {"register": 1, "value": 0},
             "bytecode_id": 95,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 70, "value": "0x64"},
+            "metadata": {"register": 0, "value": 0x64},
             "bytecode_id": 96,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 71, "lhs_register": 70, "rhs_register": "zero"},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 97,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 72, "value": 20},
+            "metadata": {"register": 0, "value": 20},
             "bytecode_id": 98,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 73, "lhs_register": 71, "rhs_register": 72},
+            "metadata": {"register": 2, "lhs_register": 1, "rhs_register": 0},
             "bytecode_id": 99,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 74, "value": 1},
+            "metadata": {"register": 0, "value": 1},
             "bytecode_id": 100,
         },
         {
             "instruction": "STORE",
-            "metadata": {"register": 73, "value": 74},
+            "metadata": {"register": 2, "value": 0},
             "bytecode_id": 101,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 75, "value": "0x60"},
+            "metadata": {"register": 0, "value": 0x60},
             "bytecode_id": 102,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 76, "lhs_register": 75, "rhs_register": "zero"},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 103,
         },
         {
             "instruction": "LOAD",
-            "metadata": {"register": 77, "value": 76},
+            "metadata": {"register": 0, "value": 1},
             "bytecode_id": 104,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 78, "value": 4},
+            "metadata": {"register": 1, "value": 4},
             "bytecode_id": 105,
         },
         {
             "instruction": "LSHIFT",
-            "metadata": {"register": 79, "lhs_register": 77, "rhs_register": 78},
+            "metadata": {"register": 2, "lhs_register": 0, "rhs_register": 1},
             "bytecode_id": 106,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 80, "value": 1},
+            "metadata": {"register": 0, "value": 1},
             "bytecode_id": 107,
         },
         {
             "instruction": "EQ",
-            "metadata": {"register": 81, "lhs_register": 79, "rhs_register": 80},
+            "metadata": {"register": 1, "lhs_register": 2, "rhs_register": 0},
             "bytecode_id": 108,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 82, "value": "0x60"},
+            "metadata": {"register": 0, "value": 0x60},
             "bytecode_id": 109,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 83, "lhs_register": 82, "rhs_register": "zero"},
+            "metadata": {"register": 2, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 110,
         },
         {
             "instruction": "LOAD",
-            "metadata": {"register": 84, "value": 83},
+            "metadata": {"register": 0, "value": 2},
             "bytecode_id": 111,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 85, "value": 1},
+            "metadata": {"register": 2, "value": 1},
             "bytecode_id": 112,
         },
         {
             "instruction": "GT",
-            "metadata": {"register": 86, "lhs_register": 84, "rhs_register": 85},
+            "metadata": {"register": 3, "lhs_register": 0, "rhs_register": 2},
             "bytecode_id": 113,
         },
         {
             "instruction": "OR",
-            "metadata": {"register": 87, "lhs_register": 81, "rhs_register": 86},
+            "metadata": {"register": 0, "lhs_register": 1, "rhs_register": 3},
             "bytecode_id": 114,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 88, "value": "0x60"},
+            "metadata": {"register": 1, "value": 0x60},
             "bytecode_id": 115,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 89, "lhs_register": 88, "rhs_register": "zero"},
+            "metadata": {"register": 2, "lhs_register": 1, "rhs_register": "zero"},
             "bytecode_id": 116,
         },
         {
             "instruction": "LOAD",
-            "metadata": {"register": 90, "value": 89},
+            "metadata": {"register": 1, "value": 2},
             "bytecode_id": 117,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 91, "value": 10},
+            "metadata": {"register": 2, "value": 10},
             "bytecode_id": 118,
         },
         {
             "instruction": "LT",
-            "metadata": {"register": 92, "lhs_register": 90, "rhs_register": 91},
+            "metadata": {"register": 3, "lhs_register": 1, "rhs_register": 2},
             "bytecode_id": 119,
         },
         {
             "instruction": "AND",
-            "metadata": {"register": 93, "lhs_register": 87, "rhs_register": 92},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": 3},
             "bytecode_id": 120,
         },
         {
             "instruction": "JZ",
-            "metadata": {"conditional_register": 93, "jump_size": 10},
+            "metadata": {"conditional_register": 1, "jump_size": 10},
             "bytecode_id": 121,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 94, "value": "0x8c"},
+            "metadata": {"register": 0, "value": 0x8c},
             "bytecode_id": 122,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 95, "lhs_register": 94, "rhs_register": "zero"},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 123,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 96, "value": "0x60"},
+            "metadata": {"register": 0, "value": 0x60},
             "bytecode_id": 124,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 97, "lhs_register": 96, "rhs_register": "zero"},
+            "metadata": {"register": 2, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 125,
         },
         {
             "instruction": "LOAD",
-            "metadata": {"register": 98, "value": 97},
+            "metadata": {"register": 0, "value": 2},
             "bytecode_id": 126,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 99, "value": 1},
+            "metadata": {"register": 2, "value": 1},
             "bytecode_id": 127,
         },
         {
             "instruction": "BITAND",
-            "metadata": {"register": 100, "lhs_register": 98, "rhs_register": 99},
+            "metadata": {"register": 3, "lhs_register": 0, "rhs_register": 2},
             "bytecode_id": 128,
         },
         {
             "instruction": "STORE",
-            "metadata": {"register": 95, "value": 100},
+            "metadata": {"register": 1, "value": 3},
             "bytecode_id": 129,
         },
         {
@@ -1393,102 +1394,102 @@ MACHINE_CODE = {
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 101, "value": "0x8c"},
+            "metadata": {"register": 0, "value": 0x8c},
             "bytecode_id": 131,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 102, "lhs_register": 101, "rhs_register": "zero"},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 132,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 103, "value": "0x60"},
+            "metadata": {"register": 0, "value": 0x60},
             "bytecode_id": 133,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 104, "lhs_register": 103, "rhs_register": "zero"},
+            "metadata": {"register": 2, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 134,
         },
         {
             "instruction": "LOAD",
-            "metadata": {"register": 105, "value": 104},
+            "metadata": {"register": 0, "value": 2},
             "bytecode_id": 135,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 106, "value": 1},
+            "metadata": {"register": 2, "value": 1},
             "bytecode_id": 136,
         },
         {
             "instruction": "BITOR",
-            "metadata": {"register": 107, "lhs_register": 105, "rhs_register": 106},
+            "metadata": {"register": 3, "lhs_register": 0, "rhs_register": 2},
             "bytecode_id": 137,
         },
         {
             "instruction": "STORE",
-            "metadata": {"register": 102, "value": 107},
+            "metadata": {"register": 1, "value": 3},
             "bytecode_id": 138,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 108, "value": "0x60"},
+            "metadata": {"register": 0, "value": 0x60},
             "bytecode_id": 139,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 109, "lhs_register": 108, "rhs_register": "zero"},
+            "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"},
             "bytecode_id": 140,
         },
         {
             "instruction": "LOAD",
-            "metadata": {"register": 110, "value": 109},
+            "metadata": {"register": 0, "value": 1},
             "bytecode_id": 141,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 111, "value": "0x8c"},
+            "metadata": {"register": 1, "value": 0x8c},
             "bytecode_id": 142,
         },
         {
             "instruction": "ADD",
-            "metadata": {"register": 112, "lhs_register": 111, "rhs_register": "zero"},
+            "metadata": {"register": 2, "lhs_register": 1, "rhs_register": "zero"},
             "bytecode_id": 143,
         },
         {
             "instruction": "LOAD",
-            "metadata": {"register": 113, "value": 112},
+            "metadata": {"register": 1, "value": 2},
             "bytecode_id": 144,
         },
         {
             "instruction": "MULT",
-            "metadata": {"register": 114, "lhs_register": 110, "rhs_register": 113},
+            "metadata": {"register": 2, "lhs_register": 0, "rhs_register": 1},
             "bytecode_id": 145,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 115, "value": 2},
+            "metadata": {"register": 0, "value": 2},
             "bytecode_id": 146,
         },
         {
             "instruction": "DIV",
-            "metadata": {"register": 116, "lhs_register": 114, "rhs_register": 115},
+            "metadata": {"register": 1, "lhs_register": 2, "rhs_register": 0},
             "bytecode_id": 147,
         },
         {
             "instruction": "CONSTANT",
-            "metadata": {"register": 117, "value": 1},
+            "metadata": {"register": 0, "value": 1},
             "bytecode_id": 148,
         },
         {
             "instruction": "RSHIFT",
-            "metadata": {"register": 118, "lhs_register": 116, "rhs_register": 117},
+            "metadata": {"register": 2, "lhs_register": 1, "rhs_register": 0},
             "bytecode_id": 149,
         },
         {
             "instruction": "MOV",
-            "metadata": {"register": "ret_value", "value": 118},
+            "metadata": {"register": "ret_value", "value": 2},
             "bytecode_id": 150,
         },
         {
@@ -5,6 +5,7 @@ from copy import deepcopy
 from pytest import fixture
 
 from src.abstract_syntax_tree import AbstractSyntaxTree
+from src.ast_nodes import ADD, CST, MULT
 from src.ast_nodes.basic.PROG import PROG
 from tests.unit.common import TOKENIZED_SOURCE_CODE
 
@@ -177,3 +178,32 @@ def test_build(capfd: fixture) -> None:
 
     expected_tree = EXPECTED_PRINT_TREE
     assert out == expected_tree
+
+
+def test_build_does_not_modify_source() -> None:
+    """Test that the `build` method does not modify the source code."""
+
+    _source = deepcopy(TOKENIZED_SOURCE_CODE)
+    ast = AbstractSyntaxTree(source_code=_source)
+    _ = ast.build()
+
+    assert _source == TOKENIZED_SOURCE_CODE
+
+
+def test_iter_certificate_label() -> None:
+    """Test that certificate labels are streamed in post-order."""
+
+    # 1 + 2 * 3
+    root = ADD(
+        lhs=CST({"value": 1, "type": "int"}),
+        rhs=MULT(
+            lhs=CST({"value": 2, "type": "int"}),
+            rhs=CST({"value": 3, "type": "int"}),
+        ),
+    )
+    root.certificate({})
+
+    expected_label = [(11, 2), (11, 3), (11, 4), (83,), (73,)]
+
+    assert list(root.iter_certificate_label()) == expected_label
+    assert root.get_certificate_label() == expected_label
@@ -1,6 +1,8 @@
 """Implement unit tests for the `src.certificators.backend` module."""
 
-from src.certificators import BackendCertificator
+from copy import deepcopy
+
+from src.certificators import BackendCertificator, Certificate
 from tests.unit.common import CERTIFICATE, MACHINE_CODE
 
 
@@ -9,7 +11,7 @@ def test_init() -> None:
 
     backend_certificator = BackendCertificator(program=MACHINE_CODE)
 
-    assert backend_certificator.computed_certificate == []
+    assert backend_certificator.computed_certificate == Certificate()
     assert backend_certificator.current_prime == 2
     assert backend_certificator.program == MACHINE_CODE
 
@@ -21,103 +23,109 @@ def test_init() -> None:
            4: {"prime": 7}
         },
         "variables": {
-            "0x28": {
+            0x28: {
                 "addresses": {
-                    "0x28": "int",
-                    "0x2c": "__unknown_type__",
+                    0x28: "int",
+                    0x2c: "__unknown_type__",
                 },
                 "prime": 2,
             },
-            "0x30": {
+            0x30: {
                 "addresses": {
-                    "0x30": "int",
+                    0x30: "int",
                 },
                 "prime": 3,
+                "parameter": True,
             },
-            "0x34": {
+            0x34: {
                 "addresses": {
-                    "0x34": "int",
+                    0x34: "int",
                 },
                 "prime": 5,
+                "parameter": True,
             },
-            "0x38": {
+            0x38: {
                 "addresses": {
-                    "0x38": "int",
+                    0x38: "int",
                 },
                 "prime": 7,
             },
-            "0x3c": {
+            0x3c: {
                 "addresses": {
-                    "0x3c": "float",
+                    0x3c: "float",
                 },
                 "prime": 11,
+                "parameter": True,
             },
-            "0x40": {
+            0x40: {
                 "addresses": {
-                    "0x40": "int",
+                    0x40: "int",
                 },
                 "prime": 13,
+                "parameter": True,
             },
-            "0x44": {
+            0x44: {
                 "addresses": {
-                    "0x44": "int",
+                    0x44: "int",
                 },
                 "prime": 17,
+                "parameter": True,
             },
-            "0x48": {
+            0x48: {
                 "addresses": {
-                    "0x48": "int",
+                    0x48: "int",
                 },
                 "prime": 19,
+                "parameter": True,
             },
-            "0x4c": {
+            0x4c: {
                 "addresses": {
-                    "0x4c": "int",
+                    0x4c: "int",
                 },
                 "prime": 23,
             },
-            "0x50": {
+            0x50: {
                 "addresses": {
-                    "0x50": "float",
+                    0x50: "float",
                 },
                 "prime": 29,
             },
-            "0x58": {
+            0x58: {
                 "addresses": {
-                    "0x58": "int",
-                    "0x5c": "__unknown_type__",
+                    0x58: "int",
+                    0x5c: "__unknown_type__",
                 },
                 "prime": 31,
             },
-            "0x60": {
+            0x60: {
                 "addresses": {
-                    "0x60": "int",
+                    0x60: "int",
                 },
                 "prime": 37,
             },
-            "0x64": {
+            0x64: {
                 "addresses": {
-                    "0x64": "__unknown_type__",
-                    "0x68": "__unknown_type__",
-                    "0x6c": "__unknown_type__",
-                    "0x70": "__unknown_type__",
-                    "0x74": "__unknown_type__",
-                    "0x78": "int",
-                    "0x7c": "__unknown_type__",
-                    "0x80": "__unknown_type__",
-                    "0x84": "__unknown_type__",
-                    "0x88": "__unknown_type__",
+                    0x64: "__unknown_type__",
+                    0x68: "__unknown_type__",
+                    0x6c: "__unknown_type__",
+                    0x70: "__unknown_type__",
+                    0x74: "__unknown_type__",
+                    0x78: "int",
+                    0x7c: "__unknown_type__",
+                    0x80: "__unknown_type__",
+                    0x84: "__unknown_type__",
+                    0x88: "__unknown_type__",
                 },
                 "prime": 41,
             },
-            "0x8c": {
+            0x8c: {
                 "addresses": {
-                    "0x8c": "int",
+                    0x8c: "int",
                 },
                 "prime": 43,
             },
         },
-        "stash": {101: ["41"]}
+        "stash": {101: [(41,)]}
     }
 
 
@@ -128,3 +136,43 @@ def test_init() -> None:
 #     backend_certificator.certificate()
 
 #     assert backend_certificator.get_certificate() == CERTIFICATE
+
+
+def test_def_use_index() -> None:
+    """Test the def-use index of the registers."""
+
+    backend_certificator = BackendCertificator(program=MACHINE_CODE)
+    bytecode_list = backend_certificator.bytecode_list
+
+    for definition_idx, uses in backend_certificator.definition_uses.items():
+        register = bytecode_list[definition_idx]["metadata"]["register"]
+
+        assert definition_idx in backend_certificator.register_definitions[register]
+
+        for use_idx in uses:
+            assert use_idx > definition_idx
+            assert backend_certificator._get_definition_index(
+                bytecode_idx=use_idx,
+                register=register
+            ) == definition_idx
+
+        assert backend_certificator._get_uses(
+            bytecode_idx=definition_idx,
+            register=register
+        ) == [
+            use_idx
+            for use_idx in uses
+            if use_idx > definition_idx
+        ]
+
+
+def test_program_is_not_modified() -> None:
+    """Test that the certification does not modify (nor copy) the program."""
+
+    program = deepcopy(MACHINE_CODE)
+
+    backend_certificator = BackendCertificator(program=program)
+    backend_certificator.certificate()
+
+    assert backend_certificator.program is program
+    assert program == MACHINE_CODE
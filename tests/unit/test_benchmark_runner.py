@@ -0,0 +1,128 @@
+"""Implement unit tests for the `src.benchmark_runner` module."""
+
+import pytest
+
+from src.benchmark_runner import BenchmarkRunner
+
+
+SOURCE_CODE = """
+int main() {
+    int i;
+    i = 10;
+
+    while (i) {
+        i = i - 1;
+    }
+
+    return 0;
+}
+"""
+
+
+def test_run(tmp_path) -> None:
+    """Test the `BenchmarkRunner.run` method."""
+
+    runner = BenchmarkRunner(
+        benchmarks={
+            "loop.ch": SOURCE_CODE,
+            "no_main.ch": "int f() { return 0; }",
+        },
+        repeats=3,
+        warmup=1
+    )
+
+    results = runner.run()
+
+    assert results["metadata"]["repeats"] == 3
+    assert results["metadata"]["warmup"] == 1
+
+    result = results["benchmarks"]["loop.ch"]
+
+    assert result["certificates_match"]
+
+    for stage in BenchmarkRunner.STAGES:
+        assert result[stage]["samples"] == 3
+        assert 0 < result[stage]["min"] <= result[stage]["median"] <= result[stage]["max"]
+
+    assert results["benchmarks"]["no_main.ch"] == {
+        "error": "SyntaxError: No main function found. Execution aborted."
+    }
+
+    path = str(tmp_path / "results.json")
+    runner.save(results, path)
+
+    assert runner.load(path) == results
+
+
+def test_from_directory(tmp_path) -> None:
+    """Test the `BenchmarkRunner.from_directory` method."""
+
+    (tmp_path / "loop.ch").write_text(SOURCE_CODE)
+    (tmp_path / "notes.txt").write_text("not a benchmark")
+
+    runner = BenchmarkRunner.from_directory(directory=str(tmp_path), repeats=2)
+
+    assert runner.benchmarks == {"loop.ch": SOURCE_CODE}
+    assert runner.repeats == 2
+
+    with pytest.raises(ValueError):
+        BenchmarkRunner(benchmarks={}, repeats=0)
+
+
+def test_measure_memory() -> None:
+    """Test the `BenchmarkRunner.measure_memory` method."""
+
+    runner = BenchmarkRunner(benchmarks={})
+    peaks = runner.measure_memory(SOURCE_CODE)
+
+    assert list(peaks) == BenchmarkRunner.STAGES
+    assert all(peak > 0 for peak in peaks.values())
+
+
+def test_get_memory_size() -> None:
+    """Test the `BenchmarkRunner.get_memory_size` method."""
+
+    assert BenchmarkRunner.get_memory_size({"data": {}}) == 1024
+    assert BenchmarkRunner.get_memory_size({"data": {0: 8, 2000: 32}}) == 2032
+
+
+def test_summarize() -> None:
+    """Test the `BenchmarkRunner.summarize` method."""
+
+    summary = BenchmarkRunner.summarize([1.0, 2.0, 3.0, 4.0, 10.0])
+
+    assert summary["median"] == 3.0
+    assert summary["mean"] == 4.0
+    assert summary["min"] == 1.0
+    assert summary["max"] == 10.0
+    assert summary["iqr"] == pytest.approx(5.5)
+    assert summary["samples"] == 5
+
+    assert BenchmarkRunner.summarize([2.0])["stdev"] == 0.0
+
+
+def test_compare() -> None:
+    """Test the `BenchmarkRunner.compare` method."""
+
+    def _results(median: float, iqr: float) -> dict:
+        return {
+            "benchmarks": {
+                "loop.ch": {
+                    stage: {"median": median, "iqr": iqr}
+                    for stage in BenchmarkRunner.STAGES
+                },
+                "failed.ch": {"error": "ZeroDivisionError: division by zero"},
+            }
+        }
+
+    baseline = _results(median=1.0, iqr=0.01)
+
+    assert BenchmarkRunner.compare(baseline, _results(median=1.05, iqr=0.01)) == []
+
+    # Slower, but within the spread of the timings
+    assert BenchmarkRunner.compare(baseline, _results(median=1.5, iqr=1.0)) == []
+
+    regressions = BenchmarkRunner.compare(baseline, _results(median=2.0, iqr=0.01))
+
+    assert [regression["stage"] for regression in regressions] == BenchmarkRunner.STAGES
+    assert regressions[0]["ratio"] == 2.0
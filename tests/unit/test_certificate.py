@@ -0,0 +1,92 @@
+"""Implement unit tests for the `src.certificators.certificate` module."""
+
+from src.certificators import Certificate
+
+
+CERTIFICATE = "2^((13)^(3)^(5))*3^((11)^(-3))*5^((11)^(2.5))*7^(67)"
+
+
+def test_from_exponents() -> None:
+    """Test the `Certificate.from_exponents` method."""
+
+    certificate = Certificate.from_exponents(
+        [(13, 3, 5), (11, -3), (11, 2.5), (67,)]
+    )
+
+    assert certificate.entries == (
+        (2, (13, 3, 5)),
+        (3, (11, -3)),
+        (5, (11, 2.5)),
+        (7, (67,)),
+    )
+    assert certificate == Certificate.from_string(CERTIFICATE)
+
+
+def test_str() -> None:
+    """Test rendering a Certificate to the string format."""
+
+    assert str(Certificate.from_string(CERTIFICATE)) == CERTIFICATE
+    assert str(Certificate()) == ""
+    assert Certificate.from_string("") == Certificate()
+
+
+def test_eq_and_hash() -> None:
+    """Test the equality comparison and the hashing of Certificates."""
+
+    certificate = Certificate.from_string(CERTIFICATE)
+    same_certificate = Certificate.from_string(CERTIFICATE)
+    other_certificate = Certificate.from_string("2^((13)^(3)^(5))*3^(67)")
+
+    assert certificate == same_certificate
+    assert hash(certificate) == hash(same_certificate)
+    assert certificate != other_certificate
+    assert certificate != CERTIFICATE
+
+    # `1` and `1.0` are different exponents
+    assert Certificate.from_string("2^((11)^(1))") != Certificate.from_string("2^((11)^(1.0))")
+
+
+def test_getitem() -> None:
+    """Test indexing and slicing Certificates."""
+
+    certificate = Certificate.from_string(CERTIFICATE)
+
+    assert len(certificate) == 4
+    assert certificate[0] == (2, (13, 3, 5))
+    assert list(certificate)[-1] == (7, (67,))
+
+    # Slices keep the positional primes
+    assert certificate[2:] == Certificate(((5, (11, 2.5)), (7, (67,))))
+    assert str(certificate[2:]) == "5^((11)^(2.5))*7^(67)"
+
+
+def test_matches() -> None:
+    """Test the `Certificate.matches` method."""
+
+    certificate = Certificate.from_string(CERTIFICATE)
+    same_certificate = Certificate.from_string(CERTIFICATE)
+    other_certificate = Certificate.from_string("2^((13)^(3)^(5))*3^(67)")
+
+    assert certificate.fingerprint() == same_certificate.fingerprint()
+    assert certificate.fingerprint() != other_certificate.fingerprint()
+
+    assert certificate.matches(same_certificate)
+    assert certificate.matches(same_certificate, strict=True)
+    assert not certificate.matches(other_certificate)
+    assert not certificate.matches(other_certificate, strict=True)
+
+
+def test_compose() -> None:
+    """Test the `Certificate.compose` method."""
+
+    certificate = Certificate.from_string(CERTIFICATE)
+
+    composed_certificate = Certificate.compose([
+        Certificate.from_exponents([(13, 3, 5)]),
+        Certificate(),
+        Certificate.from_exponents([(11, -3), (11, 2.5), (67,)]),
+    ])
+
+    assert composed_certificate == certificate
+    assert Certificate.compose([certificate[:2], certificate[2:]]) == certificate
+    assert Certificate.compose([]) == Certificate()
@@ -15,11 +15,13 @@ def test_init() -> None:
     assert cg.root == ABSTRACT_SYNTAX_TREE_ROOT
     assert cg.program == {
         "functions": {},
+        "function_table": {},
         "global_vars": [],
         "data": {},
         "code": []
     }
     assert cg.register == 0
+    assert cg.optimization_level == 0
 
 
 def test_generate_code() -> None:
@@ -65,6 +67,10 @@ def test_parse_functions() -> None:
 
     cg.parse_functions()
 
+    # The number of registers is only known after the allocation
+    cg.allocate_registers()
+
     expected_functions_indices = MACHINE_CODE["functions"]
 
     assert cg.program["functions"] == expected_functions_indices
+    assert cg.program["function_table"] == MACHINE_CODE["function_table"]
@@ -0,0 +1,162 @@
+"""Implement unit tests for the `src.optimizations.constant_folder` module."""
+
+import pytest
+
+from src.abstract_syntax_tree import AbstractSyntaxTree
+from src.ast_nodes import *
+from src.lexer import Lexer
+from src.optimizations import ConstantFolder
+from src.runner import create_instance
+
+
+SOURCE_CODE = """
+int main() {
+    int x;
+    float f;
+
+    x = (72 + 85) / 5;
+    f = 1.5 * 2;
+    x = x * 1 + 0;
+    f = x + 0;
+    x = 1 / 0;
+    x = !(1 && 0);
+
+    return 0 - 2;
+}
+"""
+
+
+def _get_statements() -> list[Node]:
+    """Build and fold the AST of `SOURCE_CODE`, and get its statements."""
+
+    ast = AbstractSyntaxTree(
+        source_code=Lexer(source_code=SOURCE_CODE).parse_source_code()
+    )
+    ast.build()
+
+    root = ConstantFolder(root=ast.get_root()).fold()
+    main: FUNC_DEF = root.children[0]
+
+    return main.statements.children
+
+
+def test_fold() -> None:
+    """Test the `ConstantFolder.fold` method."""
+
+    statements = _get_statements()
+
+    # x = (72 + 85) / 5
+    assert statements[2].rhs == CST(constant_metadata={"type": "int", "value": 31})
+
+    # f = 1.5 * 2
+    assert statements[3].rhs == CST(constant_metadata={"type": "float", "value": 3.0})
+    assert statements[3].rhs.get_type() == "float"
+
+    # x = !(1 && 0)
+    assert statements[7].rhs == CST(constant_metadata={"type": "int", "value": 1})
+
+    # return 0 - 2
+    assert statements[8].returned_value == CST(constant_metadata={"type": "int", "value": -2})
+
+
+def test_fold_identities() -> None:
+    """Test the simplification of algebraic identities."""
+
+    statements = _get_statements()
+
+    # x = x * 1 + 0
+    assert isinstance(statements[4].rhs, VAR)
+
+    # f = x + 0 (the assignment still casts `x` to float)
+    assert isinstance(statements[5].rhs, VAR)
+    assert statements[5].rhs.get_type() == "int"
+
+
+def test_fold_division_by_zero() -> None:
+    """Test that operations that fail at runtime are not folded."""
+
+    statements = _get_statements()
+
+    # x = 1 / 0
+    assert isinstance(statements[6].rhs, DIV)
+
+
+BOOLEAN_SOURCE_CODE = """
+int main() {
+    int x;
+    float y;
+    short s;
+
+    x = 2.0 < 3.5;
+    y = 2.0 == 2.0;
+    x = 1.5 && 0.0;
+    x = !(1.5 > 2.5);
+    s = 3;
+    s = s + (300 + 300);
+
+    return 0;
+}
+"""
+
+
+def test_fold_boolean_operations() -> None:
+    """Test that comparisons and logical operations fold into `int` constants."""
+
+    ast = AbstractSyntaxTree(
+        source_code=Lexer(source_code=BOOLEAN_SOURCE_CODE).parse_source_code()
+    )
+    ast.build()
+
+    root = ConstantFolder(root=ast.get_root()).fold()
+    statements = root.children[0].statements.children
+
+    # x = 2.0 < 3.5
+    assert statements[3].rhs == CST(constant_metadata={"type": "int", "value": 1})
+    assert isinstance(statements[3].rhs.get_value(), int)
+
+    # y = 2.0 == 2.0
+    assert statements[4].rhs == CST(constant_metadata={"type": "int", "value": 1})
+
+    # x = 1.5 && 0.0
+    assert statements[5].rhs == CST(constant_metadata={"type": "int", "value": 0})
+
+    # x = !(1.5 > 2.5)
+    assert statements[6].rhs == CST(constant_metadata={"type": "int", "value": 1})
+
+
+@pytest.mark.parametrize(
+    "optimization_level, trust_ast_optimizations", [(0, False), (2, False), (2, True)]
+)
+def test_fold_boolean_operations_certification(
+    optimization_level: int, trust_ast_optimizations: bool
+) -> None:
+    """Test the certification of folded comparisons and logical operations."""
+
+    instance = create_instance(
+        BOOLEAN_SOURCE_CODE,
+        optimization_level=optimization_level,
+        trust_ast_optimizations=trust_ast_optimizations
+    )
+    frontend_certificate, backend_certificate = instance.certificate()
+
+    assert frontend_certificate == backend_certificate
+
+    instance.run()
+
+    assert instance.get_vm().get_memory() == {0x0: 1, 0x4: 1.0, 0x8: 603}
+
+
+@pytest.mark.parametrize("trust_ast_optimizations", [False, True])
+def test_fold_only_if_trusted(trust_ast_optimizations: bool) -> None:
+    """Test that the AST is only folded if its optimizations are trusted."""
+
+    instance = create_instance(
+        SOURCE_CODE,
+        optimization_level=2,
+        trust_ast_optimizations=trust_ast_optimizations
+    )
+    main: FUNC_DEF = instance.get_ast().get_root().children[0]
+    statement = main.statements.children[2]
+
+    # x = (72 + 85) / 5
+    assert isinstance(statement.rhs, CST) == trust_ast_optimizations
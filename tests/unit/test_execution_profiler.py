@@ -0,0 +1,132 @@
+"""Implement unit tests for the `src.execution_profiler` module."""
+
+import pytest
+
+from src.execution_profiler import ExecutionProfiler
+from src.runner import create_instance
+from src.virtual_machine import VirtualMachine
+
+
+SOURCE_CODE = """
+int count(int n) {
+    int m;
+    int r;
+    r = 0;
+    if (n > 0) {
+        m = n - 1;
+        r = count(m) + 1;
+    }
+    return r;
+}
+
+int twice(int n) {
+    int r;
+    r = count(n) + count(n);
+    return r;
+}
+
+int main() {
+    int x;
+    int y;
+    x = 3;
+    y = twice(x);
+    return y;
+}
+"""
+
+
+@pytest.fixture
+def profiled_instance():
+    """Create an instance of `SOURCE_CODE`, and run it with profiling."""
+
+    instance = create_instance(SOURCE_CODE, profile=True)
+    instance.run()
+
+    return instance
+
+
+def test_counts(profiled_instance) -> None:
+    """Test the bytecode and opcode counts of the `ExecutionProfiler`."""
+
+    program = profiled_instance.get_program()
+    profiler = profiled_instance.get_vm().profiler
+
+    opcode_counts = profiler.get_opcode_counts()
+
+    assert sum(opcode_counts.values()) == sum(profiler.counts)
+    assert list(opcode_counts.values()) == sorted(opcode_counts.values(), reverse=True)
+
+    # `twice` calls `count` twice, that recurses from 3 down to 0
+    assert opcode_counts["JAL"] == 1 + 2 + 2 * 3
+    assert opcode_counts["HALT"] == 1
+
+    main_start = program["functions"]["main"]["start"]
+    assert profiler.counts[main_start] == 1
+
+    count_start = program["functions"]["count"]["start"]
+    assert profiler.counts[count_start] == 8
+
+
+def test_get_function_stats(profiled_instance) -> None:
+    """Test the `ExecutionProfiler.get_function_stats` method."""
+
+    profiler = profiled_instance.get_vm().profiler
+    function_stats = profiler.get_function_stats()
+
+    assert {name: stats["calls"] for name, stats in function_stats.items()} == {
+        "main": 1,
+        "twice": 1,
+        "count": 8,
+    }
+
+    assert sum(stats["instructions"] for stats in function_stats.values()) == (
+        sum(profiler.counts) - 1  # The final `HALT` is not in any function
+    )
+
+    main_stats = function_stats["main"]
+    exclusive_time = sum(stats["exclusive_time"] for stats in function_stats.values())
+
+    assert main_stats["inclusive_time"] == pytest.approx(exclusive_time)
+
+    # Recursive calls are only accounted once in the inclusive time
+    count_stats = function_stats["count"]
+    assert count_stats["inclusive_time"] == pytest.approx(count_stats["exclusive_time"])
+    assert count_stats["inclusive_time"] <= function_stats["twice"]["inclusive_time"]
+
+    assert profiler.call_stack == []
+
+
+def test_annotated_listing(profiled_instance) -> None:
+    """Test the listing annotated with `ExecutionProfiler.get_annotations`."""
+
+    code_generator = profiled_instance.get_code_generator()
+    profiler = profiled_instance.get_vm().profiler
+
+    annotations = profiler.get_annotations()
+    listing = code_generator.format(annotations)
+
+    assert len(annotations) == len(profiled_instance.get_program()["code"])
+    assert listing.splitlines()[:2] == str(code_generator).splitlines()[:2]
+    assert annotations[0] in listing
+
+    assert code_generator.format() == str(code_generator)
+
+    report = profiler.format()
+
+    assert "JAL" in report
+    assert "twice" in report
+
+
+def test_profiling_disabled() -> None:
+    """Test that the `VirtualMachine` does not profile by default."""
+
+    instance = create_instance(SOURCE_CODE)
+    instance.run()
+
+    assert instance.get_vm().profiler is None
+
+    profiled_vm = VirtualMachine(program=instance.get_program(), profile=True)
+    profiled_vm.run()
+
+    assert isinstance(profiled_vm.profiler, ExecutionProfiler)
+    assert profiled_vm.get_memory() == instance.get_vm().get_memory()
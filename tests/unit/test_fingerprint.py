@@ -0,0 +1,59 @@
+"""Implement unit tests for the `src.certificators.fingerprint` module."""
+
+from src.certificators.fingerprint import (
+    FINGERPRINT_MODULI,
+    compute_fingerprint,
+    power_tower_mod,
+    totient,
+)
+
+
+def test_compute_fingerprint() -> None:
+    """Test the `compute_fingerprint` function."""
+
+    # 2^(3^2) * 3^5
+    entries = [(2, (3, 2)), (3, (5,))]
+    godel_number = 2**9 * 3**5
+
+    assert compute_fingerprint(entries) == tuple(
+        godel_number % modulus for modulus in FINGERPRINT_MODULI
+    )
+    assert compute_fingerprint(entries, moduli=(97,)) == (godel_number % 97,)
+    assert compute_fingerprint([]) == (1,) * len(FINGERPRINT_MODULI)
+
+
+def test_compute_fingerprint_non_natural() -> None:
+    """Test that negative and floating point exponents are told apart."""
+
+    fingerprints = [
+        compute_fingerprint([(2, (11, exponent))])
+        for exponent in [1, -1, 1.0, -1.0]
+    ]
+
+    assert len(set(fingerprints)) == len(fingerprints)
+
+
+def test_power_tower_mod() -> None:
+    """Test the `power_tower_mod` function."""
+
+    # Small towers are computed exactly
+    assert power_tower_mod((2, 3, 2), 1000) == 2**9 % 1000
+    assert power_tower_mod((2, 0, 5), 7) == 1
+    assert power_tower_mod((0, 0), 7) == 1
+    assert power_tower_mod((5,), 3) == 2
+    assert power_tower_mod((5, 2), 1) == 0
+
+    # Large towers have their exponents reduced, even if the base and the
+    # modulus are not coprime
+    assert power_tower_mod((2, 2, 2, 2, 2), 1000) == pow(2, 2**16, 1000)
+    assert power_tower_mod((3, 2, 70), 1000) == pow(3, 2**70, 1000)
+    assert power_tower_mod((6, 4, 33), 10**9) == pow(6, 4**33, 10**9)
+
+
+def test_totient() -> None:
+    """Test the `totient` function."""
+
+    assert totient(1) == 1
+    assert totient(7) == 6
+    assert totient(36) == 12
+    assert totient(1000) == 400
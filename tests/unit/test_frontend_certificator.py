@@ -1,6 +1,6 @@
 """Implement unit tests for the `src.certificators.frontend` module."""
 
-from src.certificators import FrontendCertificator
+from src.certificators import Certificate, FrontendCertificator
 from tests.unit.common import ABSTRACT_SYNTAX_TREE, CERTIFICATE
 
 
@@ -9,7 +9,7 @@ def test_init() -> None:
 
     frontend_certificator = FrontendCertificator(ast=ABSTRACT_SYNTAX_TREE)
 
-    assert frontend_certificator.computed_certificate == []
+    assert frontend_certificator.computed_certificate == Certificate()
     assert frontend_certificator.current_prime == 2
     assert frontend_certificator.ast == ABSTRACT_SYNTAX_TREE
 
@@ -0,0 +1,145 @@
+"""Implement unit tests for the `src.instrumentation` package."""
+
+import json
+
+import pytest
+
+from src.instrumentation import (
+    AbstractSubscriber,
+    Instrumentation,
+    JSONLinesSubscriber,
+    StageEvent,
+    SummarySubscriber
+)
+
+
+class RecordingSubscriber(AbstractSubscriber):
+    """Subscriber that records every event."""
+
+    def __init__(self) -> None:
+        self.events: list[StageEvent] = []
+
+    def on_event(self, event: StageEvent) -> None:
+        self.events.append(event)
+
+
+def test_stage_without_subscribers() -> None:
+    """Test that stages are not instrumented when there are no subscribers."""
+
+    instrumentation = Instrumentation()
+
+    assert instrumentation.stage("lex") is instrumentation.stage("run")
+
+    subscriber = instrumentation.subscribe(RecordingSubscriber())
+    instrumentation.unsubscribe(subscriber)
+
+    with instrumentation.stage("lex"):
+        pass
+
+    assert subscriber.events == []
+
+    with pytest.raises(ValueError):
+        instrumentation.unsubscribe(subscriber)
+
+
+def test_stage() -> None:
+    """Test the events emitted by `Instrumentation.stage`."""
+
+    instrumentation = Instrumentation()
+    subscriber = instrumentation.subscribe(RecordingSubscriber())
+
+    with instrumentation.stage("codegen"):
+        with instrumentation.stage("run"):
+            data = [0] * 100_000
+
+        del data
+
+    assert [(event.stage, event.kind) for event in subscriber.events] == [
+        ("codegen", StageEvent.START),
+        ("run", StageEvent.START),
+        ("run", StageEvent.END),
+        ("codegen", StageEvent.END),
+    ]
+
+    start_event, _, run_event, codegen_event = subscriber.events
+
+    assert start_event.memory_peak is None
+    assert run_event.wall_time > 0
+
+    # The peak of the enclosing stage accounts for the nested one
+    assert run_event.memory_peak >= 800_000
+    assert codegen_event.memory_peak >= run_event.memory_peak
+    assert codegen_event.wall_time >= run_event.wall_time
+
+
+def test_stage_raises() -> None:
+    """Test that the end event is emitted even if the stage raises."""
+
+    instrumentation = Instrumentation(trace_memory=False)
+    subscriber = instrumentation.subscribe(RecordingSubscriber())
+
+    with pytest.raises(ZeroDivisionError):
+        with instrumentation.stage("run"):
+            1 / 0
+
+    assert [event.kind for event in subscriber.events] == [StageEvent.START, StageEvent.END]
+    assert subscriber.events[-1].memory_peak is None
+
+
+def test_summary_subscriber() -> None:
+    """Test the `SummarySubscriber` class."""
+
+    summary = SummarySubscriber()
+
+    for wall_time, memory_peak in [(1.0, 100), (2.0, 300)]:
+        summary.on_event(StageEvent("lex", StageEvent.START, timestamp=0.0))
+        summary.on_event(
+            StageEvent(
+                "lex",
+                StageEvent.END,
+                timestamp=0.0,
+                wall_time=wall_time,
+                cpu_time=0.5,
+                memory_peak=memory_peak
+            )
+        )
+
+    summary.on_event(StageEvent("run", StageEvent.END, timestamp=0.0, wall_time=3.0))
+
+    assert summary.get_summary() == {
+        "lex": {"calls": 2, "wall_time": 3.0, "cpu_time": 1.0, "memory_peak": 300},
+        "run": {"calls": 1, "wall_time": 3.0, "cpu_time": 0.0, "memory_peak": None},
+    }
+
+    table = summary.format().splitlines()
+
+    assert len(table) == 3
+    assert table[1].split() == ["lex", "2", "3000.000", "1000.000", "0.3"]
+    assert table[2].split()[-1] == "-"
+
+
+def test_json_lines_subscriber(tmp_path) -> None:
+    """Test the `JSONLinesSubscriber` class."""
+
+    path = str(tmp_path / "trace.jsonl")
+
+    instrumentation = Instrumentation(trace_memory=False)
+    instrumentation.subscribe(JSONLinesSubscriber(path))
+
+    for stage in ["lex", "run"]:
+        with instrumentation.stage(stage):
+            pass
+
+    with open(path, "r") as trace_file:
+        events = [json.loads(line) for line in trace_file]
+
+    assert [(event["stage"], event["kind"]) for event in events] == [
+        ("lex", "start"),
+        ("lex", "end"),
+        ("run", "start"),
+        ("run", "end"),
+    ]
+
+    assert set(events[0]) == {
+        "stage", "kind", "timestamp", "wall_time", "cpu_time", "memory_peak"
+    }
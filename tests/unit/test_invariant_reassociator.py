@@ -0,0 +1,57 @@
+"""Implement unit tests for the `src.optimizations.invariant_reassociator` module."""
+
+from src.abstract_syntax_tree import AbstractSyntaxTree
+from src.ast_nodes import *
+from src.lexer import Lexer
+from src.optimizations import InvariantReassociator
+
+
+SOURCE_CODE = """
+int main() {
+    int i;
+    int x;
+    int avg;
+    int scaled;
+
+    x = i + avg + scaled;
+
+    while (i < 5) {
+        x = i + avg + scaled;
+        x = avg + i + scaled;
+        i = i + 1;
+    }
+
+    return 0;
+}
+"""
+
+
+def test_reassociate() -> None:
+    """Test the `InvariantReassociator.reassociate` method."""
+
+    ast = AbstractSyntaxTree(
+        source_code=Lexer(source_code=SOURCE_CODE).parse_source_code()
+    )
+    ast.build()
+
+    root = InvariantReassociator(root=ast.get_root()).reassociate()
+    statements = root.children[0].statements.children
+
+    # Expressions outside loops are kept as they are: (i + avg) + scaled
+    expression = statements[4].rhs
+    assert isinstance(expression.lhs, ADD)
+    assert isinstance(expression.rhs, VAR)
+
+    loop: WHILE = statements[5]
+    loop_statements = loop.statement_if_true.children
+
+    # i + (avg + scaled)
+    expression = loop_statements[0].rhs
+    assert isinstance(expression.lhs, VAR)
+    assert expression.lhs.get_id() == statements[0].get_value()
+    assert isinstance(expression.rhs, ADD)
+
+    # (avg + i) + scaled: `avg + i` is not invariant
+    expression = loop_statements[1].rhs
+    assert isinstance(expression.lhs, ADD)
+    assert isinstance(expression.rhs, VAR)
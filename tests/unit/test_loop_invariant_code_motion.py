@@ -0,0 +1,139 @@
+"""Implement unit tests for the `src.optimizations.loop_invariant_code_motion` module."""
+
+from copy import deepcopy
+
+from src.optimizations import LoopInvariantCodeMotion
+
+
+# int main() { while (i < 3) { x = a + b; i = i + 1; } }
+PROGRAM = {
+    "functions": {
+        "main": {"start": 0, "end": 14, "parameters": 0},
+    },
+    "function_table": {1: 0},
+    "global_vars": [],
+    "data": {0: 4, 4: 4, 8: 4, 12: 4},
+    "code": [
+        {"instruction": "LOADA", "metadata": {"register": 0, "address": 0}},
+        {"instruction": "CONSTANT", "metadata": {"register": 1, "value": 3}},
+        {"instruction": "LT", "metadata": {"register": 2, "lhs_register": 0, "rhs_register": 1}},
+        {"instruction": "JZ", "metadata": {"conditional_register": 2, "jump_size": 10}},
+        {"instruction": "LOADA", "metadata": {"register": 3, "address": 4}},
+        {"instruction": "LOADA", "metadata": {"register": 4, "address": 8}},
+        {"instruction": "ADD", "metadata": {"register": 5, "lhs_register": 3, "rhs_register": 4}},
+        {"instruction": "STOREA", "metadata": {"address": 12, "value": 5}},
+        {"instruction": "LOADA", "metadata": {"register": 6, "address": 0}},
+        {"instruction": "CONSTANT", "metadata": {"register": 7, "value": 1}},
+        {"instruction": "ADD", "metadata": {"register": 8, "lhs_register": 6, "rhs_register": 7}},
+        {"instruction": "STOREA", "metadata": {"address": 0, "value": 8}},
+        {"instruction": "JZ", "metadata": {"conditional_register": "zero", "jump_size": -12}},
+        {"instruction": "JR", "metadata": {"register": "ret_address"}},
+        {"instruction": "HALT", "metadata": {}},
+    ],
+}
+
+
+def test_optimize() -> None:
+    """Test the `LoopInvariantCodeMotion.optimize` method."""
+
+    optimized_program = LoopInvariantCodeMotion(program=deepcopy(PROGRAM)).optimize()
+
+    assert optimized_program["code"] == [
+        # Pre-header
+        {"instruction": "LOADA", "metadata": {"register": 3, "address": 4}},
+        {"instruction": "LOADA", "metadata": {"register": 4, "address": 8}},
+        {"instruction": "ADD", "metadata": {"register": 9, "lhs_register": 3, "rhs_register": 4}},
+
+        # Loop
+        {"instruction": "LOADA", "metadata": {"register": 0, "address": 0}},
+        {"instruction": "CONSTANT", "metadata": {"register": 1, "value": 3}},
+        {"instruction": "LT", "metadata": {"register": 2, "lhs_register": 0, "rhs_register": 1}},
+        {"instruction": "JZ", "metadata": {"conditional_register": 2, "jump_size": 8}},
+        {"instruction": "MOV", "metadata": {"register": 5, "value": 9, "hoisted": True}},
+        {"instruction": "STOREA", "metadata": {"address": 12, "value": 5}},
+        {"instruction": "LOADA", "metadata": {"register": 6, "address": 0}},
+        {"instruction": "CONSTANT", "metadata": {"register": 7, "value": 1}},
+        {"instruction": "ADD", "metadata": {"register": 8, "lhs_register": 6, "rhs_register": 7}},
+        {"instruction": "STOREA", "metadata": {"address": 0, "value": 8}},
+        {"instruction": "JZ", "metadata": {"conditional_register": "zero", "jump_size": -10}},
+        {"instruction": "JR", "metadata": {"register": "ret_address"}},
+        {"instruction": "HALT", "metadata": {}},
+    ]
+
+    assert optimized_program["functions"] == {
+        "main": {"start": 0, "end": 15, "parameters": 0},
+    }
+    assert optimized_program["function_table"] == {1: 0}
+
+
+def test_optimize_written_variable() -> None:
+    """Test that reads of variables written by the loop are not hoisted."""
+
+    program = deepcopy(PROGRAM)
+
+    # while (i < 3) { b = a + b; i = i + 1; }
+    program["code"][7] = {"instruction": "STOREA", "metadata": {"address": 8, "value": 5}}
+    expected_code = deepcopy(program["code"])
+
+    optimized_program = LoopInvariantCodeMotion(program=program).optimize()
+
+    assert optimized_program["code"] == expected_code
+
+
+def test_optimize_unsafe_division() -> None:
+    """Test that divisions by non-constant values are not hoisted."""
+
+    program = deepcopy(PROGRAM)
+
+    # while (i < 3) { x = a / b; i = i + 1; }
+    program["code"][6] = {"instruction": "DIV", "metadata": {"register": 5, "lhs_register": 3, "rhs_register": 4}}
+    expected_code = deepcopy(program["code"])
+
+    optimized_program = LoopInvariantCodeMotion(program=program).optimize()
+
+    assert optimized_program["code"] == expected_code
+
+
+def test_optimize_reassociation() -> None:
+    """Test that the invariant operands of a chain of additions are hoisted."""
+
+    program = deepcopy(PROGRAM)
+
+    # while (i < 3) { x = i + a + b; i = i + 1; }
+    program["code"][4:7] = [
+        {"instruction": "LOADA", "metadata": {"register": 3, "address": 0}},
+        {"instruction": "LOADA", "metadata": {"register": 4, "address": 4}},
+        {"instruction": "ADD", "metadata": {"register": 9, "lhs_register": 3, "rhs_register": 4}},
+        {"instruction": "LOADA", "metadata": {"register": 10, "address": 8}},
+        {"instruction": "ADD", "metadata": {"register": 5, "lhs_register": 9, "rhs_register": 10}},
+    ]
+    program["code"][3]["metadata"]["jump_size"] = 12
+    program["code"][-3]["metadata"]["jump_size"] = -14
+    program["functions"]["main"]["end"] = 16
+
+    optimized_program = LoopInvariantCodeMotion(program=program).optimize()
+
+    assert optimized_program["code"][:12] == [
+        # Pre-header
+        {"instruction": "LOADA", "metadata": {"register": 4, "address": 4}},
+        {"instruction": "LOADA", "metadata": {"register": 10, "address": 8}},
+        {"instruction": "ADD", "metadata": {"register": 11, "lhs_register": 4, "rhs_register": 10}},
+
+        # Loop
+        {"instruction": "LOADA", "metadata": {"register": 0, "address": 0}},
+        {"instruction": "CONSTANT", "metadata": {"register": 1, "value": 3}},
+        {"instruction": "LT", "metadata": {"register": 2, "lhs_register": 0, "rhs_register": 1}},
+        {"instruction": "JZ", "metadata": {"conditional_register": 2, "jump_size": 10}},
+        {"instruction": "LOADA", "metadata": {"register": 3, "address": 0}},
+        {
+            "instruction": "MOV",
+            "metadata": {"register": 9, "value": 11, "hoisted": True, "reassociated_operands": 2},
+        },
+        {"instruction": "ADD", "metadata": {"register": 5, "lhs_register": 3, "rhs_register": 9}},
+        {"instruction": "STOREA", "metadata": {"address": 12, "value": 5}},
+        {"instruction": "LOADA", "metadata": {"register": 6, "address": 0}},
+    ]
+    assert optimized_program["code"][15] == {
+        "instruction": "JZ",
+        "metadata": {"conditional_register": "zero", "jump_size": -12},
+    }
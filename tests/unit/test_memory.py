@@ -0,0 +1,99 @@
+"""Implement unit tests for the `src.memory.Memory` class."""
+
+import pickle
+
+from src.memory import Memory
+
+
+def test_init() -> None:
+    """Test the instantiation of Memory objects."""
+
+    memory = Memory(size=16)
+
+    assert memory.size == 16
+    assert len(memory.integers) == 16
+    assert len(memory.floats) == 16
+    assert memory.types == bytearray(16)
+    assert list(memory.items()) == []
+
+
+def test_getitem_setitem() -> None:
+    """Test reading and writing values of different types."""
+
+    memory = Memory(size=16)
+
+    memory[0x0] = 123
+    memory[0x4] = 2.5
+    memory[0x8] = 0
+
+    assert memory[0x0] == 123
+    assert memory[0x4] == 2.5
+    assert isinstance(memory[0x4], float)
+    assert memory[0x8] == 0
+    assert memory[0xC] is None
+
+
+def test_items() -> None:
+    """Test the `Memory.items` method."""
+
+    memory = Memory(size=16)
+
+    memory[0x8] = -7
+    memory[0x0] = 1.0
+
+    assert list(memory.items()) == [(0x0, 1.0), (0x8, -7)]
+
+
+def test_eq() -> None:
+    """Test the equality comparison between Memory instances."""
+
+    memory = Memory(size=8)
+    other_memory = Memory(size=8)
+
+    assert memory == other_memory
+
+    memory[0x4] = 0
+    assert memory != other_memory
+
+    other_memory[0x4] = 0
+    assert memory == other_memory
+
+
+def test_pickle() -> None:
+    """Test pickling Memory instances (e.g., to send them to other processes)."""
+
+    memory = Memory(size=16)
+
+    memory[0x8] = -7
+    memory[0x0] = 1.5
+
+    unpickled_memory = pickle.loads(pickle.dumps(memory))
+
+    assert unpickled_memory == memory
+
+    unpickled_memory[0x4] = 2.5
+    assert unpickled_memory[0x4] == 2.5
+
+
+def test_big_integers() -> None:
+    """Test storing integers that do not fit in 64 bits."""
+
+    memory = Memory(size=8)
+
+    memory[0x0] = 2**70
+    memory[0x4] = -(2**63) - 1
+
+    assert memory[0x0] == 2**70
+    assert memory[0x4] == -(2**63) - 1
+    assert memory.types[0x0] == Memory.BIG_INT
+    assert dict(memory.items()) == {0x0: 2**70, 0x4: -(2**63) - 1}
+
+    unpickled_memory = pickle.loads(pickle.dumps(memory))
+    assert unpickled_memory == memory
+
+    # Overwritten big integers are gone
+    memory[0x0] = 3
+
+    assert memory[0x0] == 3
+    assert memory.get_big_integers() == {0x4: -(2**63) - 1}
+    assert memory != unpickled_memory
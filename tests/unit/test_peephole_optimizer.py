@@ -0,0 +1,226 @@
+"""Implement unit tests for the `src.optimizations` module."""
+
+from src.optimizations import (
+    AbsoluteLoadRule,
+    AbsoluteStoreRule,
+    ConstantCopyRule,
+    PeepholeOptimizer
+)
+
+
+def _get_register_uses(code: list[dict[str, dict]]) -> dict[int, list[int]]:
+    """Compute the uses of each register of `code`."""
+
+    return PeepholeOptimizer._compute_register_uses(code)
+
+
+def test_absolute_load_rule() -> None:
+    """Test the `AbsoluteLoadRule.match` method."""
+
+    code = [
+        {"instruction": "CONSTANT", "metadata": {"register": 0, "value": 8}},
+        {"instruction": "ADD", "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"}},
+        {"instruction": "LOAD", "metadata": {"register": 2, "value": 1}},
+        {"instruction": "MOV", "metadata": {"register": "ret_value", "value": 2}},
+    ]
+
+    rewrite = AbsoluteLoadRule().match(
+        code=code,
+        bytecode_idx=0,
+        register_uses=_get_register_uses(code)
+    )
+
+    assert rewrite == {
+        0: None,
+        1: None,
+        2: {"instruction": "LOADA", "metadata": {"register": 2, "address": 8}},
+    }
+
+    # There is no pattern starting at the `ADD`
+    rewrite = AbsoluteLoadRule().match(
+        code=code,
+        bytecode_idx=1,
+        register_uses=_get_register_uses(code)
+    )
+
+    assert rewrite is None
+
+
+def test_absolute_load_rule_short_with_offset() -> None:
+    """Test the `AbsoluteLoadRule.match` method with a `short` attribute."""
+
+    code = [
+        {"instruction": "CONSTANT", "metadata": {"register": 0, "value": 8}},
+        {"instruction": "ADD", "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"}},
+        {"instruction": "CONSTANT", "metadata": {"register": 2, "value": 4}},
+        {"instruction": "ADD", "metadata": {"register": 3, "lhs_register": 1, "rhs_register": 2}},
+        {"instruction": "LOAD", "metadata": {"register": 4, "value": 3}},
+        {"instruction": "TRUNC", "metadata": {"register": 5, "value": 4}},
+        {"instruction": "MOV", "metadata": {"register": "ret_value", "value": 5}},
+    ]
+
+    rewrite = AbsoluteLoadRule().match(
+        code=code,
+        bytecode_idx=0,
+        register_uses=_get_register_uses(code)
+    )
+
+    assert rewrite == {
+        0: None,
+        1: None,
+        2: None,
+        3: None,
+        4: None,
+        5: {"instruction": "LOADSA", "metadata": {"register": 5, "address": 12}},
+    }
+
+
+def test_absolute_store_rule() -> None:
+    """Test the `AbsoluteStoreRule.match` method."""
+
+    code = [
+        {"instruction": "CONSTANT", "metadata": {"register": 0, "value": 8}},
+        {"instruction": "ADD", "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"}},
+        {"instruction": "CONSTANT", "metadata": {"register": 2, "value": 1.5}},
+        {"instruction": "STOREF", "metadata": {"register": 1, "value": 2}},
+    ]
+
+    rewrite = AbsoluteStoreRule().match(
+        code=code,
+        bytecode_idx=0,
+        register_uses=_get_register_uses(code)
+    )
+
+    assert rewrite == {
+        0: None,
+        1: None,
+        3: {"instruction": "STOREFA", "metadata": {"address": 8, "value": 2}},
+    }
+
+
+def test_absolute_store_rule_parameter() -> None:
+    """Test that `AbsoluteStoreRule` does not fuse stores of parameters."""
+
+    code = [
+        {"instruction": "CONSTANT", "metadata": {"register": 0, "value": 8}},
+        {"instruction": "ADD", "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"}},
+        {"instruction": "STORE", "metadata": {"register": 1, "value": "arg", "argument": 0}},
+    ]
+
+    rewrite = AbsoluteStoreRule().match(
+        code=code,
+        bytecode_idx=0,
+        register_uses=_get_register_uses(code)
+    )
+
+    assert rewrite is None
+
+
+def test_constant_copy_rule() -> None:
+    """Test the `ConstantCopyRule.match` method."""
+
+    code = [
+        {"instruction": "CONSTANT", "metadata": {"register": 0, "value": 8}},
+        {"instruction": "ADD", "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"}},
+        {"instruction": "CONSTANT", "metadata": {"register": 2, "value": 5}},
+        {"instruction": "MOV", "metadata": {"register": "arg", "value": 2, "argument": 0}},
+        {"instruction": "CONSTANT", "metadata": {"register": 3, "value": 0}},
+        {"instruction": "MOV", "metadata": {"register": "ret_value", "value": 3}},
+    ]
+
+    register_uses = _get_register_uses(code)
+
+    assert ConstantCopyRule().match(
+        code=code,
+        bytecode_idx=0,
+        register_uses=register_uses
+    ) == {
+        0: None,
+        1: {"instruction": "CONSTANT", "metadata": {"register": 1, "value": 8}},
+    }
+
+    assert ConstantCopyRule().match(
+        code=code,
+        bytecode_idx=2,
+        register_uses=register_uses
+    ) == {
+        2: None,
+        3: {"instruction": "CONSTANT", "metadata": {"register": "arg", "argument": 0, "value": 5}},
+    }
+
+    assert ConstantCopyRule().match(
+        code=code,
+        bytecode_idx=4,
+        register_uses=register_uses
+    ) == {
+        4: None,
+        5: {"instruction": "CONSTANT", "metadata": {"register": "ret_value", "value": 0}},
+    }
+
+    # There is no pattern starting at the `ADD`
+    assert ConstantCopyRule().match(
+        code=code,
+        bytecode_idx=1,
+        register_uses=register_uses
+    ) is None
+
+
+def test_optimize() -> None:
+    """Test the `PeepholeOptimizer.optimize` method."""
+
+    # int f() { while (x < 3) { x = (x < 3); } }
+    # int main() { return f(); }
+    program = {
+        "functions": {
+            "f": {"start": 0, "end": 12, "parameters": 0},
+            "main": {"start": 12, "end": 15, "parameters": 0},
+        },
+        "function_table": {1: 0, 2: 12},
+        "global_vars": [],
+        "data": {0: 4},
+        "code": [
+            {"instruction": "CONSTANT", "metadata": {"register": 0, "value": 0}},
+            {"instruction": "ADD", "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"}},
+            {"instruction": "LOAD", "metadata": {"register": 2, "value": 1}},
+            {"instruction": "CONSTANT", "metadata": {"register": 3, "value": 3}},
+            {"instruction": "LT", "metadata": {"register": 4, "lhs_register": 2, "rhs_register": 3}},
+            {"instruction": "JZ", "metadata": {"conditional_register": 4, "jump_size": 6}},
+            {"instruction": "CONSTANT", "metadata": {"register": 5, "value": 0}},
+            {"instruction": "ADD", "metadata": {"register": 6, "lhs_register": 5, "rhs_register": "zero"}},
+            {"instruction": "MOV", "metadata": {"register": 7, "value": 4}},
+            {"instruction": "STORE", "metadata": {"register": 6, "value": 7}},
+            {"instruction": "JZ", "metadata": {"conditional_register": "zero", "jump_size": -10}},
+            {"instruction": "JR", "metadata": {"register": "ret_address"}},
+            {"instruction": "JAL", "metadata": {"value": 1}},
+            {"instruction": "MOV", "metadata": {"register": 0, "value": "ret_value"}},
+            {"instruction": "JR", "metadata": {"register": "ret_address"}},
+            {"instruction": "HALT", "metadata": {}},
+        ],
+    }
+
+    optimizer = PeepholeOptimizer(
+        program=program,
+        rules=[AbsoluteLoadRule(), AbsoluteStoreRule()]
+    )
+    optimized_program = optimizer.optimize()
+
+    assert optimized_program["code"] == [
+        {"instruction": "LOADA", "metadata": {"register": 2, "address": 0}},
+        {"instruction": "CONSTANT", "metadata": {"register": 3, "value": 3}},
+        {"instruction": "LT", "metadata": {"register": 4, "lhs_register": 2, "rhs_register": 3}},
+        {"instruction": "JZ", "metadata": {"conditional_register": 4, "jump_size": 4}},
+        {"instruction": "MOV", "metadata": {"register": 7, "value": 4}},
+        {"instruction": "STOREA", "metadata": {"address": 0, "value": 7}},
+        {"instruction": "JZ", "metadata": {"conditional_register": "zero", "jump_size": -6}},
+        {"instruction": "JR", "metadata": {"register": "ret_address"}},
+        {"instruction": "JAL", "metadata": {"value": 1}},
+        {"instruction": "MOV", "metadata": {"register": 0, "value": "ret_value"}},
+        {"instruction": "JR", "metadata": {"register": "ret_address"}},
+        {"instruction": "HALT", "metadata": {}},
+    ]
+
+    assert optimized_program["functions"] == {
+        "f": {"start": 0, "end": 8, "parameters": 0},
+        "main": {"start": 8, "end": 11, "parameters": 0},
+    }
+    assert optimized_program["function_table"] == {1: 0, 2: 8}
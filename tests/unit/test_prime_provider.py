@@ -0,0 +1,67 @@
+"""Implement unit tests for the `src.prime_provider.PrimeProvider` class."""
+
+import pytest
+
+from src.prime_provider import PrimeProvider
+
+
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71]
+
+
+def test_get_primes() -> None:
+    """Test the `PrimeProvider.get_primes` method."""
+
+    # Small segments, so the table grows several times
+    prime_provider = PrimeProvider(segment_size=8)
+
+    assert prime_provider.get_primes(0) == []
+    assert prime_provider.get_primes(5) == PRIMES[:5]
+    assert prime_provider.get_primes(len(PRIMES)) == PRIMES
+
+    # The table is only extended, and never recomputed
+    assert prime_provider.primes[:len(PRIMES)] == PRIMES
+    assert prime_provider.get_primes(3) == PRIMES[:3]
+
+
+def test_get_primes_large() -> None:
+    """Test the `PrimeProvider.get_primes` method with many primes."""
+
+    primes = PrimeProvider(segment_size=100).get_primes(10000)
+
+    assert len(primes) == 10000
+    assert primes[-1] == 104729
+    assert primes == sorted(set(primes))
+
+
+def test_is_prime() -> None:
+    """Test the `PrimeProvider.is_prime` method."""
+
+    prime_provider = PrimeProvider(segment_size=8)
+
+    assert [number for number in range(-5, 72) if prime_provider.is_prime(number)] == PRIMES
+    assert prime_provider.is_prime(7919)
+    assert not prime_provider.is_prime(7917)
+
+
+def test_next_prime() -> None:
+    """Test the `PrimeProvider.next_prime` method."""
+
+    prime_provider = PrimeProvider(segment_size=8)
+
+    assert prime_provider.next_prime(-10) == 2
+    assert prime_provider.next_prime(2) == 3
+    assert prime_provider.next_prime(24) == 29
+    assert prime_provider.next_prime(7907) == 7919
+
+
+def test_previous_prime() -> None:
+    """Test the `PrimeProvider.previous_prime` method."""
+
+    prime_provider = PrimeProvider(segment_size=8)
+
+    assert prime_provider.previous_prime(3) == 2
+    assert prime_provider.previous_prime(29) == 23
+    assert prime_provider.previous_prime(7920) == 7919
+
+    with pytest.raises(ValueError):
+        prime_provider.previous_prime(2)
@@ -0,0 +1,87 @@
+"""Implement unit tests for the `src.program_cache` module."""
+
+import os
+
+from src.program_cache import ProgramCache
+
+
+def test_get_key(tmp_path) -> None:
+    """Test the `ProgramCache.get_key` method."""
+
+    cache = ProgramCache(directory=str(tmp_path))
+
+    key = cache.get_key(source_code="int main() { return 0; }")
+
+    assert key == cache.get_key(source_code="int main() { return 0; }")
+    assert key != cache.get_key(source_code="int main() { return 1; }")
+    assert key != cache.get_key(
+        source_code="int main() { return 0; }",
+        optimization_level=2
+    )
+    assert key != cache.get_key(
+        source_code="int main() { return 0; }",
+        trust_ast_optimizations=True
+    )
+
+    assert cache.compiler_version == ProgramCache.compute_compiler_version()
+
+
+def test_get_and_put(tmp_path) -> None:
+    """Test the `ProgramCache.get` and `ProgramCache.put` methods."""
+
+    cache = ProgramCache(directory=str(tmp_path))
+    entry = {"program": {"code": [{"instruction": "HALT", "metadata": {}}]}}
+
+    assert cache.get("key") is None
+
+    cache.put(key="key", entry=entry)
+
+    assert cache.get("key") == entry
+    assert ProgramCache(directory=str(tmp_path)).get("key") == entry
+    assert cache.get_size() > 0
+
+    cache.clear()
+
+    assert cache.get("key") is None
+    assert cache.get_size() == 0
+
+
+def test_corrupted_entry(tmp_path) -> None:
+    """Test that corrupted entries are evicted."""
+
+    cache = ProgramCache(directory=str(tmp_path))
+    cache.put(key="key", entry={"value": 1})
+
+    with open(cache._get_path("key"), "wb") as entry_file:
+        entry_file.write(b"corrupted")
+
+    assert cache.get("key") is None
+    assert not os.path.exists(cache._get_path("key"))
+
+
+def test_evict(tmp_path) -> None:
+    """Test the eviction of the least recently used entries."""
+
+    cache = ProgramCache(directory=str(tmp_path))
+    entry = {"value": list(range(64))}
+
+    for idx, key in enumerate(["first", "second", "third"]):
+        cache.put(key=key, entry=entry)
+
+        # Make the modification times increase, regardless of the resolution
+        # of the file system timestamps
+        os.utime(cache._get_path(key), (idx, idx))
+
+    entry_size = os.path.getsize(cache._get_path("first"))
+
+    # Using `first` makes `second` the least recently used entry
+    assert cache.get("first") == entry
+
+    cache.max_size = 3 * entry_size
+    cache.put(key="fourth", entry=entry)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == entry
+    assert cache.get("third") == entry
+    assert cache.get("fourth") == entry
+    assert cache.get_size() <= cache.max_size
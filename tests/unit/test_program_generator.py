@@ -0,0 +1,62 @@
+"""Implement unit tests for the `src.program_generator` module."""
+
+import pytest
+
+from src.program_generator import ProgramGenerator
+from src.runner import create_instance
+
+
+@pytest.mark.parametrize(
+    "parameters",
+    [
+        {},
+        {"functions": 1, "statements": 1, "arrays": 0, "structs": 0},
+        {"functions": 5, "statements": 24, "nesting_depth": 3, "call_fan_out": 3, "seed": 7},
+        {"expression_depth": 4, "structs": 2, "arrays": 2, "loop_iterations": 4, "seed": 3},
+    ]
+)
+@pytest.mark.parametrize("optimization_level", [0, 1, 2])
+def test_generate(parameters: dict, optimization_level: int) -> None:
+    """Test that the generated programs are valid, and certificate and run."""
+
+    source_code = ProgramGenerator(**parameters).generate()
+
+    instance = create_instance(source_code, optimization_level=optimization_level)
+
+    assert instance.validate_and_run(parallel=False)
+
+
+def test_generate_is_deterministic() -> None:
+    """Test that the same parameters always generate the same program."""
+
+    generator = ProgramGenerator(functions=3, statements=12, seed=42)
+    source_code = generator.generate()
+
+    assert generator.generate() == source_code
+    assert ProgramGenerator(functions=3, statements=12, seed=42).generate() == source_code
+    assert ProgramGenerator(functions=3, statements=12, seed=43).generate() != source_code
+
+    for function_idx in range(3):
+        assert f"int f{function_idx}(int p0, int p1)" in source_code
+
+
+def test_generate_scales() -> None:
+    """Test that the size of the programs grows with the parameters."""
+
+    sizes = [
+        len(ProgramGenerator(statements=statements).generate().splitlines())
+        for statements in [8, 16, 32]
+    ]
+
+    assert sizes == sorted(sizes)
+    assert sizes[0] < sizes[-1]
+
+
+def test_init_raises() -> None:
+    """Test the validation of the parameters of `ProgramGenerator`."""
+
+    with pytest.raises(ValueError):
+        ProgramGenerator(variables=0)
+
+    with pytest.raises(ValueError):
+        ProgramGenerator(loop_iterations=ProgramGenerator.ARRAY_SIZE + 1)
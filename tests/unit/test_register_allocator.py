@@ -0,0 +1,83 @@
+"""Implement unit tests for the `src.register_allocator.RegisterAllocator` class."""
+
+from src.register_allocator import RegisterAllocator
+
+
+def test_get_definitions_and_uses() -> None:
+    """Test the `RegisterAllocator.get_definitions_and_uses` method."""
+
+    test_cases = [
+        ({"instruction": "CONSTANT", "metadata": {"register": 0, "value": 3}}, ["register"], []),
+        (
+            {"instruction": "ADD", "metadata": {"register": 1, "lhs_register": 0, "rhs_register": "zero"}},
+            ["register"],
+            ["lhs_register"],
+        ),
+        ({"instruction": "LOAD", "metadata": {"register": 2, "value": 1}}, ["register"], ["value"]),
+        ({"instruction": "STORE", "metadata": {"register": 1, "value": 2}}, [], ["register", "value"]),
+        ({"instruction": "STORE", "metadata": {"register": 1, "value": "arg"}}, [], ["register"]),
+        ({"instruction": "LOADA", "metadata": {"register": 2, "address": 4}}, ["register"], []),
+        ({"instruction": "STOREA", "metadata": {"address": 4, "value": 2}}, [], ["value"]),
+        ({"instruction": "JZ", "metadata": {"conditional_register": 3, "jump_size": 2}}, [], ["conditional_register"]),
+        ({"instruction": "MOV", "metadata": {"register": 4, "value": "ret_value"}}, ["register"], []),
+        ({"instruction": "MOV", "metadata": {"register": "arg", "value": 4}}, [], ["value"]),
+        ({"instruction": "JAL", "metadata": {"value": 1}}, [], []),
+        ({"instruction": "JR", "metadata": {"register": "ret_address"}}, [], []),
+    ]
+
+    for bytecode, expected_definitions, expected_uses in test_cases:
+        definitions, uses = RegisterAllocator.get_definitions_and_uses(bytecode)
+
+        assert definitions == expected_definitions
+        assert uses == expected_uses
+
+
+def test_allocate() -> None:
+    """Test the `RegisterAllocator.allocate` method with straight-line code."""
+
+    code = [
+        {"instruction": "CONSTANT", "metadata": {"register": 0, "value": 1}},
+        {"instruction": "CONSTANT", "metadata": {"register": 1, "value": 2}},
+        {"instruction": "ADD", "metadata": {"register": 2, "lhs_register": 0, "rhs_register": 1}},
+        {"instruction": "CONSTANT", "metadata": {"register": 3, "value": 3}},
+        {"instruction": "MULT", "metadata": {"register": 4, "lhs_register": 2, "rhs_register": 3}},
+        {"instruction": "MOV", "metadata": {"register": "ret_value", "value": 4}},
+        {"instruction": "JR", "metadata": {"register": "ret_address"}},
+    ]
+
+    register_count = RegisterAllocator(code=code).allocate()
+
+    assert register_count == 3
+    assert [bytecode["metadata"] for bytecode in code] == [
+        {"register": 0, "value": 1},
+        {"register": 1, "value": 2},
+        {"register": 2, "lhs_register": 0, "rhs_register": 1},
+        {"register": 0, "value": 3},
+        {"register": 1, "lhs_register": 2, "rhs_register": 0},
+        {"register": "ret_value", "value": 1},
+        {"register": "ret_address"},
+    ]
+
+
+def test_allocate_loop() -> None:
+    """
+    Test the `RegisterAllocator.allocate` method with a loop.
+
+    Registers that are live across the back edge must not be reused inside
+    the loop.
+    """
+
+    code = [
+        {"instruction": "CONSTANT", "metadata": {"register": 0, "value": 4}},
+        {"instruction": "CONSTANT", "metadata": {"register": 1, "value": 0}},
+        {"instruction": "JZ", "metadata": {"conditional_register": 0, "jump_size": 4}},
+        {"instruction": "CONSTANT", "metadata": {"register": 2, "value": 1}},
+        {"instruction": "STORE", "metadata": {"register": 1, "value": 2}},
+        {"instruction": "JZ", "metadata": {"conditional_register": "zero", "jump_size": -3}},
+        {"instruction": "JR", "metadata": {"register": "ret_address"}},
+    ]
+
+    register_count = RegisterAllocator(code=code).allocate()
+
+    assert register_count == 3
+    assert code[3]["metadata"]["register"] == 2
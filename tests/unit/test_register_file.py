@@ -0,0 +1,92 @@
+"""Implement unit tests for the `src.register_file.RegisterFile` class."""
+
+from src.register_file import RegisterFile
+
+
+def test_init() -> None:
+    """Test the instantiation of RegisterFile objects."""
+
+    register_file = RegisterFile(size=3, argument_slots=2)
+
+    assert register_file.size == 3
+    assert register_file.argument_slots == 2
+    assert register_file.frame_size == 7
+    assert register_file.values == [0] * 14
+    assert register_file.frame == [0]
+    assert register_file.return_addresses == []
+
+
+def test_getitem_setitem() -> None:
+    """Test reading and writing registers."""
+
+    register_file = RegisterFile(size=3, argument_slots=2)
+
+    register_file[1] = 2.5
+
+    assert register_file[1] == 2.5
+    assert register_file["zero"] == 0
+    assert register_file["arg"] == [0, 0]
+    assert register_file["ret_address"] == []
+
+
+def test_index() -> None:
+    """Test the `RegisterFile.index` method."""
+
+    register_file = RegisterFile(size=3, argument_slots=2)
+
+    assert register_file.index(2) == 6
+    assert register_file.index("zero") == 3
+
+    # The called function reads its arguments and writes its returned value
+    assert register_file.index("arg") == 1
+    assert register_file.index("arg", argument=1) == 2
+    assert register_file.index("ret_value", is_written=True) == 0
+
+    # The caller writes the arguments and reads the returned value
+    assert register_file.index("arg", is_written=True) == 8
+    assert register_file.index("arg", argument=1, is_written=True) == 9
+    assert register_file.index("ret_value") == 7
+
+
+def test_push_frame_pop_frame() -> None:
+    """Test the `RegisterFile.push_frame` and `RegisterFile.pop_frame` methods."""
+
+    register_file = RegisterFile(size=2, argument_slots=1)
+    values = register_file.values
+
+    register_file[0] = 7
+    register_file["arg"] = 11
+    register_file.push_frame()
+
+    # The called function gets its own registers, and the arguments
+    assert register_file.frame == [5]
+    assert register_file["arg"] == [11]
+
+    register_file[0] = 13
+    register_file[1] = 17
+    register_file["ret_value"] = 19
+    register_file.pop_frame()
+
+    # The caller gets its registers back, and the returned value
+    assert register_file.frame == [0]
+    assert register_file[0] == 7
+    assert register_file["ret_value"] == 19
+    assert register_file.values is values
+
+
+def test_push_frame_grow() -> None:
+    """Test that nested calls grow the register file."""
+
+    register_file = RegisterFile(size=1)
+
+    for depth in range(10):
+        register_file[0] = depth
+        register_file.push_frame()
+
+    for depth in reversed(range(10)):
+        register_file.pop_frame()
+
+        assert register_file[0] == depth
+
+    assert register_file["zero"] == 0
+    assert len(register_file.values) >= 11 * register_file.frame_size
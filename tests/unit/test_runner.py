@@ -1,7 +1,11 @@
 """Implement unit tests for the `src.interpreter` module."""
 
+import pytest
+
 from src.certificators import BackendCertificator, FrontendCertificator
-from src.runner import create_instance
+from src.instrumentation import Instrumentation, SummarySubscriber
+from src.program_cache import ProgramCache
+from src.runner import Charon, create_instance
 from src.virtual_machine import VirtualMachine
 
 from tests.unit.common import *
@@ -60,3 +64,122 @@ def test_backend_certificator():
     """Test if the created instance has the expected `backend_certificator`."""
 
     pass
+
+
+def test_create_instance_with_cache(tmp_path):
+    """Test creating instances with a `ProgramCache`."""
+
+    cache = ProgramCache(directory=str(tmp_path))
+
+    instance = create_instance(SOURCE_CODE, cache=cache)
+
+    assert instance.get_frontend_certificate() is not None
+    assert instance.get_backend_certificate() is not None
+    assert instance.get_vm().are_globals_initialized
+
+    cached_instance = create_instance(SOURCE_CODE, cache=cache)
+
+    assert not cached_instance.is_computed("ast")
+    assert cached_instance.get_program() == instance.get_program()
+    assert cached_instance.get_frontend_certificate() == instance.get_frontend_certificate()
+    assert cached_instance.get_backend_certificate() == instance.get_backend_certificate()
+    assert cached_instance.get_vm().are_globals_initialized
+
+    assert instance.validate_and_run(parallel=False)
+    assert cached_instance.validate_and_run()
+
+    assert cached_instance.get_vm().get_memory() == instance.get_vm().get_memory()
+
+    # The stages that were not cached are still computed on demand
+    assert cached_instance.get_ast() == instance.get_ast()
+
+
+def test_create_instance_with_instrumentation(tmp_path):
+    """Test that `create_instance` emits the events of each stage."""
+
+    instrumentation = Instrumentation(trace_memory=False)
+    summary = instrumentation.subscribe(SummarySubscriber())
+
+    instance = create_instance(SOURCE_CODE, instrumentation=instrumentation)
+
+    assert summary.get_summary() == {}
+
+    # The frontend (certificated first) does not wait for the code generator
+    assert instance.validate_and_run(parallel=False)
+    assert list(summary.get_summary()) == [
+        "lex",
+        "ast_build",
+        "certificator_construction",
+        "certification",
+        "codegen",
+        "vm_construction",
+        "run",
+    ]
+    assert summary.get_summary()["certification"]["calls"] == 2
+
+    # Loading from a cache skips the compilation
+    cache = ProgramCache(directory=str(tmp_path))
+    create_instance(SOURCE_CODE, cache=cache)
+
+    summary = instrumentation.subscribe(SummarySubscriber())
+    create_instance(SOURCE_CODE, cache=cache, instrumentation=instrumentation)
+
+    assert list(summary.get_summary()) == ["vm_construction"]
+
+
+def test_lazy_instance():
+    """Test that the stages of an instance are only computed on demand."""
+
+    instance = create_instance(SOURCE_CODE)
+
+    assert not any(instance.is_computed(stage) for stage in Charon.STAGES)
+
+    # Running the program does not build the certificators
+    instance.run()
+
+    assert instance.is_computed("vm")
+    assert instance.is_computed("program")
+    assert not instance.is_computed("frontend_certificator")
+    assert not instance.is_computed("backend_certificator")
+
+    # Computed stages are kept
+    program = instance.get_program()
+
+    assert instance.certificate()[0] == instance.certificate()[1]
+    assert instance.get_backend_certificator().program is program
+    assert instance.get_frontend_certificator() is instance.get_frontend_certificator()
+
+    # Stages can be given already computed
+    vm = VirtualMachine(program=program)
+    other_instance = Charon(source_code=SOURCE_CODE, stages={"vm": vm})
+
+    assert other_instance.get_vm() is vm
+    assert not other_instance.is_computed("program")
+
+    with pytest.raises(ValueError):
+        Charon(source_code=SOURCE_CODE, stages={"bytecode": []})
+
+    with pytest.raises(AttributeError):
+        other_instance.bytecode
+
+
+@pytest.mark.parametrize(
+    "optimization_level, trust_ast_optimizations, is_ast_optimized",
+    [(0, True, False), (2, False, False), (2, True, True)]
+)
+def test_frontend_certificator_dependencies(
+    optimization_level: int,
+    trust_ast_optimizations: bool,
+    is_ast_optimized: bool
+):
+    """Test that the frontend only waits for the code generator if it optimizes the AST."""
+
+    instance = create_instance(
+        SOURCE_CODE,
+        optimization_level=optimization_level,
+        trust_ast_optimizations=trust_ast_optimizations
+    )
+    instance.get_frontend_certificator()
+
+    assert instance.is_computed("ast")
+    assert instance.is_computed("code_generator") == is_ast_optimized
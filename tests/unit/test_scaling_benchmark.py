@@ -0,0 +1,68 @@
+"""Implement unit tests for the `src.scaling_benchmark` module."""
+
+import pytest
+
+from src.benchmark_runner import BenchmarkRunner
+from src.scaling_benchmark import ScalingBenchmark
+
+
+def test_run(tmp_path) -> None:
+    """Test the `ScalingBenchmark.run` method."""
+
+    benchmark = ScalingBenchmark(
+        sizes=[2, 1],
+        parameter="functions",
+        generator_parameters={"statements": 4},
+        repeats=1,
+        warmup=0
+    )
+
+    results = benchmark.run()
+
+    assert results["parameter"] == "functions"
+    assert results["metadata"]["generator_parameters"] == {"statements": 4}
+    assert [point["size"] for point in results["points"]] == [1, 2]
+
+    for point in results["points"]:
+        assert point["certificates_match"]
+        assert point["lines"] > 0
+        assert point["instructions"] > 0
+        assert list(point["time"]) == BenchmarkRunner.STAGES
+        assert list(point["memory"]) == BenchmarkRunner.STAGES
+
+    assert results["points"][0]["lines"] < results["points"][1]["lines"]
+
+    for metric in ["time", "memory"]:
+        assert list(results["fits"][metric]) == BenchmarkRunner.STAGES
+
+    path = str(tmp_path / "scaling.json")
+    benchmark.save(results, path)
+
+    assert BenchmarkRunner.load(path)["points"] == results["points"]
+
+
+def test_init_raises() -> None:
+    """Test the validation of the parameters of `ScalingBenchmark`."""
+
+    with pytest.raises(ValueError):
+        ScalingBenchmark(sizes=[1, 2], parameter="seed")
+
+    with pytest.raises(ValueError):
+        ScalingBenchmark(sizes=[1])
+
+
+def test_fit_power_law() -> None:
+    """Test the `ScalingBenchmark.fit_power_law` method."""
+
+    sizes = [10, 20, 40, 80]
+
+    coefficient, exponent = ScalingBenchmark.fit_power_law(
+        sizes, [3 * size**2 for size in sizes]
+    )
+
+    assert coefficient == pytest.approx(3)
+    assert exponent == pytest.approx(2)
+
+    _, exponent = ScalingBenchmark.fit_power_law(sizes, [5.0] * len(sizes))
+
+    assert exponent == pytest.approx(0)
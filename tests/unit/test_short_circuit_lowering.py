@@ -0,0 +1,91 @@
+"""Implement unit tests for the `src.optimizations.short_circuit_lowering` module."""
+
+from copy import deepcopy
+
+from src.optimizations import ShortCircuitLowering
+
+
+# int main() { if (a < 3 && b < 4) { x = 1; } }
+PROGRAM = {
+    "functions": {
+        "main": {"start": 0, "end": 12, "parameters": 0},
+    },
+    "function_table": {1: 0},
+    "global_vars": [],
+    "data": {0: 4, 4: 4, 8: 4},
+    "code": [
+        {"instruction": "LOADA", "metadata": {"register": 0, "address": 0}},
+        {"instruction": "CONSTANT", "metadata": {"register": 1, "value": 3}},
+        {"instruction": "LT", "metadata": {"register": 2, "lhs_register": 0, "rhs_register": 1}},
+        {"instruction": "LOADA", "metadata": {"register": 3, "address": 4}},
+        {"instruction": "CONSTANT", "metadata": {"register": 4, "value": 4}},
+        {"instruction": "LT", "metadata": {"register": 5, "lhs_register": 3, "rhs_register": 4}},
+        {"instruction": "AND", "metadata": {"register": 6, "lhs_register": 2, "rhs_register": 5}},
+        {"instruction": "JZ", "metadata": {"conditional_register": 6, "jump_size": 3}},
+        {"instruction": "CONSTANT", "metadata": {"register": 7, "value": 1}},
+        {"instruction": "STOREA", "metadata": {"address": 8, "value": 7}},
+        {"instruction": "JR", "metadata": {"register": "ret_address"}},
+        {"instruction": "HALT", "metadata": {}},
+    ],
+}
+
+
+def test_optimize_conjunction() -> None:
+    """Test the `ShortCircuitLowering.optimize` method with an `AND`."""
+
+    optimized_program = ShortCircuitLowering(program=deepcopy(PROGRAM)).optimize()
+
+    assert optimized_program["code"] == [
+        {"instruction": "LOADA", "metadata": {"register": 0, "address": 0}},
+        {"instruction": "CONSTANT", "metadata": {"register": 1, "value": 3}},
+        {"instruction": "LT", "metadata": {"register": 2, "lhs_register": 0, "rhs_register": 1}},
+        {"instruction": "JZ", "metadata": {"conditional_register": 2, "jump_size": 4}},
+        {"instruction": "LOADA", "metadata": {"register": 3, "address": 4}},
+        {"instruction": "CONSTANT", "metadata": {"register": 4, "value": 4}},
+        {"instruction": "LT", "metadata": {"register": 5, "lhs_register": 3, "rhs_register": 4}},
+        {"instruction": "AND", "metadata": {"register": 6, "lhs_register": 2, "rhs_register": 5}},
+        {"instruction": "JZ", "metadata": {"conditional_register": 6, "jump_size": 3}},
+        {"instruction": "CONSTANT", "metadata": {"register": 7, "value": 1}},
+        {"instruction": "STOREA", "metadata": {"address": 8, "value": 7}},
+        {"instruction": "JR", "metadata": {"register": "ret_address"}},
+        {"instruction": "HALT", "metadata": {}},
+    ]
+
+    assert optimized_program["functions"] == {
+        "main": {"start": 0, "end": 13, "parameters": 0},
+    }
+
+
+def test_optimize_disjunction() -> None:
+    """Test the `ShortCircuitLowering.optimize` method with an `OR`."""
+
+    program = deepcopy(PROGRAM)
+    program["code"][6]["instruction"] = "OR"
+
+    optimized_program = ShortCircuitLowering(program=program).optimize()
+
+    assert optimized_program["code"][3:10] == [
+        {"instruction": "JZ", "metadata": {"conditional_register": 2, "jump_size": 2}},
+        {"instruction": "JZ", "metadata": {"conditional_register": "zero", "jump_size": 4}},
+        {"instruction": "LOADA", "metadata": {"register": 3, "address": 4}},
+        {"instruction": "CONSTANT", "metadata": {"register": 4, "value": 4}},
+        {"instruction": "LT", "metadata": {"register": 5, "lhs_register": 3, "rhs_register": 4}},
+        {"instruction": "OR", "metadata": {"register": 6, "lhs_register": 2, "rhs_register": 5}},
+        {"instruction": "JZ", "metadata": {"conditional_register": 6, "jump_size": 3}},
+    ]
+
+
+def test_optimize_short_rhs() -> None:
+    """Test that right hand sides too short to pay for the jumps are kept."""
+
+    program = deepcopy(PROGRAM)
+
+    # if (a < 3 && b) { x = 1; }
+    del program["code"][4:6]
+    program["code"][4]["metadata"]["rhs_register"] = 3
+    program["functions"]["main"]["end"] = 10
+    expected_code = deepcopy(program["code"])
+
+    optimized_program = ShortCircuitLowering(program=program).optimize()
+
+    assert optimized_program["code"] == expected_code
@@ -0,0 +1,22 @@
+"""Implement unit tests for the `src.ast_nodes.variable_prime_label` module."""
+
+from src.ast_nodes import VariablePrimeLabel
+
+
+def test_resolve() -> None:
+    """Test the `VariablePrimeLabel.resolve` method."""
+
+    label = VariablePrimeLabel(67, 1, 3, 2, slots=(1, 3))
+    variables = {1: {"prime": 5}, 2: {"prime": 7}}
+
+    assert label.resolve(variables) == (67, 5, 3, 7)
+    assert repr(label) == "(67)^(VAR_1_PRIME)^(3)^(VAR_2_PRIME)"
+
+
+def test_eq() -> None:
+    """Test the equality comparison between VariablePrimeLabel objects."""
+
+    assert VariablePrimeLabel(67, 1, slots=(1,)) == VariablePrimeLabel(67, 1, slots=(1,))
+    assert VariablePrimeLabel(67, 1, slots=(1,)) != VariablePrimeLabel(67, 2, slots=(1,))
+    assert VariablePrimeLabel(67, 1, slots=(1,)) != VariablePrimeLabel(67, 1)
+    assert VariablePrimeLabel(67, 1, slots=(1,)) != (67, 1)
@@ -1,11 +1,51 @@
 """Implement unit tests for the `src.virtual_machine.VirtualMachine` class."""
 
+import pickle
+from typing import Union
+
 import pytest
 
+from src.memory import Memory
+from src.register_file import RegisterFile
+from src.runner import create_instance
 from src.virtual_machine import VirtualMachine
 from tests.unit.common import MACHINE_CODE
 
 
+def execute(
+    vm: VirtualMachine,
+    instruction: str,
+    instruction_params: dict[str, Union[int, float, str]],
+    bytecode_idx: int = 0
+) -> Union[int, None]:
+    """
+    Decode a single bytecode and execute it on a VirtualMachine.
+
+    Parameters
+    ----------
+    vm : VirtualMachine
+        The VirtualMachine to execute the bytecode on.
+    instruction : str
+        The instruction of the bytecode.
+    instruction_params : dict[str, Union[int, float, str]]
+        The bytecode metadata.
+    bytecode_idx : int, optional (default = 0)
+        The index of the bytecode in the program.
+
+    Returns
+    -------
+    : Union[int, None]
+        The index of the next instruction to be executed.
+    """
+
+    handler = vm._decode_instruction(
+        bytecode={"instruction": instruction, "metadata": instruction_params},
+        bytecode_idx=bytecode_idx
+    )
+
+    return handler()
+
+
 def test_init() -> None:
     """Test the instantiation of VirtualMachine objects."""
 
@@ -14,11 +54,12 @@ def test_init() -> None:
     vm = VirtualMachine(program=MACHINE_CODE, memory_size=memory_size)
 
     assert vm.program == MACHINE_CODE
-    assert vm.memory == {hex(_byte): None for _byte in range(memory_size)}
+    assert vm.function_table == MACHINE_CODE["function_table"]
+    assert vm.memory == Memory(size=memory_size)
     assert vm.memory_size == memory_size
     assert vm.memory_pointer == 0x0
     assert vm.program_counter == 0
-    assert vm.registers == {"arg": [], "ret_address": [], "ret_value": [], "zero": 0}
+    assert vm.registers == RegisterFile(size=4, argument_slots=2)
     assert vm.variables == {}
 
 
@@ -28,18 +69,11 @@ def test_get_memory() -> None:
     memory_size = 8
 
     vm = VirtualMachine(program=MACHINE_CODE, memory_size=memory_size)
-    vm.memory = {
-        "0x0": 1,
-        "0x1": None,
-        "0x2": None,
-        "0x3": None,
-        "0x4": 2,
-        "0x5": None,
-        "0x6": 35,
-        "0x7": None,
-    }
+    vm.memory[0x0] = 1
+    vm.memory[0x4] = 2
+    vm.memory[0x6] = 35
 
-    expected_memory = {"0x0": 1, "0x4": 2, "0x6": 35}
+    expected_memory = {0x0: 1, 0x4: 2, 0x6: 35}
 
     assert vm.get_memory() == expected_memory
 
@@ -52,23 +86,102 @@ def test_run() -> None:
     vm.run()
 
     expected_memory = {
-        '0x3c': 2.0,
-        '0x40': 123,
-        '0x44': 1,
-        '0x48': 2,
-        '0x4c': 1,
-        '0x50': 2.0,
-        '0x58': 1,
-        '0x60': 3,
-        '0x78': 1,
-        '0x8c': 1
+        0x3c: 2.0,
+        0x40: 123,
+        0x44: 1,
+        0x48: 2,
+        0x4c: 1,
+        0x50: 2.0,
+        0x58: 1,
+        0x60: 3,
+        0x78: 1,
+        0x8c: 1
     }
 
     assert vm.get_memory() == expected_memory
 
 
+def test_pickle() -> None:
+    """Test that an unpickled VirtualMachine decodes its program again."""
+
+    vm = pickle.loads(pickle.dumps(VirtualMachine(program=MACHINE_CODE)))
+
+    assert len(vm.handlers) == len(MACHINE_CODE["code"])
+
+    vm.run()
+
+    expected_vm = VirtualMachine(program=MACHINE_CODE)
+    expected_vm.run()
+
+    assert vm.get_memory() == expected_vm.get_memory()
+
+
+def test_decode() -> None:
+    """Test the `VirtualMachine._decode` method."""
+
+    vm = VirtualMachine(program=MACHINE_CODE)
+
+    bytecodes = [
+        {"instruction": "CONSTANT", "metadata": {"register": 0, "value": 3}},
+        {"instruction": "CONSTANT", "metadata": {"register": 1, "value": 4}},
+        {
+            "instruction": "MULT",
+            "metadata": {"register": 2, "lhs_register": 0, "rhs_register": 1},
+        },
+        {
+            "instruction": "JZ",
+            "metadata": {"conditional_register": 2, "jump_size": 2},
+        },
+        {"instruction": "JZ", "metadata": {"conditional_register": "zero", "jump_size": 2}},
+        {"instruction": "NOT", "metadata": {"register": 3, "value": 2}},
+        {"instruction": "HALT", "metadata": {}},
+    ]
+
+    handlers = vm._decode(bytecodes)
+
+    assert len(handlers) == len(bytecodes)
+
+    # Each handler returns the index of the next instruction to be executed
+    assert handlers[0]() == 1
+    assert handlers[1]() == 2
+    assert handlers[2]() == 3
+    assert vm.registers[2] == 12
+    assert handlers[3]() == 4
+    assert handlers[4]() == 6
+    assert handlers[5]() == 6
+    assert vm.registers[3] == 0
+    assert handlers[6]() is None
+    assert vm.program_counter == 6
+
+
+def test_decode_absolute_access() -> None:
+    """Test the `VirtualMachine._decode` method with fused instructions."""
+
+    vm = VirtualMachine(program=MACHINE_CODE)
+
+    bytecodes = [
+        {"instruction": "CONSTANT", "metadata": {"register": 0, "value": 70000}},
+        {"instruction": "STOREA", "metadata": {"address": 0, "value": 0}},
+        {"instruction": "CONSTANT", "metadata": {"register": 1, "value": 2.5}},
+        {"instruction": "STOREFA", "metadata": {"address": 4, "value": 1}},
+        {"instruction": "LOADA", "metadata": {"register": 2, "address": 0}},
+        {"instruction": "LOADFA", "metadata": {"register": 3, "address": 4}},
+        {"instruction": "LOADSA", "metadata": {"register": 0, "address": 0}},
+    ]
+
+    handlers = vm._decode(bytecodes)
+
+    for idx, handler in enumerate(handlers):
+        assert handler() == idx + 1
+
+    assert vm.get_memory() == {0: 70000, 4: 2.5}
+    assert vm.registers[2] == 70000
+    assert vm.registers[3] == 2.5
+    assert vm.registers[0] == 4464
+
+
 def test_ADD() -> None:
-    """Test the `VirtualMachine.ADD` method."""
+    """Test the `ADD` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -88,13 +201,13 @@ def test_ADD() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.ADD(instruction_params=instruction_params)
+    execute(vm, "ADD", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_AND() -> None:
-    """Test the `VirtualMachine.AND` method."""
+    """Test the `AND` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -114,13 +227,13 @@ def test_AND() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.AND(instruction_params=instruction_params)
+    execute(vm, "AND", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_BITAND() -> None:
-    """Test the `VirtualMachine.BITAND` method."""
+    """Test the `BITAND` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -140,13 +253,13 @@ def test_BITAND() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.BITAND(instruction_params=instruction_params)
+    execute(vm, "BITAND", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_BITOR() -> None:
-    """Test the `VirtualMachine.BITOR` method."""
+    """Test the `BITOR` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -166,13 +279,13 @@ def test_BITOR() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.BITOR(instruction_params=instruction_params)
+    execute(vm, "BITOR", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_CONSTANT() -> None:
-    """Test the `VirtualMachine.CONSTANT` method."""
+    """Test the `CONSTANT` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -185,13 +298,13 @@ def test_CONSTANT() -> None:
         "type": "int",
     }
 
-    vm.CONSTANT(instruction_params=instruction_params)
+    execute(vm, "CONSTANT", instruction_params)
 
     assert vm.registers[result_register] == expected_value
 
 
 def test_DIV() -> None:
-    """Test the `VirtualMachine.DIV` method."""
+    """Test the `DIV` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -211,13 +324,13 @@ def test_DIV() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.DIV(instruction_params=instruction_params)
+    execute(vm, "DIV", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_EQ() -> None:
-    """Test the `VirtualMachine.EQ` method."""
+    """Test the `EQ` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -237,13 +350,13 @@ def test_EQ() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.EQ(instruction_params=instruction_params)
+    execute(vm, "EQ", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_FADD() -> None:
-    """Test the `VirtualMachine.FADD` method."""
+    """Test the `FADD` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -263,13 +376,13 @@ def test_FADD() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.FADD(instruction_params=instruction_params)
+    execute(vm, "FADD", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_FAND() -> None:
-    """Test the `VirtualMachine.FAND` method."""
+    """Test the `FAND` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -289,13 +402,13 @@ def test_FAND() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.FAND(instruction_params=instruction_params)
+    execute(vm, "FAND", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_FDIV() -> None:
-    """Test the `VirtualMachine.FDIV` method."""
+    """Test the `FDIV` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -315,13 +428,13 @@ def test_FDIV() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.FDIV(instruction_params=instruction_params)
+    execute(vm, "FDIV", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_FEQ() -> None:
-    """Test the `VirtualMachine.FEQ` method."""
+    """Test the `FEQ` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -341,13 +454,13 @@ def test_FEQ() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.FEQ(instruction_params=instruction_params)
+    execute(vm, "FEQ", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_FGT() -> None:
-    """Test the `VirtualMachine.FGT` method."""
+    """Test the `FGT` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -367,13 +480,13 @@ def test_FGT() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.GT(instruction_params=instruction_params)
+    execute(vm, "FGT", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_FLT() -> None:
-    """Test the `VirtualMachine.FLT` method."""
+    """Test the `FLT` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -393,13 +506,13 @@ def test_FLT() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.LT(instruction_params=instruction_params)
+    execute(vm, "FLT", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_FMULT() -> None:
-    """Test the `VirtualMachine.FMULT` method."""
+    """Test the `FMULT` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -419,13 +532,13 @@ def test_FMULT() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.MULT(instruction_params=instruction_params)
+    execute(vm, "FMULT", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_FNEQ() -> None:
-    """Test the `VirtualMachine.FNEQ` method."""
+    """Test the `FNEQ` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -445,13 +558,13 @@ def test_FNEQ() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.FNEQ(instruction_params=instruction_params)
+    execute(vm, "FNEQ", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_FOR() -> None:
-    """Test the `VirtualMachine.FOR` method."""
+    """Test the `FOR` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -471,13 +584,13 @@ def test_FOR() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.OR(instruction_params=instruction_params)
+    execute(vm, "FOR", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_FSUB() -> None:
-    """Test the `VirtualMachine.FSUB` method."""
+    """Test the `FSUB` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -497,13 +610,13 @@ def test_FSUB() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.SUB(instruction_params=instruction_params)
+    execute(vm, "FSUB", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_GT() -> None:
-    """Test the `VirtualMachine.GT` method."""
+    """Test the `GT` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -523,38 +636,62 @@ def test_GT() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.GT(instruction_params=instruction_params)
+    execute(vm, "GT", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_HALT() -> None:
-    """Test the `VirtualMachine.HALT` method."""
+    """Test the `HALT` instruction."""
+
+    vm = VirtualMachine(program=MACHINE_CODE)
+
+    assert execute(vm, "HALT", {}, bytecode_idx=42) is None
+    assert vm.program_counter == 42
 
-    ...
+
+def test_JAL_JR() -> None:
+    """
+    Test the `JAL` and `JR` instructions together.
+
+    The registers of the caller must be preserved across the function call.
+    """
+
+    vm = VirtualMachine(program=MACHINE_CODE)
+
+    vm.registers[0] = 35
+
+    next_idx = execute(vm, "JAL", {"value": 2}, bytecode_idx=99)
+
+    assert next_idx == MACHINE_CODE["functions"]["some_simple_function"]["start"]
+    assert vm.registers["ret_address"] == [100]
+
+    # Clobber the register in the called function
+    vm.registers[0] = 123
+
+    assert execute(vm, "JR", {"register": "ret_address"}) == 100
+    assert vm.registers[0] == 35
+    assert vm.registers["ret_address"] == []
 
 
 def test_JR() -> None:
-    """Test the `VirtualMachine.JR` method."""
+    """Test the `JR` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
     jump_register = 1
-    jump_size = 23
-    expected_program_counter = jump_size
+    jump_address = 23
 
-    vm.registers[jump_register] = jump_size
+    vm.registers[jump_register] = jump_address
 
     instruction_params = {"register": jump_register}
 
-    vm.JR(instruction_params=instruction_params)
-
-    assert vm.program_counter == expected_program_counter
+    assert execute(vm, "JR", instruction_params) == jump_address
 
 
 def test_JZ_true() -> None:
     """
-    Test the `VirtualMachine.JZ` method.
+    Test the `JZ` instruction.
 
     For this test, the `conditional_register` contains a `true` value (1).
     """
@@ -562,7 +699,7 @@ def test_JZ_true() -> None:
     vm = VirtualMachine(program=MACHINE_CODE)
 
     jump_size = 23
-    expected_program_counter = vm.program_counter
+    expected_next_idx = 1
     conditional_register = 0
 
     instruction_params = {
@@ -572,14 +709,12 @@ def test_JZ_true() -> None:
 
     vm.registers[conditional_register] = 1
 
-    vm.JZ(instruction_params=instruction_params)
-
-    assert vm.program_counter == expected_program_counter
+    assert execute(vm, "JZ", instruction_params) == expected_next_idx
 
 
 def test_JZ_false() -> None:
     """
-    Test the `VirtualMachine.JZ` method.
+    Test the `JZ` instruction.
 
     For this test, the `conditional_register` contains a `false` value (1).
     """
@@ -587,7 +722,7 @@ def test_JZ_false() -> None:
     vm = VirtualMachine(program=MACHINE_CODE)
 
     jump_size = 23
-    expected_program_counter = jump_size - 1
+    expected_next_idx = jump_size
     conditional_register = 0
 
     instruction_params = {
@@ -597,46 +732,84 @@ def test_JZ_false() -> None:
 
     vm.registers[conditional_register] = 0
 
-    vm.JZ(instruction_params=instruction_params)
-
-    assert vm.program_counter == expected_program_counter
+    assert execute(vm, "JZ", instruction_params) == expected_next_idx
 
 
 def test_LOAD() -> None:
-    """Test the `VirtualMachine.LOAD` method."""
+    """Test the `LOAD` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE, memory_size=10)
 
     expected_value = 77
     expected_value_register = 3
 
-    vm.registers = {0: "0x0", 1: "0x4", 2: "0x8"}
+    for register, address in enumerate([0x0, 0x4, 0x8]):
+        vm.registers[register] = address
+
     instruction_params = {
         "register": expected_value_register,
         "value": 2,
     }
 
+    for address, value in enumerate([123, 321, 23, 35, 6, 13, 32, 34, expected_value, 7]):
+        vm.memory[address] = value
 
-    vm.memory = {
-        "0x0": 123,
-        "0x1": 321,
-        "0x2": 23,
-        "0x3": 35,
-        "0x4": 6,
-        "0x5": 13,
-        "0x6": 32,
-        "0x7": 34,
-        "0x8": expected_value,
-        "0x9": 7,
-    }
+    execute(vm, "LOAD", instruction_params)
 
-    vm.LOAD(instruction_params=instruction_params)
+    assert vm.registers[expected_value_register] == expected_value
+
+
+def test_LOADA() -> None:
+    """Test the `LOADA` instruction."""
+
+    vm = VirtualMachine(program=MACHINE_CODE, memory_size=10)
+
+    expected_value = 77
+    expected_value_register = 3
+
+    vm.memory[8] = expected_value
+    instruction_params = {"register": expected_value_register, "address": 8}
+
+    execute(vm, "LOADA", instruction_params)
+
+    assert vm.registers[expected_value_register] == expected_value
+
+
+def test_LOADFA() -> None:
+    """Test the `LOADFA` instruction."""
+
+    vm = VirtualMachine(program=MACHINE_CODE, memory_size=10)
+
+    expected_value = 7.7
+    expected_value_register = 3
+
+    vm.memory[8] = expected_value
+    instruction_params = {"register": expected_value_register, "address": 8}
+
+    execute(vm, "LOADFA", instruction_params)
+
+    assert vm.registers[expected_value_register] == expected_value
+
+
+def test_LOADSA() -> None:
+    """Test the `LOADSA` instruction."""
+
+    vm = VirtualMachine(program=MACHINE_CODE, memory_size=10)
+
+    value = 70000
+    expected_value = 4464
+    expected_value_register = 3
+
+    vm.memory[8] = value
+    instruction_params = {"register": expected_value_register, "address": 8}
+
+    execute(vm, "LOADSA", instruction_params)
 
     assert vm.registers[expected_value_register] == expected_value
 
 
 def test_LSHIFT() -> None:
-    """Test the `VirtualMachine.LSHIFT` method."""
+    """Test the `LSHIFT` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -656,13 +829,13 @@ def test_LSHIFT() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.LSHIFT(instruction_params=instruction_params)
+    execute(vm, "LSHIFT", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_LT() -> None:
-    """Test the `VirtualMachine.LT` method."""
+    """Test the `LT` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -682,13 +855,13 @@ def test_LT() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.LT(instruction_params=instruction_params)
+    execute(vm, "LT", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_MOD() -> None:
-    """Test the `VirtualMachine.MOD` method."""
+    """Test the `MOD` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -708,13 +881,41 @@ def test_MOD() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.MOD(instruction_params=instruction_params)
+    execute(vm, "MOD", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
+def test_MOV() -> None:
+    """
+    Test the `MOV` instruction.
+
+    Values are moved in and out of a function call through the `arg` and
+    `ret_value` slots.
+    """
+
+    vm = VirtualMachine(program=MACHINE_CODE)
+
+    vm.registers[0] = 23
+    vm.registers[1] = 35
+
+    execute(vm, "MOV", {"register": "arg", "value": 0, "argument": 0})
+    execute(vm, "MOV", {"register": "arg", "value": 1, "argument": 1})
+    execute(vm, "JAL", {"value": 2})
+
+    assert vm.registers["arg"] == [23, 35]
+
+    execute(vm, "MOV", {"register": 1, "value": "arg", "argument": 1})
+    execute(vm, "MOV", {"register": "ret_value", "value": 1})
+    execute(vm, "JR", {"register": "ret_address"})
+    execute(vm, "MOV", {"register": 2, "value": "ret_value"})
+
+    assert vm.registers["ret_value"] == 35
+    assert vm.registers[2] == 35
+
+
 def test_MULT() -> None:
-    """Test the `VirtualMachine.MULT` method."""
+    """Test the `MULT` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -734,13 +935,13 @@ def test_MULT() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.MULT(instruction_params=instruction_params)
+    execute(vm, "MULT", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_NEQ() -> None:
-    """Test the `VirtualMachine.NEQ` method."""
+    """Test the `NEQ` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -760,13 +961,13 @@ def test_NEQ() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.NEQ(instruction_params=instruction_params)
+    execute(vm, "NEQ", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_OR() -> None:
-    """Test the `VirtualMachine.OR` method."""
+    """Test the `OR` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -786,13 +987,13 @@ def test_OR() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.OR(instruction_params=instruction_params)
+    execute(vm, "OR", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_RSHIFT() -> None:
-    """Test the `VirtualMachine.RSHIFT` method."""
+    """Test the `RSHIFT` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -812,14 +1013,14 @@ def test_RSHIFT() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.RSHIFT(instruction_params=instruction_params)
+    execute(vm, "RSHIFT", instruction_params)
 
     assert vm.registers[result_register] == expected_result
 
 
 def test_STORE_simple() -> None:
     """
-    Test the `VirtualMachine.STORE` method when handling simple variables.
+    Test the `STORE` instruction when handling simple variables.
 
     In this case, `register` contains the register with the `id`
     of the variable to be written to.
@@ -829,19 +1030,20 @@ def test_STORE_simple() -> None:
 
     instruction_params = {"register": 0, "value": 1}
 
-    store_address = "0x0"
+    store_address = 0x0
     value_to_store = 23
 
-    vm.registers = {0: store_address, 1: value_to_store}
+    vm.registers[0] = store_address
+    vm.registers[1] = value_to_store
 
-    vm.STORE(instruction_params)
+    execute(vm, "STORE", instruction_params)
 
     assert vm.memory[store_address] == value_to_store
 
 
 def test_STORE_arrays_structs() -> None:
     """
-    Test the `VirtualMachine.STORE` method when handling arrays/structs.
+    Test the `STORE` instruction when handling arrays/structs.
 
     In this case, `register` contains the register with the address to write to.
     """
@@ -851,17 +1053,75 @@ def test_STORE_arrays_structs() -> None:
     instruction_params = {"register": 0, "value": 1}
 
     value_to_store = 23
-    store_address = "0x8"
+    store_address = 0x8
+
+    vm.registers[0] = store_address
+    vm.registers[1] = value_to_store
+
+    execute(vm, "STORE", instruction_params)
+
+    assert vm.memory[store_address] == value_to_store
+
+
+def test_STORE_parameter() -> None:
+    """
+    Test the `STORE` instruction when handling function parameters.
+
+    In this case, `value` is the `arg` register, and the value to store is read
+    from the slot of the given argument position.
+    """
+
+    vm = VirtualMachine(program=MACHINE_CODE, memory_size=20)
+
+    instruction_params = {"register": 0, "value": "arg", "argument": 1}
+
+    value_to_store = 23
+    store_address = 0x4
+
+    vm.registers[1] = store_address
+    execute(vm, "MOV", {"register": "arg", "value": 1, "argument": 0})
 
-    vm.registers = {0: store_address, 1: value_to_store}
+    vm.registers[1] = value_to_store
+    execute(vm, "MOV", {"register": "arg", "value": 1, "argument": 1})
 
-    vm.STORE(instruction_params)
+    execute(vm, "JAL", {"value": 2})
+
+    vm.registers[0] = store_address
+    execute(vm, "STORE", instruction_params)
 
     assert vm.memory[store_address] == value_to_store
 
 
+def test_STOREA() -> None:
+    """Test the `STOREA` instruction."""
+
+    vm = VirtualMachine(program=MACHINE_CODE)
+
+    value_register = 1
+    vm.registers[value_register] = 23
+
+    instruction_params = {"address": 8, "value": value_register}
+    execute(vm, "STOREA", instruction_params)
+
+    assert vm.get_memory() == {8: 23}
+
+
+def test_STOREFA() -> None:
+    """Test the `STOREFA` instruction."""
+
+    vm = VirtualMachine(program=MACHINE_CODE)
+
+    value_register = 1
+    vm.registers[value_register] = 2.3
+
+    instruction_params = {"address": 8, "value": value_register}
+    execute(vm, "STOREFA", instruction_params)
+
+    assert vm.get_memory() == {8: 2.3}
+
+
 def test_SUB() -> None:
-    """Test the `VirtualMachine.SUB` method."""
+    """Test the `SUB` instruction."""
 
     vm = VirtualMachine(program=MACHINE_CODE)
 
@@ -881,6 +1141,32 @@ def test_SUB() -> None:
         "rhs_register": rhs_register,
     }
 
-    vm.SUB(instruction_params=instruction_params)
+    execute(vm, "SUB", instruction_params)
 
     assert vm.registers[result_register] == expected_result
+
+
+@pytest.mark.parametrize("optimization_level", [0, 1, 2])
+def test_run_big_integers(optimization_level: int) -> None:
+    """Test running a program whose integers grow beyond 64 bits."""
+
+    source_code = """
+    int main() {
+        int x;
+        int i;
+        int y;
+        x = 1;
+        i = 0;
+        while (i < 70) {
+            x = x * 2;
+            i = i + 1;
+        }
+        y = x / 1024;
+        return 0;
+    }
+    """
+
+    instance = create_instance(source_code, optimization_level=optimization_level)
+
+    assert instance.validate_and_run(parallel=False)
+    assert instance.get_vm().get_memory() == {0x0: 2**70, 0x4: 70, 0x8: 2**60}